@@ -0,0 +1,85 @@
+""" Benchmark looking up items in large action managers.
+
+A menu bar of 10 menus, each with 20 groups of 100 actions and a chain of
+nested sub-menus, is built one item at a time, finding each group before
+adding to it, as the Tasks action manager builder and plugins do.  Then the
+actions and the deepest nested items are looked up by path.  The time of each
+phase is reported.
+
+Usage::
+
+    python benchmarks/bench_action_manager_find.py
+
+"""
+
+from __future__ import print_function
+
+import time
+
+from pyface.action.api import Action, Group, MenuBarManager, MenuManager
+
+N_MENUS = 10
+N_GROUPS = 20
+N_ITEMS = 100
+DEPTH = 10
+N_LOOKUPS = 20000
+
+
+def build():
+    menu_bar = MenuBarManager()
+    for i in range(N_MENUS):
+        menu = MenuManager(*[
+            Group(id='group_{}'.format(j)) for j in range(N_GROUPS)
+        ], id='menu_{}'.format(i), name='Menu {}'.format(i))
+        menu_bar.append(menu)
+        for j in range(N_GROUPS):
+            for k in range(N_ITEMS):
+                group = menu.find_group('group_{}'.format(j))
+                group.append(Action(id='action_{}_{}'.format(j, k)))
+                # Check for an existing item before adding the next one.
+                menu.find_item('action_{}_{}'.format(j, k))
+
+        parent = menu
+        for depth in range(DEPTH):
+            child = MenuManager(id='sub_{}'.format(depth))
+            parent.append(child)
+            parent = child
+        parent.append(Action(id='deepest'))
+
+    return menu_bar
+
+
+def run():
+    start = time.time()
+    menu_bar = build()
+    built = time.time() - start
+
+    paths = [
+        'menu_{}/action_{}_{}'.format(
+            i % N_MENUS, i % N_GROUPS, (i * 7) % N_ITEMS
+        )
+        for i in range(N_LOOKUPS)
+    ]
+    start = time.time()
+    for path in paths:
+        assert menu_bar.find_item(path) is not None
+    found = time.time() - start
+
+    deep_path = '/'.join(
+        ['menu_0'] + ['sub_{}'.format(i) for i in range(DEPTH)] + ['deepest']
+    )
+    start = time.time()
+    for i in range(N_LOOKUPS):
+        assert menu_bar.find_item(deep_path) is not None
+    found_deep = time.time() - start
+
+    print('build {:6.3f} s, {} lookups {:6.3f} s, {} deep lookups {:6.3f} s'
+          .format(built, N_LOOKUPS, found, N_LOOKUPS, found_deep))
+
+
+def main():
+    run()
+
+
+if __name__ == '__main__':
+    main()
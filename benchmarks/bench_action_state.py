@@ -0,0 +1,83 @@
+""" Benchmark updating the state of many listening actions shown in a menu.
+
+A menu holds 2,000 listening actions whose enabled and visible states depend
+on two traits of a shared object, as task actions depend on the state of
+their task.  A burst of 10 changes to those traits, as a single change of
+selection can cause, is then made and the event loop is run once.  The time
+to create the menu and the time of the burst are reported, with the state
+service evaluating the actions immediately and deferred until the event loop
+is idle.
+
+Usage::
+
+    ETS_TOOLKIT=qt4 python benchmarks/bench_action_state.py
+
+"""
+
+from __future__ import print_function
+
+import time
+
+from traits.api import Bool, HasTraits
+
+from pyface.action.api import (
+    ActionStateService, Group, ListeningAction, MenuManager
+)
+from pyface.gui import GUI
+from pyface.qt import QtGui
+
+N_ACTIONS = 2000
+N_CHANGES = 10
+
+
+class Selection(HasTraits):
+
+    has_selection = Bool(True)
+
+    is_editable = Bool(True)
+
+
+def run(label, deferred):
+    gui = GUI()
+    parent = QtGui.QWidget()
+    selection = Selection()
+    service = ActionStateService(deferred=deferred)
+
+    start = time.time()
+    actions = [
+        ListeningAction(
+            name='Action {}'.format(i), object=selection,
+            enabled_name='has_selection', visible_name='is_editable',
+            state_service=service,
+        )
+        for i in range(N_ACTIONS)
+    ]
+    manager = MenuManager(Group(*actions))
+    manager.create_menu(parent)
+    gui.process_events()
+    created = time.time() - start
+
+    evaluations = service.evaluations
+    start = time.time()
+    for i in range(N_CHANGES):
+        selection.has_selection = not selection.has_selection
+        selection.is_editable = i % 3 != 0
+    gui.process_events()
+    burst = time.time() - start
+
+    print('{:>9}: create {:6.3f} s, burst {:6.3f} s, {} evaluations'.format(
+        label, created, burst, service.evaluations - evaluations))
+
+    for action in actions:
+        action.destroy()
+    parent.deleteLater()
+    gui.process_events()
+
+
+def main():
+    run('immediate', False)
+    run('deferred', True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+""" Benchmark syntax highlighting in the Qt code editor.
+
+A 50,000 line Python file is opened in a CodeWidget and an
+AdvancedCodeWidget.  The time until the widget is usable and the time until
+the whole file has been highlighted are reported, followed by the average
+time taken to type a character at the start of a line in the middle of the
+file.
+
+Usage::
+
+    ETS_TOOLKIT=qt4 python benchmarks/bench_code_editor.py
+
+"""
+
+from __future__ import print_function
+
+import inspect
+import time
+
+from pyface.qt import QtCore, QtGui
+from pyface.qt.QtTest import QTest
+
+from pyface.api import GUI
+from pyface.ui.qt4.code_editor import code_widget
+from pyface.ui.qt4.code_editor.code_widget import (
+    AdvancedCodeWidget, CodeWidget
+)
+
+N_LINES = 50000
+
+N_KEYSTROKES = 200
+
+
+def source():
+    lines = inspect.getsource(code_widget).splitlines()
+    return '\n'.join((lines * (N_LINES // len(lines) + 1))[:N_LINES])
+
+
+def highlighted(highlighter):
+    next_pending_block = getattr(highlighter, '_next_pending_block', None)
+    return next_pending_block is None or next_pending_block() is None
+
+
+def run(label, widget_class):
+    gui = GUI()
+    text = source()
+    widget = widget_class(None)
+    widget.resize(800, 600)
+    widget.show()
+    code = getattr(widget, 'code', widget)
+    gui.process_events()
+
+    start = time.time()
+    code.setPlainText(text)
+    gui.process_events()
+    opened = time.time()
+    while not highlighted(code.highlighter):
+        gui.process_events()
+    done = time.time()
+
+    cursor = code.textCursor()
+    cursor.setPosition(
+        code.document().findBlockByNumber(N_LINES // 2).position()
+    )
+    code.setTextCursor(cursor)
+    keystroke_start = time.time()
+    for i in range(N_KEYSTROKES):
+        QTest.keyClick(code, QtCore.Qt.Key_A)
+    gui.process_events()
+    keystroke = (time.time() - keystroke_start) / N_KEYSTROKES
+
+    widget.close()
+    gui.process_events()
+
+    print('{:>20}: open {:8.1f} ms  highlighted {:8.1f} ms  '
+          'keystroke {:6.2f} ms'.format(
+              label, (opened - start) * 1e3, (done - start) * 1e3,
+              keystroke * 1e3))
+
+
+def main():
+    QtGui.QApplication.instance() or QtGui.QApplication([])
+    run('CodeWidget', CodeWidget)
+    run('AdvancedCodeWidget', AdvancedCodeWidget)
+
+
+if __name__ == '__main__':
+    main()
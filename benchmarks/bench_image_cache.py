@@ -0,0 +1,71 @@
+""" Benchmark repeated creation of toolkit images from image resources.
+
+Simulates repainting a large tree or table, where every row asks for the
+same few icons, and reports the time per call along with the statistics of
+the shared decoded-image cache.
+
+Usage::
+
+    python benchmarks/bench_image_cache.py
+
+"""
+
+from __future__ import print_function
+
+import time
+
+import pkg_resources
+
+from pyface.api import GUI, ImageResource
+from pyface.resource.resource_cache import image_cache
+from pyface.resource_manager import resource_manager
+
+N_ROWS = 10000
+ICONS = ['image_not_found', 'splash', 'about', 'carat_open', 'question']
+SEARCH_PATH = pkg_resources.resource_filename('pyface', 'images')
+
+
+def paint_rows(resources, create):
+    start = time.time()
+    for i in range(N_ROWS):
+        create(resources[i % len(resources)])
+    return time.time() - start
+
+
+def main():
+    # Toolkit images need a running toolkit application.
+    GUI()
+    resources = [ImageResource(name, SEARCH_PATH) for name in ICONS]
+
+    for kind in ['create_image', 'create_bitmap', 'create_icon']:
+        image_cache.clear()
+        image_cache.reset_statistics()
+        create = lambda resource: getattr(resource, kind)()
+        elapsed = paint_rows(resources, create)
+        print('{:>14}: {:8.2f} us/call  {}'.format(
+            kind, elapsed * 1e6 / N_ROWS, image_cache.statistics()))
+
+    # Images decoded from data (eg. read from a zip file).
+    factory = resource_manager.resource_factory
+    data = []
+    for resource in resources:
+        with open(resource.absolute_path, 'rb') as fp:
+            data.append(fp.read())
+    image_cache.clear()
+    elapsed = paint_rows(data, factory.image_from_data)
+    print('{:>14}: {:8.2f} us/call'.format(
+        'from_data', elapsed * 1e6 / N_ROWS))
+
+    # Disable the cache for comparison.
+    image_cache.clear()
+    image_cache.resize(max_bytes=0)
+    elapsed = paint_rows(resources, lambda resource: resource.create_image())
+    print('{:>14}: {:8.2f} us/call  (uncached)'.format(
+        'create_image', elapsed * 1e6 / N_ROWS))
+    elapsed = paint_rows(data, factory.image_from_data)
+    print('{:>14}: {:8.2f} us/call  (uncached)'.format(
+        'from_data', elapsed * 1e6 / N_ROWS))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+""" Benchmark loading the standard image library volumes.
+
+Measures the time and memory needed to discover the '@std' and '@icons'
+volumes and resolve an image from each, to resolve an image from just the
+'@icons' volume, and then to load the information for every image in the
+library.
+
+Usage::
+
+    python benchmarks/bench_image_library.py
+
+"""
+
+from __future__ import print_function
+
+import gc
+import time
+import tracemalloc
+
+from pyface.image.image import ImageLibrary
+
+
+def measure(label, function):
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    result = function()
+    elapsed = time.time() - start
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('{:>10}: {:8.2f} ms  {:8.1f} KiB allocated  {:8.1f} KiB peak'.format(
+        label, elapsed * 1e3, size / 1024.0, peak / 1024.0))
+    return result
+
+
+def first_lookup():
+    library = ImageLibrary.__class__()
+    library.image_info('@icons:dialog-warning')
+    return library
+
+
+def startup():
+    # A fresh library, rather than the shared instance.
+    library = ImageLibrary.__class__()
+    library.image_resource('@std:BE5')
+    library.image_info('@icons:dialog-warning')
+    return library
+
+
+def main():
+    library = measure('startup', startup)
+    measure('first', first_lookup)
+    measure('all images', lambda: library.images)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+""" Benchmark importing pyface.api.
+
+Imports pyface.api, and then a typical handful of names from it, in fresh
+interpreters (with the toolkit selected through ETS_TOOLKIT, and with no
+toolkit selected) and reports the median wall time, the peak memory allocated
+during the import, and whether pkg_resources was imported.
+
+Usage::
+
+    python benchmarks/bench_import.py [toolkit]
+
+"""
+
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+
+N_RUNS = 7
+
+IMPORTS = [
+    'import pyface.api',
+    'from pyface.api import ApplicationWindow, GUI, ImageResource',
+]
+
+CODE = """
+import sys, time, tracemalloc
+tracemalloc.start()
+start = time.time()
+{}
+elapsed = time.time() - start
+size, peak = tracemalloc.get_traced_memory()
+print('pkg_resources' in sys.modules, elapsed, peak)
+"""
+
+
+def run(toolkit, statement):
+    env = dict(os.environ, ETS_TOOLKIT=toolkit)
+    code = CODE.format(statement)
+    output = subprocess.check_output([sys.executable, '-c', code], env=env)
+    imported, elapsed, peak = output.decode('ascii').split()
+    return imported == 'True', float(elapsed), int(peak)
+
+
+def main():
+    toolkit = sys.argv[1] if len(sys.argv) > 1 else 'qt4'
+    for statement in IMPORTS:
+        print(statement)
+        for label, name in [(toolkit, toolkit), ('(none)', '')]:
+            results = sorted(run(name, statement) for i in range(N_RUNS))
+            imported, elapsed, peak = results[N_RUNS // 2]
+            times = sorted(result[1] for result in results)
+            print('{:>8}: {:8.1f} ms  {:8.1f} KiB peak  pkg_resources: {}'
+                  .format(label, times[N_RUNS // 2] * 1e3, peak / 1024.0,
+                          imported))
+
+
+if __name__ == '__main__':
+    main()
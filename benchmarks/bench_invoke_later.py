@@ -0,0 +1,68 @@
+""" Benchmark dispatching calls to the GUI thread.
+
+A worker thread makes 100,000 GUI.invoke_later calls, and then 100,000
+GUI.set_trait_later calls which all set the same trait, and the time until the
+GUI thread has handled all of them is reported.
+
+Usage::
+
+    ETS_TOOLKIT=qt4 python benchmarks/bench_invoke_later.py
+
+"""
+
+from __future__ import print_function
+
+import threading
+import time
+
+from traits.api import HasTraits, Int
+
+from pyface.api import GUI
+
+N_CALLS = 100000
+
+
+class Progress(HasTraits):
+
+    value = Int
+
+    changes = Int
+
+    def _value_changed(self):
+        self.changes += 1
+
+
+def run(label, post, done):
+    gui = GUI()
+    start = time.time()
+    worker = threading.Thread(target=post)
+    worker.start()
+    while not done():
+        gui.process_events()
+    elapsed = time.time() - start
+    worker.join()
+    print('{:>16}: {:8.1f} ms  {:10.0f} calls/s'.format(
+        label, elapsed * 1e3, N_CALLS / elapsed))
+
+
+def main():
+    results = []
+
+    def invoke():
+        for i in range(N_CALLS):
+            GUI.invoke_later(results.append, i)
+
+    run('invoke_later', invoke, lambda: len(results) == N_CALLS)
+
+    progress = Progress()
+
+    def set_trait():
+        for i in range(1, N_CALLS + 1):
+            GUI.set_trait_later(progress, 'value', i)
+
+    run('set_trait_later', set_trait, lambda: progress.value == N_CALLS)
+    print('{:>16}: {} trait changes'.format('', progress.changes))
+
+
+if __name__ == '__main__':
+    main()
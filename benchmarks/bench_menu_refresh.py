@@ -0,0 +1,84 @@
+""" Benchmark refreshing large menus and tool bars when their items change.
+
+A menu of 2,000 actions in 20 groups, and a tool bar with the same items, are
+created.  Then, as a dynamic menu such as a window list or a recent files
+list would, the items of a small group are replaced and the manager's
+'changed' event is fired.  The time to create the controls and the average
+time of each refresh are reported.  A lazy menu creates its actions, and
+applies changes, only when it is about to be shown.
+
+Usage::
+
+    ETS_TOOLKIT=qt4 python benchmarks/bench_menu_refresh.py
+
+"""
+
+from __future__ import print_function
+
+from functools import partial
+import time
+
+from pyface.action.api import Action, Group, MenuManager, ToolBarManager
+from pyface.gui import GUI
+from pyface.qt import QtGui
+
+N_GROUPS = 20
+N_ITEMS = 100
+N_DYNAMIC_ITEMS = 5
+N_REFRESHES = 20
+
+
+def create_manager(klass):
+    groups = [
+        Group(*[
+            Action(name='Action {} {}'.format(i, j)) for j in range(N_ITEMS)
+        ])
+        for i in range(N_GROUPS)
+    ]
+    dynamic_group = Group()
+    return klass(dynamic_group, *groups), dynamic_group
+
+
+def run(label, klass, create):
+    gui = GUI()
+    parent = QtGui.QWidget()
+    manager, dynamic_group = create_manager(klass)
+
+    start = time.time()
+    control = create(manager, parent)
+    gui.process_events()
+    created = time.time() - start
+
+    start = time.time()
+    for i in range(N_REFRESHES):
+        dynamic_group.destroy()
+        dynamic_group.clear()
+        for j in range(N_DYNAMIC_ITEMS):
+            dynamic_group.append(Action(name='Dynamic {} {}'.format(i, j)))
+        manager.changed = True
+        gui.process_events()
+    refreshed = (time.time() - start) / N_REFRESHES
+
+    print('{:>9}: create {:6.3f} s, refresh {:6.4f} s, {} actions'.format(
+        label, created, refreshed, len(control.actions())))
+
+    parent.deleteLater()
+    gui.process_events()
+
+
+def create_menu(manager, parent):
+    return manager.create_menu(parent)
+
+
+def create_tool_bar(manager, parent):
+    return manager.create_tool_bar(parent)
+
+
+def main():
+    run('menu', MenuManager, create_menu)
+    run('lazy menu', partial(MenuManager, lazy=True), create_menu)
+    run('tool bar', ToolBarManager, create_tool_bar)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+""" Benchmark the overhead of updating a progress dialog from a tight loop.
+
+A progress dialog is updated 20,000 times, with the time labels shown, once
+repainting on every update and once with the updates rate limited to 30
+repaints a second.  The time per update call is reported.
+
+Usage::
+
+    ETS_TOOLKIT=qt4 python benchmarks/bench_progress_dialog.py
+
+"""
+
+from __future__ import print_function
+
+import time
+
+from pyface.api import GUI, ProgressDialog
+
+N_UPDATES = 20000
+
+
+def run(label, update_rate):
+    gui = GUI()
+    dialog = ProgressDialog(
+        min=0, max=N_UPDATES, show_time=True, update_rate=update_rate,
+    )
+    dialog.open()
+    gui.process_events()
+
+    start = time.time()
+    for i in range(N_UPDATES):
+        dialog.update(i)
+    elapsed = time.time() - start
+
+    dialog.close()
+    gui.process_events()
+
+    print('{:>16}: {:8.2f} us/update'.format(
+        label, elapsed / N_UPDATES * 1e6))
+
+
+def main():
+    run('every update', 0.0)
+    run('30 per second', 30.0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+""" Benchmark showing a lot of output in the Qt Python shell.
+
+A command printing 200,000 lines is executed, then 200,000 lines are written
+while the prompt is shown (as output from a worker thread would be) and the
+event loop is run until they have been shown.  The time taken by each, and
+the longest time the event loop is blocked while showing the second, are
+reported.
+
+Usage::
+
+    ETS_TOOLKIT=qt4 python benchmarks/bench_python_shell.py
+
+"""
+
+from __future__ import print_function
+
+import time
+
+from pyface.qt import QtGui
+
+N_LINES = 200000
+
+
+def run(label, widget, write):
+    app = QtGui.QApplication.instance()
+    app.processEvents()
+
+    start = time.time()
+    write()
+    longest = time.time() - start
+    while widget._pending_output:
+        tick = time.time()
+        app.processEvents()
+        longest = max(longest, time.time() - tick)
+    elapsed = time.time() - start
+
+    print('{:>16}: {:8.2f} s, longest block {:6.3f} s'.format(
+        label, elapsed, longest))
+
+
+def main():
+    app = QtGui.QApplication.instance() or QtGui.QApplication([])
+    from pyface.ui.qt4.python_shell import PythonWidget
+
+    widget = PythonWidget()
+    widget.show()
+
+    def execute():
+        widget.execute(
+            "for i in range({}):\n    print('line', i)\n\n".format(N_LINES),
+            hidden=False,
+        )
+
+    def write_idle():
+        for i in range(N_LINES):
+            widget.write('line {}\n'.format(i))
+
+    run('while executing', widget, execute)
+    run('at the prompt', widget, write_idle)
+    widget.close()
+    app.processEvents()
+
+
+if __name__ == '__main__':
+    main()
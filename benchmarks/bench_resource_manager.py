@@ -0,0 +1,78 @@
+""" Benchmark image resolution by the resource manager.
+
+Resolves 1,000 distinct icons spread over a directory tree and an
+'images.zip' archive, first with a fresh resource manager (cold) and then
+again with the same manager (warm).
+
+Usage::
+
+    python benchmarks/bench_resource_manager.py
+
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import tempfile
+import time
+from zipfile import ZipFile
+
+from pyface.resource.api import ResourceFactory, ResourceManager
+
+N_ICONS = 1000
+N_DIRS = 10
+DATA = b'\x89PNG\r\n\x1a\n'
+
+
+def make_tree(root):
+    """ Create N_DIRS resource directories, half of them with zipped images.
+    """
+    dirs = []
+    for i in range(N_DIRS):
+        dirname = os.path.join(root, 'dir_%d' % i)
+        images_dir = os.path.join(dirname, 'images')
+        os.makedirs(images_dir)
+        names = ['icon_%d_%d' % (i, j) for j in range(N_ICONS // N_DIRS)]
+        if i % 2:
+            zip_filename = os.path.join(dirname, 'images.zip')
+            with ZipFile(zip_filename, 'w') as zip_file:
+                for name in names:
+                    zip_file.writestr(name + '.png', DATA)
+        else:
+            for name in names:
+                with open(os.path.join(images_dir, name + '.png'), 'wb') as fp:
+                    fp.write(DATA)
+        dirs.append(dirname)
+    return dirs
+
+
+def resolve_all(resource_manager, dirs):
+    start = time.time()
+    for i in range(N_DIRS):
+        for j in range(N_ICONS // N_DIRS):
+            reference = resource_manager.locate_image(
+                'icon_%d_%d' % (i, j), dirs
+            )
+            assert reference is not None
+    return time.time() - start
+
+
+def main():
+    root = tempfile.mkdtemp()
+    try:
+        dirs = make_tree(root)
+        resource_manager = ResourceManager(resource_factory=ResourceFactory())
+        cold = resolve_all(resource_manager, dirs)
+        warm = resolve_all(resource_manager, dirs)
+        print('Resolved {} icons in {} directories'.format(N_ICONS, N_DIRS))
+        print('cold: {:8.3f} ms total, {:8.1f} us/icon'.format(
+            cold * 1e3, cold * 1e6 / N_ICONS))
+        print('warm: {:8.3f} ms total, {:8.1f} us/icon'.format(
+            warm * 1e3, warm * 1e6 / N_ICONS))
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+""" Benchmark running many timers at once.
+
+10,000 timers are started with intervals of 10 to 109 ms, and run for one
+second, once each with a toolkit timer per timer and once with the shared
+scheduler.  The time to start the timers and the number of callbacks made in
+the second are reported.  The same is then done with plain callbacks scheduled
+directly with the scheduler.
+
+Usage::
+
+    ETS_TOOLKIT=qt4 python benchmarks/bench_scheduler.py
+
+"""
+
+from __future__ import print_function
+
+import time
+
+from pyface.api import GUI
+from pyface.timer.api import (
+    CallbackTimer, ScheduledCallbackTimer, get_scheduler
+)
+
+N_TIMERS = 10000
+
+DURATION = 1.0
+
+
+def run(label, start_timer):
+    gui = GUI()
+    calls = [0]
+
+    def callback():
+        calls[0] += 1
+
+    start = time.time()
+    stops = [
+        start_timer(callback, 0.01 + 0.001 * (i % 100))
+        for i in range(N_TIMERS)
+    ]
+    started = time.time()
+
+    while time.time() < started + DURATION:
+        gui.process_events()
+
+    for stop in stops:
+        stop()
+    gui.process_events()
+
+    print('{:>16}: start {:8.1f} ms  {:10d} callbacks/s'.format(
+        label, (started - start) * 1e3, int(calls[0] / DURATION)))
+
+
+def timer_starter(timer_class):
+    def start_timer(callback, interval):
+        timer = timer_class(callback=callback, interval=interval)
+        timer.start()
+        return timer.stop
+
+    return start_timer
+
+
+def schedule(callback, interval):
+    return get_scheduler().schedule(callback, interval, interval).cancel
+
+
+def main():
+    run('CallbackTimer', timer_starter(CallbackTimer))
+    run('Scheduled timer', timer_starter(ScheduledCallbackTimer))
+    run('schedule', schedule)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+""" Benchmark building the menus and tool bars of tasks with large menus.
+
+Each task has a menu bar of 10 menus and a tool bar, and 50 "plugins" each
+contribute 40 schema additions (actions, groups of actions and tool bar
+actions) placed with 'before' and 'after' constraints, for 2,000 additions in
+total.  The time to build the menu bar and tool bar managers of a task is
+reported, first for a single task and then for each of a number of tasks that
+share the additions, as well as the time to open a window holding those tasks.
+
+Usage::
+
+    ETS_TOOLKIT=qt4 python benchmarks/bench_task_action_manager_builder.py
+
+"""
+
+from __future__ import print_function
+
+import time
+
+from pyface.action.api import Action
+from pyface.gui import GUI
+from pyface.tasks.action.api import (
+    SchemaAddition, SGroup, SMenu, SMenuBar, SToolBar,
+    TaskActionManagerBuilder
+)
+from pyface.tasks.api import Task, TaskPane, TaskWindow
+
+N_MENUS = 10
+N_PLUGINS = 50
+N_ADDITIONS = 40
+N_TASKS = 10
+
+
+class BenchTask(Task):
+
+    def _menu_bar_default(self):
+        return SMenuBar(*[
+            SMenu(
+                SGroup(*[
+                    Action(name='Action {}'.format(j)) for j in range(5)
+                ], id='Group'),
+                id='Menu{}'.format(i), name='Menu {}'.format(i),
+            )
+            for i in range(N_MENUS)
+        ])
+
+    def _tool_bars_default(self):
+        return [SToolBar(Action(name='Tool'), id='ToolBar')]
+
+    def create_central_pane(self):
+        return TaskPane()
+
+
+def action_factory(plugin, index):
+    def factory():
+        return Action(
+            id='plugin{}_{}'.format(plugin, index),
+            name='Plugin {} action {}'.format(plugin, index),
+        )
+    return factory
+
+
+def group_factory(plugin, index):
+    def factory():
+        return SGroup(
+            Action(name='Plugin {} grouped action {}'.format(plugin, index)),
+            id='Plugin{}Group'.format(plugin),
+        )
+    return factory
+
+
+def create_additions():
+    """ Create the schema additions contributed by all the plugins. """
+    additions = []
+    for plugin in range(N_PLUGINS):
+        previous = None
+        for index in range(N_ADDITIONS):
+            menu = 'MenuBar/Menu{}'.format(index % N_MENUS)
+            if index % 4 == 0:
+                addition = SchemaAddition(
+                    id='Plugin{}Group'.format(plugin),
+                    factory=group_factory(plugin, index), path=menu,
+                    before='Group',
+                )
+            elif index % 4 == 1:
+                addition = SchemaAddition(
+                    id='plugin{}_tool{}'.format(plugin, index),
+                    factory=action_factory(plugin, index),
+                    path='ToolBar',
+                )
+            else:
+                addition = SchemaAddition(
+                    id='plugin{}_{}'.format(plugin, index),
+                    factory=action_factory(plugin, index),
+                    path=menu + '/Group', after=previous or '',
+                )
+                previous = addition.id
+            additions.append(addition)
+    return additions
+
+
+def build(task):
+    builder = TaskActionManagerBuilder(task=task)
+    builder.create_menu_bar_manager()
+    builder.create_tool_bar_managers()
+
+
+def main():
+    additions = create_additions()
+    tasks = [
+        BenchTask(id='bench.task_{}'.format(i), name='Task {}'.format(i),
+                  extra_actions=additions)
+        for i in range(N_TASKS + 1)
+    ]
+
+    start = time.time()
+    build(tasks[0])
+    first = time.time() - start
+
+    start = time.time()
+    for task in tasks[1:]:
+        build(task)
+    each = (time.time() - start) / N_TASKS
+
+    gui = GUI()
+    start = time.time()
+    window = TaskWindow(size=(800, 600))
+    for task in tasks[1:]:
+        window.add_task(task)
+    window.open()
+    gui.process_events()
+    opened = time.time() - start
+    window.destroy()
+    gui.process_events()
+
+    print('build first task {:6.3f} s, each further task {:6.3f} s, '
+          'open window of {} tasks {:6.3f} s'.format(
+              first, each, N_TASKS, opened))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+""" Benchmark the latency of opening a TaskWindow with many tasks and panes.
+
+A window with 8 tasks, each with 15 dock panes of which 3 are in its default
+layout, and a menu bar of 100 actions, is opened, once creating everything up
+front and once in lazy mode.  The time until the window is shown is reported,
+as is the time to then switch to every other task in turn.
+
+Usage::
+
+    ETS_TOOLKIT=qt4 python benchmarks/bench_task_window.py
+
+"""
+
+from __future__ import print_function
+
+import time
+
+from pyface.action.api import Action
+from pyface.gui import GUI
+from pyface.qt import QtGui
+from pyface.tasks.action.api import SGroup, SMenu, SMenuBar
+from pyface.tasks.api import (
+    DockPane, PaneItem, Task, TaskLayout, TaskPane, TaskWindow, VSplitter
+)
+
+N_TASKS = 8
+N_DOCK_PANES = 15
+N_ROWS = 100
+
+
+class TableDockPane(DockPane):
+    """ A dock pane whose contents are moderately expensive to create. """
+
+    def create_contents(self, parent):
+        table = QtGui.QTableWidget(N_ROWS, 10, parent)
+        for row in range(N_ROWS):
+            for column in range(10):
+                table.setItem(
+                    row, column, QtGui.QTableWidgetItem(str(row * column))
+                )
+        return table
+
+
+class BenchTask(Task):
+
+    def _default_layout_default(self):
+        return TaskLayout(
+            left=VSplitter(
+                PaneItem(self.id + '.pane_0'), PaneItem(self.id + '.pane_1')
+            ),
+            right=PaneItem(self.id + '.pane_2'),
+        )
+
+    def _menu_bar_default(self):
+        menus = [
+            SMenu(
+                SGroup(*[
+                    Action(name='Action {}'.format(j)) for j in range(10)
+                ]),
+                id='menu_{}'.format(i), name='Menu {}'.format(i),
+            )
+            for i in range(10)
+        ]
+        return SMenuBar(*menus)
+
+    def create_central_pane(self):
+        return TaskPane()
+
+    def create_dock_panes(self):
+        return [
+            TableDockPane(id='{}.pane_{}'.format(self.id, i),
+                          name='Pane {}'.format(i))
+            for i in range(N_DOCK_PANES)
+        ]
+
+
+def run(label, lazy):
+    gui = GUI()
+    tasks = [
+        BenchTask(id='bench.task_{}'.format(i), name='Task {}'.format(i))
+        for i in range(N_TASKS)
+    ]
+
+    start = time.time()
+    window = TaskWindow(lazy=lazy, size=(800, 600))
+    for task in tasks:
+        window.add_task(task)
+    window.open()
+    gui.process_events()
+    opened = time.time() - start
+
+    start = time.time()
+    for task in tasks[1:]:
+        window.activate_task(task)
+        gui.process_events()
+    switched = time.time() - start
+
+    window.destroy()
+    gui.process_events()
+
+    print('{:>8}: open {:6.3f} s, switch to each task {:6.3f} s'.format(
+        label, opened, switched))
+
+
+def main():
+    run('eager', False)
+    run('lazy', True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+""" Benchmark reading image volume members through FastZipFile.
+
+Performs 10,000 member reads spread over 50 zip volumes, first from a single
+thread and then from 4 threads at once, and reports the number of threads
+started to manage the open zip files.  When the pool supports it the reads
+are repeated with memory mapped member extraction.
+
+Usage::
+
+    python benchmarks/bench_zip_file_pool.py
+
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from pyface.image import image
+
+N_READS = 10000
+N_VOLUMES = 50
+N_MEMBERS = 20
+N_THREADS = 4
+DATA = os.urandom(1024) + b'\0' * 3072
+
+
+def make_volumes(root):
+    paths = []
+    for i in range(N_VOLUMES):
+        path = os.path.join(root, 'volume_%d.zip' % i)
+        with ZipFile(path, 'w', ZIP_DEFLATED) as zip_file:
+            for j in range(N_MEMBERS):
+                zip_file.writestr('image_%d.png' % j, DATA)
+        paths.append(path)
+    return paths
+
+
+def read_members(zip_files, count):
+    for i in range(count):
+        zip_file = zip_files[i % N_VOLUMES]
+        data = zip_file.read('image_%d.png' % ((i // N_VOLUMES) % N_MEMBERS))
+        assert len(data) == len(DATA)
+
+
+def run(label, zip_files):
+    threads_before = threading_count()
+    start = time.time()
+    read_members(zip_files, N_READS)
+    single = time.time() - start
+    threads_started = threading_count() - threads_before
+    threads_before = threading_count()
+
+    threads = [
+        threading.Thread(
+            target=read_members, args=(zip_files, N_READS // N_THREADS))
+        for i in range(N_THREADS)
+    ]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    concurrent = time.time() - start
+    threads_started += threading_count() - threads_before - N_THREADS
+
+    print('{:>8}: {:8.1f} ms single thread  {:8.1f} ms {} threads  '
+          '{} helper threads'.format(
+              label, single * 1e3, concurrent * 1e3, N_THREADS,
+              threads_started))
+
+
+_started = [0]
+_thread_start = threading.Thread.start
+
+
+def _counting_start(self):
+    _started[0] += 1
+    _thread_start(self)
+
+
+threading.Thread.start = _counting_start
+
+
+def threading_count():
+    """ Count the threads started so far, including finished ones. """
+    return _started[0]
+
+
+def main():
+    root = tempfile.mkdtemp()
+    try:
+        paths = make_volumes(root)
+        zip_files = [image.FastZipFile(path=path) for path in paths]
+        run('default', zip_files)
+
+        pool = getattr(image, 'zip_file_pool', None)
+        if pool is not None:
+            pool.close_all()
+            pool.use_mmap = True
+            run('mmap', zip_files)
+            pool.close_all()
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
@@ -15,6 +15,13 @@
     Part of the TraitsGUI project of the Enthought Tool Suite.
 """
 
+import os as _os
+
+# Start profiling as early as possible if start-up profiling was requested:
+if _os.environ.get('PYFACE_STARTUP_PROFILE'):
+    from pyface.util.startup_profiler import enable_from_environment
+    enable_from_environment()
+
 try:
     from pyface._version import full_version as __version__
 except ImportError:
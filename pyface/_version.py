@@ -0,0 +1,8 @@
+# THIS FILE IS GENERATED FROM PYFACE SETUP.PY
+version = '6.1.0'
+full_version = '6.1.0.dev0'
+git_revision = 'Unknown'
+is_released = False
+
+if not is_released:
+    version = full_version
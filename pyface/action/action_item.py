@@ -15,7 +15,7 @@
 
 
 # Enthought library imports.
-from traits.api import Any, Instance, List, Property, Str, on_trait_change
+from traits.api import Any, Instance, List, Property, Str
 
 # Local imports.
 from pyface.action.action import Action
@@ -75,10 +75,10 @@ class ActionItem(ActionManagerItem):
     def _visible_changed(self, trait_name, old, new):
         self.action.visible = new
 
-    @on_trait_change('_wrappers.control')
     def _on_destroy(self, object, name, old, new):
         """ Handle the destruction of the wrapper. """
         if name == 'control' and new is None:
+            object.on_trait_change(self._on_destroy, 'control', remove=True)
             self._wrappers.remove(object)
 
     ###########################################################################
@@ -105,7 +105,7 @@ class ActionItem(ActionManagerItem):
                 self.control = wrapper.control
                 self.control_id = wrapper.control_id
 
-            self._wrappers.append(wrapper)
+            self._add_wrapper(wrapper)
 
     def add_to_toolbar(self, parent, tool_bar, image_cache, controller,
                        show_labels=True):
@@ -134,7 +134,7 @@ class ActionItem(ActionManagerItem):
                 self.control = wrapper.control
                 self.control_id = wrapper.control_id
 
-            self._wrappers.append(wrapper)
+            self._add_wrapper(wrapper)
 
     def add_to_palette(self, tool_palette, image_cache, show_labels=True):
         """ Adds the item to a tool palette.
@@ -151,7 +151,7 @@ class ActionItem(ActionManagerItem):
             Should the toolbar item show a label.
         """
         wrapper = _PaletteTool(tool_palette, image_cache, self, show_labels)
-        self._wrappers.append(wrapper)
+        self._add_wrapper(wrapper)
 
     def destroy(self):
         """ Called when the action is no longer required.
@@ -159,3 +159,17 @@ class ActionItem(ActionManagerItem):
         By default this method calls 'destroy' on the action itself.
         """
         self.action.destroy()
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _add_wrapper(self, wrapper):
+        """ Add a wrapper, listening for its destruction.
+
+        Only items that have been added to a menu or tool bar have wrappers,
+        so the listener is added as each wrapper is created rather than for
+        every item when it is created.
+        """
+        wrapper.on_trait_change(self._on_destroy, 'control')
+        self._wrappers.append(wrapper)
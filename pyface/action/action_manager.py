@@ -174,6 +174,27 @@ class ActionManager(HasTraits):
         group.append(item)
         return group
 
+    def extend(self, items):
+        """ Append several items to the manager.
+
+        Parameters
+        ----------
+        items : collection of strings, Group instances or ActionManagerItem instances
+            The items to append.
+
+        Notes
+        -----
+
+        Each item is appended as by :py:meth:`append`, but the ``changed``
+        event is only fired once, after all of the items have been appended,
+        so that any menus or tool bars built from the manager are only
+        updated once.
+        """
+        for item in items:
+            self.append(item)
+
+        self.changed = True
+
     def destroy(self):
         """ Called when the manager is no longer required.
 
@@ -248,14 +269,17 @@ class ActionManager(HasTraits):
         """
         components = path.split('/')
 
-        # If there is only one component, then the path is just an Id so look
-        # it up in this manager.
-        if len(components) > 0:
-            item = self._find_item(components[0])
-            if len(components) > 1 and item is not None:
-                item = item.find_item('/'.join(components[1:]))
-        else:
-            item = None
+        # Walk down the path one component at a time, rather than building
+        # (and splitting again) the rest of the path at every level.
+        item = self
+        for index, component in enumerate(components):
+            if not isinstance(item, ActionManager):
+                # Let any other kind of item resolve the rest of the path.
+                return item.find_item('/'.join(components[index:]))
+
+            item = item._find_item(component)
+            if item is None:
+                break
 
         return item
 
@@ -368,8 +392,15 @@ class ActionManager(HasTraits):
             Returns the item with the specified Id, or None if no such item
             exists.
         """
-        for group in self.groups:
-            item = group.find(id)
+        for group in self._groups:
+            item = group._find_indexed(id)
+            if item is not None:
+                return item
+
+        # An item whose id has changed is missing from the indexes, so look
+        # at every item before giving up.
+        for group in self._groups:
+            item = group._find_unindexed(id)
             if item is not None:
                 return item
         else:
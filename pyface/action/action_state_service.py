@@ -0,0 +1,209 @@
+# Copyright (c) 2005-2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#
+# Author: Enthought, Inc.
+# Description: <Enthought pyface package component>
+""" A service that evaluates the state of listening actions. """
+
+# Standard library imports.
+import weakref
+
+# Enthought library imports.
+from traits.api import Any, Bool, HasTraits, Int
+
+
+#: The kinds of state of a listening action.
+ALL_KINDS = ('enabled', 'visible', 'checked')
+
+
+class ActionStateService(HasTraits):
+    """ Evaluates the enabled, visible and checked state of listening actions.
+
+    The actions that watch the same trait of the same object share a single
+    trait listener.  When the trait changes, each of those actions is marked
+    as dirty and the kinds of state (enabled, visible or checked) which the
+    trait determines for it are evaluated again.
+
+    If the service is deferred, the dirty actions are collected and evaluated
+    together, once, when the GUI event loop is next idle.  A burst of trait
+    changes (for instance a change of selection that many actions depend on)
+    then costs one evaluation per action, rather than one per change.
+    Otherwise each dirty action is evaluated straight away.
+    """
+
+    #### 'ActionStateService' interface #######################################
+
+    #: Are the evaluations deferred until the GUI event loop is next idle?
+    deferred = Bool(False)
+
+    #: The number of evaluations that have been done (for diagnostics).
+    evaluations = Int
+
+    #### Private interface ####################################################
+
+    #: The shared listeners, keyed by (id(object), trait name).
+    _listeners = Any
+
+    #: The listeners used by each action.
+    _action_listeners = Any
+
+    #: The dirty actions and kinds of state, in the order they were marked,
+    #: waiting for a flush.
+    _dirty = Any
+
+    #: Has a flush been scheduled?
+    _flush_scheduled = Bool(False)
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, **traits):
+        super(ActionStateService, self).__init__(**traits)
+        self._listeners = {}
+        self._action_listeners = weakref.WeakKeyDictionary()
+        self._dirty = []
+
+    ###########################################################################
+    # 'ActionStateService' interface.
+    ###########################################################################
+
+    def watch(self, action, object, names):
+        """ Evaluate an action again whenever some traits of an object change.
+
+        Any traits that the action watched before are no longer watched.
+
+        Parameters
+        ----------
+        action : ListeningAction
+            The action to evaluate.
+        object : HasTraits
+            The object that the names apply to.
+        names : list of (str, str)
+            The (extended) name of each trait to watch, with the kind of
+            state ('enabled', 'visible' or 'checked') that it determines.
+        """
+        self.unwatch(action)
+
+        listeners = []
+        for name, kind in names:
+            key = (id(object), name)
+            listener = self._listeners.get(key)
+            if listener is None:
+                listener = self._listeners[key] = _SharedListener(
+                    self, object, name
+                )
+            kinds = listener.actions.get(action)
+            if kinds is None:
+                listener.actions[action] = kinds = set()
+                listeners.append(listener)
+            kinds.add(kind)
+
+        if listeners:
+            self._action_listeners[action] = listeners
+
+    def unwatch(self, action):
+        """ Stop evaluating an action when the traits it watches change. """
+
+        for listener in self._action_listeners.pop(action, []):
+            listener.actions.pop(action, None)
+            if len(listener.actions) == 0:
+                self._remove_listener(listener)
+
+    def invalidate(self, action, kinds=ALL_KINDS):
+        """ Mark some kinds of state of an action as dirty, evaluating them
+        now unless deferred.
+        """
+
+        if not self.deferred:
+            self._evaluate(action, kinds)
+            return
+
+        self._dirty.append((action, kinds))
+        if not self._flush_scheduled:
+            # Imported here so that the toolkit is not selected on import.
+            from pyface.gui import GUI
+
+            self._flush_scheduled = True
+            GUI.invoke_later(self.flush)
+
+    def flush(self):
+        """ Evaluate all of the dirty actions, once each. """
+
+        self._flush_scheduled = False
+        dirty, self._dirty = self._dirty, []
+
+        # Merge the kinds of state of each action, keeping the order.
+        actions = []
+        dirty_kinds = {}
+        for action, kinds in dirty:
+            if action in dirty_kinds:
+                dirty_kinds[action].update(kinds)
+            else:
+                actions.append(action)
+                dirty_kinds[action] = set(kinds)
+
+        for action in actions:
+            self._evaluate(action, dirty_kinds[action])
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _evaluate(self, action, kinds):
+        """ Evaluate some kinds of state of an action. """
+
+        self.evaluations += 1
+        action._update_state(kinds)
+
+    def _remove_listener(self, listener):
+        """ Remove a listener that no action uses any more. """
+
+        if self._listeners.get(listener.key) is listener:
+            del self._listeners[listener.key]
+        listener.dispose()
+
+
+class _SharedListener(object):
+    """ A trait listener shared by the actions that watch the same trait. """
+
+    def __init__(self, service, object, name):
+        self.service = service
+        self.name = name
+        self.key = (id(object), name)
+
+        # The kinds of state that the trait determines for each action that
+        # watches it.
+        self.actions = weakref.WeakKeyDictionary()
+
+        # The listener does not keep the object alive.
+        self.object_ref = weakref.ref(object, self._object_deleted)
+        object.on_trait_change(self._trait_changed, name)
+
+    def dispose(self):
+        object = self.object_ref()
+        if object is not None:
+            object.on_trait_change(self._trait_changed, self.name, remove=True)
+
+    def _object_deleted(self, ref):
+        listeners = self.service._listeners
+        if listeners.get(self.key) is self:
+            del listeners[self.key]
+
+    def _trait_changed(self):
+        actions = list(self.actions.items())
+        if len(actions) == 0:
+            self.service._remove_listener(self)
+
+        for action, kinds in actions:
+            self.service.invalidate(action, kinds)
+
+
+#: The service used by listening actions that are not given one.
+default_action_state_service = ActionStateService()
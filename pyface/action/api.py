@@ -9,30 +9,35 @@
 
 from __future__ import absolute_import
 
-from .action import Action
-from .action_controller import ActionController
-from .action_event import ActionEvent
-from .action_item import ActionItem
-from .action_manager import ActionManager
-from .action_manager_item import ActionManagerItem
-from .field_action import FieldAction
-from .group import Group, Separator
-from .gui_application_action import (
-    AboutAction, CloseActiveWindowAction, CreateWindowAction, ExitAction,
-    GUIApplicationAction
-)
-from .listening_action import ListeningAction
-from .menu_manager import MenuManager
-from .menu_bar_manager import MenuBarManager
-from .status_bar_manager import StatusBarManager
-from .tool_bar_manager import ToolBarManager
-from .traitsui_widget_action import TraitsUIWidgetAction
-from .window_action import CloseWindowAction, WindowAction
+from ..util.lazy_api import lazy_api
 
-# This part of the module handles widgets that are still wx specific.  This
-# will all be removed when everything has been ported to PyQt and pyface
-# becomes toolkit agnostic.
+lazy_api(__name__, globals(), {
+    'Action': '.action',
+    'ActionController': '.action_controller',
+    'ActionEvent': '.action_event',
+    'ActionItem': '.action_item',
+    'ActionManager': '.action_manager',
+    'ActionManagerItem': '.action_manager_item',
+    'ActionStateService': '.action_state_service',
+    'FieldAction': '.field_action',
+    'Group': '.group',
+    'Separator': '.group',
+    'AboutAction': '.gui_application_action',
+    'CloseActiveWindowAction': '.gui_application_action',
+    'CreateWindowAction': '.gui_application_action',
+    'ExitAction': '.gui_application_action',
+    'GUIApplicationAction': '.gui_application_action',
+    'ListeningAction': '.listening_action',
+    'MenuManager': '.menu_manager',
+    'MenuBarManager': '.menu_bar_manager',
+    'StatusBarManager': '.status_bar_manager',
+    'ToolBarManager': '.tool_bar_manager',
+    'TraitsUIWidgetAction': '.traitsui_widget_action',
+    'CloseWindowAction': '.window_action',
+    'WindowAction': '.window_action',
 
-from traits.etsconfig.api import ETSConfig
-if ETSConfig.toolkit == 'wx':
-    from .tool_palette_manager import ToolPaletteManager
+    # This widget is still wx specific, and will return Unimplemented for Qt.
+    'ToolPaletteManager': '.tool_palette_manager',
+})
+
+del lazy_api
@@ -0,0 +1,93 @@
+# Copyright (c) 2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+""" An action which does its work off the GUI thread. """
+
+from traits.api import Bool, Callable, Instance, on_trait_change, Property
+
+from pyface.action.action import Action
+from pyface.concurrent.api import (
+    BackgroundExecutor, BackgroundFuture, get_executor
+)
+
+
+class BackgroundAction(Action):
+    """ An action whose ``on_perform`` callable is run by a background
+    executor, so that long operations don't freeze the UI.
+
+    The action is disabled while its job is running.  The job must not touch
+    GUI objects; anything which needs to update the GUI with the result
+    should be done by ``on_done``, which is called in the GUI thread.  This
+    works in any action manager, including the menus and tool bars of a
+    TaskWindow.
+    """
+
+    # BackgroundAction interface ---------------------------------------------
+
+    #: The executor which runs the job.  By default this is the shared
+    #: thread pool executor.
+    executor = Instance(BackgroundExecutor)
+
+    #: The future of the most recent job.
+    future = Instance(BackgroundFuture)
+
+    #: Whether the job is running.
+    running = Property(Bool, depends_on='future.state')
+
+    #: A callable called in the GUI thread with the future when the job is
+    #: done (whether it completed, failed or was cancelled).
+    on_done = Callable
+
+    # -------------------------------------------------------------------------
+    # 'Action' interface.
+    # -------------------------------------------------------------------------
+
+    def perform(self, event):
+        """ Submit the job to the executor.
+
+        Parameters
+        ----------
+        event : ActionEvent instance
+            The event which triggered the action.
+
+        Raises
+        ------
+        queue.Full
+            If the executor has too many jobs waiting.  The action stays
+            enabled.
+        """
+        if self.on_perform is None or self.running:
+            return
+
+        # The future's state changes are dispatched to the GUI thread, so it
+        # can't be seen to finish before the action is disabled.
+        future = self.executor.submit(self.on_perform)
+        self.enabled = False
+        self.future = future
+
+    def destroy(self):
+        """ Cancel the job if it is running. """
+        if self.future is not None:
+            self.future.cancel()
+
+    # -------------------------------------------------------------------------
+    # Private interface.
+    # -------------------------------------------------------------------------
+
+    @on_trait_change('future:state')
+    def _future_state_updated(self, future, name, new):
+        if future is self.future and future.done:
+            self.enabled = True
+            if self.on_done is not None:
+                self.on_done(future)
+
+    def _get_running(self):
+        return self.future is not None and not self.future.done
+
+    def _executor_default(self):
+        return get_executor()
@@ -61,6 +61,12 @@ class Group(HasTraits):
     #: All of the items in the group.
     _items = List  #(ActionManagerItem)
 
+    #: The first item with each id, or None if it has to be built again.
+    _item_index = Any
+
+    #: The items appended since the index was last brought up to date.
+    _unindexed_items = Any
+
     ###########################################################################
     # 'object' interface.
     ###########################################################################
@@ -122,6 +128,8 @@ class Group(HasTraits):
     def clear(self):
         """ Remove all items from the group. """
         self._items = []
+        self._item_index = {}
+        self._unindexed_items = []
 
     def destroy(self):
         """ Called when the manager is no longer required.
@@ -162,10 +170,39 @@ class Group(HasTraits):
             item = ActionItem(action=Action(name=name, on_perform=item))
 
         item.parent = self
+        appended = index >= len(self._items)
         self._items.insert(index, item)
 
+        # Appended items are indexed when the index is next needed (ids are
+        # only looked up then, as an action's id defaults to its name).  Any
+        # other insertion may change which item is the first with its id, so
+        # the index is built again.
+        if appended and self._item_index is not None:
+            self._unindexed_items.append(item)
+        else:
+            self._item_index = None
+
         return item
 
+    def extend(self, items):
+        """ Appends several items to the group.
+
+        Parameters
+        ----------
+        items : collection of ActionManagerItem, Action or callable
+            The items to append.
+
+        Returns
+        -------
+        items : list of ActionManagerItem
+            The actually appended items.
+
+        Notes
+        -----
+        Each item is handled as by :py:meth:`append`.
+        """
+        return [self.append(item) for item in items]
+
     def remove(self, item):
         """ Removes an item from the group.
 
@@ -177,6 +214,9 @@ class Group(HasTraits):
         self._items.remove(item)
         item.parent = None
 
+        # Another item with the same id may now be the first one.
+        self._item_index = None
+
     def insert_before(self, before, item):
         """ Inserts an item into the group before the specified item.
 
@@ -244,11 +284,11 @@ class Group(HasTraits):
         item : ActionManagerItem
             The item with the specified Id, or None if no such item exists.
         """
-        for item in self._items:
-            if item.id == id:
-                return item
-        else:
-            return None
+        item = self._find_indexed(id)
+        if item is None:
+            item = self._find_unindexed(id)
+
+        return item
 
     @classmethod
     def factory(cls, *args, **kwargs):
@@ -259,6 +299,51 @@ class Group(HasTraits):
         """
         return partial(cls, *args, **kwargs)
 
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _get_item_index(self):
+        """ Returns the index of the first item with each id. """
+        item_index = self._item_index
+        if item_index is None:
+            item_index = self._item_index = {}
+            unindexed_items = self._items
+        else:
+            unindexed_items = self._unindexed_items
+
+        for item in unindexed_items:
+            item_index.setdefault(item.id, item)
+        self._unindexed_items = []
+
+        return item_index
+
+    def _find_indexed(self, id):
+        """ Find the item with the specified id using the index.
+
+        This is quick, but misses an item whose id has changed since the
+        index was built (the ids of items are not observable), so None means
+        that :py:meth:`_find_unindexed` should be used to make sure.
+        """
+        item = self._get_item_index().get(id)
+        if item is not None and item.id != id:
+            item = None
+
+        return item
+
+    def _find_unindexed(self, id):
+        """ Find the item with the specified id by looking at every item.
+
+        If the item is found, the index is stale and is built again when it
+        is next needed.
+        """
+        for item in self._items:
+            if item.id == id:
+                self._item_index = None
+                return item
+        else:
+            return None
+
 
 class Separator(Group):
     """ A convenience class.
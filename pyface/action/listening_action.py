@@ -15,7 +15,10 @@ import logging
 
 # Enthought library imports.
 from pyface.action.action import Action
-from traits.api import Any, Str
+from pyface.action.action_state_service import (
+    ALL_KINDS, ActionStateService, default_action_state_service
+)
+from traits.api import Any, Instance, Str
 
 # Logging.
 logger = logging.getLogger(__name__)
@@ -40,9 +43,17 @@ class ListeningAction(Action):
     #: is visible. By default, the action is always visible.
     visible_name = Str
 
+    #: The (extended) name of the attribute that determines whether the action
+    #: is checked. By default, the checked state is left to the action.
+    checked_name = Str
+
     #: The object to which the names above apply.
     object = Any
 
+    #: The service that listens to the object and evaluates the state of the
+    #: action. Actions share the listeners of the service.
+    state_service = Instance(ActionStateService)
+
     # -------------------------------------------------------------------------
     # 'Action' interface.
     # -------------------------------------------------------------------------
@@ -53,13 +64,7 @@ class ListeningAction(Action):
         Removes all the task listeners.
         """
 
-        if self.object:
-            self.object.on_trait_change(
-                self._enabled_update, self.enabled_name, remove=True
-            )
-            self.object.on_trait_change(
-                self._visible_update, self.visible_name, remove=True
-            )
+        self.state_service.unwatch(self)
 
     def perform(self, event=None):
         """ Call the appropriate function.
@@ -82,7 +87,7 @@ class ListeningAction(Action):
     def _get_attr(self, obj, name, default=None):
         """ Perform an extended look up of a dotted name. """
         try:
-            for attr in name.split('.'):
+            for attr in _split_name(name):
                 # Perform the access in the Trait name style: if the object is
                 # None, assume it simply hasn't been initialized and don't show
                 # the warning.
@@ -95,36 +100,50 @@ class ListeningAction(Action):
             return default
         return obj
 
+    def _update_listeners(self, kinds=ALL_KINDS):
+        """ Watch the names on the object and evaluate some kinds of state
+        again.
+        """
+        obj = self.object
+        names = [
+            (getattr(self, kind + '_name'), kind) for kind in ALL_KINDS
+            if getattr(self, kind + '_name')
+        ]
+        if obj is not None and names:
+            self.state_service.watch(self, obj, names)
+        else:
+            self.state_service.unwatch(self)
+        self.state_service.invalidate(self, kinds)
+
+    def _update_state(self, kinds=ALL_KINDS):
+        """ Evaluate some kinds of state ('enabled', 'visible' or 'checked')
+        of the action.
+        """
+        if 'enabled' in kinds:
+            self._enabled_update()
+        if 'visible' in kinds:
+            self._visible_update()
+        if 'checked' in kinds:
+            self._checked_update()
+
     # Trait change handlers --------------------------------------------------
 
-    def _enabled_name_changed(self, old, new):
-        obj = self.object
-        if obj is not None:
-            if old:
-                obj.on_trait_change(self._enabled_update, old, remove=True)
-            if new:
-                obj.on_trait_change(self._enabled_update, new)
-        self._enabled_update()
-
-    def _visible_name_changed(self, old, new):
-        obj = self.object
-        if obj is not None:
-            if old:
-                obj.on_trait_change(self._visible_update, old, remove=True)
-            if new:
-                obj.on_trait_change(self._visible_update, new)
-        self._visible_update()
-
-    def _object_changed(self, old, new):
-        for kind in ('enabled', 'visible'):
-            method = getattr(self, '_%s_update' % kind)
-            name = getattr(self, '%s_name' % kind)
-            if name:
-                if old:
-                    old.on_trait_change(method, name, remove=True)
-                if new:
-                    new.on_trait_change(method, name)
-            method()
+    def _enabled_name_changed(self):
+        self._update_listeners(('enabled',))
+
+    def _visible_name_changed(self):
+        self._update_listeners(('visible',))
+
+    def _checked_name_changed(self):
+        self._update_listeners(('checked',))
+
+    def _object_changed(self):
+        self._update_listeners()
+
+    def _state_service_changed(self, old, new):
+        if old is not None:
+            old.unwatch(self)
+        self._update_listeners()
 
     def _enabled_update(self):
         if self.enabled_name:
@@ -147,3 +166,30 @@ class ListeningAction(Action):
                 self.visible = False
         else:
             self.visible = True
+
+    def _checked_update(self):
+        if self.checked_name:
+            if self.object:
+                self.checked = bool(
+                    self._get_attr(self.object, self.checked_name, False)
+                )
+            else:
+                self.checked = False
+
+    # Trait initializers -----------------------------------------------------
+
+    def _state_service_default(self):
+        return default_action_state_service
+
+
+#: The names that have been split into their components.
+_split_names = {}
+
+
+def _split_name(name):
+    """ Split an extended name into its components, remembering the result.
+    """
+    components = _split_names.get(name)
+    if components is None:
+        components = _split_names[name] = name.split('.')
+    return components
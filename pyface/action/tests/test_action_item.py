@@ -90,6 +90,23 @@ class TestActionItem(unittest.TestCase, UnittestTools):
         action_item.add_to_menu(window.control, menu, None)
         window.close()
 
+    def test_add_to_menu_wrapper_destroyed(self):
+        window = Window()
+        window.open()
+        action_item = ActionItem(action=self.action)
+        menu_bar_manager = MenuBarManager()
+        menu_manager = MenuManager(name='Test')
+        menu_bar = menu_bar_manager.create_menu_bar(window.control)
+        menu = menu_manager.create_menu(menu_bar)
+        action_item.add_to_menu(window.control, menu, None)
+        self.assertEqual(len(action_item._wrappers), 1)
+
+        # Destroying the control of a wrapper forgets the wrapper.
+        wrapper = action_item._wrappers[0]
+        wrapper.control = None
+        self.assertEqual(action_item._wrappers, [])
+        window.close()
+
     def test_add_to_menu_controller(self):
         window = Window()
         window.open()
@@ -186,6 +186,42 @@ class TestActionItem(unittest.TestCase, UnittestTools):
         item = action_manager.find_item("test2/Test")
         self.assertEqual(item, self.action_item)
 
+    def test_find_item_deep_hierarchy(self):
+        action_manager = ActionManager(self.group)
+        parent = action_manager
+        for i in range(5):
+            child = ActionManager(id='level%d' % i)
+            parent.append(child)
+            parent = child
+        parent.append(self.action_item)
+
+        item = action_manager.find_item("level0/level1/level2/level3/"
+                                        "level4/Test")
+        self.assertEqual(item, self.action_item)
+        item = action_manager.find_item("level0/missing/level2/Test")
+        self.assertIsNone(item)
+
+    def test_find_item_new_id(self):
+        self.group.append(self.action_item)
+        action_manager = ActionManager(self.group)
+        self.assertEqual(action_manager.find_item("Test"), self.action_item)
+
+        self.action.id = 'Renamed'
+        self.assertEqual(action_manager.find_item("Renamed"), self.action_item)
+        self.assertIsNone(action_manager.find_item("Test"))
+
+    def test_extend(self):
+        action_manager = ActionManager()
+        action_item2 = ActionItem(action=Action(name='Action 2'))
+        with self.assertTraitChanges(action_manager, 'changed', count=1):
+            action_manager.extend([self.group, self.action_item,
+                                   action_item2])
+        default_group = action_manager._get_default_group()
+        self.assertEqual(action_manager.groups, [default_group, self.group])
+        self.assertEqual(default_group.items, [self.action_item,
+                                               action_item2])
+        self.assertEqual(action_manager.find_item("Action 2"), action_item2)
+
     def test_walk_hierarchy(self):
         action_manager = ActionManager(self.group)
         action_manager_2 = ActionManager(self.action_item, id='test2')
@@ -0,0 +1,137 @@
+from __future__ import absolute_import
+
+import gc
+
+from traits.api import Any, Bool, HasTraits
+from traits.testing.unittest_tools import unittest, UnittestTools
+
+from pyface.gui import GUI
+from ..action_state_service import ActionStateService
+from ..listening_action import ListeningAction
+
+
+class WatchedObject(HasTraits):
+
+    #: Trait to watch for enabled state
+    is_enabled = Bool(True)
+
+    #: Trait to watch for visible state
+    is_visible = Bool(True)
+
+    #: Child object to test dotted lookup
+    child = Any
+
+
+class TestActionStateService(unittest.TestCase, UnittestTools):
+
+    def setUp(self):
+        self.gui = GUI()
+        self.object = WatchedObject()
+        self.service = ActionStateService()
+
+    def create_actions(self, n, **traits):
+        return [
+            ListeningAction(
+                object=self.object, state_service=self.service, **traits
+            )
+            for i in range(n)
+        ]
+
+    def test_shared_listener(self):
+        actions = self.create_actions(
+            10, enabled_name='is_enabled', visible_name='is_visible'
+        )
+
+        # One listener for each watched trait, whatever the number of actions.
+        self.assertEqual(len(self.service._listeners), 2)
+
+        self.object.is_enabled = False
+        for action in actions:
+            self.assertFalse(action.enabled)
+            self.assertTrue(action.visible)
+
+        for action in actions:
+            action.destroy()
+        self.assertEqual(len(self.service._listeners), 0)
+
+    def test_shared_listener_extended_name(self):
+        self.object.child = WatchedObject()
+        actions = self.create_actions(3, enabled_name='child.is_enabled')
+        self.assertEqual(len(self.service._listeners), 1)
+
+        self.object.child.is_enabled = False
+        for action in actions:
+            self.assertFalse(action.enabled)
+
+    def test_deferred(self):
+        self.service.deferred = True
+        actions = self.create_actions(
+            10, enabled_name='is_enabled', visible_name='is_visible'
+        )
+        self.gui.process_events()
+        evaluations = self.service.evaluations
+
+        # A burst of changes only evaluates each action once.
+        self.object.is_enabled = False
+        self.object.is_visible = False
+        self.object.is_enabled = True
+        self.object.is_enabled = False
+        for action in actions:
+            self.assertTrue(action.enabled)
+
+        self.gui.process_events()
+        for action in actions:
+            self.assertFalse(action.enabled)
+            self.assertFalse(action.visible)
+        self.assertEqual(self.service.evaluations, evaluations + 10)
+
+    def test_deferred_kinds(self):
+        self.service.deferred = True
+        action, = self.create_actions(1, enabled_name='is_enabled')
+        self.gui.process_events()
+        action.visible = False
+
+        # Only the kinds of state which depend on the changed traits are
+        # evaluated.
+        self.object.is_enabled = False
+        self.gui.process_events()
+        self.assertFalse(action.enabled)
+        self.assertFalse(action.visible)
+
+    def test_flush(self):
+        self.service.deferred = True
+        action, = self.create_actions(1, enabled_name='is_enabled')
+        self.object.is_enabled = False
+
+        self.service.flush()
+        self.assertFalse(action.enabled)
+        self.gui.process_events()
+
+    def test_change_object(self):
+        action, = self.create_actions(1, enabled_name='is_enabled')
+        other = WatchedObject(is_enabled=False)
+
+        action.object = other
+        self.assertFalse(action.enabled)
+        self.assertEqual(len(self.service._listeners), 1)
+
+        # The old object is no longer watched.
+        with self.assertTraitDoesNotChange(action, 'enabled'):
+            self.object.is_enabled = False
+            self.object.is_enabled = True
+
+    def test_change_service(self):
+        action = ListeningAction(object=self.object, enabled_name='is_enabled')
+        action.state_service = self.service
+        self.assertEqual(len(self.service._listeners), 1)
+
+        self.object.is_enabled = False
+        self.assertFalse(action.enabled)
+        self.assertGreater(self.service.evaluations, 0)
+
+    def test_deleted_object(self):
+        self.create_actions(1, enabled_name='is_enabled')
+        self.object = None
+        gc.collect()
+
+        self.assertEqual(len(self.service._listeners), 0)
@@ -0,0 +1,98 @@
+from __future__ import absolute_import
+
+from collections import deque
+import threading
+import time
+
+from six.moves.queue import Full
+from traits.testing.unittest_tools import unittest
+
+from pyface.concurrent.api import (
+    BackgroundExecutor, CANCELLED, COMPLETED, get_executor
+)
+from ..action_event import ActionEvent
+from ..background_action import BackgroundAction
+
+
+class TestBackgroundAction(unittest.TestCase):
+
+    def setUp(self):
+        self.pending = deque()
+        self.executor = BackgroundExecutor(dispatch=self.pending.append)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def pump_until(self, condition, timeout=5.0):
+        end = time.time() + timeout
+        while not condition():
+            if time.time() > end:
+                self.fail("Timed out")
+            while self.pending:
+                self.pending.popleft()()
+            time.sleep(0.001)
+
+    def test_perform(self):
+        event = threading.Event()
+        done = []
+        action = BackgroundAction(
+            name='Test', executor=self.executor,
+            on_perform=lambda: event.wait(5.0) and 'result',
+            on_done=done.append,
+        )
+
+        action.perform(ActionEvent())
+        self.assertTrue(action.running)
+        self.assertFalse(action.enabled)
+
+        # Performing again while running does nothing.
+        future = action.future
+        action.perform(ActionEvent())
+        self.assertIs(action.future, future)
+
+        event.set()
+        self.pump_until(lambda: not action.running)
+        self.assertTrue(action.enabled)
+        self.assertEqual(future.state, COMPLETED)
+        self.assertEqual(future.result, 'result')
+        self.assertEqual(done, [future])
+
+    def test_perform_queue_full(self):
+        event = threading.Event()
+        executor = BackgroundExecutor(
+            dispatch=self.pending.append, max_workers=1, max_waiting=0,
+        )
+        self.addCleanup(executor.shutdown)
+        self.addCleanup(event.set)
+        executor.submit(event.wait, 5.0)
+        action = BackgroundAction(
+            name='Test', executor=executor, on_perform=lambda: None,
+        )
+
+        with self.assertRaises(Full):
+            action.perform(ActionEvent())
+        self.assertTrue(action.enabled)
+        self.assertIsNone(action.future)
+
+    def test_perform_none(self):
+        action = BackgroundAction(name='Test', executor=self.executor)
+        action.perform(ActionEvent())
+        self.assertIsNone(action.future)
+
+    def test_destroy(self):
+        event = threading.Event()
+        action = BackgroundAction(
+            name='Test', executor=self.executor,
+            on_perform=lambda: event.wait(5.0),
+        )
+        action.perform(ActionEvent())
+
+        action.destroy()
+        event.set()
+        self.pump_until(lambda: not action.running)
+        self.assertEqual(action.future.state, CANCELLED)
+        self.assertTrue(action.enabled)
+
+    def test_default_executor(self):
+        action = BackgroundAction(name='Test')
+        self.assertIs(action.executor, get_executor())
@@ -163,6 +163,53 @@ class TestActionItem(unittest.TestCase, UnittestTools):
         item = group.find('Not here')
         self.assertIsNone(item)
 
+    def test_find_first(self):
+        group = Group(self.action_item)
+        action_item2 = ActionItem(action=Action(name='Test'))
+        group.append(action_item2)
+        self.assertIs(group.find('Test'), self.action_item)
+
+        # Inserting an item with the same id in front replaces it.
+        action_item3 = ActionItem(action=Action(name='Test'))
+        group.insert(0, action_item3)
+        self.assertIs(group.find('Test'), action_item3)
+
+        group.remove(action_item3)
+        self.assertIs(group.find('Test'), self.action_item)
+
+    def test_find_changed_id(self):
+        group = Group(self.action_item)
+        self.assertIs(group.find('Test'), self.action_item)
+
+        self.action.id = 'Renamed'
+        self.assertIsNone(group.find('Test'))
+        self.assertIs(group.find('Renamed'), self.action_item)
+
+    def test_find_new_id(self):
+        group = Group(self.action_item)
+        self.assertIs(group.find('Test'), self.action_item)
+
+        # The item is found by its new id without looking up the old one.
+        self.action.id = 'Renamed'
+        self.assertIs(group.find('Renamed'), self.action_item)
+        self.assertIsNone(group.find('Test'))
+
+    def test_find_after_clear(self):
+        group = Group(self.action_item)
+        group.clear()
+        self.assertIsNone(group.find('Test'))
+
+        group.append(self.action_item)
+        self.assertIs(group.find('Test'), self.action_item)
+
+    def test_extend(self):
+        group = Group()
+        action_item2 = ActionItem(action=Action(name='Action 2'))
+        items = group.extend([self.action_item, action_item2])
+        self.assertEqual(items, [self.action_item, action_item2])
+        self.assertEqual(group.items, [self.action_item, action_item2])
+        self.assertIs(group.find('Action 2'), action_item2)
+
     def test_enabled_changed(self):
         group = Group(self.action_item)
         group.enabled = False
@@ -21,6 +21,9 @@ class WatchedObject(HasTraits):
     #: Other trait to watch for visible state
     is_also_visible = Bool(True)
 
+    #: Trait to watch for checked state
+    is_checked = Bool(False)
+
     #: Flag that is set when method called
     was_called = Bool
 
@@ -233,7 +236,50 @@ class TestListeningAction(unittest.TestCase, UnittestTools):
 
         self.assertFalse(action.visible)
 
+    def test_enabled_change_keeps_visible(self):
+        action = ListeningAction(object=self.object, enabled_name='is_enabled')
+        action.visible = False
+
+        # Only the enabled state depends on the trait.
+        self.object.is_enabled = False
+        self.assertFalse(action.enabled)
+        self.assertFalse(action.visible)
+
+    def test_visible_change_keeps_enabled(self):
+        action = ListeningAction(object=self.object, visible_name='is_visible')
+        action.enabled = False
+
+        # Only the visible state depends on the trait.
+        self.object.is_visible = False
+        self.assertFalse(action.visible)
+        self.assertFalse(action.enabled)
+
     def test_destroy(self):
         action = ListeningAction(object=self.object)
 
-        action.destroy()
\ No newline at end of file
+        action.destroy()
+
+    def test_checked(self):
+        action = ListeningAction(
+            object=self.object, checked_name='is_checked', style='toggle'
+        )
+
+        self.assertFalse(action.checked)
+
+        with self.assertTraitChanges(action, 'checked', 1):
+            self.object.is_checked = True
+
+        self.assertTrue(action.checked)
+
+        with self.assertTraitChanges(action, 'checked', 1):
+            action.object = None
+
+        self.assertFalse(action.checked)
+
+    def test_destroy_removes_listeners(self):
+        action = ListeningAction(object=self.object, enabled_name='is_enabled')
+
+        action.destroy()
+
+        with self.assertTraitDoesNotChange(action, 'enabled'):
+            self.object.is_enabled = False
@@ -12,60 +12,77 @@
 # Description: <Enthought pyface package component>
 #------------------------------------------------------------------------------
 
-from __future__ import absolute_import
+""" The public API of pyface.
+
+The names in this module are imported the first time they are used (see
+:py:mod:`pyface.util.lazy_api`), so that importing it does not import every
+widget module and resolve every toolkit object.
+"""
 
-from .about_dialog import AboutDialog
-from .application import Application
-from .application_window import ApplicationWindow
-from .beep import beep
-from .clipboard import clipboard, Clipboard
-from .confirmation_dialog import confirm, ConfirmationDialog
-from .constant import OK, CANCEL, YES, NO
-from .dialog import Dialog
-from .directory_dialog import DirectoryDialog
-from .file_dialog import FileDialog
-from .filter import Filter
-from .gui import GUI
-from .gui_application import GUIApplication
-from .heading_text import HeadingText
-from .image_cache import ImageCache
-from .image_resource import ImageResource
-from .key_pressed_event import KeyPressedEvent
-from .message_dialog import error, information, warning, MessageDialog
-from .progress_dialog import ProgressDialog
-from .python_editor import PythonEditor
-from .python_shell import PythonShell
-from .sorter import Sorter
-from .single_choice_dialog import choose_one, SingleChoiceDialog
-from .splash_screen import SplashScreen
-from .split_application_window import SplitApplicationWindow
-from .split_dialog import SplitDialog
-from .split_panel import SplitPanel
-from .system_metrics import SystemMetrics
-from .ui_traits import Alignment, Border, HasBorder, HasMargin, Image, Margin
-from .window import Window
-from .widget import Widget
+from __future__ import absolute_import
 
-# ----------------------------------------------------------------------------
-# Legacy and Wx-specific imports.
-# ----------------------------------------------------------------------------
+from .util.lazy_api import lazy_api
 
-# These widgets currently only have Wx implementations
-# will return Unimplemented for Qt.
+lazy_api(__name__, globals(), {
+    'AboutDialog': '.about_dialog',
+    'Application': '.application',
+    'ApplicationWindow': '.application_window',
+    'beep': '.beep',
+    'clipboard': '.clipboard',
+    'Clipboard': '.clipboard',
+    'confirm': '.confirmation_dialog',
+    'ConfirmationDialog': '.confirmation_dialog',
+    'OK': '.constant',
+    'CANCEL': '.constant',
+    'YES': '.constant',
+    'NO': '.constant',
+    'Dialog': '.dialog',
+    'DirectoryDialog': '.directory_dialog',
+    'FileDialog': '.file_dialog',
+    'Filter': '.filter',
+    'GUI': '.gui',
+    'GUIApplication': '.gui_application',
+    'HeadingText': '.heading_text',
+    'ImageCache': '.image_cache',
+    'ImageResource': '.image_resource',
+    'KeyPressedEvent': '.key_pressed_event',
+    'error': '.message_dialog',
+    'information': '.message_dialog',
+    'warning': '.message_dialog',
+    'MessageDialog': '.message_dialog',
+    'ProgressDialog': '.progress_dialog',
+    'PythonEditor': '.python_editor',
+    'PythonShell': '.python_shell',
+    'Sorter': '.sorter',
+    'choose_one': '.single_choice_dialog',
+    'SingleChoiceDialog': '.single_choice_dialog',
+    'SplashScreen': '.splash_screen',
+    'SplitApplicationWindow': '.split_application_window',
+    'SplitDialog': '.split_dialog',
+    'SplitPanel': '.split_panel',
+    'SystemMetrics': '.system_metrics',
+    'Alignment': '.ui_traits',
+    'Border': '.ui_traits',
+    'HasBorder': '.ui_traits',
+    'HasMargin': '.ui_traits',
+    'Image': '.ui_traits',
+    'Margin': '.ui_traits',
+    'Window': '.window',
+    'Widget': '.widget',
 
-from .expandable_panel import ExpandablePanel
-from .image_widget import ImageWidget
-from .layered_panel import LayeredPanel
-from .mdi_application_window import MDIApplicationWindow
-from .mdi_window_menu import MDIWindowMenu
-from .multi_toolbar_window import MultiToolbarWindow
+    # ------------------------------------------------------------------------
+    # Legacy and Wx-specific imports.
+    # ------------------------------------------------------------------------
 
-# This code isn't toolkit widget code, but is wx-specific
-from traits.etsconfig.api import ETSConfig
-if ETSConfig.toolkit == 'wx':
+    # These widgets currently only have Wx implementations
+    # will return Unimplemented for Qt.
 
-    # Fix for broken Pycrust introspect module.
-    # XXX move this somewhere better? - CJW 2017
-    from .util import fix_introspect_bug
+    'ExpandablePanel': '.expandable_panel',
+    'ImageWidget': '.image_widget',
+    'LayeredPanel': '.layered_panel',
+    'MDIApplicationWindow': '.mdi_application_window',
+    'MDIWindowMenu': '.mdi_window_menu',
+    'MultiToolbarWindow': '.multi_toolbar_window',
+})
 
-del ETSConfig
+del lazy_api
@@ -0,0 +1,240 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#------------------------------------------------------------------------------
+""" asyncio integration with the GUI event loop.
+
+After :py:func:`install_event_loop` has been called, the asyncio event loop
+of the GUI thread is run by the toolkit's event loop, so coroutines can be
+used for I/O and timed work in the GUI thread alongside the toolkit's own
+events::
+
+    from pyface.api import GUI
+    from pyface.async_loop import install_event_loop
+
+    loop = install_event_loop()
+    loop.create_task(poll_device())
+    GUI().start_event_loop()
+
+``loop.run_until_complete()`` also works, and runs the toolkit event loop
+until the future is done.  The functions in this module return asyncio
+futures which can be awaited by coroutines in the GUI thread.
+
+This module requires Python 3.4 or later.
+"""
+
+import asyncio
+import threading
+
+from pyface.constant import CANCEL
+from pyface.toolkit import toolkit_object
+
+PyfaceEventLoop = toolkit_object('async_loop:PyfaceEventLoop')
+
+
+class PyfaceEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """ An event loop policy which gives the GUI thread a PyfaceEventLoop.
+
+    Other threads get the default event loop.
+    """
+
+    def new_event_loop(self):
+        if threading.current_thread() is threading.main_thread():
+            return PyfaceEventLoop()
+        return super(PyfaceEventLoopPolicy, self).new_event_loop()
+
+
+def install_event_loop():
+    """ Make asyncio use an event loop run by the GUI in the GUI thread.
+
+    This must be called from the GUI thread, which must be the main thread.
+
+    Returns
+    -------
+    loop : PyfaceEventLoop
+        The GUI thread's event loop.
+    """
+    if not isinstance(asyncio.get_event_loop_policy(), PyfaceEventLoopPolicy):
+        asyncio.set_event_loop_policy(PyfaceEventLoopPolicy())
+    return asyncio.get_event_loop()
+
+
+def do_after(interval, callable, *args, **kwargs):
+    """ Call a callable after a delay, and return a future of its result.
+
+    This is the awaitable equivalent of :py:func:`pyface.timer.api.do_after`.
+    Cancelling the future stops the call being made.
+
+    Parameters
+    ----------
+    interval : float
+        The delay in milliseconds.
+    callable : callable
+        The callable to call.
+    *args, **kwargs :
+        Arguments to be passed through to the callable.
+
+    Returns
+    -------
+    future : asyncio.Future
+        The future of the callable's result.
+    """
+    loop = asyncio.get_event_loop()
+    future = loop.create_future()
+
+    def call():
+        if future.cancelled():
+            return
+        try:
+            result = callable(*args, **kwargs)
+        except Exception as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    handle = loop.call_later(interval / 1000.0, call)
+    future.add_done_callback(lambda future: handle.cancel())
+    return future
+
+
+def do_later(callable, *args, **kwargs):
+    """ Call a callable 50 milliseconds from now, and return a future of its
+    result.
+
+    Parameters
+    ----------
+    callable : callable
+        The callable to call.
+    *args, **kwargs :
+        Arguments to be passed through to the callable.
+
+    Returns
+    -------
+    future : asyncio.Future
+        The future of the callable's result.
+    """
+    return do_after(50, callable, *args, **kwargs)
+
+
+def open_dialog(dialog):
+    """ Open a dialog without blocking, and return a future of its return
+    code.
+
+    The dialog is opened as a non-modal dialog, so that the event loop keeps
+    running, and the future is done when the dialog is closed.  Cancelling
+    the future closes the dialog.
+
+    Parameters
+    ----------
+    dialog : IDialog
+        The dialog to open.  It must not have been created as a modal dialog.
+
+    Returns
+    -------
+    future : asyncio.Future
+        The future of the dialog's return code.
+    """
+    if dialog.control is None:
+        dialog.style = 'nonmodal'
+    elif dialog.style == 'modal':
+        raise ValueError("The dialog has already been created as modal")
+
+    loop = asyncio.get_event_loop()
+    future = loop.create_future()
+
+    def closed():
+        dialog.on_trait_change(closed, 'closed', remove=True)
+        if not future.done():
+            future.set_result(dialog.return_code)
+
+    def done(future):
+        if future.cancelled() and dialog.control is not None:
+            dialog.return_code = CANCEL
+            dialog.close()
+
+    dialog.on_trait_change(closed, 'closed')
+    future.add_done_callback(done)
+    dialog.open()
+    return future
+
+
+def gather_with_progress(dialog, awaitables):
+    """ Wait for awaitables to complete, showing progress in a dialog.
+
+    The dialog's range is set to the number of awaitables, and it is updated
+    as each one completes.  If the user cancels the dialog then the
+    awaitables which have not completed are cancelled.
+
+    Parameters
+    ----------
+    dialog : IProgressDialog
+        The progress dialog.  It is opened and closed by this function.
+    awaitables : iterable
+        The coroutines and futures to wait for.
+
+    Returns
+    -------
+    future : asyncio.Future
+        The future of the list of results, in the order of the awaitables.
+        The future is cancelled if the dialog is cancelled, and gets the
+        first exception raised by any of the awaitables.
+    """
+    loop = asyncio.get_event_loop()
+    futures = [
+        asyncio.ensure_future(awaitable, loop=loop)
+        for awaitable in awaitables
+    ]
+    result = loop.create_future()
+    if not futures:
+        result.set_result([])
+        return result
+
+    count = [0]
+
+    def update(future):
+        if result.done():
+            return
+
+        if future.cancelled():
+            result.cancel()
+            return
+
+        if future.exception() is not None:
+            result.set_exception(future.exception())
+            return
+
+        count[0] += 1
+        if count[0] == len(futures):
+            result.set_result([future.result() for future in futures])
+
+        cont, skip = dialog.update(count[0])
+        if cont is False:
+            result.cancel()
+
+    def closed():
+        # The dialog was closed by the user before everything completed.
+        if not result.done():
+            result.cancel()
+
+    def done(result):
+        dialog.on_trait_change(closed, 'closed', remove=True)
+        for future in futures:
+            future.cancel()
+        if dialog.control is not None:
+            dialog.close()
+
+    dialog.min = 0
+    dialog.max = len(futures)
+    dialog.open()
+    dialog.on_trait_change(closed, 'closed')
+    result.add_done_callback(done)
+    for future in futures:
+        future.add_done_callback(update)
+
+    return result
@@ -52,16 +52,24 @@ to load toolkits:
   and `null` last.
 
 - finally, if all else fails, we try to load the null toolkit.
+
+Scanning entry points requires importing :py:mod:`pkg_resources`, which is
+slow, so the toolkits which are built in to a package can be registered in
+:py:data:`STATIC_TOOLKITS`.  These are loaded directly, without scanning the
+entry points, and the entry points are only scanned if none of the registered
+toolkits can be loaded.
 """
 
+from importlib import import_module
 import logging
 import os
-import pkg_resources
 import sys
 
-from traits.api import HasTraits, List, ReadOnly, Str, TraitError
+from traits.api import Dict, HasTraits, List, ReadOnly, Str, TraitError
 from traits.etsconfig.api import ETSConfig
 
+from pyface.util import startup_profiler
+
 
 try:
     provisional_toolkit = ETSConfig.provisional_toolkit
@@ -98,6 +106,19 @@ TOOLKIT_PRIORITIES = {
 }
 default_priorities = lambda plugin: TOOLKIT_PRIORITIES.get(plugin.name, 0)
 
+#: The toolkits built in to ETS packages, which can be loaded without scanning
+#: their entry points.  This maps entry point names to dictionaries which map
+#: toolkit names to the 'module:object' location of their toolkit objects, and
+#: should match the entry points declared in the packages' setup.py.
+STATIC_TOOLKITS = {
+    'pyface.toolkits': {
+        'qt4': 'pyface.ui.qt4.init:toolkit_object',
+        'qt': 'pyface.ui.qt4.init:toolkit_object',
+        'wx': 'pyface.ui.wx.init:toolkit_object',
+        'null': 'pyface.ui.null.init:toolkit_object',
+    },
+}
+
 
 class Toolkit(HasTraits):
     """ A basic toolkit implementation for use by specific toolkits.
@@ -116,6 +137,9 @@ class Toolkit(HasTraits):
     #: The packages to look in for implementations.
     packages = List(Str)
 
+    #: The toolkit objects which have already been found, keyed by name.
+    _objects = Dict(Str)
+
     def __init__(self, package, toolkit, *packages, **traits):
         super(Toolkit, self).__init__(
             package=package,
@@ -133,8 +157,21 @@ class Toolkit(HasTraits):
             The name consists of the relative module path and the object name
             separated by a colon.
         """
-        from importlib import import_module
+        obj = self._objects.get(name)
+        if obj is None:
+            if startup_profiler.current_profiler is not None:
+                with startup_profiler.measure(
+                        'toolkit', '{}.{}:{}'.format(self.package,
+                                                     self.toolkit, name)):
+                    obj = self._find_object(name)
+            else:
+                obj = self._find_object(name)
+            self._objects[name] = obj
 
+        return obj
+
+    def _find_object(self, name):
+        """ Return the toolkit specific object with the given name. """
         mname, oname = name.split(':')
         if not mname.startswith('.'):
             mname = '.' + mname
@@ -179,10 +216,19 @@ class Toolkit(HasTraits):
 
         return Unimplemented
 
+    def _packages_changed(self):
+        self._objects = {}
+
+    def _packages_items_changed(self):
+        self._objects = {}
+
 
 def import_toolkit(toolkit_name, entry_point='pyface.toolkits'):
     """ Attempt to import an toolkit specified by an entry point.
 
+    Toolkits registered in :py:data:`STATIC_TOOLKITS` are loaded without
+    scanning the entry points.
+
     Parameters
     ----------
     toolkit_name : str
@@ -201,7 +247,11 @@ def import_toolkit(toolkit_name, entry_point='pyface.toolkits'):
         If no toolkit is found, or if the toolkit cannot be loaded for some
         reason.
     """
-    plugins = list(pkg_resources.iter_entry_points(entry_point, toolkit_name))
+    toolkit_object = _import_static_toolkit(toolkit_name, entry_point)
+    if toolkit_object is not None:
+        return toolkit_object
+
+    plugins = _iter_entry_points(entry_point, toolkit_name)
     if len(plugins) == 0:
         msg = 'No {} plugin found for toolkit {}'
         msg = msg.format(entry_point, toolkit_name)
@@ -262,9 +312,35 @@ def find_toolkit(entry_point, toolkits=None, priorities=default_priorities):
     if ETSConfig.toolkit:
         return import_toolkit(ETSConfig.toolkit, entry_point)
 
+    # Try the preferred built-in toolkits before scanning the entry points.
+    tried = set()
+    if priorities is default_priorities:
+        static_toolkits = STATIC_TOOLKITS.get(entry_point, {})
+        preferred = sorted(
+            (name for name in static_toolkits
+             if TOOLKIT_PRIORITIES.get(name, 0) < 0 and
+             (toolkits is None or name in toolkits)),
+            key=TOOLKIT_PRIORITIES.get
+        )
+        for name in preferred:
+            tried.add((name, static_toolkits[name].split(':')[0]))
+            try:
+                with ETSConfig.provisional_toolkit(name):
+                    toolkit = _import_static_toolkit(name, entry_point)
+                    if toolkit is None:
+                        raise RuntimeError(
+                            "Could not load static toolkit %r" % name
+                        )
+                    return toolkit
+            except (ImportError, AttributeError, RuntimeError) as exc:
+                msg = "Could not load %s toolkit %r from %r"
+                logger.info(msg, entry_point, name, static_toolkits[name])
+                logger.debug(exc, exc_info=True)
+
     entry_points = [
-        plugin for plugin in pkg_resources.iter_entry_points(entry_point)
-        if toolkits is None or plugin.name in toolkits
+        plugin for plugin in _iter_entry_points(entry_point)
+        if (toolkits is None or plugin.name in toolkits) and
+        (plugin.name, plugin.module_name) not in tried
     ]
     for plugin in sorted(entry_points, key=priorities):
         try:
@@ -281,3 +357,33 @@ def find_toolkit(entry_point, toolkits=None, priorities=default_priorities):
         return import_toolkit('null', entry_point)
 
     raise TraitError("Could not import any {} toolkit.".format(entry_point))
+
+
+def _import_static_toolkit(toolkit_name, entry_point):
+    """ Import a toolkit registered in STATIC_TOOLKITS.
+
+    Returns None if the toolkit is not registered or can't be imported.
+    """
+    location = STATIC_TOOLKITS.get(entry_point, {}).get(toolkit_name)
+    if location is None:
+        return None
+
+    module_name, object_name = location.split(':')
+    try:
+        module = import_module(module_name)
+        return getattr(module, object_name)
+    except (ImportError, AttributeError) as exc:
+        msg = "Could not load static toolkit %r from %r"
+        logger.info(msg, toolkit_name, location)
+        logger.debug(exc, exc_info=True)
+        return None
+
+
+def _iter_entry_points(entry_point, toolkit_name=None):
+    """ Return a list of the plugins for an entry point.
+
+    This is the only place which imports pkg_resources, which is slow.
+    """
+    with startup_profiler.measure('entry_points', entry_point):
+        import pkg_resources
+        return list(pkg_resources.iter_entry_points(entry_point, toolkit_name))
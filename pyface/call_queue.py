@@ -0,0 +1,148 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#------------------------------------------------------------------------------
+""" A queue of calls to be made on the GUI thread.
+
+This is the toolkit-independent part of ``GUI.invoke_later`` and
+``GUI.set_trait_later``.  Calls can be added from any thread, and the toolkit
+is only asked to wake up the GUI thread when the queue goes from empty to
+non-empty, so a burst of calls costs a single toolkit event.  The GUI thread
+then makes many calls each time it drains the queue.
+"""
+
+from collections import deque
+import logging
+from threading import Lock
+from timeit import default_timer as clock
+
+
+logger = logging.getLogger(__name__)
+
+
+class CallQueue(object):
+    """ A queue of calls, added from any thread and made in batches.
+
+    Trait assignments made with :py:meth:`set_trait` are coalesced: if a
+    trait of an object is set again before the queue has got to the first
+    assignment, only the latest value is assigned, in the place of the first
+    assignment.
+
+    Parameters
+    ----------
+    wake : callable
+        A callable, which must be safe to call from any thread, which arranges
+        for :py:meth:`drain` to be called in the GUI thread.
+    max_calls : int or None
+        The maximum number of calls to make each time the queue is drained,
+        or None for no limit.
+    max_time : float or None
+        The time in seconds after which draining the queue stops, or None for
+        no limit.
+    """
+
+    def __init__(self, wake, max_calls=None, max_time=None):
+        self.wake = wake
+        self.max_calls = max_calls
+        self.max_time = max_time
+
+        # The queued calls, as (callable, args, kwargs) tuples, or
+        # (None, key, None) tuples for the trait assignments in '_traits'.
+        # Appending to and popping from a deque are atomic.
+        self._calls = deque()
+
+        # Maps (id(object), trait name) keys to the [object, trait name,
+        # value] of the pending assignments.
+        self._traits = {}
+
+        # Whether a wake-up has been requested and not yet handled.
+        self._scheduled = False
+
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._calls)
+
+    ###########################################################################
+    # 'CallQueue' interface.
+    ###########################################################################
+
+    def call(self, callable, *args, **kw):
+        """ Queue a call to be made in the GUI thread. """
+        self._calls.append((callable, args, kw))
+        self._schedule()
+
+    def set_trait(self, obj, trait_name, new):
+        """ Queue a trait assignment to be made in the GUI thread. """
+        key = (id(obj), trait_name)
+        with self._lock:
+            pending = self._traits.get(key)
+            if pending is not None and pending[0] is obj:
+                pending[2] = new
+                return
+
+            self._traits[key] = [obj, trait_name, new]
+
+        self._calls.append((None, key, None))
+        self._schedule()
+
+    def drain(self):
+        """ Make the queued calls, up to the limits of the queue.
+
+        This must be called in the GUI thread.  If calls are left in the queue
+        when a limit is reached then another wake-up is requested, so that
+        other GUI events can be handled in between.
+
+        Returns
+        -------
+        count : int
+            The number of calls made.
+        """
+        with self._lock:
+            self._scheduled = False
+
+        calls = self._calls
+        max_calls = self.max_calls
+        deadline = None if self.max_time is None else clock() + self.max_time
+        count = 0
+        while calls:
+            if max_calls is not None and count >= max_calls:
+                break
+            if deadline is not None and count > 0 and clock() > deadline:
+                break
+
+            callable, args, kw = calls.popleft()
+            count += 1
+            try:
+                if callable is None:
+                    with self._lock:
+                        obj, trait_name, new = self._traits.pop(args)
+                    setattr(obj, trait_name, new)
+                else:
+                    callable(*args, **kw)
+            except Exception:
+                logger.exception("Exception in call made in the GUI thread")
+
+        if calls:
+            self._schedule()
+
+        return count
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _schedule(self):
+        """ Request a wake-up, unless one is already pending. """
+        with self._lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+
+        self.wake()
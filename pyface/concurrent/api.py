@@ -0,0 +1,19 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+from .background_executor import BackgroundExecutor, get_executor
+from .background_future import (
+    BackgroundFuture, CANCELLED, CANCELLING, COMPLETED, EXECUTING, FAILED,
+    JobCancelled, WAITING
+)
+from .progress import show_progress
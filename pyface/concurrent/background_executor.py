@@ -0,0 +1,321 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#------------------------------------------------------------------------------
+""" An executor which runs jobs off the GUI thread and reports back to it.
+
+The executor wraps a ``concurrent.futures`` thread or process pool (on Python
+2 this needs the ``futures`` backport).  Jobs are submitted from the GUI
+thread, and each gets a :py:class:`BackgroundFuture` whose traits are only
+ever changed in the GUI thread.  The results, and the progress reported by
+jobs, are delivered through a :py:class:`~pyface.call_queue.CallQueue`, so a
+burst of updates costs a single toolkit event and progress updates which the
+GUI thread hasn't got to yet are coalesced.
+"""
+
+from __future__ import absolute_import
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+import multiprocessing
+import threading
+import traceback
+
+from six.moves.queue import Full
+from traits.api import (
+    Any, Bool, Callable, Either, Enum, HasStrictTraits, Instance, Int, List,
+    Property
+)
+
+from pyface.call_queue import CallQueue
+from .background_future import (
+    BackgroundFuture, CANCELLED, CANCELLING, COMPLETED, EXECUTING, FAILED,
+    JobCancelled, WAITING
+)
+
+
+#: The executor shared by code which is not given one.
+_shared_executor = None
+
+
+def get_executor():
+    """ Return the thread pool executor shared by the application.
+
+    The executor is created the first time this is called.
+    """
+    global _shared_executor
+
+    if _shared_executor is None or not _shared_executor.running:
+        _shared_executor = BackgroundExecutor()
+    return _shared_executor
+
+
+def _gui_invoke_later(callable):
+    """ Call a callable in the GUI thread with GUI.invoke_later. """
+    from pyface.gui import GUI
+
+    GUI.invoke_later(callable)
+
+
+class BackgroundExecutor(HasStrictTraits):
+    """ Runs jobs in a thread or process pool, and reports their progress
+    and results in the GUI thread.
+
+    At most ``max_workers`` jobs are handed to the pool at a time, and the
+    others wait in the executor, where they can be cancelled cheaply.  The
+    executor's methods must be called in the GUI thread.
+    """
+
+    #: Whether to run jobs in threads or in processes.  Jobs run in processes
+    #: must be picklable, and can't report progress.
+    kind = Enum('thread', 'process')
+
+    #: The maximum number of jobs which run at once.
+    max_workers = Int
+
+    #: The maximum number of jobs which can be waiting for a worker, or None
+    #: for no limit.
+    max_waiting = Either(None, Int)
+
+    #: A callable which calls a callable in the GUI thread, from any thread.
+    #: This defaults to ``GUI.invoke_later``.
+    dispatch = Callable(_gui_invoke_later)
+
+    #: The futures of the jobs which have not finished.
+    futures = List(Instance(BackgroundFuture))
+
+    #: Whether the executor accepts jobs.
+    running = Property(Bool)
+
+    # Private interface ------------------------------------------------------
+
+    #: The concurrent.futures executor, created when first needed.
+    _pool = Any
+
+    #: The futures of the jobs waiting for a worker.
+    _waiting = Instance(deque, ())
+
+    #: The number of jobs handed to the pool which have not finished.
+    _executing = Int
+
+    #: The queue of calls to make in the GUI thread.
+    _call_queue = Instance(CallQueue)
+
+    #: Whether the executor has been shut down.
+    _shut_down = Bool(False)
+
+    # -------------------------------------------------------------------------
+    # 'object' interface
+    # -------------------------------------------------------------------------
+
+    def __init__(self, **traits):
+        super(BackgroundExecutor, self).__init__(**traits)
+        # This is created up front, since workers use it.
+        self._call_queue = CallQueue(self._wake)
+
+    # -------------------------------------------------------------------------
+    # 'BackgroundExecutor' interface
+    # -------------------------------------------------------------------------
+
+    def submit(self, callable, *args, **kwargs):
+        """ Submit a job.
+
+        Parameters
+        ----------
+        callable : callable
+            The callable to call in a worker.
+        *args, **kwargs :
+            Arguments to be passed to the callable.
+
+        Returns
+        -------
+        future : BackgroundFuture
+            The future of the job.
+
+        Raises
+        ------
+        queue.Full
+            If ``max_waiting`` jobs are already waiting.
+        RuntimeError
+            If the executor has been shut down.
+        """
+        return self._submit(callable, args, kwargs, False)
+
+    def submit_progress(self, callable, *args, **kwargs):
+        """ Submit a job which reports its progress.
+
+        The callable is passed an extra ``progress`` keyword argument, a
+        callable which it can call from the worker with any value to set the
+        future's ``progress`` trait.  Once cancellation has been requested,
+        calling ``progress`` raises :py:class:`JobCancelled`.  Only thread
+        executors can run jobs which report progress.
+
+        Parameters
+        ----------
+        callable : callable
+            The callable to call in a worker.
+        *args, **kwargs :
+            Arguments to be passed to the callable.
+
+        Returns
+        -------
+        future : BackgroundFuture
+            The future of the job.
+        """
+        if self.kind != 'thread':
+            raise ValueError("Only thread executors can report progress")
+
+        return self._submit(callable, args, kwargs, True)
+
+    def call_in_gui_thread(self, callable, *args, **kwargs):
+        """ Call a callable in the GUI thread, from any thread.
+
+        The call is made in order with the executor's updates of its futures,
+        so for example output sent by a job this way arrives before the job's
+        future is done.
+        """
+        self._call_queue.call(callable, *args, **kwargs)
+
+    def shutdown(self, wait=True):
+        """ Cancel every job, and stop accepting new ones.
+
+        Parameters
+        ----------
+        wait : bool
+            Whether to wait for the running jobs to finish.  If so, the
+            futures are all done when this returns.
+        """
+        if self._shut_down:
+            return
+
+        for future in list(self.futures):
+            future.cancel()
+        self._shut_down = True
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            if wait:
+                self._call_queue.drain()
+
+    # -------------------------------------------------------------------------
+    # Private interface
+    # -------------------------------------------------------------------------
+
+    def _submit(self, callable, args, kwargs, report_progress):
+        """ Create the future for a job, and start it if a worker is free. """
+        if self._shut_down:
+            raise RuntimeError("The executor has been shut down")
+
+        if (self.max_waiting is not None
+                and self._executing >= self.max_workers
+                and len(self._waiting) >= self.max_waiting):
+            raise Full("Too many jobs are waiting")
+
+        future = BackgroundFuture(
+            _executor=self, _cancel_event=threading.Event(),
+        )
+        if report_progress:
+            kwargs = dict(kwargs)
+            kwargs['progress'] = partial(self._report_progress, future)
+        future._job = (callable, args, kwargs)
+
+        self.futures.append(future)
+        self._waiting.append(future)
+        self._start_waiting()
+        return future
+
+    def _start_waiting(self):
+        """ Hand waiting jobs to the pool while there are free workers. """
+        while self._waiting and self._executing < self.max_workers:
+            future = self._waiting.popleft()
+            callable, args, kwargs = future._job
+            future._job = None
+            future.state = EXECUTING
+            self._executing += 1
+            concurrent_future = self._get_pool().submit(
+                callable, *args, **kwargs
+            )
+            future._concurrent_future = concurrent_future
+            concurrent_future.add_done_callback(
+                partial(self._concurrent_future_done, future)
+            )
+
+    def _cancel(self, future):
+        """ Cancel the job of a future; called by BackgroundFuture.cancel. """
+        future._cancel_event.set()
+        if future.state == WAITING:
+            self._waiting.remove(future)
+            future._job = None
+            self.futures.remove(future)
+            future.state = CANCELLED
+        else:
+            future.state = CANCELLING
+            # This succeeds if the pool hasn't started the job yet.
+            future._concurrent_future.cancel()
+
+    def _report_progress(self, future, value):
+        """ Report progress from a job; called in the worker. """
+        if future._cancel_event.is_set():
+            raise JobCancelled()
+        self._call_queue.set_trait(future, 'progress', value)
+
+    def _concurrent_future_done(self, future, concurrent_future):
+        """ Called in a worker or the pool's thread when a job finishes. """
+        self._call_queue.call(self._job_done, future, concurrent_future)
+
+    def _job_done(self, future, concurrent_future):
+        """ Update the future of a finished job, in the GUI thread. """
+        self._executing -= 1
+        self.futures.remove(future)
+        future._concurrent_future = None
+
+        if concurrent_future.cancelled() or future.state == CANCELLING:
+            future.state = CANCELLED
+        else:
+            exception = concurrent_future.exception()
+            if exception is None:
+                future.result = concurrent_future.result()
+                future.state = COMPLETED
+            elif isinstance(exception, JobCancelled):
+                future.state = CANCELLED
+            else:
+                future.exception = exception
+                future.traceback = ''.join(traceback.format_exception(
+                    type(exception), exception,
+                    getattr(exception, '__traceback__', None),
+                ))
+                future.state = FAILED
+
+        if not self._shut_down:
+            self._start_waiting()
+
+    def _wake(self):
+        """ Arrange for the call queue to be drained in the GUI thread. """
+        self.dispatch(self._call_queue.drain)
+
+    def _get_pool(self):
+        if self._pool is None:
+            if self.kind == 'thread':
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers
+                )
+        return self._pool
+
+    # Trait property handlers ------------------------------------------------
+
+    def _get_running(self):
+        return not self._shut_down
+
+    # Trait default methods --------------------------------------------------
+
+    def _max_workers_default(self):
+        return multiprocessing.cpu_count()
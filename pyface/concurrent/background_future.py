@@ -0,0 +1,129 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#------------------------------------------------------------------------------
+""" The traits-based future of a job run by a BackgroundExecutor. """
+
+from traits.api import Any, Bool, Enum, HasStrictTraits, Property, Str
+
+#: The job is waiting for a worker.
+WAITING = 'waiting'
+
+#: The job is running.
+EXECUTING = 'executing'
+
+#: The job completed and its result is available.
+COMPLETED = 'completed'
+
+#: The job raised an exception.
+FAILED = 'failed'
+
+#: Cancellation has been requested, but the job is still running.
+CANCELLING = 'cancelling'
+
+#: The job was cancelled.
+CANCELLED = 'cancelled'
+
+#: The states in which a future's job has finished.
+DONE_STATES = frozenset([COMPLETED, FAILED, CANCELLED])
+
+#: The states in which a future's job can be cancelled.
+CANCELLABLE_STATES = frozenset([WAITING, EXECUTING])
+
+
+class JobCancelled(Exception):
+    """ Raised by a job's progress callable when the job has been cancelled.
+
+    Jobs which report progress can also raise this themselves to show that
+    they have stopped because of a cancellation request.
+    """
+
+
+class BackgroundFuture(HasStrictTraits):
+    """ The future of a job run by a BackgroundExecutor.
+
+    The traits of the future are only ever changed in the GUI thread, so
+    they can be listened to by views and other GUI code.  The ``result`` and
+    ``exception`` are set before the ``state`` changes to ``COMPLETED`` or
+    ``FAILED``.
+    """
+
+    #: The state of the job.
+    state = Enum(
+        WAITING, [WAITING, EXECUTING, COMPLETED, FAILED, CANCELLING,
+                  CANCELLED],
+    )
+
+    #: The value returned by the job, once it has completed.
+    result = Any
+
+    #: The exception raised by the job, if it failed.
+    exception = Any
+
+    #: The formatted traceback of the exception, if available.
+    traceback = Str
+
+    #: The most recent progress reported by the job.  Progress reported
+    #: more quickly than the GUI thread handles it is coalesced, so only the
+    #: most recent value is seen.
+    progress = Any
+
+    #: Whether the job has finished, successfully or not.
+    done = Property(Bool, depends_on='state')
+
+    #: Whether the job can be cancelled.
+    cancellable = Property(Bool, depends_on='state')
+
+    # Private interface ------------------------------------------------------
+
+    #: The executor running the job.
+    _executor = Any
+
+    #: A threading.Event which is set when cancellation is requested.
+    _cancel_event = Any
+
+    #: The concurrent.futures Future of the job, once submitted to a pool.
+    _concurrent_future = Any
+
+    #: The (callable, args, kwargs) of the job.
+    _job = Any
+
+    # -------------------------------------------------------------------------
+    # 'BackgroundFuture' interface
+    # -------------------------------------------------------------------------
+
+    def cancel(self):
+        """ Request cancellation of the job.
+
+        A job which is waiting is cancelled straight away.  A running job
+        can't be interrupted: the state changes to ``CANCELLING`` and any
+        result is discarded, and a job which reports progress gets
+        :py:class:`JobCancelled` raised the next time it does so.  This must
+        be called in the GUI thread.
+
+        Returns
+        -------
+        cancelled : bool
+            Whether the job was cancellable.
+        """
+        if not self.cancellable:
+            return False
+
+        self._executor._cancel(self)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Private interface
+    # -------------------------------------------------------------------------
+
+    def _get_done(self):
+        return self.state in DONE_STATES
+
+    def _get_cancellable(self):
+        return self.state in CANCELLABLE_STATES
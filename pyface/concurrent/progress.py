@@ -0,0 +1,53 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#------------------------------------------------------------------------------
+""" Showing the progress of background jobs in a progress dialog. """
+
+
+def show_progress(future, dialog):
+    """ Show the progress of a background job in a progress dialog.
+
+    The dialog is opened, updated with each progress value (which should be
+    a number between the dialog's ``min`` and ``max``) seen by the future,
+    and closed when the job is done.  If the user cancels or closes the
+    dialog then the job is cancelled.
+
+    Parameters
+    ----------
+    future : BackgroundFuture
+        The future of a job submitted with ``submit_progress``.
+    dialog : IProgressDialog
+        The progress dialog, which should not be open yet.
+    """
+
+    def progress_updated(value):
+        if value is None or dialog.control is None:
+            return
+        cont, skip = dialog.update(value)
+        if cont is False:
+            future.cancel()
+
+    def closed():
+        if not future.done:
+            future.cancel()
+
+    def state_updated():
+        if future.done:
+            future.on_trait_change(progress_updated, 'progress', remove=True)
+            future.on_trait_change(state_updated, 'state', remove=True)
+            dialog.on_trait_change(closed, 'closed', remove=True)
+            if dialog.control is not None:
+                dialog.close()
+
+    dialog.open()
+    future.on_trait_change(progress_updated, 'progress')
+    future.on_trait_change(state_updated, 'state')
+    dialog.on_trait_change(closed, 'closed')
+    state_updated()
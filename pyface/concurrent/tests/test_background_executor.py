@@ -0,0 +1,316 @@
+from __future__ import absolute_import
+
+from collections import deque
+import threading
+import time
+
+from six.moves.queue import Full
+from traits.api import Any, Event, HasTraits, Int
+from traits.testing.unittest_tools import unittest, UnittestTools
+
+from ..background_executor import BackgroundExecutor, get_executor
+from ..background_future import (
+    CANCELLED, CANCELLING, COMPLETED, EXECUTING, FAILED, JobCancelled,
+    WAITING
+)
+from ..progress import show_progress
+
+
+def square(x):
+    return x * x
+
+
+def fail():
+    raise ZeroDivisionError("failed")
+
+
+def wait_for(event, result=None):
+    event.wait(5.0)
+    return result
+
+
+def count_up(n, barrier, progress):
+    for i in range(n):
+        progress(i)
+    barrier.wait(5.0)
+    return n
+
+
+def count_until_cancelled(started, progress):
+    started.set()
+    while True:
+        progress(0)
+        time.sleep(0.001)
+
+
+class FakeProgressDialog(HasTraits):
+
+    control = Any
+
+    closed = Event
+
+    cancel_at = Int(-1)
+
+    def __init__(self, **traits):
+        super(FakeProgressDialog, self).__init__(**traits)
+        self.values = []
+
+    def open(self):
+        self.control = object()
+
+    def close(self):
+        self.control = None
+        self.closed = self
+
+    def update(self, value):
+        self.values.append(value)
+        return value != self.cancel_at, False
+
+
+class ExecutorTestCase(unittest.TestCase, UnittestTools):
+    """ Base class for tests, with the test thread as the GUI thread. """
+
+    def setUp(self):
+        self.pending = deque()
+        self.executor = BackgroundExecutor(
+            dispatch=self.pending.append, max_workers=2,
+        )
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def pump_until(self, condition, timeout=5.0):
+        """ Make the calls dispatched to the 'GUI thread' until a condition
+        is true.
+        """
+        end = time.time() + timeout
+        while not condition():
+            if time.time() > end:
+                self.fail("Timed out")
+            while self.pending:
+                self.pending.popleft()()
+            time.sleep(0.001)
+
+
+class TestBackgroundExecutor(ExecutorTestCase):
+
+    def test_submit(self):
+        future = self.executor.submit(square, 3)
+
+        self.assertEqual(future.state, EXECUTING)
+        self.assertFalse(future.done)
+        self.assertEqual(self.executor.futures, [future])
+
+        self.pump_until(lambda: future.done)
+        self.assertEqual(future.state, COMPLETED)
+        self.assertEqual(future.result, 9)
+        self.assertIsNone(future.exception)
+        self.assertEqual(self.executor.futures, [])
+
+    def test_state_changes_in_gui_thread(self):
+        threads = []
+        future = self.executor.submit(square, 3)
+        future.on_trait_change(
+            lambda: threads.append(threading.current_thread()), 'state'
+        )
+
+        self.pump_until(lambda: future.done)
+        self.assertEqual(threads, [threading.current_thread()])
+
+    def test_failure(self):
+        future = self.executor.submit(fail)
+
+        self.pump_until(lambda: future.done)
+        self.assertEqual(future.state, FAILED)
+        self.assertIsInstance(future.exception, ZeroDivisionError)
+        self.assertIn('ZeroDivisionError: failed', future.traceback)
+
+    def test_workers_limited(self):
+        event = threading.Event()
+        futures = [
+            self.executor.submit(wait_for, event, i) for i in range(5)
+        ]
+
+        self.assertEqual(
+            [future.state for future in futures],
+            [EXECUTING, EXECUTING, WAITING, WAITING, WAITING],
+        )
+
+        event.set()
+        self.pump_until(lambda: all(future.done for future in futures))
+        self.assertEqual(
+            [future.result for future in futures], [0, 1, 2, 3, 4]
+        )
+
+    def test_max_waiting(self):
+        self.executor.max_waiting = 1
+        event = threading.Event()
+        self.executor.submit(wait_for, event)
+        self.executor.submit(wait_for, event)
+        self.executor.submit(wait_for, event)
+
+        with self.assertRaises(Full):
+            self.executor.submit(wait_for, event)
+        event.set()
+
+    def test_cancel_waiting(self):
+        event = threading.Event()
+        self.executor.submit(wait_for, event)
+        self.executor.submit(wait_for, event)
+        future = self.executor.submit(wait_for, event)
+
+        self.assertTrue(future.cancel())
+        self.assertEqual(future.state, CANCELLED)
+        self.assertNotIn(future, self.executor.futures)
+        self.assertFalse(future.cancel())
+        event.set()
+
+    def test_cancel_executing(self):
+        event = threading.Event()
+        future = self.executor.submit(wait_for, event, 1)
+
+        self.assertTrue(future.cancel())
+        self.assertEqual(future.state, CANCELLING)
+        self.assertFalse(future.cancellable)
+
+        event.set()
+        self.pump_until(lambda: future.done)
+        self.assertEqual(future.state, CANCELLED)
+        self.assertIsNone(future.result)
+
+    def test_progress(self):
+        barrier = threading.Event()
+        future = self.executor.submit_progress(count_up, 1000, barrier)
+
+        # Progress is coalesced, so the last value is seen, but there are
+        # far fewer changes than calls.
+        with self.assertTraitChanges(future, 'progress') as result:
+            self.pump_until(lambda: future.progress == 999)
+        self.assertLess(len(result.events), 1000)
+
+        barrier.set()
+        self.pump_until(lambda: future.done)
+        self.assertEqual(future.result, 1000)
+
+    def test_progress_cancelled(self):
+        started = threading.Event()
+        future = self.executor.submit_progress(count_until_cancelled, started)
+        started.wait(5.0)
+
+        future.cancel()
+        self.pump_until(lambda: future.done)
+        self.assertEqual(future.state, CANCELLED)
+
+    def test_job_cancelled(self):
+        def cancelled():
+            raise JobCancelled()
+
+        future = self.executor.submit(cancelled)
+        self.pump_until(lambda: future.done)
+        self.assertEqual(future.state, CANCELLED)
+
+    def test_progress_needs_threads(self):
+        executor = BackgroundExecutor(kind='process')
+        with self.assertRaises(ValueError):
+            executor.submit_progress(count_up, 10, None)
+
+    def test_call_in_gui_thread(self):
+        calls = []
+
+        def job():
+            self.executor.call_in_gui_thread(
+                calls.append, threading.current_thread()
+            )
+
+        future = self.executor.submit(job)
+        future.on_trait_change(lambda: calls.append('done'), 'state')
+        self.pump_until(lambda: future.done)
+
+        self.assertEqual(len(calls), 2)
+        self.assertIsNot(calls[0], threading.current_thread())
+        self.assertEqual(calls[1], 'done')
+
+    def test_shutdown(self):
+        event = threading.Event()
+        futures = [self.executor.submit(wait_for, event) for i in range(3)]
+        event.set()
+
+        self.executor.shutdown()
+
+        self.assertFalse(self.executor.running)
+        self.assertTrue(all(future.state == CANCELLED for future in futures))
+        with self.assertRaises(RuntimeError):
+            self.executor.submit(square, 2)
+
+    def test_get_executor(self):
+        executor = get_executor()
+        self.assertIs(get_executor(), executor)
+        self.assertEqual(executor.kind, 'thread')
+
+
+class TestProcessExecutor(ExecutorTestCase):
+
+    def setUp(self):
+        super(TestProcessExecutor, self).setUp()
+        self.executor.kind = 'process'
+
+    def test_submit(self):
+        futures = [self.executor.submit(square, i) for i in range(4)]
+
+        self.pump_until(lambda: all(future.done for future in futures))
+        self.assertEqual([future.result for future in futures], [0, 1, 4, 9])
+
+    def test_failure(self):
+        future = self.executor.submit(fail)
+
+        self.pump_until(lambda: future.done)
+        self.assertEqual(future.state, FAILED)
+        self.assertIsInstance(future.exception, ZeroDivisionError)
+
+
+class TestShowProgress(ExecutorTestCase):
+
+    def test_show_progress(self):
+        barrier = threading.Event()
+        dialog = FakeProgressDialog()
+        future = self.executor.submit_progress(count_up, 10, barrier)
+
+        show_progress(future, dialog)
+        self.assertIsNotNone(dialog.control)
+
+        self.pump_until(lambda: future.progress == 9)
+        barrier.set()
+        self.pump_until(lambda: future.done)
+
+        self.assertEqual(dialog.values[-1], 9)
+        self.assertIsNone(dialog.control)
+
+    def test_show_progress_cancelled(self):
+        started = threading.Event()
+        dialog = FakeProgressDialog(cancel_at=0)
+        future = self.executor.submit_progress(count_until_cancelled, started)
+
+        show_progress(future, dialog)
+        self.pump_until(lambda: future.done)
+
+        self.assertEqual(future.state, CANCELLED)
+        self.assertIsNone(dialog.control)
+
+    def test_show_progress_closed(self):
+        started = threading.Event()
+        dialog = FakeProgressDialog()
+        future = self.executor.submit_progress(count_until_cancelled, started)
+
+        show_progress(future, dialog)
+        dialog.close()
+        self.pump_until(lambda: future.done)
+
+        self.assertEqual(future.state, CANCELLED)
+
+    def test_show_progress_done(self):
+        dialog = FakeProgressDialog()
+        future = self.executor.submit(square, 2)
+        self.pump_until(lambda: future.done)
+
+        show_progress(future, dialog)
+        self.assertIsNone(dialog.control)
@@ -0,0 +1,241 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#------------------------------------------------------------------------------
+""" The base class for asyncio event loops driven by the GUI event loop.
+
+The toolkit event loop stays in charge: the asyncio loop doesn't block in its
+selector, but instead is run one iteration at a time (using the documented
+behaviour of ``run_forever`` when ``stop`` has already been called) whenever
+the toolkit tells it that something may be ready.  A single toolkit timer is
+kept set to go off when the next asyncio callback is due, and where the
+toolkit can watch the selector's file descriptor it also wakes the loop when
+there is I/O to handle.
+
+This module requires Python 3.4 or later.
+"""
+
+import asyncio
+
+
+class BaseGuiEventLoop(asyncio.SelectorEventLoop):
+    """ An asyncio event loop which is run by the GUI event loop.
+
+    Toolkit implementations need to provide the methods which start and stop
+    the single toolkit timer, which should call :py:meth:`_tick` when it goes
+    off, and which run and quit a nested toolkit event loop.  They may also
+    watch the selector's file descriptor.
+
+    Like the toolkit event loop, the loop must only be used from the GUI
+    thread, except for ``call_soon_threadsafe``.  Callbacks run by the loop
+    must not block, eg. by opening modal dialogs, since that stops every
+    other coroutine until they return.
+    """
+
+    #: The interval in seconds at which to poll for I/O if the toolkit can't
+    #: watch the selector's file descriptor.
+    poll_interval = 0.01
+
+    def __init__(self, selector=None):
+        # Whether the loop is running an iteration.
+        self._in_tick = False
+
+        # Whether the loop is running a nested toolkit event loop in
+        # 'run_forever'.
+        self._gui_running = False
+
+        # The loop time at which the toolkit timer is set to go off, or None.
+        self._timer_deadline = None
+
+        super(BaseGuiEventLoop, self).__init__(selector)
+
+        fileno = getattr(self._selector, 'fileno', None)
+        self._watching_selector = (
+            fileno is not None and self._watch_selector(fileno())
+        )
+
+    ###########################################################################
+    # 'AbstractEventLoop' interface.
+    ###########################################################################
+
+    def run_forever(self):
+        """ Run the toolkit event loop until stop() is called. """
+        self._check_closed()
+        if self._gui_running or self.is_running():
+            raise RuntimeError('This event loop is already running')
+
+        self._gui_running = True
+        try:
+            self._schedule_tick()
+            self._run_gui_loop()
+        finally:
+            self._gui_running = False
+
+    def stop(self):
+        """ Stop the toolkit event loop started by run_forever(). """
+        if self._gui_running:
+            self._quit_gui_loop()
+
+    def close(self):
+        """ Close the loop, and stop the toolkit from running it. """
+        if self._gui_running:
+            raise RuntimeError('Cannot close a running event loop')
+
+        if not self.is_closed():
+            self._stop_timer()
+            self._timer_deadline = None
+            if self._watching_selector:
+                self._unwatch_selector()
+                self._watching_selector = False
+
+        super(BaseGuiEventLoop, self).close()
+
+    def call_soon(self, callback, *args, **kwargs):
+        handle = super(BaseGuiEventLoop, self).call_soon(
+            callback, *args, **kwargs
+        )
+        self._wake(self.time())
+        return handle
+
+    def call_at(self, when, callback, *args, **kwargs):
+        handle = super(BaseGuiEventLoop, self).call_at(
+            when, callback, *args, **kwargs
+        )
+        self._wake(when)
+        return handle
+
+    def call_soon_threadsafe(self, callback, *args, **kwargs):
+        handle = super(BaseGuiEventLoop, self).call_soon_threadsafe(
+            callback, *args, **kwargs
+        )
+        if not self._watching_selector:
+            self._call_in_gui_thread(self._wake_now)
+        return handle
+
+    ###########################################################################
+    # Protected 'BaseGuiEventLoop' interface.
+    ###########################################################################
+
+    def _tick(self):
+        """ Run one iteration of the loop, and set the timer for the next.
+
+        This must be called by the toolkit when the timer goes off or the
+        selector becomes readable.
+        """
+        if self._in_tick or self.is_closed():
+            return
+
+        self._timer_deadline = None
+        self._in_tick = True
+        try:
+            # 'run_forever' polls the selector once and runs whatever is ready
+            # if 'stop' has already been called.
+            super(BaseGuiEventLoop, self).stop()
+            super(BaseGuiEventLoop, self).run_forever()
+        finally:
+            self._in_tick = False
+
+        self._schedule_tick()
+
+    def _start_timer(self, delay):
+        """ Set the toolkit timer to call _tick after a delay in seconds.
+
+        Subclasses should override this method.
+        """
+        raise NotImplementedError()
+
+    def _stop_timer(self):
+        """ Stop the toolkit timer.
+
+        Subclasses should override this method.
+        """
+        raise NotImplementedError()
+
+    def _run_gui_loop(self):
+        """ Run a toolkit event loop until _quit_gui_loop is called.
+
+        Subclasses should override this method.
+        """
+        raise NotImplementedError()
+
+    def _quit_gui_loop(self):
+        """ Quit the toolkit event loop started by _run_gui_loop.
+
+        Subclasses should override this method.
+        """
+        raise NotImplementedError()
+
+    def _watch_selector(self, fileno):
+        """ Make the toolkit call _tick when a file descriptor is readable.
+
+        Subclasses may override this method if the toolkit supports it.
+
+        Returns
+        -------
+        watching : bool
+            Whether the file descriptor is being watched.
+        """
+        return False
+
+    def _unwatch_selector(self):
+        """ Stop watching the selector's file descriptor. """
+        pass
+
+    def _call_in_gui_thread(self, callable):
+        """ Call a callable in the GUI thread, from any thread. """
+        from pyface.gui import GUI
+
+        GUI.invoke_later(callable)
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _wake(self, when):
+        """ Make sure that the loop is run by a loop time. """
+        # At the end of an iteration the timer is set for what is next due.
+        if self._in_tick or self.is_closed():
+            return
+
+        if self._timer_deadline is None or when < self._timer_deadline:
+            self._timer_deadline = when
+            self._start_timer(max(when - self.time(), 0.0))
+
+    def _wake_now(self):
+        """ Run the loop as soon as possible. """
+        self._wake(self.time())
+
+    def _schedule_tick(self):
+        """ Set the toolkit timer to go off when the next callback is due. """
+        if self.is_closed():
+            return
+
+        if self._ready:
+            when = self.time()
+        elif self._scheduled:
+            when = self._scheduled[0]._when
+        else:
+            when = None
+
+        # Without a watched selector, I/O on anything other than the loop's
+        # self-pipe has to be polled for.
+        if (not self._watching_selector
+                and len(self._selector.get_map()) > 1):
+            poll_time = self.time() + self.poll_interval
+            if when is None or when > poll_time:
+                when = poll_time
+
+        if when is None:
+            if self._timer_deadline is not None:
+                self._timer_deadline = None
+                self._stop_timer()
+        else:
+            self._timer_deadline = when
+            self._start_timer(max(when - self.time(), 0.0))
+
@@ -120,6 +120,9 @@ class IGUI(Interface):
     def set_trait_later(cls, obj, trait_name, new):
         """ Sets a trait in the main GUI thread.
 
+        If the same trait of the same object is set again before the first
+        assignment has been made, only the latest value is assigned.
+
         Parameters
         ----------
         obj : HasTraits instance
@@ -130,6 +133,25 @@ class IGUI(Interface):
             The value to set.
         """
 
+    @classmethod
+    def set_call_limits(cls, max_calls=None, max_time=None):
+        """ Limit the work done each time the calls queued by invoke_later
+        and set_trait_later are made.
+
+        Calls are queued and made in batches, and if a limit is reached the
+        remaining calls are made after other pending GUI events have been
+        handled.
+
+        Parameters
+        ----------
+        max_calls : int or None
+            The maximum number of calls to make in each batch, or None for no
+            limit.
+        max_time : float or None
+            The time in seconds after which no more calls are made in a
+            batch, or None for no limit.
+        """
+
     @staticmethod
     def process_events(allow_user_events=True):
         """ Process any pending GUI events.
@@ -17,6 +17,7 @@ except ImportError:  # Python 3.8 deprecation
 
 from pyface.resource_manager import resource_manager
 from pyface.resource.resource_path import resource_module, resource_path
+from pyface.resource.resource_reference import ImageReference
 from traits.api import Interface, List, Unicode
 import six
 
@@ -84,6 +85,11 @@ class IImageResource(Interface):
         image : toolkit image
             The toolkit image corresponding to the resource and the specified
             size as a bitmap.
+
+        Notes
+        -----
+        The bitmap may be shared with the other users of the same image, so
+        it must not be modified (eg. drawn on or masked): copy it first.
         """
 
     def create_icon(self, size=None):
@@ -100,6 +106,11 @@ class IImageResource(Interface):
         image : toolkit image
             The toolkit image corresponding to the resource and the specified
             size as an icon.
+
+        Notes
+        -----
+        The icon may be shared with the other users of the same image, so it
+        must not be modified: copy it first.
         """
 
     @classmethod
@@ -183,6 +194,10 @@ class MImageResource(object):
     def _get_ref(self, size=None):
         """ Return the resource manager reference to the image.
 
+        References are looked up once for each size.  If there is no image
+        specifically for the requested size then the reference for the
+        default size is used.
+
         Parameters
         ----------
         size : (int, int) or None
@@ -195,11 +210,63 @@ class MImageResource(object):
             The reference to the requested image.
         """
 
-        if self._ref is None:
-            self._ref = resource_manager.locate_image(self.name,
-                    self.search_path, size)
+        if size is None:
+            if self._ref is None:
+                self._ref = resource_manager.locate_image(
+                    self.name, self.search_path
+                )
+
+            return self._ref
+
+        # Subclasses written before references were kept for each size may
+        # not have the '_refs' trait, and then look them up every time.
+        refs = getattr(self, '_refs', None)
+        size = tuple(size)
+        ref = None if refs is None else refs.get(size)
+        if ref is None:
+            ref = resource_manager.locate_image(
+                self.name, self.search_path, size
+            )
+            if ref is None:
+                ref = self._get_ref()
+
+            if ref is not None and refs is not None:
+                refs[size] = ref
+
+        return ref
+
+    def _get_cache_key(self, ref, size, kind):
+        """ Return the key for an image in the shared image cache.
+
+        Parameters
+        ----------
+        ref : ResourceReference instance
+            The reference to the image.
+        size : (int, int) or None
+            The desired size as a width, height tuple, or None if wanting
+            default image size.
+        kind : str
+            The kind of toolkit object, eg. 'bitmap' or 'icon'.
+
+        Returns
+        -------
+        key : tuple
+            The (source, size, kind) key for the image, where the source is
+            the file name or data of the image if known, or the reference
+            itself otherwise.
+        """
+
+        source = ref
+        if type(ref) is ImageReference:
+            if ref.filename is not None:
+                source = ref.filename
+            elif ref.data is not None:
+                source = ref.data
+
+        if size is not None:
+            size = tuple(size)
 
-        return self._ref
+        return (source, size, kind)
 
     def _get_image_not_found_image(self):
         """ Returns the 'image not found' image.
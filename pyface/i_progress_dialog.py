@@ -13,8 +13,12 @@
 #------------------------------------------------------------------------------
 """ The interface for a dialog that allows the user to open/save files etc. """
 
+# Standard library imports.
+import threading
+import time
+
 # Enthought library imports.
-from traits.api import Any, Bool, Int, Str
+from traits.api import Any, Bool, Float, Int, Str
 
 # Local imports.
 from pyface.i_dialog import IDialog
@@ -50,6 +54,10 @@ class IProgressDialog(IDialog):
     #: Label for the 'cancel' button
     cancel_button_label = Str
 
+    #: The maximum number of times per second that update() repaints the
+    #: dialog and processes events, or 0 to do so on every call.
+    update_rate = Float(0.0)
+
     ###########################################################################
     # 'IProgressDialog' interface.
     ###########################################################################
@@ -60,10 +68,42 @@ class IProgressDialog(IDialog):
         If the value is >= the maximum and the progress bar is not contained
         in another panel the parent window will be closed.
 
+        If ``update_rate`` is set, calls made sooner than ``1/update_rate``
+        seconds after the last repaint return straight away, without
+        touching the toolkit, so update can be called from tight loops.
+        Calls made while the dialog is processing events are queued, and
+        made once the outer call is done.  When ``max`` is 0 the values are
+        increments, and those of skipped or queued calls are added to the
+        next value shown.
+
+        Parameters
+        ----------
+        value :
+            The progress value to set.
+
+        Returns
+        -------
+        (cont, skip) : tuple of bool
+            Whether to continue (False once the user has cancelled), and
+            whether to skip.
+        """
+
+    def update_threadsafe(self, value):
+        """ Update the progress bar from any thread.
+
+        The update is made in the GUI thread, and updates which the GUI
+        thread hasn't made yet are coalesced, so only the most recent value
+        is used.
+
         Parameters
         ----------
         value :
             The progress value to set.
+
+        Returns
+        -------
+        cont : bool
+            False once the user has cancelled.
         """
 
     def change_message(self, message):
@@ -81,13 +121,24 @@ class MProgressDialog(object):
     """ The mixin class that contains common code for toolkit specific
     implementations of the IProgressDialog interface.
 
-    Implements: update()
+    Implements: update(), update_threadsafe()
     """
 
     #: The progress bar toolkit object
     # XXX why not the control?
     progress_bar = Any
 
+    #: The weight of the most recent progress rate in the moving average
+    #: used to estimate the time remaining.
+    eta_smoothing = 0.3
+
+    def __init__(self, *args, **traits):
+        self._reset_update_state()
+        self._threaded_lock = threading.Lock()
+        self._threaded_value = None
+        self._threaded_scheduled = False
+        super(MProgressDialog, self).__init__(*args, **traits)
+
     ###########################################################################
     # 'IWindow' interface.
     ###########################################################################
@@ -98,6 +149,7 @@ class MProgressDialog(object):
             msg = "Dialog min ({}) is greater than dialog max ({})."
             raise AttributeError(msg.format(self.min, self.max))
 
+        self._reset_update_state()
         super(MProgressDialog, self).open()
 
     ###########################################################################
@@ -122,6 +174,31 @@ class MProgressDialog(object):
         if value >= self.max:
             self.close()
 
+    def update_threadsafe(self, value):
+        """ Update the progress bar from any thread.
+
+        Parameters
+        ----------
+        value :
+            The progress value to set.
+
+        Returns
+        -------
+        cont : bool
+            False once the user has cancelled.
+        """
+        from pyface.gui import GUI
+
+        with self._threaded_lock:
+            self._threaded_value = value
+            scheduled = self._threaded_scheduled
+            self._threaded_scheduled = True
+
+        if not scheduled:
+            GUI.invoke_later(self._threaded_update)
+
+        return not self._user_cancelled
+
     def change_message(self, message):
         """ Change the displayed message in the progress dialog
 
@@ -132,3 +209,97 @@ class MProgressDialog(object):
 
         """
         self.message = message
+
+    ###########################################################################
+    # Protected 'MProgressDialog' interface.
+    ###########################################################################
+
+    def _reset_update_state(self):
+        """ Forget the previous updates, eg. when the dialog is opened. """
+        # The time of the last repaint, or None.
+        self._last_repaint = None
+
+        # Whether the dialog is in the middle of an update.
+        self._updating = False
+
+        # The values of the updates made in the middle of an update (eg. by
+        # a timer firing while events are processed), to be made after it.
+        self._nested_values = []
+
+        # The sum of the increments of the updates skipped because a repaint
+        # wasn't due, when there is no maximum.
+        self._skipped_increment = 0
+
+        # The time and value of the last time estimate, or None.
+        self._eta_sample = None
+
+        # The moving average of the progress rate, in units per second.
+        self._eta_rate = 0.0
+
+    def _repaint_due(self, value):
+        """ Whether an update should repaint the dialog.
+
+        This is true for the first update, the last one, and once the user
+        has cancelled, and otherwise at most ``update_rate`` times a second.
+        """
+        now = time.time()
+        if (self.update_rate > 0
+                and self._last_repaint is not None
+                and now - self._last_repaint < 1.0 / self.update_rate
+                and not (self.max > 0 and value >= self.max)
+                and not self._user_cancelled):
+            return False
+
+        self._last_repaint = now
+        return True
+
+    def _time_estimates(self, value):
+        """ Return the elapsed, estimated total and remaining times.
+
+        The estimates use an exponential moving average of the progress rate,
+        and are None until there is a rate to go on.
+        """
+        now = time.time()
+        elapsed = now - self._start_time
+
+        if self._eta_sample is None:
+            # Before there is a previous sample, use the overall rate.
+            previous_time, previous_value = self._start_time, self.min
+        else:
+            previous_time, previous_value = self._eta_sample
+
+        interval = now - previous_time
+        if interval > 0:
+            rate = (value - previous_value) / interval
+            if self._eta_sample is None:
+                self._eta_rate = rate
+            else:
+                self._eta_rate += self.eta_smoothing * (rate - self._eta_rate)
+            self._eta_sample = (now, value)
+
+        if self._eta_rate <= 0:
+            return elapsed, None, None
+
+        remaining = max(self.max - value, 0) / self._eta_rate
+        return elapsed, elapsed + remaining, remaining
+
+    def _update_time_labels(self, value):
+        """ Show the elapsed, estimated and remaining times. """
+        elapsed, estimated, remaining = self._time_estimates(value)
+        self._set_time_label(elapsed, self._elapsed_control)
+        if estimated is not None:
+            self._set_time_label(estimated, self._estimated_control)
+            self._set_time_label(remaining, self._remaining_control)
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _threaded_update(self):
+        """ Make the most recent update requested by another thread. """
+        with self._threaded_lock:
+            value = self._threaded_value
+            self._threaded_scheduled = False
+
+        if self.control is not None:
+            self.update(value)
@@ -13,8 +13,16 @@
 #------------------------------------------------------------------------------
 """ The interface for an interactive Python shell. """
 
+# Standard library imports.
+from contextlib import contextmanager
+import ctypes
+from functools import partial
+import sys
+import threading
+
 # Enthought library imports.
-from traits.api import Event
+import six
+from traits.api import Bool, Event
 
 # Local imports.
 from pyface.key_pressed_event import KeyPressedEvent
@@ -32,6 +40,14 @@ class IPythonShell(IWidget):
     #: A key has been pressed.
     key_pressed = Event(KeyPressedEvent)
 
+    #: Whether the commands entered in the shell are executed in a worker
+    #: thread, so that the UI stays responsive while they run.  The commands
+    #: must then not touch GUI objects.
+    background = Bool(False)
+
+    #: Whether a command is executing in the background.
+    busy = Bool(False)
+
     ###########################################################################
     # 'IPythonShell' interface.
     ###########################################################################
@@ -80,6 +96,37 @@ class IPythonShell(IWidget):
             a blank line.
         """
 
+    def execute_file_in_background(self, path, executor=None):
+        """ Execute a file in the interpreter's namespace in a worker thread.
+
+        Output printed by the file is shown in the shell, and a traceback is
+        shown if it raises an exception.  The UI stays responsive while the
+        file runs, so the code must not touch GUI objects, and should take
+        care when changing objects in the namespace which the GUI uses.
+
+        Parameters
+        ----------
+        path : str
+            The path to the Python file to execute.
+        executor : BackgroundExecutor or None
+            The thread executor to run the file with, or None to use the
+            shared executor.
+
+        Returns
+        -------
+        future : BackgroundFuture
+            The future of the execution, which can be used to follow its
+            progress or cancel it while it is waiting to run.
+        """
+
+    def interrupt(self):
+        """ Interrupt the command executing in the background.
+
+        A KeyboardInterrupt is raised in the command, which is shown in the
+        shell like any other exception.  This does nothing if no command is
+        executing in the background.
+        """
+
     def get_history(self):
         """ Return the current command history and index.
 
@@ -107,7 +154,8 @@ class MPythonShell(object):
     """ The mixin class that contains common code for toolkit specific
     implementations of the IPythonShell interface.
 
-    Implements: bind(), _on_command_executed()
+    Implements: bind(), execute_file_in_background(), interrupt(),
+    _on_command_executed()
     """
 
     ###########################################################################
@@ -126,6 +174,39 @@ class MPythonShell(object):
         """
         self.interpreter().locals[name] = value
 
+    def execute_file_in_background(self, path, executor=None):
+        """ Execute a file in the interpreter's namespace in a worker thread.
+
+        Parameters
+        ----------
+        path : str
+            The path to the Python file to execute.
+        executor : BackgroundExecutor or None
+            The thread executor to run the file with, or None to use the
+            shared executor.
+
+        Returns
+        -------
+        future : BackgroundFuture
+            The future of the execution.
+        """
+        from pyface.concurrent.api import get_executor
+
+        if executor is None:
+            executor = get_executor()
+
+        write = partial(executor.call_in_gui_thread, self._write_output)
+        future = executor.submit(
+            _execute_file, path, self.interpreter().locals, write
+        )
+        future.on_trait_change(self._on_background_execution_done, 'state')
+        return future
+
+    def interrupt(self):
+        """ Interrupt the command executing in the background. """
+        if self.control is not None:
+            self.control.interrupt()
+
     ###########################################################################
     # Private interface.
     ###########################################################################
@@ -134,3 +215,141 @@ class MPythonShell(object):
         """ Called when a command has been executed in the shell. """
 
         self.command_executed = self
+
+    def _on_background_execution_done(self, future, name, new):
+        """ Called when a file executed in the background is done. """
+        if not future.done:
+            return
+
+        future.on_trait_change(
+            self._on_background_execution_done, 'state', remove=True
+        )
+        if future.traceback:
+            self._write_output(future.traceback)
+        self._on_command_executed()
+
+    def _write_output(self, text):
+        """ Show output from code executed in the background. """
+        if self.control is not None:
+            self.control.write(text)
+
+
+class _ThreadOutput(object):
+    """ A replacement for sys.stdout or sys.stderr which sends the output of
+    some threads to callables, and the rest to the original stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.writers = {}
+
+    def write(self, text):
+        writer = self.writers.get(threading.current_thread().ident)
+        if writer is None:
+            self.stream.write(text)
+        else:
+            writer(text)
+
+    def flush(self):
+        if threading.current_thread().ident not in self.writers:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+#: Protects the installation of the _ThreadOutput streams.
+_output_lock = threading.Lock()
+
+
+@contextmanager
+def _redirect_thread_output(write):
+    """ Send the current thread's output to a callable. """
+    ident = threading.current_thread().ident
+    with _output_lock:
+        for name in ('stdout', 'stderr'):
+            stream = getattr(sys, name)
+            if not isinstance(stream, _ThreadOutput):
+                stream = _ThreadOutput(stream)
+                setattr(sys, name, stream)
+            stream.writers[ident] = write
+
+    try:
+        yield
+    finally:
+        with _output_lock:
+            for name in ('stdout', 'stderr'):
+                stream = getattr(sys, name)
+                if isinstance(stream, _ThreadOutput):
+                    stream.writers.pop(ident, None)
+                    if not stream.writers:
+                        setattr(sys, name, stream.stream)
+
+
+def _execute_file(path, namespace, write):
+    """ Execute a file in a namespace, sending its output to a callable. """
+    with _redirect_thread_output(write):
+        with open(path) as source_file:
+            source = source_file.read()
+        code = compile(source, path, 'exec')
+        six.exec_(code, namespace)
+
+
+def _set_async_exc(ident, exception_type):
+    """ Raise an exception in a thread, or with None, clear the exception
+    pending for it.
+    """
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(ident),
+        None if exception_type is None else ctypes.py_object(exception_type),
+    )
+
+
+class _InterruptibleJob(object):
+    """ A callable run by a worker thread which can be interrupted from
+    another thread by raising KeyboardInterrupt in it.
+    """
+
+    def __init__(self, callable):
+        self.callable = callable
+
+        #: Guards the worker's thread ident, which is only set while the
+        #: callable runs.
+        self._lock = threading.Lock()
+        self._ident = None
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            self._ident = threading.current_thread().ident
+        try:
+            return self.callable(*args, **kwargs)
+        finally:
+            # Once this is done, no KeyboardInterrupt can reach the worker
+            # after the callable has returned.
+            with self._lock:
+                _set_async_exc(self._ident, None)
+                self._ident = None
+
+    def interrupt(self):
+        """ Raise KeyboardInterrupt in the callable, if it is running.
+
+        Returns
+        -------
+        interrupted : bool
+            Whether the callable was running.
+        """
+        with self._lock:
+            if self._ident is None:
+                return False
+            _set_async_exc(self._ident, KeyboardInterrupt)
+            return True
+
+
+def _run_source(interpreter, source, write):
+    """ Run source in an interpreter, sending its output to a callable.
+
+    Returns whether more input is needed, as InteractiveInterpreter.runsource
+    does.
+    """
+    with _redirect_thread_output(write):
+        return interpreter.runsource(source)
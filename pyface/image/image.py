@@ -14,18 +14,32 @@
 """ Defines the ImageLibrary object used to manage Pyface image libraries.
 """
 
+import atexit
+import hashlib
+import json
+import shutil
 import sys
-from os import (environ, listdir, remove, stat, makedirs, rename, access,
-                R_OK, W_OK, X_OK)
+import tempfile
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+from os import (environ, getpid, listdir, remove, stat, makedirs, rename,
+                walk, access, R_OK, W_OK, X_OK)
 from os.path import (join, isdir, isfile, splitext, abspath, dirname,
                      basename, exists)
 from stat import ST_MTIME
 from platform import system
-from zipfile import is_zipfile, ZipFile, ZIP_DEFLATED
+from zipfile import (is_zipfile, ZipFile, ZIP_DEFLATED, ZIP_STORED,
+                     BadZipfile, sizeFileHeader)
 import datetime
+import mmap
+import struct
 import time
+import zlib
+import six
 from six.moves._thread import allocate_lock
-from threading import Thread
+from threading import RLock, Thread
 
 from traits.api import (HasPrivateTraits, Property, Str, Int, List, Dict,
                         File, Instance, Bool, Undefined, TraitError, Float,
@@ -36,7 +50,7 @@ from pyface.api import ImageResource
 from pyface.resource_manager import resource_manager
 from pyface.resource.resource_reference import (ImageReference,
                                                 ResourceReference)
-from pyface.ui_traits import HasMargin, HasBorder, Alignment
+from pyface.ui_traits import HasMargin, HasBorder, Alignment, Margin, Border
 
 #---------------------------------------------------------------------------
 #  Constants:
@@ -48,8 +62,28 @@ ImageFileExts = ( '.png', '.gif', '.jpg', 'jpeg' )
 # The image_cache root directory:
 image_cache_path = join( traits_home(), 'image_cache' )
 
+# Names of the JSON manifest files describing a volume and its images:
+image_volume_index = 'image_volume.json'
+image_info_index   = 'image_info.json'
+
+# The version of the JSON manifest format written by this module:
+image_index_version = 1
+
+# ImageInfo manifest record items which are omitted when they have their
+# default value:
+ImageInfoRecordDefaults = {
+    'description': '',
+    'category':    'General',
+    'keywords':    [],
+    'alignment':   'default',
+    'border':      [ 0, 0, 0, 0 ],
+    'content':     [ 0, 0, 0, 0 ],
+    'label':       [ 0, 0, 0, 0 ]
+}
+
 # Names of files that should not be copied when ceating a new library copy:
-dont_copy_list = ( 'image_volume.py', 'image_info.py', 'license.txt' )
+dont_copy_list = ( 'image_volume.py', 'image_info.py', 'license.txt',
+                   image_volume_index, image_info_index )
 
 #-- Code Generation Templates ----------------------------------------------
 
@@ -126,6 +160,9 @@ def read_file ( file_name ):
 def write_file ( file_name, data ):
     """ Writes the specified data to the specified file.
     """
+    if isinstance( data, six.text_type ):
+        data = data.encode( 'utf-8' )
+
     with open( file_name, 'wb' ) as fh:
         fh.write( data )
 
@@ -139,6 +176,63 @@ def get_python_value ( source, name ):
     return temp[ name ]
 
 
+def get_json_value ( source, name ):
+    """ Returns the value of a specified item loaded from a JSON manifest
+        string, or None if the manifest has an unsupported format version.
+    """
+    if isinstance( source, bytes ):
+        source = source.decode( 'utf-8' )
+
+    manifest = json.loads( source )
+    if manifest.get( 'version' ) != image_index_version:
+        return None
+
+    return manifest[ name ]
+
+
+def json_code_for ( name, value ):
+    """ Returns the JSON manifest string for a specified item.
+    """
+    return json.dumps( { 'version': image_index_version, name: value },
+                       sort_keys = True, separators = ( ',', ':' ) )
+
+
+def load_image_volume ( names, read ):
+    """ Returns the ImageVolume object described by the manifest of a volume
+        containing the files in **names**, whose contents are returned by the
+        **read** function, or None if the volume has no manifest.
+    """
+    if image_volume_index in names:
+        record = get_json_value( read( image_volume_index ), 'volume' )
+        if record is not None:
+            traits = dict( record )
+            traits[ 'info' ] = [ ImageVolumeInfo( **info )
+                                 for info in record.get( 'info', [] ) ]
+            return ImageVolume( **traits )
+
+    if 'image_volume.py' in names:
+        return get_python_value( read( 'image_volume.py' ), 'volume' )
+
+    return None
+
+
+def image_info_for ( record, volume ):
+    """ Returns the ImageInfo object for a manifest **record** (which may
+        already be an ImageInfo object) belonging to **volume**.
+    """
+    if isinstance( record, ImageInfo ):
+        record.volume = volume
+        return record
+
+    traits = dict( record )
+    for name, klass in ( ( 'border', Border ), ( 'content', Margin ),
+                         ( 'label', Margin ) ):
+        if name in traits:
+            traits[ name ] = klass( *traits[ name ] )
+
+    return ImageInfo( volume = volume, **traits )
+
+
 def time_stamp_for(time):
     """ Returns a specified time as a text string.
     """
@@ -177,94 +271,267 @@ def join_image_name ( volume_name, file_name ):
     return '@%s:%s' % ( volume_name, file_name )
 
 
-class FastZipFile ( HasPrivateTraits ):
-    """ Provides fast access to zip files by keeping the underlying zip file
-        open across multiple uses.
+class ZipFileHandle ( object ):
+    """ An open zip file shared by all readers of the same path.
     """
 
-    #: The path to the zip file:
-    path = File
+    def __init__ ( self, path, use_mmap ):
+        #: The path to the zip file:
+        self.path = path
 
-    #: The open zip file object (if None, the file is closed):
-    zf = Property
+        #: The open zip file object:
+        self.zf = ZipFile( path, 'r' )
 
-    #: The time stamp of when the zip file was most recently accessed:
-    time_stamp = Float
+        #: Maps member names to their ZipInfo objects:
+        self.infos = dict( ( info.filename, info )
+                           for info in self.zf.infolist() )
 
-    #: The lock used to manage access to the 'zf' trait between the two threads:
-    access = Any
+        #: The memory map of the zip file (if members are read from it):
+        self.map = None
+        if use_mmap:
+            with open( path, 'rb' ) as fh:
+                try:
+                    self.map = mmap.mmap( fh.fileno(), 0,
+                                          access = mmap.ACCESS_READ )
+                except (ValueError, EnvironmentError):
+                    # Eg. an empty file, or mmap is not supported:
+                    pass
 
-    #-- Public Methods ---------------------------------------------------------
+        #: The lock serializing reads through the zip file object:
+        self.lock = allocate_lock()
+
+        #: The number of reads currently in progress:
+        self.readers = 0
+
+        #: Should the zip file be closed once the current reads are done?
+        self.closing = False
+
+        #: The time stamp of when the zip file was most recently accessed:
+        self.time_stamp = time.time()
 
     def namelist ( self ):
-        """ Returns the names of all files in the top-level zip file directory.
+        """ Returns the names of all files in the zip file.
         """
-        self.access.acquire()
-        try:
-            return self.zf.namelist()
-        finally:
-            self.access.release()
+        return self.zf.namelist()
 
     def read ( self, file_name ):
         """ Returns the contents of the specified **file_name** from the zip
             file.
         """
-        self.access.acquire()
-        try:
+        info = self.infos.get( file_name )
+        if ((self.map is not None) and (info is not None) and
+            (not (info.flag_bits & 0x1)) and
+            (info.compress_type in ( ZIP_STORED, ZIP_DEFLATED ))):
+            return self._read_mapped( info )
+
+        # Encrypted members, other compression types and missing members are
+        # left to the zip file object (which is not thread-safe):
+        with self.lock:
             return self.zf.read( file_name )
-        finally:
-            self.access.release()
 
     def close ( self ):
-        """ Temporarily closes the zip file (usually while the zip file is being
-            replaced by a different version).
+        """ Closes the zip file.
         """
-        self.access.acquire()
-        try:
-            if self._zf is not None:
-                self._zf.close()
-                self._zf = None
-        finally:
-            self.access.release()
+        if self.map is not None:
+            self.map.close()
+            self.map = None
 
-    #-- Default Value Implementations ------------------------------------------
+        if self.zf is not None:
+            self.zf.close()
+            self.zf = None
 
-    def _access_default ( self ):
-        return allocate_lock()
+    #-- Private Methods --------------------------------------------------------
 
-    #-- Property Implementations -----------------------------------------------
+    def _read_mapped ( self, info ):
+        """ Returns the contents of the member described by the ZipInfo object
+            **info** directly from the memory map.
+        """
+        map    = self.map
+        offset = info.header_offset
+        header = map[ offset: offset + sizeFileHeader ]
+        if header[:4] != b'PK\x03\x04':
+            raise BadZipfile( 'Bad magic number for file header' )
 
-    def _get_zf ( self ):
-        # Restart the time-out:
-        self.time_stamp = time.time()
+        name_length, extra_length = struct.unpack( '<HH', header[26:30] )
+        start = offset + sizeFileHeader + name_length + extra_length
+        data  = map[ start: start + info.compress_size ]
+        if info.compress_type == ZIP_DEFLATED:
+            data = zlib.decompress( data, -15 )
+
+        if (zlib.crc32( data ) & 0xffffffff) != info.CRC:
+            raise BadZipfile( 'Bad CRC-32 for file %r' % info.filename )
+
+        return data
+
+
+class ZipFilePool ( HasPrivateTraits ):
+    """ Keeps zip files open across multiple uses, shared by all readers, and
+        closes them once they have not been used for a while.
+    """
+
+    #: The number of seconds a zip file can be idle before it is closed:
+    idle_timeout = Float( 2.0 )
 
-        if self._zf is None:
-            self._zf = ZipFile( self.path, 'r' )
-            if self._running is None:
-                Thread( target = self._process ).start()
-                self._running = True
+    #: Should zip file members be read from a memory map of the file (which
+    #: allows reads from multiple threads to run concurrently)?
+    use_mmap = Bool( False )
 
-        return self._zf
+    #-- Private Traits ---------------------------------------------------------
+
+    #: Mapping from paths to their open ZipFileHandle objects:
+    handles = Dict
+
+    #: The lock used to manage access to the open zip files:
+    lock = Any
+
+    #: The thread closing idle zip files (if any zip files are open):
+    reaper = Any
+
+    #-- Object Methods ---------------------------------------------------------
+
+    def __init__ ( self, **traits ):
+        # The lock is created up front, rather than by a default value
+        # handler, so that threads using the pool for the first time
+        # never create (and use) different locks:
+        self.lock = allocate_lock()
+
+        super( ZipFilePool, self ).__init__( **traits )
+
+    #-- Public Methods ---------------------------------------------------------
+
+    def namelist ( self, path ):
+        """ Returns the names of all files in the top-level directory of the
+            zip file specified by **path**.
+        """
+        handle = self._acquire( path )
+        try:
+            return handle.namelist()
+        finally:
+            self._release( handle )
+
+    def read ( self, path, file_name ):
+        """ Returns the contents of the specified **file_name** from the zip
+            file specified by **path**.
+        """
+        handle = self._acquire( path )
+        try:
+            return handle.read( file_name )
+        finally:
+            self._release( handle )
+
+    def close ( self, path ):
+        """ Closes the zip file specified by **path** (usually while the zip
+            file is being replaced by a different version). The zip file is
+            reopened the next time it is used.
+        """
+        with self.lock:
+            handle = self.handles.pop( path, None )
+            if handle is not None:
+                self._close_handle( handle )
+
+    def close_all ( self ):
+        """ Closes all of the open zip files.
+        """
+        with self.lock:
+            for handle in self.handles.values():
+                self._close_handle( handle )
+
+            self.handles.clear()
 
     #-- Private Methods --------------------------------------------------------
 
-    def _process ( self ):
-        """ Waits until the zip file has not been accessed for a while, then
-            closes the file and exits.
+    def _acquire ( self, path ):
+        """ Returns the open ZipFileHandle for the specified **path**, marking
+            it as in use.
+        """
+        with self.lock:
+            handle = self.handles.get( path )
+            if handle is None:
+                handle = ZipFileHandle( path, self.use_mmap )
+                self.handles[ path ] = handle
+                if self.reaper is None:
+                    self.reaper = Thread( target = self._reap,
+                                          name   = 'ZipFilePool.reaper' )
+                    self.reaper.daemon = True
+                    self.reaper.start()
+
+            handle.readers   += 1
+            handle.time_stamp = time.time()
+
+            return handle
+
+    def _release ( self, handle ):
+        """ Marks the specified ZipFileHandle as no longer in use by a reader.
+        """
+        with self.lock:
+            handle.readers -= 1
+            if handle.closing and (handle.readers == 0):
+                handle.close()
+
+    def _close_handle ( self, handle ):
+        """ Closes the specified ZipFileHandle, or arranges for it to be closed
+            by the last reader still using it.
+        """
+        handle.closing = True
+        if handle.readers == 0:
+            handle.close()
+
+    def _reap ( self ):
+        """ Periodically closes the zip files which have not been accessed
+            for a while, and exits when no zip files are open.
         """
         while True:
-            time.sleep( 1 )
-            self.access.acquire()
-            if time.time() > (self.time_stamp + 2.0):
-                if self._zf is not None:
-                    self._zf.close()
-                    self._zf = None
-
-                self._running = None
-                self.access.release()
-                break
+            time.sleep( max( 0.01, min( 1.0, self.idle_timeout / 2.0 ) ) )
+            with self.lock:
+                expired = time.time() - self.idle_timeout
+                for path, handle in list( self.handles.items() ):
+                    if (handle.readers == 0) and (handle.time_stamp < expired):
+                        del self.handles[ path ]
+                        self._close_handle( handle )
+
+                if len( self.handles ) == 0:
+                    self.reaper = None
+                    break
+
+
+#: The pool of open zip files shared by all FastZipFile objects:
+zip_file_pool = ZipFilePool()
+
+
+class FastZipFile ( HasPrivateTraits ):
+    """ Provides fast access to zip files by keeping the underlying zip file
+        open across multiple uses.
+    """
+
+    #: The path to the zip file:
+    path = File
+
+    #: The pool managing the open zip file:
+    pool = Instance( ZipFilePool )
+
+    #-- Public Methods ---------------------------------------------------------
+
+    def namelist ( self ):
+        """ Returns the names of all files in the top-level zip file directory.
+        """
+        return self.pool.namelist( self.path )
+
+    def read ( self, file_name ):
+        """ Returns the contents of the specified **file_name** from the zip
+            file.
+        """
+        return self.pool.read( self.path, file_name )
 
-            self.access.release()
+    def close ( self ):
+        """ Temporarily closes the zip file (usually while the zip file is being
+            replaced by a different version).
+        """
+        self.pool.close( self.path )
+
+    #-- Default Value Implementations ------------------------------------------
+
+    def _pool_default ( self ):
+        return zip_file_pool
 
 #-------------------------------------------------------------------------------
 #  'ImageInfo' class:
@@ -321,6 +588,10 @@ class ImageInfo ( HasPrivateTraits ):
     #: ImageInfo object:
     image_info_code = Property
 
+    #: A read-only dictionary containing the JSON manifest record needed to
+    #: construct this ImageInfo object:
+    image_info_record = Property
+
     #-- Default Value Implementations ------------------------------------------
 
     def _name_default ( self ):
@@ -367,6 +638,23 @@ class ImageInfo ( HasPrivateTraits ):
         data.update(('l'+name, getattr(self.label, name)) for name in sides)
         return (ImageInfoTemplate % data)
 
+    def _get_image_info_record ( self ):
+        record = self.trait_get( 'name', 'image_name', 'description',
+                                 'category', 'width', 'height', 'alignment' )
+        record[ 'keywords' ] = list( self.keywords )
+        sides = [ 'left', 'right', 'top', 'bottom' ]
+        for name in [ 'border', 'content', 'label' ]:
+            value = getattr( self, name )
+            record[ name ] = [ getattr( value, side ) for side in sides ]
+
+        # Omit values which are the same as the defaults to keep the manifest
+        # compact:
+        for name, default in ImageInfoRecordDefaults.items():
+            if record[ name ] == default:
+                del record[ name ]
+
+        return record
+
     def _get_copyright ( self ):
         return self._volume_info( 'copyright' )
 
@@ -411,6 +699,10 @@ class ImageVolumeInfo ( HasPrivateTraits ):
     #: A read-only string containing the text describing the volume info:
     image_volume_info_text = Property
 
+    #: A read-only dictionary containing the JSON manifest record needed to
+    #: construct this ImageVolumeInfo object:
+    image_volume_info_record = Property
+
     #-- Property Implementations -----------------------------------------------
 
     @cached_property
@@ -421,6 +713,12 @@ class ImageVolumeInfo ( HasPrivateTraits ):
 
         return (ImageVolumeInfoCodeTemplate % data)
 
+    def _get_image_volume_info_record ( self ):
+        record = self.trait_get( 'description', 'copyright', 'license' )
+        record[ 'image_names' ] = list( self.image_names )
+
+        return record
+
     @cached_property
     def _get_image_volume_info_text ( self ):
         description = self.description.replace( '\n', '\n    ' )
@@ -442,6 +740,43 @@ class ImageVolumeInfo ( HasPrivateTraits ):
         """
         return self.clone(['description', 'copyright', 'license'])
 
+#-------------------------------------------------------------------------------
+#  'ImageCatalog' class:
+#-------------------------------------------------------------------------------
+
+class ImageCatalog ( Mapping ):
+    """ A read-only mapping from image names to the ImageInfo objects of a
+        volume, which only creates each ImageInfo object when it is first
+        looked up.
+    """
+
+    def __init__ ( self, volume, records ):
+        #: The volume the images belong to:
+        self.volume = volume
+
+        # The manifest records (or ImageInfo objects) keyed by image name:
+        self._records = records
+
+        # The ImageInfo objects created so far, keyed by image name:
+        self._images = {}
+
+    def __getitem__ ( self, image_name ):
+        image = self._images.get( image_name )
+        if image is None:
+            image = image_info_for( self._records[ image_name ], self.volume )
+            self._images[ image_name ] = image
+
+        return image
+
+    def __iter__ ( self ):
+        return iter( self._records )
+
+    def __len__ ( self ):
+        return len( self._records )
+
+    def __contains__ ( self, image_name ):
+        return image_name in self._records
+
 #-------------------------------------------------------------------------------
 #  'ImageVolume' class:
 #-------------------------------------------------------------------------------
@@ -475,8 +810,9 @@ class ImageVolume ( HasPrivateTraits ):
     #: The list of images available in the volume:
     images = List( ImageInfo )
 
-    #: A dictionary mapping image names to ImageInfo objects:
-    catalog = Property( depends_on = 'images' )
+    #: A dictionary mapping image names to ImageInfo objects.  ImageInfo
+    #: objects are only created when they are first looked up:
+    catalog = Property
 
     #: The time stamp of when the image library was last modified:
     time_stamp = Str
@@ -489,6 +825,14 @@ class ImageVolume ( HasPrivateTraits ):
     #: 'images' list for this ImageVolume object:
     images_code = Property
 
+    #: A read-only string containing the JSON manifest describing this
+    #: ImageVolume object:
+    image_volume_json = Property
+
+    #: A read-only string containing the JSON manifest describing the 'images'
+    #: list for this ImageVolume object:
+    images_json = Property
+
     #: A read-only string containing the text describing the contents of the
     #: volume (description, copyright, license information, and the images they
     #: apply to):
@@ -506,6 +850,7 @@ class ImageVolume ( HasPrivateTraits ):
 
         # Make sure the images are up to date by deleting any current value:
         self.reset_traits(['images'])
+        self._catalog = None
 
         # Save the new image volume information:
         self.save()
@@ -531,6 +876,7 @@ class ImageVolume ( HasPrivateTraits ):
         # don't want that time to interfere with the time stamp of the image
         # volume:
         images_code = self.images_code
+        images_json = self.images_json
 
         if not self.is_zip_file:
             # We need to time stamp when this volume info was generated, but
@@ -546,6 +892,11 @@ class ImageVolume ( HasPrivateTraits ):
             # Write the image info source code to a file:
             write_file( join( path, 'image_info.py' ), images_code )
 
+            # Write the JSON manifests to files:
+            write_file( join( path, image_volume_index ),
+                        self.image_volume_json )
+            write_file( join( path, image_info_index ), images_json )
+
             # Write a separate license file for human consumption:
             write_file( join( path, 'license.txt' ), self.license_text )
 
@@ -583,6 +934,10 @@ class ImageVolume ( HasPrivateTraits ):
             # Write the image info source code to the zip file:
             new_zf.writestr( 'image_info.py', images_code )
 
+            # Write the JSON manifests to the zip file:
+            new_zf.writestr( image_volume_index, self.image_volume_json )
+            new_zf.writestr( image_info_index, images_json )
+
             # Write a separate license file for human consumption:
             new_zf.writestr( 'license.txt', self.license_text )
 
@@ -624,20 +979,14 @@ class ImageVolume ( HasPrivateTraits ):
         volume_name, file_name = split_image_name( image_name )
 
         if self.is_zip_file:
-            # See if we already have the image file cached in the file system:
-            cache_file = self._check_cache( file_name )
-            if cache_file is None:
-                # If not cached, then create a zip file reference:
-                ref = ZipFileReference(
-                          resource_factory = resource_manager.resource_factory,
-                          zip_file         = self.zip_file,
-                          path             = self.path,
-                          volume_name      = self.name,
-                          file_name        = file_name )
-            else:
-                # Otherwise, create a cache file reference:
-                ref = ImageReference( resource_manager.resource_factory,
-                                      filename = cache_file )
+            # Create a zip file reference (the image is decoded directly from
+            # the zip file data):
+            ref = ZipFileReference(
+                      resource_factory = resource_manager.resource_factory,
+                      zip_file         = self.zip_file,
+                      path             = self.path,
+                      volume_name      = self.name,
+                      file_name        = file_name )
         else:
             # Otherwise, create a normal file reference:
             ref = ImageReference( resource_manager.resource_factory,
@@ -681,13 +1030,26 @@ class ImageVolume ( HasPrivateTraits ):
         return [ ImageVolumeInfo() ]
 
     def _images_default ( self ):
-        return self._load_image_info()
+        catalog = self.catalog
+
+        return [ catalog[ image_name ] for image_name in sorted( catalog ) ]
+
+    #-- Trait Event Handlers ---------------------------------------------------
+
+    def _images_changed ( self ):
+        self._catalog = dict( ( image.image_name, image )
+                              for image in self.images )
+
+    def _images_items_changed ( self ):
+        self._images_changed()
 
     #-- Property Implementations -----------------------------------------------
 
-    @cached_property
     def _get_catalog ( self ):
-        return dict((image.image_name, image) for image in self.images)
+        if self._catalog is None:
+            self._catalog = ImageCatalog( self, self._load_image_info() )
+
+        return self._catalog
 
     def _get_image_volume_code ( self ):
         data = dict((name, repr(value))
@@ -704,6 +1066,21 @@ class ImageVolume ( HasPrivateTraits ):
 
         return (ImageVolumeImagesTemplate % images)
 
+    def _get_image_volume_json ( self ):
+        record = dict( ( name, list( value ) if isinstance( value, list )
+                                             else value )
+                       for name, value in self.trait_get(
+                           'category', 'keywords', 'aliases', 'time_stamp'
+                       ).items() )
+        record[ 'info' ] = [ info.image_volume_info_record
+                             for info in self.info ]
+
+        return json_code_for( 'volume', record )
+
+    def _get_images_json ( self ):
+        return json_code_for( 'images', [ image.image_info_record
+                                          for image in self.images ] )
+
     def _get_license_text ( self ):
         return (('\n\n%s\n' % ('-' * 79)).join( [ info.image_volume_info_text
                                                   for info in self.info ] ))
@@ -711,101 +1088,189 @@ class ImageVolume ( HasPrivateTraits ):
     #-- Private Methods --------------------------------------------------------
 
     def _load_image_info ( self ):
-        """ Returns the list of ImageInfo objects for the images in the volume.
+        """ Returns a dictionary mapping image names to the manifest records
+            (or ImageInfo objects, for older manifests) for the images in the
+            volume.
         """
         # If there is no current path, then return a default list of images:
         if self.path == '':
-            return []
+            return {}
 
         time_stamp  = time_stamp_for( stat( self.path )[ ST_MTIME ] )
         volume_name = self.name
-        old_images  = []
-        cur_images  = []
 
         if self.is_zip_file:
-            zf = self.zip_file
-
             # Get the names of all top-level entries in the zip file:
-            names = zf.namelist()
+            names = self.zip_file.namelist()
+            read  = self.zip_file.read
+        else:
+            names = listdir( self.path )
+            read  = lambda name: read_file( join( self.path, name ) )
 
-            # Check to see if there is an image info manifest file:
-            if 'image_info.py' in names:
-                # Load the manifest code and extract the images list:
-                old_images = get_python_value( zf.read( 'image_info.py' ),
-                                               'images' )
+        # Load the image manifest, preferring the JSON version if present:
+        old_images = None
+        if image_info_index in names:
+            old_images = get_json_value( read( image_info_index ), 'images' )
 
-            # Check to see if our time stamp is up to data with the file:
-            if self.time_stamp < time_stamp:
+        if (old_images is None) and ('image_info.py' in names):
+            old_images = get_python_value( read( 'image_info.py' ), 'images' )
 
-                # If not, create an ImageInfo object for all image files
-                # contained in the .zip file:
-                for name in names:
-                    root, ext = splitext( name )
-                    if ext in ImageFileExts:
-                        cur_images.append( ImageInfo(
-                           name       = root,
-                           image_name = join_image_name( volume_name, name ) ) )
+        images = {}
+        for image in old_images or []:
+            if isinstance( image, ImageInfo ):
+                images[ image.image_name ] = image
+            else:
+                images[ image[ 'image_name' ] ] = image
 
-        else:
-            image_info_path = join( self.path, 'image_info.py' )
-            if exists( image_info_path ):
-                # Load the manifest code and extract the images list:
-                old_images = get_python_value( read_file( image_info_path ),
-                                               'images' )
-
-            # Check to see if our time stamp is up to data with the file:
-            if self.time_stamp < time_stamp:
-
-                # If not, create an ImageInfo object for each image file
-                # contained in the path:
-                for name in listdir( self.path ):
-                    root, ext = splitext( name )
-                    if ext in ImageFileExts:
-                        cur_images.append( ImageInfo(
-                           name       = root,
-                           image_name = join_image_name( volume_name, name ) ) )
-
-        # Merge the old and current images into a single up to date list:
-        if len( cur_images ) == 0:
-            images = old_images
-        else:
-            cur_image_set = dict( [ ( image.image_name, image )
-                                    for image in cur_images ] )
-            for old_image in old_images:
-                cur_image = cur_image_set.get( old_image.image_name )
-                if cur_image is not None:
-                    cur_image_set[ old_image.image_name ] = old_image
-                    cur_image.volume = self
-                    old_image.width  = cur_image.width
-                    old_image.height = cur_image.height
-                    cur_image.volume = None
-
-            images = list(cur_image_set.values())
+        # Check to see if our time stamp is up to date with the file:
+        if self.time_stamp < time_stamp:
+
+            # If not, bring the images up to date with the image files that
+            # the volume contains.  Note that the sizes of new images are only
+            # determined when they are first needed:
+            cur_images = {}
+            for name in names:
+                root, ext = splitext( name )
+                if ext in ImageFileExts:
+                    image_name = join_image_name( volume_name, name )
+                    cur_images[ image_name ] = images.get( image_name,
+                        { 'name': root, 'image_name': image_name } )
+
+            if len( cur_images ) > 0:
+                images = cur_images
 
         # Set the new time stamp of the volume:
         self.time_stamp = time_stamp
 
-        # Return the resulting sorted list as the default value:
-        images.sort( key = lambda item: item.image_name )
+        return images
 
-        # Make sure all images reference this volume:
-        for image in images:
-            image.volume = self
+#-------------------------------------------------------------------------------
+#  'ImageFileCache' class:
+#-------------------------------------------------------------------------------
 
-        return images
+class ImageFileCache ( HasPrivateTraits ):
+    """ Manages the files extracted from zip file image volumes.
+
+        Images in zip file volumes are normally decoded directly from memory,
+        and are only extracted to a file when a file name is actually needed
+        (eg. for the **absolute_path** of an ImageResource). If the cache is
+        enabled, the extracted files are kept in **path** across sessions
+        (named using a hash of their contents, so that a changed image is
+        never confused with an old one); otherwise they are written to a
+        temporary directory which is removed on exit.
+    """
+
+    #: Should extracted image files be kept in the persistent cache?
+    enabled = Bool( False )
+
+    #: The root directory of the persistent cache:
+    path = Str( image_cache_path )
+
+    #: The maximum total size of the files in the persistent cache (0 means
+    #: no limit):
+    max_bytes = Int( 16 * 1024 * 1024 )
+
+    #-- Private Traits ---------------------------------------------------------
+
+    #: The temporary directory used when the persistent cache is disabled:
+    temp_path = Any
+
+    #: The lock used to make creating cache files thread-safe:
+    lock = Any
+
+    #-- Object Methods ---------------------------------------------------------
+
+    def __init__ ( self, **traits ):
+        # Zip volumes extract files from worker threads too, so the lock must
+        # exist before any of them can use the cache:
+        self.lock = allocate_lock()
 
-    def _check_cache ( self, file_name ):
-        """ Checks to see if the specified zip file name has been saved in the
-            image cache. If it has, it returns the fully-qualified cache file
-            name to use; otherwise it returns None.
+        super( ImageFileCache, self ).__init__( **traits )
+
+    #-- Public Methods ---------------------------------------------------------
+
+    def file_for ( self, volume_name, file_name, data ):
+        """ Returns the name of a file containing the image **data** for the
+            image file **file_name** in the volume **volume_name**, creating
+            the file if necessary.
         """
-        cache_file = join( image_cache_path, self.name, file_name )
-        if (exists( cache_file ) and
-           (time_stamp_for( stat( cache_file )[ ST_MTIME ] ) >
-            self.time_stamp)):
-            return cache_file
+        root, ext  = splitext( file_name )
+        digest     = hashlib.sha1( data ).hexdigest()[ :16 ]
+        cache_file = join( self._root(), volume_name,
+                           '%s-%s%s' % ( root, digest, ext ) )
+
+        with self.lock:
+            if not exists( cache_file ):
+                cache_dir = dirname( cache_file )
+                if not exists( cache_dir ):
+                    makedirs( cache_dir )
+
+                # Write to a temporary file first, so that other processes
+                # sharing the cache never see a partially written file:
+                temp_file = '%s.%d.tmp' % ( cache_file, getpid() )
+                with open( temp_file, 'wb' ) as fh:
+                    fh.write( data )
+                try:
+                    rename( temp_file, cache_file )
+                except EnvironmentError:
+                    # Another process created the file first:
+                    remove( temp_file )
 
-        return None
+                if self.enabled:
+                    self.prune()
+
+        return cache_file
+
+    def prune ( self ):
+        """ Removes the least recently modified files from the persistent cache
+            until its total size is no more than **max_bytes**.
+        """
+        if (self.max_bytes <= 0) or (not isdir( self.path )):
+            return
+
+        files = []
+        for dir_path, dir_names, file_names in walk( self.path ):
+            for name in file_names:
+                file_name = join( dir_path, name )
+                info      = stat( file_name )
+                files.append( ( info[ ST_MTIME ], info.st_size, file_name ) )
+
+        total = sum( size for mtime, size, file_name in files )
+        for mtime, size, file_name in sorted( files ):
+            if total <= self.max_bytes:
+                break
+
+            try:
+                remove( file_name )
+                total -= size
+            except EnvironmentError:
+                pass
+
+    def clear ( self ):
+        """ Removes all files from the persistent cache.
+        """
+        with self.lock:
+            if isdir( self.path ):
+                shutil.rmtree( self.path, ignore_errors = True )
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _root ( self ):
+        """ Returns the root directory for extracted image files.
+        """
+        if self.enabled:
+            return self.path
+
+        with self.lock:
+            if self.temp_path is None:
+                self.temp_path = tempfile.mkdtemp( prefix = 'pyface_images_' )
+                atexit.register( shutil.rmtree, self.temp_path, True )
+
+        return self.temp_path
+
+
+#: The cache of the image files extracted from zip file image volumes:
+image_file_cache = ImageFileCache()
 
 #-------------------------------------------------------------------------------
 #  'ZipFileReference' class:
@@ -822,12 +1287,13 @@ class ZipFileReference ( ResourceReference ):
     #: The file within the zip file:
     file_name = Str
 
-    #: The name of the cached image file:
+    #: The name of the extracted image file (if it has been extracted):
     cache_file = File
 
     #-- The 'ResourceReference' API --------------------------------------------
 
-    #: The file name of the image (in this case, the cache file name):
+    #: The file name of the image (accessing this extracts the image from the
+    #: zip file into the image file cache):
     filename = Property
 
     #-- ResourceReference Interface Implementation -----------------------------
@@ -835,42 +1301,29 @@ class ZipFileReference ( ResourceReference ):
     def load ( self ):
         """ Loads the resource.
         """
-        # Check if the cache file has already been created:
-        cache_file = self.cache_file
-        if cache_file == '':
-            # Extract the data from the zip file:
-            data = self.zip_file.read( self.file_name )
+        # Extract the data from the zip file:
+        data = self.zip_file.read( self.file_name )
 
-            # Try to create an image from the data, without writing it to a
-            # file first:
-            image = self.resource_factory.image_from_data( data, Undefined )
-            if image is not None:
-                return image
+        # Try to create an image directly from the data, without writing it
+        # to a file first (the Python 2 toolkit bindings do not accept
+        # memoryviews):
+        if six.PY3:
+            data = memoryview( data )
 
-            # Make sure the correct image cache directory exists:
-            cache_dir = join( image_cache_path, self.volume_name )
-            if not exists( cache_dir ):
-                makedirs( cache_dir )
+        image = self.resource_factory.image_from_data( data, Undefined )
+        if image is not None:
+            return image
 
-            # Write the image data to the cache file:
-            cache_file = join( cache_dir, self.file_name )
-            with open(cache_file, 'wb') as fh:
-                fh.write( data )
-
-            # Save the cache file name in case we are called again:
-            self.cache_file = cache_file
-
-            # Release our reference to the zip file object:
-            self.zip_file = None
-
-        # Return the image data from the image cache file:
-        return self.resource_factory.image_from_file( cache_file )
+        # Otherwise load the image from an extracted copy of the file:
+        return self.resource_factory.image_from_file( self.filename )
 
     #-- Property Implementations -----------------------------------------------
 
     def _get_filename ( self ):
         if self.cache_file == '':
-            self.load()
+            self.cache_file = image_file_cache.file_for(
+                self.volume_name, self.file_name,
+                self.zip_file.read( self.file_name ) )
 
         return self.cache_file
 
@@ -889,14 +1342,44 @@ class ImageLibrary ( HasPrivateTraits ):
     #: corresponding ImageVolume objects):
     catalog = Dict( Str, ImageVolume )
 
-    #: The list of available images in the library:
-    images = Property( List, depends_on = 'volumes.images' )
+    #: The list of available images in the library (note that accessing this
+    #: loads the information for every image in every volume):
+    images = Property( List )
+
+    #: The names of the volumes to load in a background thread when
+    #: **prewarm** is called without any volume names:
+    prewarm_volumes = List( Str, [ 'std', 'icons' ] )
 
     #-- Private Traits ---------------------------------------------------------
 
     #: Mapping from a 'virtual' library name to a 'real' library name:
     aliases = Dict
 
+    #: Mapping from the names of the volumes found in the default library
+    #: locations to their paths (found without opening any of the volumes):
+    volume_paths = Property
+
+    #: The volumes which have been loaded individually, keyed by path (a
+    #: value of None means that the path is not a valid volume):
+    loaded_volumes = Dict
+
+    #: Has the list of all volumes been loaded?
+    volumes_loaded = Bool( False )
+
+    #: The lock used to make loading volumes thread-safe:
+    lock = Any
+
+    #-- Object Methods ---------------------------------------------------------
+
+    def __init__ ( self, **traits ):
+        # Created here (see ZipFilePool) so that the prewarming thread and
+        # the GUI thread always share the same lock:
+        self.lock = RLock()
+
+        # (The class name is rebound to the singleton instance below, so it
+        # can't be used with super):
+        HasPrivateTraits.__init__( self, **traits )
+
     #-- Public methods ---------------------------------------------------------
 
     def image_info ( self, image_name ):
@@ -933,7 +1416,17 @@ class ImageLibrary ( HasPrivateTraits ):
         # Extract the volume name from the image name:
         volume_name, file_name = split_image_name( image_name )
 
-        # Find the correct volume, possibly resolving any aliases used:
+        # Until all of the volumes have been loaded, try to load just the
+        # requested volume:
+        if not self.volumes_loaded:
+            path = self.volume_paths.get( volume_name )
+            if path is not None:
+                volume = self._load_volume( path )
+                if (volume is not None) and (volume.name == volume_name):
+                    return volume
+
+        # Otherwise find the correct volume, possibly resolving any aliases
+        # used (which requires loading all volumes):
         catalog = self.catalog
         aliases = self.aliases
         while volume_name not in catalog:
@@ -943,6 +1436,28 @@ class ImageLibrary ( HasPrivateTraits ):
 
         return catalog[ volume_name ]
 
+    def prewarm ( self, volume_names = None, background = True ):
+        """ Loads the volumes specified by **volume_names** (or by
+            **prewarm_volumes** if omitted), along with the information for
+            their images, so that the first use of an image from one of them
+            does not have to wait for the volume to be indexed. If
+            **background** is True the volumes are loaded in a daemon thread,
+            which is returned.
+        """
+        if volume_names is None:
+            volume_names = list( self.prewarm_volumes )
+
+        if not background:
+            self._prewarm( volume_names )
+            return None
+
+        thread = Thread( target = self._prewarm, args = ( volume_names, ),
+                         name = 'ImageLibrary.prewarm' )
+        thread.daemon = True
+        thread.start()
+
+        return thread
+
     def add_volume ( self, file_name = None ):
         """ If **file_name** is a file, it adds an image volume specified by
             **file_name** to the image library. If **file_name** is a
@@ -1009,26 +1524,19 @@ class ImageLibrary ( HasPrivateTraits ):
                               path )
 
         # Create the ImageVolume to describe the path's contents:
-        image_volume_path = join( path, 'image_volume.py' )
-        if exists( image_volume_path ):
-            volume = get_python_value( read_file( image_volume_path ),
-                                       'volume' )
-        else:
+        volume = load_image_volume( listdir( path ),
+                                    lambda name: read_file( join( path, name ) ) )
+        if volume is None:
             volume = ImageVolume()
 
-        # Set up the rest of the volume information:
+        # Set up the rest of the volume information.  Note that if the volume
+        # information is out of date, the images are brought up to date when
+        # they are first loaded, but the manifest is only rewritten by an
+        # explicit 'save' or 'update':
         volume.trait_set( name        = volume_name,
                           path        = path,
                           is_zip_file = False )
 
-        # Try to bring the volume information up to date if necessary:
-        if volume.time_stamp < time_stamp_for( stat( path )[ ST_MTIME ] ):
-            # Note that the save could fail if the volume is read-only, but
-            # that's OK, because we're only trying to do the save in case
-            # a developer had added or deleted some image files, which would
-            # require write access to the volume:
-            volume.save()
-
         # Add the new volume to the library:
         self.catalog[ volume_name ] = volume
         self.volumes.append( volume )
@@ -1127,6 +1635,10 @@ class ImageLibrary ( HasPrivateTraits ):
             # Write the image info source code to the zip file:
             zf.writestr( 'image_info.py', volume.images_code )
 
+            # Write the JSON manifests to the zip file:
+            zf.writestr( image_volume_index, volume.image_volume_json )
+            zf.writestr( image_info_index, volume.images_json )
+
             # Write a separate licenses file for human consumption:
             zf.writestr( 'license.txt', volume.license_text )
 
@@ -1141,29 +1653,12 @@ class ImageLibrary ( HasPrivateTraits ):
 
     def _volumes_default ( self ):
         result = []
+        for path in self._default_volume_files():
+            volume = self._load_volume( path )
+            if volume is not None:
+                result.append( volume )
 
-        # Check for and add the 'application' image library:
-        app_library = join( dirname( abspath( sys.argv[0] ) ), 'library' )
-        if isdir( app_library ):
-            result.extend( self._add_path( app_library ) )
-
-        # Get all volumes in the standard Traits UI image library directory:
-        result.extend(
-            self._add_path( join( get_resource_path( 1 ), 'library' ) ) )
-
-        # Check to see if there is an environment variable specifying a list
-        # of paths containing image libraries:
-        paths = environ.get( 'TRAITS_IMAGES' )
-        if paths is not None:
-            # Determine the correct OS path separator to use:
-            separator = ';'
-            if system() != 'Windows':
-                separator = ':'
-
-            # Add all image volumes found in each path in the environment
-            # variable:
-            for path in paths.split( separator ):
-                result.extend( self._add_path( path ) )
+        self.volumes_loaded = True
 
         # Return the list of default volumes found:
         return result
@@ -1173,10 +1668,19 @@ class ImageLibrary ( HasPrivateTraits ):
 
     #-- Property Implementations -----------------------------------------------
 
-    @cached_property
     def _get_images ( self ):
         return self._get_images_list()
 
+    def _get_volume_paths ( self ):
+        if self._volume_paths is None:
+            with self.lock:
+                if self._volume_paths is None:
+                    self._volume_paths = dict(
+                        ( splitext( basename( path ) )[0], path )
+                        for path in self._default_volume_files() )
+
+        return self._volume_paths
+
     #-- Private Methods --------------------------------------------------------
 
     def _get_images_list ( self ):
@@ -1193,24 +1697,79 @@ class ImageLibrary ( HasPrivateTraits ):
         # Return the images list:
         return images
 
-    def _add_path ( self, path ):
-        """ Returns a list of ImageVolume objects, one for each image library
-            located in the specified **path**.
+    def _default_volume_files ( self ):
+        """ Returns the list of candidate volume zip files in the default
+            image library locations, without opening any of them.
         """
         result = []
 
+        # Check for the 'application' image library:
+        app_library = join( dirname( abspath( sys.argv[0] ) ), 'library' )
+        if isdir( app_library ):
+            result.extend( self._volume_files( app_library ) )
+
+        # Get all volumes in the standard Traits UI image library directory:
+        result.extend(
+            self._volume_files( join( get_resource_path( 1 ), 'library' ) ) )
+
+        # Check to see if there is an environment variable specifying a list
+        # of paths containing image libraries:
+        paths = environ.get( 'TRAITS_IMAGES' )
+        if paths is not None:
+            # Determine the correct OS path separator to use:
+            separator = ';'
+            if system() != 'Windows':
+                separator = ':'
+
+            # Add all image volumes found in each path in the environment
+            # variable:
+            for path in paths.split( separator ):
+                result.extend( self._volume_files( path ) )
+
+        return result
+
+    def _volume_files ( self, path ):
+        """ Returns the list of candidate volume zip files located in the
+            specified **path**.
+        """
         # Make sure the path is a directory:
-        if isdir( path ):
+        if not isdir( path ):
+            return []
 
-            # Find each zip file in the directory:
-            for base in listdir( path ):
-                if splitext( base )[1] == '.zip':
+        # Find each zip file in the directory:
+        return [ abspath( join( path, base ) ) for base in listdir( path )
+                 if splitext( base )[1] == '.zip' ]
 
-                    # Try to create a volume from the zip file and add it to
-                    # the result:
-                    volume = self._add_volume( join( path, base ) )
-                    if volume is not None:
-                        result.append( volume )
+    def _load_volume ( self, path ):
+        """ Returns the ImageVolume object for the volume zip file specified
+            by **path**, loading it if it has not already been loaded, or None
+            if it is not a valid volume.
+        """
+        with self.lock:
+            if path not in self.loaded_volumes:
+                self.loaded_volumes[ path ] = self._add_volume( path )
+
+            return self.loaded_volumes[ path ]
+
+    def _prewarm ( self, volume_names ):
+        """ Loads the specified volumes and the information for their images.
+        """
+        for volume_name in volume_names:
+            volume = self.find_volume( '@%s:' % volume_name )
+            if volume is not None:
+                volume.catalog
+
+    def _add_path ( self, path ):
+        """ Returns a list of ImageVolume objects, one for each image library
+            located in the specified **path**.
+        """
+        result = []
+
+        # Try to create a volume from each zip file and add it to the result:
+        for file_name in self._volume_files( path ):
+            volume = self._add_volume( file_name )
+            if volume is not None:
+                result.append( volume )
 
         # Return the list of volumes found:
         return result
@@ -1234,12 +1793,10 @@ class ImageLibrary ( HasPrivateTraits ):
             # Get the names of all top-level entries in the zip file:
             names = zf.namelist()
 
-            # Check to see if there is a manifest file:
-            if 'image_volume.py' in names:
-                # Load the manifest code and extract the volume object:
-                volume = get_python_value( zf.read( 'image_volume.py' ),
-                                           'volume' )
-
+            # Check to see if there is a manifest file, and if so load the
+            # volume object from it:
+            volume = load_image_volume( names, zf.read )
+            if volume is not None:
                 # Set the volume name:
                 volume.name = volume_name
 
@@ -1259,13 +1816,9 @@ class ImageLibrary ( HasPrivateTraits ):
                                        path     = path,
                                        zip_file = zf )
 
-            # If this volume is not up to date, update it:
-            if volume.time_stamp < time_stamp_for( stat( path )[ ST_MTIME ] ):
-                # Note that the save could fail if the volume is read-only, but
-                # that's OK, because we're only trying to do the save in case
-                # a developer had added or deleted some image files, which would
-                # require write access to the volume:
-                volume.save()
+            # Note that if this volume is not up to date, its images are brought
+            # up to date when they are first loaded, but the zip file is only
+            # rewritten by an explicit 'save' or 'update':
 
             # Return the volume:
             return volume
@@ -0,0 +1,303 @@
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+
+from traits.testing.unittest_tools import unittest
+
+from ..image import (FastZipFile, ImageFileCache, ImageInfo, ImageLibrary,
+                     ImageVolume, ZipFilePool, get_json_value,
+                     image_file_cache, image_info_index, image_volume_index,
+                     load_image_volume, read_file)
+
+IMAGE_PATH = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'tests', 'images', 'core.png'
+)
+
+
+class TestImageVolume(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        shutil.copy(IMAGE_PATH, os.path.join(self.tmpdir, 'core.png'))
+        shutil.copy(IMAGE_PATH, os.path.join(self.tmpdir, 'other.png'))
+        self.volume = ImageVolume(
+            name='test', path=self.tmpdir, is_zip_file=False
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _read(self, name):
+        return read_file(os.path.join(self.tmpdir, name))
+
+    def test_catalog_lazy(self):
+        catalog = self.volume.catalog
+
+        self.assertEqual(sorted(catalog), ['@test:core', '@test:other'])
+        self.assertEqual(catalog._images, {})
+
+        image = catalog['@test:core']
+
+        self.assertIsInstance(image, ImageInfo)
+        self.assertIs(image.volume, self.volume)
+        self.assertEqual(list(catalog._images), ['@test:core'])
+        self.assertIs(catalog.get('@test:core'), image)
+        self.assertIsNone(catalog.get('@test:missing'))
+
+    def test_images(self):
+        images = self.volume.images
+
+        self.assertEqual([image.image_name for image in images],
+                         ['@test:core', '@test:other'])
+        self.assertIs(self.volume.catalog['@test:core'], images[0])
+
+    def test_save_json_manifest(self):
+        self.volume.save()
+
+        names = os.listdir(self.tmpdir)
+        self.assertIn(image_volume_index, names)
+        self.assertIn(image_info_index, names)
+
+        records = get_json_value(self._read(image_info_index), 'images')
+        self.assertEqual(records[0], {
+            'name': 'core',
+            'image_name': '@test:core',
+            'width': 64,
+            'height': 64,
+        })
+
+    def test_load_json_manifest(self):
+        self.volume.images[0].description = 'A description'
+        self.volume.images[0].border.left = 2
+        self.volume.save()
+
+        volume = load_image_volume(os.listdir(self.tmpdir), self._read)
+        volume.trait_set(name='test', path=self.tmpdir, is_zip_file=False)
+        self.assertEqual(volume.time_stamp, self.volume.time_stamp)
+
+        image = volume.catalog['@test:core']
+        self.assertEqual(image.description, 'A description')
+        self.assertEqual(image.border.left, 2)
+        self.assertEqual(image.width, 64)
+
+    def test_unsupported_json_manifest(self):
+        self.assertIsNone(get_json_value(b'{"version": 999}', 'images'))
+
+
+class TestZipFilePool(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'test.zip')
+        with zipfile.ZipFile(self.path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('deflated.txt', b'deflated' * 100)
+            zf.writestr(zipfile.ZipInfo('stored.txt'), b'stored')
+        self.pool = ZipFilePool(idle_timeout=0.05)
+
+    def tearDown(self):
+        self.pool.close_all()
+        shutil.rmtree(self.tmpdir)
+
+    def check_read(self):
+        self.assertEqual(self.pool.read(self.path, 'deflated.txt'),
+                         b'deflated' * 100)
+        self.assertEqual(self.pool.read(self.path, 'stored.txt'), b'stored')
+        with self.assertRaises(KeyError):
+            self.pool.read(self.path, 'missing.txt')
+
+    def test_read(self):
+        self.check_read()
+        self.assertEqual(sorted(self.pool.namelist(self.path)),
+                         ['deflated.txt', 'stored.txt'])
+
+    def test_read_mmap(self):
+        self.pool.use_mmap = True
+        self.check_read()
+        self.assertIsNotNone(self.pool.handles[self.path].map)
+
+    def test_shared_handle(self):
+        zf_1 = FastZipFile(path=self.path, pool=self.pool)
+        zf_2 = FastZipFile(path=self.path, pool=self.pool)
+
+        zf_1.read('stored.txt')
+        handle = self.pool.handles[self.path]
+        zf_2.read('stored.txt')
+
+        self.assertEqual(list(self.pool.handles), [self.path])
+        self.assertIs(self.pool.handles[self.path], handle)
+
+    def test_close(self):
+        zip_file = FastZipFile(path=self.path, pool=self.pool)
+        zip_file.read('stored.txt')
+        handle = self.pool.handles[self.path]
+
+        zip_file.close()
+
+        self.assertEqual(self.pool.handles, {})
+        self.assertIsNone(handle.zf)
+        self.assertEqual(zip_file.read('stored.txt'), b'stored')
+
+    def test_idle_timeout(self):
+        self.pool.read(self.path, 'stored.txt')
+        reaper = self.pool.reaper
+
+        self.assertIsNotNone(reaper)
+        reaper.join(5.0)
+
+        self.assertEqual(self.pool.handles, {})
+        self.assertIsNone(self.pool.reaper)
+
+    def test_concurrent_reads(self):
+        self.pool.use_mmap = True
+        errors = []
+
+        def read():
+            try:
+                for i in range(200):
+                    self.check_read()
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=read) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+
+class TestImageFileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = ImageFileCache(path=self.tmpdir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_disabled(self):
+        cache_file = self.cache.file_for('test', 'core.png', b'data')
+
+        self.assertFalse(cache_file.startswith(self.tmpdir))
+        self.assertEqual(read_file(cache_file), b'data')
+        self.assertEqual(os.listdir(self.tmpdir), [])
+
+    def test_content_hashed(self):
+        self.cache.enabled = True
+
+        cache_file = self.cache.file_for('test', 'core.png', b'data')
+        other_file = self.cache.file_for('test', 'core.png', b'other')
+
+        self.assertTrue(cache_file.startswith(self.tmpdir))
+        self.assertTrue(cache_file.endswith('.png'))
+        self.assertNotEqual(cache_file, other_file)
+        self.assertEqual(read_file(cache_file), b'data')
+        self.assertEqual(
+            self.cache.file_for('test', 'core.png', b'data'), cache_file
+        )
+
+    def test_prune(self):
+        self.cache.trait_set(enabled=True, max_bytes=10)
+
+        old_file = self.cache.file_for('test', 'old.png', b'x' * 6)
+        os.utime(old_file, (0, 0))
+        new_file = self.cache.file_for('test', 'new.png', b'y' * 6)
+
+        self.assertFalse(os.path.exists(old_file))
+        self.assertTrue(os.path.exists(new_file))
+
+    def test_clear(self):
+        self.cache.enabled = True
+        self.cache.file_for('test', 'core.png', b'data')
+
+        self.cache.clear()
+
+        self.assertFalse(os.path.exists(self.tmpdir))
+
+
+class TestZipFileReference(unittest.TestCase):
+
+    def test_load_in_memory(self):
+        temp_path = image_file_cache.temp_path
+        resource = ImageLibrary.image_resource('@icons:dialog-warning')
+
+        image = resource._ref.load()
+
+        self.assertIsNotNone(image)
+        self.assertEqual(resource._ref.cache_file, '')
+        self.assertEqual(image_file_cache.temp_path, temp_path)
+
+    def test_filename(self):
+        resource = ImageLibrary.image_resource('@icons:folder-new')
+
+        filename = resource._ref.filename
+
+        self.assertTrue(filename.endswith('.png'))
+        self.assertTrue(os.path.exists(filename))
+
+
+class TestImageLibrary(unittest.TestCase):
+
+    def test_standard_volumes_not_saved(self):
+        volume = ImageLibrary.find_volume('@icons:dialog-warning')
+        mtime = os.stat(volume.path).st_mtime
+
+        image = ImageLibrary.image_info('@icons:dialog-warning')
+
+        self.assertEqual(image.width, 32)
+        self.assertEqual(os.stat(volume.path).st_mtime, mtime)
+
+    def test_find_volume_loads_only_that_volume(self):
+        library = type(ImageLibrary)()
+
+        self.assertIn('std', library.volume_paths)
+        self.assertIn('icons', library.volume_paths)
+        self.assertEqual(library.loaded_volumes, {})
+
+        volume = library.find_volume('@icons:dialog-warning')
+
+        self.assertEqual(volume.name, 'icons')
+        self.assertEqual(list(library.loaded_volumes), [volume.path])
+        self.assertFalse(library.volumes_loaded)
+        self.assertIs(library.find_volume('@icons:dialog-error'), volume)
+
+    def test_volumes_reuse_loaded_volumes(self):
+        library = type(ImageLibrary)()
+        volume = library.find_volume('@icons:dialog-warning')
+
+        self.assertIn(volume, library.volumes)
+        self.assertTrue(library.volumes_loaded)
+        self.assertIs(library.catalog['icons'], volume)
+
+    def test_find_volume_unknown(self):
+        library = type(ImageLibrary)()
+
+        self.assertIsNone(library.find_volume('@missing:image'))
+
+    def test_prewarm(self):
+        library = type(ImageLibrary)()
+        library.prewarm_volumes = ['icons']
+
+        thread = library.prewarm()
+        thread.join()
+
+        self.assertEqual(len(library.loaded_volumes), 1)
+        volume = library.find_volume('@icons:dialog-warning')
+        self.assertIsNotNone(volume._catalog)
+
+    def test_lock_created_up_front(self):
+        # The lock exists before any thread uses the library, pool or cache,
+        # so that two threads can't each create their own.
+        for obj in (type(ImageLibrary)(), ZipFilePool(), ImageFileCache()):
+            self.assertIsNotNone(obj.__dict__.get('lock'))
+
+    def test_prewarm_foreground(self):
+        library = type(ImageLibrary)()
+
+        self.assertIsNone(library.prewarm(['std'], background=False))
+        self.assertIsNotNone(library.find_volume('@std:alert16')._catalog)
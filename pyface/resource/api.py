@@ -13,6 +13,7 @@
 #------------------------------------------------------------------------------
 from __future__ import absolute_import
 
+from .resource_cache import ResourceCache
 from .resource_factory import ResourceFactory
 from .resource_manager import ResourceManager
 from .resource_path    import resource_path
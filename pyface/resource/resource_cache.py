@@ -0,0 +1,301 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#------------------------------------------------------------------------------
+""" A bounded, least-recently-used cache for loaded resources.
+
+Decoding images is expensive, and the same handful of icons tends to be
+requested over and over again (eg. once per row of a tree or table), so
+toolkit images are kept in a process-wide cache.  The cache is bounded by the
+(approximate) number of bytes held, and evicts the least recently used entries
+when it is full.
+"""
+
+from collections import OrderedDict
+from threading import RLock
+from weakref import WeakValueDictionary
+
+
+class ResourceCache(object):
+    """ A thread-safe, size-bounded LRU cache.
+
+    Each entry has a size in bytes given when it is added to the cache.  When
+    adding an entry takes the total size over ``max_bytes`` (or the number of
+    entries over ``max_items``), the least recently used entries are evicted.
+
+    If ``weak_values`` is True then evicted values are still returned by
+    lookups for as long as something else holds a reference to them, so that
+    the same key always gives the same live object.
+
+    Parameters
+    ----------
+    max_bytes : int or None
+        The maximum total size of the cached values, or None for no limit.
+    max_items : int or None
+        The maximum number of cached values, or None for no limit.
+    weak_values : bool
+        Whether to keep weak references to evicted values.
+    """
+
+    def __init__(self, max_bytes=None, max_items=None, weak_values=False):
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self.weak_values = weak_values
+
+        #: The number of lookups that found a value in the cache.
+        self.hits = 0
+
+        #: The number of lookups that did not find a value in the cache.
+        self.misses = 0
+
+        #: The number of entries removed to keep the cache within its limits.
+        self.evictions = 0
+
+        #: The total size of the cached values in bytes.
+        self.nbytes = 0
+
+        # Maps keys to (value, nbytes) tuples, least recently used first.
+        self._entries = OrderedDict()
+
+        # Weak references to evicted values, if 'weak_values' is True.
+        self._weak_entries = WeakValueDictionary()
+
+        self._lock = RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries or key in self._weak_entries
+
+    ###########################################################################
+    # 'ResourceCache' interface.
+    ###########################################################################
+
+    def get(self, key, default=None):
+        """ Return the value cached for a key, or a default value.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the value.
+        default : any
+            The value to return if the key is not in the cache.
+
+        Returns
+        -------
+        value : any
+            The cached value or the default.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                value = self._weak_entries.get(key)
+                if value is not None:
+                    self.hits += 1
+                    return value
+
+                self.misses += 1
+                return default
+
+            # Re-insert the entry to mark it as the most recently used.
+            self._entries[key] = entry
+            self.hits += 1
+
+            return entry[0]
+
+    def set(self, key, value, nbytes=0):
+        """ Add a value to the cache, evicting old entries if required.
+
+        Values which are larger than the cache itself are not stored.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the value.
+        value : any
+            The value to cache.
+        nbytes : int
+            The (approximate) size of the value in bytes.
+        """
+        with self._lock:
+            self._remove(key)
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                return
+
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            self._evict()
+
+    def get_or_create(self, key, factory, size_of=None):
+        """ Return the value cached for a key, creating it if required.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the value.
+        factory : callable
+            A callable with no arguments that creates the value.
+        size_of : callable or None
+            A callable which returns the size of a value in bytes.  If None
+            the value is counted as taking no space.
+
+        Returns
+        -------
+        value : any
+            The cached or newly created value.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = factory()
+            nbytes = size_of(value) if size_of is not None else 0
+            self.set(key, value, nbytes)
+
+        return value
+
+    def discard(self, key):
+        """ Remove the value for a key from the cache, if present.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the value.
+        """
+        with self._lock:
+            self._remove(key)
+
+    def discard_matching(self, predicate):
+        """ Remove all values whose keys match a predicate.
+
+        Parameters
+        ----------
+        predicate : callable
+            A callable which is given a key and returns True if its value
+            should be removed from the cache.
+        """
+        with self._lock:
+            keys = list(self._entries) + list(self._weak_entries.keys())
+            for key in keys:
+                if predicate(key):
+                    self._remove(key)
+
+    def clear(self):
+        """ Remove all values from the cache. """
+        with self._lock:
+            self._entries.clear()
+            self._weak_entries.clear()
+            self.nbytes = 0
+
+    def resize(self, max_bytes=None, max_items=None):
+        """ Change the limits of the cache, evicting entries if required.
+
+        Parameters
+        ----------
+        max_bytes : int or None
+            The maximum total size of the cached values, or None for no limit.
+        max_items : int or None
+            The maximum number of cached values, or None for no limit.
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            self.max_items = max_items
+            self._evict()
+
+    def statistics(self):
+        """ Return a dictionary of statistics about the cache.
+
+        Returns
+        -------
+        statistics : dict
+            The hits, misses and evictions counts, the number of entries
+            (and of weakly referenced evicted entries) and the total size of
+            the cache.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'items': len(self._entries),
+                'weak_items': len(self._weak_entries),
+                'nbytes': self.nbytes,
+                'max_bytes': self.max_bytes,
+                'max_items': self.max_items,
+            }
+
+    def reset_statistics(self):
+        """ Reset the hits, misses and evictions counters. """
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _remove(self, key):
+        """ Remove an entry from the cache without counting an eviction. """
+        self._weak_entries.pop(key, None)
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+    def _evict(self):
+        """ Evict least recently used entries until the cache is in bounds.
+        """
+        while self._entries and (
+            (self.max_bytes is not None and self.nbytes > self.max_bytes) or
+            (self.max_items is not None and
+                len(self._entries) > self.max_items)):
+            key, (value, nbytes) = self._entries.popitem(last=False)
+            self.nbytes -= nbytes
+            self.evictions += 1
+            if self.weak_values:
+                try:
+                    self._weak_entries[key] = value
+                except TypeError:
+                    # The value can't be weakly referenced.
+                    pass
+
+
+def data_cache_key(data):
+    """ Return a hashable cache key for image data.
+
+    Parameters
+    ----------
+    data : bytes-like
+        The image data, eg. bytes or a memoryview of a zip file member.
+
+    Returns
+    -------
+    key : bytes
+        The data itself if it is a bytes object, the bytes object underlying
+        a memoryview of the whole of one, or otherwise a copy of the data.
+    """
+    if isinstance(data, bytes):
+        return data
+
+    if isinstance(data, memoryview):
+        obj = getattr(data, 'obj', None)
+        if isinstance(obj, bytes) and len(obj) == data.nbytes:
+            return obj
+
+        return data.tobytes()
+
+    return bytes(data)
+
+
+#: The default maximum size of the shared image cache in bytes.
+IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+#: A shared cache of decoded toolkit images, keyed by (source, size, kind)
+#: tuples where the source is a file name or image data.
+image_cache = ResourceCache(max_bytes=IMAGE_CACHE_MAX_BYTES)
+
+#### EOF ######################################################################
@@ -15,12 +15,13 @@ sounds etc.
 """
 
 # Standard library imports.
-import collections, glob, inspect, os, sys, types
+import collections, inspect, os, sys, types
 from os.path import join
+from stat import S_ISREG
 from zipfile import is_zipfile, ZipFile
 
 # Enthought library imports.
-from traits.api import HasTraits, Instance, List
+from traits.api import Dict, HasTraits, Instance, List
 from traits.util.resource import get_path
 
 # Local imports.
@@ -48,6 +49,20 @@ class ResourceManager(HasTraits):
     # a images in the format that they require.
     resource_factory = Instance(ResourceFactory)
 
+    #### Private interface ####################################################
+
+    # Index of the files in each directory that has been searched, used to
+    # resolve image names without globbing.  Maps a directory name to an
+    # (mtime, index) tuple, where the index maps a file basename to a
+    # dictionary of {extension: filename}.
+    _directory_indexes = Dict
+
+    # The zip files that have been searched, kept open so that each archive
+    # is only opened and scanned once.  Maps a filename to a (key, entry)
+    # tuple, where the key is the file's (mtime, size) and the entry is a
+    # (zip_file, names) tuple, or None if the file is not a zip file.
+    _zip_files = Dict
+
     ###########################################################################
     # 'ResourceManager' interface.
     ###########################################################################
@@ -98,12 +113,13 @@ class ResourceManager(HasTraits):
         basename, extension = os.path.splitext(image_name)
         if len(extension) > 0:
             extensions = [extension]
-            pattern = image_name
 
         # Otherwise, we will search for common image suffixes.
         else:
             extensions = self.IMAGE_EXTENSIONS
-            pattern = image_name + '.*'
+
+        # The image name may itself contain a relative path.
+        image_dirname, image_basename = os.path.split(basename)
 
         # Try the 'images' sub-directory first (since that is commonly
         # where we put them!).  If the image is not found there then look
@@ -133,39 +149,40 @@ class ResourceManager(HasTraits):
 
             # Is there anything resembling the image name in the directory?
             for path in subdirs:
-                filenames = glob.glob(join(dirname, path, pattern))
-                for filename in filenames:
-                    not_used, extension = os.path.splitext(filename)
-                    if extension in extensions:
-                        reference = ImageReference(
-                            self.resource_factory, filename=filename
-                        )
+                index = self._get_directory_index(
+                    join(dirname, path, image_dirname)
+                )
+                filenames = index.get(image_basename)
+                if filenames is not None:
+                    for extension in extensions:
+                        filename = filenames.get(extension)
+                        if filename is not None:
+                            reference = ImageReference(
+                                self.resource_factory, filename=filename
+                            )
 
-                        return reference
+                            return reference
 
             # Is there an 'images' zip file in the directory?
-            zip_filename = join(dirname, 'images.zip')
-            if os.path.isfile(zip_filename):
-                zip_file = ZipFile(zip_filename, 'r')
+            zip_entry = self._get_zip_file(join(dirname, 'images.zip'))
+            if zip_entry is not None:
+                zip_file, names = zip_entry
                 # Try the image name itself, and then the image name with
                 # common images suffixes.
                 for extension in extensions:
-                    try:
-                        image_data = zip_file.read(basename + extension)
+                    name = basename + extension
+                    if name in names:
                         reference = ImageReference(
-                            self.resource_factory, data=image_data
+                            self.resource_factory, data=zip_file.read(name)
                         )
 
                         return reference
 
-                    except:
-                        pass
-
             # is this a path within a zip file?
             # first, find the zip file in the path
             filepath = dirname
             zippath = ''
-            while not is_zipfile(filepath) and \
+            while self._get_zip_file(filepath) is None and \
                   os.path.splitdrive(filepath)[1].startswith('\\') and \
                   os.path.splitdrive(filepath)[1].startswith('/'):
                 filepath, tail = os.path.split(filepath)
@@ -174,43 +191,106 @@ class ResourceManager(HasTraits):
                 else:
                     zippath = tail
 
-
-
             # if we found a zipfile, then look inside it for the image!
-            if is_zipfile(filepath):
-
-                zip_file = ZipFile(filepath)
+            zip_entry = self._get_zip_file(filepath)
+            if zip_entry is not None:
+                zip_file, names = zip_entry
                 for subpath in ['images', '']:
                     for extension in extensions:
-                        try:
-                            # this is a little messy. since zip files don't
-                            # recognize a leading slash, we have to be very
-                            # particular about how we build this path when
-                            # there are empty strings
-                            if zippath != '':
-                                path = zippath + '/'
-                            else:
-                                path = ''
-
-                            if subpath != '':
-                                path = path + subpath + '/'
-
-                            path = path + basename + extension
-                            # now that we have the path we can attempt to load
-                            # the image
-                            image_data = zip_file.read(path)
+                        # this is a little messy. since zip files don't
+                        # recognize a leading slash, we have to be very
+                        # particular about how we build this path when
+                        # there are empty strings
+                        if zippath != '':
+                            path = zippath + '/'
+                        else:
+                            path = ''
+
+                        if subpath != '':
+                            path = path + subpath + '/'
+
+                        path = path + basename + extension
+                        # now that we have the path we can attempt to load
+                        # the image
+                        if path in names:
                             reference = ImageReference(
-                                self.resource_factory, data=image_data
-                                )
+                                self.resource_factory,
+                                data=zip_file.read(path)
+                            )
 
-                            # if there was no exception then return the result
                             return reference
 
-                        except:
-                            pass
-
         return None
 
+    def _get_directory_index(self, dirname):
+        """ Returns the index of the files in a directory.
+
+        The index is built the first time a directory is searched and is
+        rebuilt only when the modification time of the directory changes.
+        Directories that do not exist have an empty index.
+
+        """
+
+        try:
+            mtime = os.stat(dirname).st_mtime
+        except OSError:
+            return {}
+
+        cached = self._directory_indexes.get(dirname)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            filenames = os.listdir(dirname)
+        except OSError:
+            filenames = []
+
+        index = {}
+        for filename in filenames:
+            basename, extension = os.path.splitext(filename)
+            index.setdefault(basename, {})[extension] = join(dirname, filename)
+
+        self._directory_indexes[dirname] = (mtime, index)
+
+        return index
+
+    def _get_zip_file(self, filename):
+        """ Returns a (zip_file, names) tuple for a zip file.
+
+        Each zip file is opened once and its list of member names cached
+        until the file is modified.  None is returned if the file does not
+        exist or is not a zip file.
+
+        """
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+
+        if not S_ISREG(stat.st_mode):
+            return None
+
+        key = (stat.st_mtime, stat.st_size)
+        cached = self._zip_files.get(filename)
+        if cached is not None:
+            if cached[0] == key:
+                return cached[1]
+
+            elif cached[1] is not None:
+                cached[1][0].close()
+
+        if is_zipfile(filename):
+            zip_file = ZipFile(filename, 'r')
+            entry = (zip_file, frozenset(zip_file.namelist()))
+
+        else:
+            entry = None
+
+        self._zip_files[filename] = (key, entry)
+
+        return entry
+
     def _get_resource_path(self, object):
         """ Returns the resource path for an object. """
 
@@ -0,0 +1,171 @@
+from __future__ import absolute_import
+
+import gc
+
+from traits.testing.unittest_tools import unittest
+
+from ..resource_cache import ResourceCache, data_cache_key
+
+
+class TestResourceCache(unittest.TestCase):
+
+    def test_get_missing(self):
+        cache = ResourceCache()
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('a', 1), 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hits, 0)
+
+    def test_set_get(self):
+        cache = ResourceCache()
+
+        cache.set('a', 1, 10)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.nbytes, 10)
+        self.assertIn('a', cache)
+
+    def test_set_replaces(self):
+        cache = ResourceCache()
+
+        cache.set('a', 1, 10)
+        cache.set('a', 2, 5)
+
+        self.assertEqual(cache.get('a'), 2)
+        self.assertEqual(cache.nbytes, 5)
+        self.assertEqual(len(cache), 1)
+
+    def test_evict_max_bytes(self):
+        cache = ResourceCache(max_bytes=20)
+        cache.set('a', 1, 10)
+        cache.set('b', 2, 10)
+
+        # 'a' becomes the most recently used, so 'b' is evicted.
+        cache.get('a')
+        cache.set('c', 3, 10)
+
+        self.assertNotIn('b', cache)
+        self.assertIn('a', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.nbytes, 20)
+
+    def test_evict_max_items(self):
+        cache = ResourceCache(max_items=2)
+        for key in 'abc':
+            cache.set(key, key)
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_too_large(self):
+        cache = ResourceCache(max_bytes=20)
+        cache.set('a', 1, 10)
+
+        cache.set('b', 2, 30)
+
+        self.assertNotIn('b', cache)
+        self.assertIn('a', cache)
+
+    def test_get_or_create(self):
+        cache = ResourceCache()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return 'value'
+
+        value_1 = cache.get_or_create('a', factory, len)
+        value_2 = cache.get_or_create('a', factory, len)
+
+        self.assertEqual(value_1, 'value')
+        self.assertEqual(value_2, 'value')
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.nbytes, 5)
+
+    def test_discard(self):
+        cache = ResourceCache()
+        cache.set('a', 1, 10)
+
+        cache.discard('a')
+        cache.discard('b')
+
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.nbytes, 0)
+        self.assertEqual(cache.evictions, 0)
+
+    def test_discard_matching(self):
+        cache = ResourceCache()
+        cache.set(('a', 'image'), 1, 10)
+        cache.set(('a', 'icon'), 2, 10)
+        cache.set(('b', 'image'), 3, 10)
+
+        cache.discard_matching(lambda key: key[0] == 'a')
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.nbytes, 10)
+
+    def test_resize(self):
+        cache = ResourceCache()
+        for key in 'abc':
+            cache.set(key, key, 10)
+
+        cache.resize(max_bytes=15)
+
+        self.assertEqual(len(cache), 1)
+        self.assertIn('c', cache)
+
+    def test_statistics(self):
+        cache = ResourceCache(max_bytes=100)
+        cache.set('a', 1, 10)
+        cache.get('a')
+        cache.get('b')
+
+        statistics = cache.statistics()
+
+        self.assertEqual(statistics['hits'], 1)
+        self.assertEqual(statistics['misses'], 1)
+        self.assertEqual(statistics['items'], 1)
+        self.assertEqual(statistics['nbytes'], 10)
+        self.assertEqual(statistics['max_bytes'], 100)
+
+        cache.reset_statistics()
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+
+    def test_weak_values(self):
+        class Value(object):
+            pass
+
+        cache = ResourceCache(max_items=1, weak_values=True)
+        value = Value()
+        cache.set('a', value)
+        cache.set('b', Value())
+
+        # 'a' has been evicted, but is still alive so is still found.
+        self.assertIs(cache.get('a'), value)
+        self.assertEqual(cache.statistics()['weak_items'], 1)
+
+        del value
+        gc.collect()
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.statistics()['weak_items'], 0)
+
+
+class TestDataCacheKey(unittest.TestCase):
+
+    def test_bytes(self):
+        data = b'data'
+
+        self.assertIs(data_cache_key(data), data)
+
+    def test_memoryview(self):
+        data = b'data'
+
+        self.assertEqual(data_cache_key(memoryview(data)), data)
+        self.assertEqual(data_cache_key(memoryview(data)[1:]), b'ata')
+        self.assertEqual(data_cache_key(bytearray(data)), data)
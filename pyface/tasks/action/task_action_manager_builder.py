@@ -15,6 +15,13 @@ from pyface.tasks.action.schema_addition import SchemaAddition
 # Logging.
 logger = logging.getLogger(__name__)
 
+# The maximum number of resolved paths to keep in the cache.
+_RESOLVED_ITEMS_CACHE_SIZE = 1024
+
+# The order and merging of the items at the paths that have additions, keyed
+# by a description of the items. See TaskActionManagerBuilder._resolve_items.
+_resolved_items_cache = {}
+
 
 class TaskActionManagerBuilder(HasTraits):
     """ Builds menu bars and tool bars from menu bar and tool bar schema, along
@@ -163,6 +170,9 @@ class TaskActionManagerBuilder(HasTraits):
         Items must be subclasses of `Schema` and they must be instances of
         the same class to be merged.
 
+        Return a list of tuples of items: a tuple with several items holds
+        schemas that are to be built as a single merged schema.
+
         """
 
         merged_items = []
@@ -176,53 +186,92 @@ class TaskActionManagerBuilder(HasTraits):
             for items_class in ordered_items_class:
                 items_with_same_class = class_to_items[items_class]
 
-                if len(items_with_same_class) == 1:
-                    merged_items.extend(items_with_same_class)
+                # Only schemas can be merged.
+                if (len(items_with_same_class) > 1
+                        and issubclass(items_class, Schema)):
+                    merged_items.append(tuple(items_with_same_class))
 
                 else:
-                    # Only schemas can be merged.
-                    if issubclass(items_class, Schema):
-                        # Merge into a single schema.
-                        items_content = sum(
-                            (item.items for item in items_with_same_class), []
-                        )
-
-                        merged_item = items_with_same_class[0].clone_traits()
-                        merged_item.items = items_content
-                        merged_items.append(merged_item)
-
-                    else:
-                        merged_items.extend(items_with_same_class)
+                    merged_items.extend(
+                        (item,) for item in items_with_same_class
+                    )
 
         return merged_items
 
-    def _preprocess_schemas(self, schema, additions, path):
-        """ Sort and merge a schema and a set of schema additions. """
-
-        # Determine the order of the items at this path.
-        if additions[path]:
-            all_items = self._get_ordered_schemas(schema.items+additions[path])
-        else:
-            all_items = schema.items
-
-        unpacked_items = self._unpack_schema_additions(all_items)
+    def _resolve_items(self, items, unpacked_items, ordered):
+        """ Resolve the order and merging of the items at a path.
 
-        id_to_items, ordered_items_ids = self._group_items_by_id(unpacked_items)
+        Returns a list of tuples of indices into `unpacked_items`, one tuple
+        per child of the path (see `_merge_items_with_same_path`).
 
-        merged_items = self._merge_items_with_same_path(id_to_items,
-                                                        ordered_items_ids)
-
-        return merged_items
-
-    def _create_action_manager_recurse(self, schema, additions, path=''):
+        When the items have to be sorted, the result is cached under a key
+        describing the items at the path, so that it can be reused by every
+        task (and every window) with the same schema and additions. Only the
+        indices are cached; the items themselves are never shared.
+        """
+        if ordered:
+            key = tuple(
+                self._get_item_key(item, unpacked_item)
+                for item, unpacked_item in zip(items, unpacked_items)
+            )
+            resolved = _resolved_items_cache.get(key)
+            if resolved is not None:
+                return resolved
+
+        positions = dict(
+            (id(item), index) for index, item in enumerate(unpacked_items)
+        )
+        if ordered:
+            unpacked_positions = dict(
+                (id(item), unpacked_item)
+                for item, unpacked_item in zip(items, unpacked_items)
+            )
+            unpacked_items = [
+                unpacked_positions[id(item)]
+                for item in self._get_ordered_schemas(items)
+            ]
+
+        id_to_items, ordered_items_ids = self._group_items_by_id(
+            unpacked_items
+        )
+        resolved = [
+            tuple(positions[id(item)] for item in merged)
+            for merged in self._merge_items_with_same_path(
+                id_to_items, ordered_items_ids
+            )
+        ]
+
+        if ordered:
+            if len(_resolved_items_cache) >= _RESOLVED_ITEMS_CACHE_SIZE:
+                _resolved_items_cache.clear()
+            _resolved_items_cache[key] = resolved
+        return resolved
+
+    def _get_item_key(self, item, unpacked_item):
+        """ Return a hashable description of an item at a path with additions.
+
+        The description holds everything that the sorting and the merging of
+        the items depend on.
+        """
+        return (
+            unpacked_item.__class__,
+            unpacked_item.id,
+            item.id,
+            getattr(item, 'before', None),
+            getattr(item, 'after', None),
+            getattr(item, 'absolute_position', None),
+        )
+
+    def _create_action_manager_recurse(self, schema, additions, path='',
+                                       merged_schemas=()):
         """ Recursively create a manager for the given schema and additions map.
 
         Items with the same path are merged together in a single entry if
         possible (i.e., if they have the same class).
 
-        When a list of items is merged, their children are added to a clone
-        of the first item in the list. As a consequence, traits like menu
-        names etc. are inherited from the first item.
+        When a list of items is merged, their children are added to the
+        manager created by the first item in the list. As a consequence,
+        traits like menu names etc. are inherited from the first item.
 
         """
 
@@ -232,13 +281,28 @@ class TaskActionManagerBuilder(HasTraits):
         else:
             path = schema.id
 
-        preprocessed_items = self._preprocess_schemas(schema, additions, path)
+        items = schema.items
+        for merged_schema in merged_schemas:
+            items = items + merged_schema.items
+
+        path_additions = additions.get(path)
+        if path_additions:
+            items = items + path_additions
+
+        unpacked_items = self._unpack_schema_additions(items)
+        resolved_items = self._resolve_items(
+            items, unpacked_items, bool(path_additions)
+        )
 
         # Create the actual children by calling factory items.
         children = []
-        for item in preprocessed_items:
+        for indices in resolved_items:
+            item = unpacked_items[indices[0]]
             if isinstance(item, Schema):
-                item = self._create_action_manager_recurse(item,additions,path)
+                item = self._create_action_manager_recurse(
+                    item, additions, path,
+                    [unpacked_items[index] for index in indices[1:]]
+                )
             else:
                 item = self.prepare_item(item, path+'/'+item.id)
 
@@ -258,3 +322,4 @@ class TaskActionManagerBuilder(HasTraits):
     def _controller_default(self):
         from .task_action_controller import TaskActionController
         return TaskActionController(task=self.task)
+
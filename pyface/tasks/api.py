@@ -10,25 +10,36 @@
 from __future__ import absolute_import
 
 # Local imports.
-from .advanced_editor_area_pane import AdvancedEditorAreaPane
-from .split_editor_area_pane import SplitEditorAreaPane
-from .dock_pane import DockPane
-from .editor import Editor
-from .editor_area_pane import EditorAreaPane
-from .enaml_dock_pane import EnamlDockPane
-from .enaml_editor import EnamlEditor
-from .enaml_task_pane import EnamlTaskPane
-from .i_dock_pane import IDockPane
-from .i_editor import IEditor
-from .i_editor_area_pane import IEditorAreaPane
-from .i_task_pane import ITaskPane
-from .task import Task
-from .tasks_application import TasksApplication, TaskFactory
-from .task_layout import TaskLayout, PaneItem, Tabbed, Splitter, HSplitter, \
-    VSplitter
-from .task_pane import TaskPane
-from .task_window import TaskWindow
-from .task_window_layout import TaskWindowLayout
-from .traits_dock_pane import TraitsDockPane
-from .traits_editor import TraitsEditor
-from .traits_task_pane import TraitsTaskPane
+from ..util.lazy_api import lazy_api
+
+lazy_api(__name__, globals(), {
+    'AdvancedEditorAreaPane': '.advanced_editor_area_pane',
+    'SplitEditorAreaPane': '.split_editor_area_pane',
+    'DockPane': '.dock_pane',
+    'Editor': '.editor',
+    'EditorAreaPane': '.editor_area_pane',
+    'EnamlDockPane': '.enaml_dock_pane',
+    'EnamlEditor': '.enaml_editor',
+    'EnamlTaskPane': '.enaml_task_pane',
+    'IDockPane': '.i_dock_pane',
+    'IEditor': '.i_editor',
+    'IEditorAreaPane': '.i_editor_area_pane',
+    'ITaskPane': '.i_task_pane',
+    'Task': '.task',
+    'TasksApplication': '.tasks_application',
+    'TaskFactory': '.tasks_application',
+    'TaskLayout': '.task_layout',
+    'PaneItem': '.task_layout',
+    'Tabbed': '.task_layout',
+    'Splitter': '.task_layout',
+    'HSplitter': '.task_layout',
+    'VSplitter': '.task_layout',
+    'TaskPane': '.task_pane',
+    'TaskWindow': '.task_window',
+    'TaskWindowLayout': '.task_window_layout',
+    'TraitsDockPane': '.traits_dock_pane',
+    'TraitsEditor': '.traits_editor',
+    'TraitsTaskPane': '.traits_task_pane',
+})
+
+del lazy_api
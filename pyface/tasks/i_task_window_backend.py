@@ -40,6 +40,11 @@ class ITaskWindowBackend(Interface):
             specified TaskState.
         """
 
+    def show_dock_pane(self, dock_pane):
+        """ Show a dock pane of the active task whose control has just been
+            created, in its dock area.
+        """
+
     #### Methods for saving and restoring the layout ##########################
 
     def get_layout(self):
@@ -79,6 +84,9 @@ class MTaskWindowBackend(HasTraits):
     def show_task(self, state):
         raise NotImplementedError
 
+    def show_dock_pane(self, dock_pane):
+        raise NotImplementedError
+
     def get_layout(self):
         raise NotImplementedError
 
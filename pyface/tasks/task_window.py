@@ -57,6 +57,15 @@ class TaskWindow(ApplicationWindow):
     # the translation process, although this is not usually necessary.
     action_manager_builder_factory = Callable(TaskActionManagerBuilder)
 
+    # Whether the panes of tasks are only created when they are needed. If
+    # enabled, the panes and the menu and tool bars of a task are created when
+    # it is first activated, and the control of a dock pane is created when
+    # the pane is first shown, either by the task's layout or by setting its
+    # 'visible' trait. This makes opening a window with many tasks and panes
+    # much quicker, but code must then not assume that the panes of inactive
+    # tasks, or the controls of hidden dock panes, exist.
+    lazy = Bool(False)
+
     #### Protected traits #####################################################
 
     _active_state = Instance('pyface.tasks.task_window.TaskState')
@@ -129,6 +138,9 @@ class TaskWindow(ApplicationWindow):
             if self._active_state is not None:
                 self._window_backend.hide_task(self._active_state)
 
+            # Create the task's panes and action managers, if necessary.
+            self._create_state(state)
+
             # Initialize the new task, if necessary.
             if not state.initialized:
                 task.initialized()
@@ -166,24 +178,10 @@ class TaskWindow(ApplicationWindow):
         if self.control is None:
             self._create()
 
-        # Create the central pane.
-        state.central_pane = task.create_central_pane()
-        state.central_pane.task = task
-        state.central_pane.create(self.control)
-
-        # Create the dock panes.
-        state.dock_panes = task.create_dock_panes()
-        for dock_pane_factory in task.extra_dock_pane_factories:
-            state.dock_panes.append(dock_pane_factory(task=task))
-        for dock_pane in state.dock_panes:
-            dock_pane.task = task
-            dock_pane.create(self.control)
-
-        # Build the menu and tool bars.
-        builder = self.action_manager_builder_factory(task=task)
-        state.menu_bar_manager = builder.create_menu_bar_manager()
-        state.status_bar_manager = task.status_bar
-        state.tool_bar_managers = builder.create_tool_bar_managers()
+        # Create the panes and the menu and tool bars, unless this is put
+        # off until the task is activated.
+        if not self.lazy:
+            self._create_state(state)
 
     def remove_task(self, task):
         """ Removes a task that has already been added to the window. All the
@@ -331,6 +329,45 @@ class TaskWindow(ApplicationWindow):
     # Protected 'TaskWindow' interface.
     ###########################################################################
 
+    def _create_dock_pane(self, dock_pane):
+        """ Create the control of a dock pane, if it has not been created.
+        """
+        if dock_pane.control is None:
+            dock_pane.create(self.control)
+
+    def _create_state(self, state):
+        """ Create the panes and the action managers of a Task state, if they
+            have not been created.
+
+        In lazy mode, the controls of the dock panes are left to be created
+        when the panes are shown.
+        """
+        if state.created:
+            return
+
+        task = state.task
+
+        # Create the central pane.
+        state.central_pane = task.create_central_pane()
+        state.central_pane.task = task
+        state.central_pane.create(self.control)
+
+        # Create the dock panes.
+        state.dock_panes = task.create_dock_panes()
+        for dock_pane_factory in task.extra_dock_pane_factories:
+            state.dock_panes.append(dock_pane_factory(task=task))
+        for dock_pane in state.dock_panes:
+            dock_pane.task = task
+            if not self.lazy:
+                dock_pane.create(self.control)
+
+        # Build the menu and tool bars.
+        builder = self.action_manager_builder_factory(task=task)
+        state.menu_bar_manager = builder.create_menu_bar_manager()
+        state.status_bar_manager = task.status_bar
+        state.tool_bar_managers = builder.create_tool_bar_managers()
+        state.created = True
+
     def _destroy_state(self, state):
         """ Destroy all controls associated with a Task state.
         """
@@ -348,7 +385,8 @@ class TaskWindow(ApplicationWindow):
         # Destroy all controls associated with the task.
         for dock_pane in state.dock_panes:
             dock_pane.destroy()
-        state.central_pane.destroy()
+        if state.central_pane is not None:
+            state.central_pane.destroy()
         state.task.window = None
 
     def _get_pane_ring(self):
@@ -409,6 +447,13 @@ class TaskWindow(ApplicationWindow):
             self.status_bar_manager = state.status_bar_manager
             self.tool_bar_managers = state.tool_bar_managers
 
+    @on_trait_change('dock_panes:visible')
+    def _dock_pane_visible_updated(self, dock_pane, name, new):
+        # In lazy mode, create and show a dock pane which has not been shown.
+        if new and dock_pane.control is None and self.control is not None:
+            self._create_dock_pane(dock_pane)
+            self._window_backend.show_dock_pane(dock_pane)
+
     @on_trait_change('central_pane.has_focus, dock_panes.has_focus')
     def _focus_updated(self, obj, name, old, new):
         if name == 'has_focus' and new:
@@ -428,6 +473,9 @@ class TaskState(HasStrictTraits):
     layout = Instance(TaskLayout)
     initialized = Bool(False)
 
+    # Whether the panes and the action managers have been created.
+    created = Bool(False)
+
     central_pane = Instance(ITaskPane)
     dock_panes = List(IDockPane)
     menu_bar_manager = Instance(MenuBarManager)
@@ -343,5 +343,100 @@ class ActionManagerBuilderTestCase(unittest.TestCase):
                                  id='MenuBar')
         self.assertActionElementsEqual(actual, desired)
 
+    #### Tests about reusing resolved schemas #################################
+
+    def test_same_additions_for_several_tasks(self):
+        """ Do tasks with the same schemas and additions build the same menus?
+        """
+        calls = []
+
+        def factory():
+            calls.append(None)
+            return Action(id='extra', name='Extra')
+
+        extras = [ SchemaAddition(factory=factory, id='extra',
+                                  before='action1',
+                                  path='MenuBar/File/FileGroup') ]
+
+        managers = []
+        for i in range(2):
+            schema = MenuBarSchema(
+                MenuSchema(GroupSchema(Action(id='action1', name='Action 1'),
+                                       id='FileGroup'),
+                           id='File'))
+            builder = TaskActionManagerBuilder(
+                task=Task(menu_bar=schema, extra_actions=extras))
+            managers.append(builder.create_menu_bar_manager())
+
+        # The factory is called for every menu, so no action is shared.
+        self.assertEqual(len(calls), 2)
+        first, second = [manager.find_item('File/extra')
+                         for manager in managers]
+        self.assertIsNot(first.action, second.action)
+
+        desired = MenuBarManager(MenuManager(Group(Action(id='extra',
+                                                          name='Extra'),
+                                                   self.action1,
+                                                   id='FileGroup'),
+                                             id='File'),
+                                 id='MenuBar')
+        for manager in managers:
+            self.assertActionElementsEqual(manager, desired)
+
+    def test_changed_additions(self):
+        """ Are menus rebuilt correctly when the additions change?
+        """
+        schema = MenuBarSchema(
+            MenuSchema(GroupSchema(self.action1, self.action2, id='FileGroup'),
+                       id='File'))
+        addition = SchemaAddition(factory=lambda: self.action3,
+                                  id='action3', before='action1',
+                                  path='MenuBar/File/FileGroup')
+        task = Task(menu_bar=schema, extra_actions=[addition])
+        builder = TaskActionManagerBuilder(task=task)
+        actual = builder.create_menu_bar_manager()
+        desired = MenuBarManager(MenuManager(Group(self.action3, self.action1,
+                                                   self.action2,
+                                                   id='FileGroup'),
+                                             id='File'),
+                                 id='MenuBar')
+        self.assertActionElementsEqual(actual, desired)
+
+        addition.before = 'action2'
+        task.extra_actions.append(
+            SchemaAddition(factory=lambda: self.action4,
+                           path='MenuBar/File/FileGroup'))
+        actual = builder.create_menu_bar_manager()
+        desired = MenuBarManager(MenuManager(Group(self.action1, self.action3,
+                                                   self.action2, self.action4,
+                                                   id='FileGroup'),
+                                             id='File'),
+                                 id='MenuBar')
+        self.assertActionElementsEqual(actual, desired)
+
+    def test_merging_does_not_modify_schemas(self):
+        """ Are the merged schemas left untouched?
+        """
+        schema = MenuBarSchema(
+            MenuSchema(GroupSchema(self.action1, id='FileGroup'),
+                       id='File', name='&File'))
+        extra_menu = MenuSchema(GroupSchema(self.action2, id='OtherGroup'),
+                                id='File', name='Other')
+        extras = [ SchemaAddition(factory=lambda: extra_menu,
+                                  path='MenuBar') ]
+        builder = TaskActionManagerBuilder(task=Task(menu_bar=schema,
+                                                     extra_actions=extras))
+        actual = builder.create_menu_bar_manager()
+        desired = MenuBarManager(MenuManager(Group(self.action1,
+                                                   id='FileGroup'),
+                                             Group(self.action2,
+                                                   id='OtherGroup'),
+                                             id='File', name='&File'),
+                                 id='MenuBar')
+        self.assertActionElementsEqual(actual, desired)
+        self.assertEqual(len(schema.items[0].items), 1)
+        self.assertEqual(len(extra_menu.items), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
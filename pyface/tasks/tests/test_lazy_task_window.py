@@ -0,0 +1,141 @@
+# Standard library imports.
+import unittest
+
+# Enthought library imports.
+from pyface.gui import GUI
+from pyface.tasks.api import (
+    DockPane, PaneItem, Task, TaskLayout, TaskPane, TaskWindow
+)
+from traits.etsconfig.api import ETSConfig
+
+
+USING_WX = ETSConfig.toolkit not in ['', 'qt4']
+
+
+class LazyTask(Task):
+
+    id = 'tests.lazy_task'
+    name = 'Lazy Task'
+
+    def _default_layout_default(self):
+        return TaskLayout(left=PaneItem('tests.lazy_task.shown'))
+
+    def create_central_pane(self):
+        return TaskPane(id='tests.lazy_task.central_pane')
+
+    def create_dock_panes(self):
+        return [
+            DockPane(id='tests.lazy_task.shown', name='Shown'),
+            DockPane(id='tests.lazy_task.hidden', name='Hidden'),
+            DockPane(id='tests.lazy_task.visible', name='Visible',
+                     visible=True),
+        ]
+
+
+class OtherLazyTask(LazyTask):
+
+    id = 'tests.other_lazy_task'
+
+
+class LazyTaskWindowTestCase(unittest.TestCase):
+
+    @unittest.skipIf(USING_WX, "TaskWindowBackend is not implemented in WX")
+    def setUp(self):
+        self.gui = GUI()
+        self.task = LazyTask()
+        self.other_task = OtherLazyTask()
+
+        self.window = TaskWindow(lazy=True)
+        self.window.add_task(self.task)
+        self.window.add_task(self.other_task)
+
+    def tearDown(self):
+        if self.window.control is not None:
+            self.window.destroy()
+            self.gui.process_events()
+        del self.window
+        del self.task
+        del self.other_task
+        del self.gui
+
+    def get_control(self, pane_id, task=None):
+        return self.window.get_dock_pane(pane_id, task).control
+
+    def test_nothing_created_before_activation(self):
+        state = self.window._get_state(self.task)
+
+        self.assertIsNone(state.central_pane)
+        self.assertEqual(state.dock_panes, [])
+        self.assertIsNone(state.menu_bar_manager)
+
+    def test_only_shown_panes_created(self):
+        self.window.open()
+        self.gui.process_events()
+
+        self.assertIsNotNone(self.window.central_pane.control)
+        self.assertIsNotNone(self.get_control('tests.lazy_task.shown'))
+        self.assertIsNotNone(self.get_control('tests.lazy_task.visible'))
+        self.assertIsNone(self.get_control('tests.lazy_task.hidden'))
+        other_state = self.window._get_state(self.other_task)
+        self.assertIsNone(other_state.central_pane)
+
+    def test_pane_created_when_made_visible(self):
+        self.window.open()
+        self.gui.process_events()
+        dock_pane = self.window.get_dock_pane('tests.lazy_task.hidden')
+
+        dock_pane.visible = True
+        self.gui.process_events()
+
+        self.assertIsNotNone(dock_pane.control)
+        self.assertTrue(dock_pane.control.isVisible())
+        self.assertEqual(
+            self.window.control.dockWidgetArea(dock_pane.control),
+            self.window.control.dockWidgetArea(
+                self.get_control('tests.lazy_task.shown')
+            ),
+        )
+
+    def test_pane_created_by_layout(self):
+        self.window.open()
+        self.gui.process_events()
+
+        self.window.set_layout(
+            TaskLayout(right=PaneItem('tests.lazy_task.hidden', width=100))
+        )
+        self.gui.process_events()
+
+        dock_pane = self.window.get_dock_pane('tests.lazy_task.hidden')
+        self.assertIsNotNone(dock_pane.control)
+        self.assertTrue(dock_pane.visible)
+        layout = self.window.get_layout()
+        self.assertEqual(layout.right.id, 'tests.lazy_task.hidden')
+
+    def test_switch_tasks(self):
+        self.window.open()
+        self.gui.process_events()
+
+        self.window.activate_task(self.other_task)
+        self.gui.process_events()
+
+        self.assertIsNotNone(self.window.central_pane.control)
+        self.assertTrue(self.window._get_state(self.other_task).created)
+        self.assertIsNone(
+            self.get_control('tests.lazy_task.hidden', self.other_task)
+        )
+
+        self.window.activate_task(self.task)
+        self.gui.process_events()
+        self.assertIsNone(self.get_control('tests.lazy_task.hidden'))
+
+    def test_remove_unactivated_task(self):
+        self.window.open()
+        self.gui.process_events()
+
+        self.window.remove_task(self.other_task)
+
+        self.assertIsNone(self.other_task.window)
+
+
+if __name__ == '__main__':
+    unittest.main()
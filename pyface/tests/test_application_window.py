@@ -178,6 +178,28 @@ class TestApplicationWindow(unittest.TestCase, GuiTestAssistant):
         with self.event_loop():
             self.window.close()
 
+    def test_toolbar_recreated(self):
+        # test that the old toolbars stop following a manager which is used
+        # again, as a task window does when a task is activated again
+        tool_bar_manager = ToolBarManager(
+            Action(name="New", image=ImageResource('core')),
+        )
+        self.window.tool_bar_managers = [tool_bar_manager]
+        with self.event_loop():
+            self.window._create()
+        with self.event_loop():
+            self.window.tool_bar_managers = [tool_bar_manager]
+        with self.event_loop():
+            tool_bar_manager.append(
+                Action(name="Open", image=ImageResource('core'))
+            )
+            tool_bar_manager.changed = True
+        with self.event_loop():
+            self.window.close()
+
+        notifiers = tool_bar_manager.trait('changed')._notifiers(True)
+        self.assertEqual(len(notifiers), 0)
+
     def test_statusbar(self):
         # test that status bar gets created as expected
         self.window.status_bar_manager = StatusBarManager(
@@ -0,0 +1,252 @@
+from __future__ import absolute_import
+
+import threading
+
+from traits.api import Any, Event, HasTraits, Int, Str
+from traits.testing.unittest_tools import unittest
+
+from ..constant import CANCEL, OK
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+else:
+    from ..async_loop import (
+        PyfaceEventLoop, PyfaceEventLoopPolicy, do_after, do_later,
+        gather_with_progress, install_event_loop, open_dialog
+    )
+
+
+class FakeDialog(HasTraits):
+    """ Enough of a dialog for the helpers, without a toolkit. """
+
+    control = Any
+
+    style = Str('modal')
+
+    return_code = Int(OK)
+
+    closed = Event
+
+    def open(self):
+        self.control = object()
+
+    def close(self):
+        if self.control is not None:
+            self.control = None
+            self.closed = self
+
+
+class FakeProgressDialog(FakeDialog):
+
+    min = Int
+
+    max = Int
+
+    cancel_at = Any
+
+    def __init__(self, **traits):
+        super(FakeProgressDialog, self).__init__(**traits)
+        self.values = []
+
+    def update(self, value):
+        self.values.append(value)
+        if value == self.cancel_at:
+            self.close()
+            return False, False
+        if value >= self.max:
+            self.close()
+        return True, False
+
+
+@unittest.skipIf(asyncio is None, 'asyncio is not available')
+class TestAsyncLoop(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = PyfaceEventLoop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def run_loop(self, future):
+        return self.loop.run_until_complete(
+            asyncio.wait_for(future, 5.0, loop=self.loop)
+        )
+
+    def test_do_after(self):
+        calls = []
+
+        first = do_after(20, calls.append, 'first')
+        second = do_after(10, calls.append, 'second')
+        self.run_loop(asyncio.gather(first, second, loop=self.loop))
+
+        self.assertEqual(calls, ['second', 'first'])
+
+    def test_do_after_result(self):
+        future = do_after(10, lambda x, y=1: x + y, 1, y=2)
+        self.assertEqual(self.run_loop(future), 3)
+
+    def test_do_after_exception(self):
+        future = do_after(10, lambda: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            self.run_loop(future)
+
+    def test_do_after_cancel(self):
+        calls = []
+
+        future = do_after(10, calls.append, 'first')
+        future.cancel()
+        self.run_loop(do_after(30, calls.append, 'second'))
+
+        self.assertEqual(calls, ['second'])
+
+    def test_do_later(self):
+        self.assertEqual(self.run_loop(do_later(str, 1)), '1')
+
+    def test_many_coroutines(self):
+        coroutines = [
+            asyncio.sleep(0.001 * (i % 20), result=i, loop=self.loop)
+            for i in range(2000)
+        ]
+        results = self.run_loop(asyncio.gather(*coroutines, loop=self.loop))
+        self.assertEqual(results, list(range(2000)))
+
+    def test_call_soon_threadsafe(self):
+        future = self.loop.create_future()
+        thread = threading.Thread(
+            target=self.loop.call_soon_threadsafe,
+            args=(future.set_result, 'done'),
+        )
+        thread.start()
+        self.assertEqual(self.run_loop(future), 'done')
+        thread.join()
+
+    def test_open_dialog(self):
+        dialog = FakeDialog()
+
+        future = open_dialog(dialog)
+        self.assertEqual(dialog.style, 'nonmodal')
+        self.assertIsNotNone(dialog.control)
+        self.assertFalse(future.done())
+
+        def close():
+            dialog.return_code = CANCEL
+            dialog.close()
+
+        self.loop.call_later(0.01, close)
+        self.assertEqual(self.run_loop(future), CANCEL)
+
+    def test_open_dialog_cancel(self):
+        dialog = FakeDialog()
+
+        future = open_dialog(dialog)
+        future.cancel()
+        self.run_loop(asyncio.sleep(0, loop=self.loop))
+
+        self.assertIsNone(dialog.control)
+        self.assertEqual(dialog.return_code, CANCEL)
+
+    def test_open_modal_dialog(self):
+        dialog = FakeDialog(control=object())
+
+        with self.assertRaises(ValueError):
+            open_dialog(dialog)
+
+    def test_gather_with_progress(self):
+        dialog = FakeProgressDialog()
+        coroutines = [
+            asyncio.sleep(0.001 * i, result=i, loop=self.loop)
+            for i in range(5)
+        ]
+
+        future = gather_with_progress(dialog, coroutines)
+        self.assertEqual(dialog.max, 5)
+        self.assertIsNotNone(dialog.control)
+
+        self.assertEqual(self.run_loop(future), [0, 1, 2, 3, 4])
+        self.assertEqual(dialog.values, [1, 2, 3, 4, 5])
+        self.assertIsNone(dialog.control)
+
+    def test_gather_with_progress_cancelled(self):
+        dialog = FakeProgressDialog(cancel_at=2)
+        coroutines = [
+            asyncio.sleep(0.01 * i, result=i, loop=self.loop)
+            for i in range(5)
+        ]
+        futures = [
+            asyncio.ensure_future(coroutine, loop=self.loop)
+            for coroutine in coroutines
+        ]
+
+        future = gather_with_progress(dialog, futures)
+        with self.assertRaises(asyncio.CancelledError):
+            self.run_loop(future)
+
+        self.assertEqual(dialog.values, [1, 2])
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertTrue(futures[-1].cancelled())
+
+    def test_gather_with_progress_closed(self):
+        dialog = FakeProgressDialog()
+        future = gather_with_progress(
+            dialog, [asyncio.sleep(1.0, loop=self.loop)]
+        )
+
+        self.loop.call_later(0.01, dialog.close)
+        with self.assertRaises(asyncio.CancelledError):
+            self.run_loop(future)
+
+    def test_gather_with_progress_exception(self):
+        dialog = FakeProgressDialog()
+        future = gather_with_progress(
+            dialog, [do_after(10, lambda: 1 / 0), asyncio.sleep(1.0)],
+        )
+
+        with self.assertRaises(ZeroDivisionError):
+            self.run_loop(future)
+        self.assertIsNone(dialog.control)
+
+    def test_gather_with_progress_nothing(self):
+        dialog = FakeProgressDialog()
+        future = gather_with_progress(dialog, [])
+
+        self.assertEqual(self.run_loop(future), [])
+        self.assertIsNone(dialog.control)
+
+
+@unittest.skipIf(asyncio is None, 'asyncio is not available')
+class TestPyfaceEventLoopPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.old_policy = asyncio.get_event_loop_policy()
+
+    def tearDown(self):
+        loop = asyncio.get_event_loop_policy().get_event_loop()
+        asyncio.set_event_loop_policy(self.old_policy)
+        loop.close()
+
+    def test_install_event_loop(self):
+        loop = install_event_loop()
+
+        self.assertIsInstance(loop, PyfaceEventLoop)
+        self.assertIs(asyncio.get_event_loop(), loop)
+        # Installing again is harmless.
+        self.assertIs(install_event_loop(), loop)
+
+    def test_other_threads(self):
+        policy = PyfaceEventLoopPolicy()
+        loops = []
+
+        def new_loop():
+            loops.append(policy.new_event_loop())
+
+        thread = threading.Thread(target=new_loop)
+        thread.start()
+        thread.join()
+        install_event_loop()
+
+        self.assertNotIsInstance(loops[0], PyfaceEventLoop)
+        loops[0].close()
@@ -1,7 +1,14 @@
+import os
+import subprocess
+import sys
+
+import mock
 from traits.testing.unittest_tools import unittest
 from traits.etsconfig.api import ETSConfig
 
-from pyface.base_toolkit import find_toolkit, import_toolkit
+from pyface import base_toolkit
+from pyface.base_toolkit import (STATIC_TOOLKITS, Toolkit, find_toolkit,
+                                 import_toolkit)
 
 
 class TestToolkit(unittest.TestCase):
@@ -48,3 +55,57 @@ class TestToolkit(unittest.TestCase):
             self.assertEqual(ETSConfig.toolkit, 'null')
         finally:
             ETSConfig._toolkit = old_etsconfig_toolkit
+
+    def test_import_static_toolkit(self):
+        STATIC_TOOLKITS['test.toolkits'] = {
+            'null': 'pyface.ui.null.init:toolkit_object'
+        }
+        try:
+            with mock.patch.object(base_toolkit, '_iter_entry_points') as scan:
+                toolkit = import_toolkit('null', 'test.toolkits')
+        finally:
+            del STATIC_TOOLKITS['test.toolkits']
+
+        scan.assert_not_called()
+        self.assertEqual(toolkit.package, 'pyface')
+        self.assertEqual(toolkit.toolkit, 'null')
+
+    def test_toolkit_object_memoized(self):
+        toolkit = Toolkit('pyface', 'null', 'pyface.ui.null')
+
+        with mock.patch.object(base_toolkit, 'import_module',
+                               wraps=base_toolkit.import_module) as imports:
+            widget = toolkit('widget:Widget')
+            self.assertIs(toolkit('widget:Widget'), widget)
+            self.assertEqual(imports.call_count, 1)
+
+            toolkit.packages.insert(0, 'pyface.ui.null')
+            self.assertIs(toolkit('widget:Widget'), widget)
+            self.assertEqual(imports.call_count, 2)
+
+    def test_unimplemented_memoized(self):
+        toolkit = Toolkit('pyface', 'null', 'pyface.ui.null')
+
+        with mock.patch.object(base_toolkit, 'import_module',
+                               wraps=base_toolkit.import_module) as imports:
+            unimplemented = toolkit('nonexistent:Nonexistent')
+            self.assertIs(toolkit('nonexistent:Nonexistent'), unimplemented)
+            self.assertEqual(imports.call_count, 1)
+
+        with self.assertRaises(NotImplementedError):
+            unimplemented()
+
+
+class TestToolkitImport(unittest.TestCase):
+    """ Regression checks for the cost of importing pyface.api. """
+
+    def test_no_entry_point_scan(self):
+        code = (
+            "import sys\n"
+            "import pyface.api\n"
+            "print('pkg_resources' in sys.modules)\n"
+        )
+        env = dict(os.environ, ETS_TOOLKIT='null')
+        output = subprocess.check_output([sys.executable, '-c', code], env=env)
+
+        self.assertEqual(output.split(), [b'False'])
@@ -0,0 +1,116 @@
+from __future__ import absolute_import
+
+import threading
+
+from traits.api import HasTraits, Int
+from traits.testing.unittest_tools import unittest
+
+from ..call_queue import CallQueue
+
+
+class Counter(HasTraits):
+
+    value = Int
+
+    changes = Int
+
+    def _value_changed(self):
+        self.changes += 1
+
+
+class TestCallQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.wakes = []
+        self.queue = CallQueue(lambda: self.wakes.append(True))
+
+    def test_call(self):
+        results = []
+
+        self.queue.call(results.append, 1)
+        self.queue.call(results.append, 2)
+
+        self.assertEqual(results, [])
+        self.assertEqual(len(self.wakes), 1)
+        self.assertEqual(self.queue.drain(), 2)
+        self.assertEqual(results, [1, 2])
+
+        self.queue.call(results.append, 3)
+        self.assertEqual(len(self.wakes), 2)
+
+    def test_set_trait_coalesced(self):
+        counter = Counter()
+        other = Counter()
+        results = []
+
+        self.queue.set_trait(counter, 'value', 1)
+        self.queue.call(results.append, 'call')
+        self.queue.set_trait(other, 'value', 5)
+        self.queue.set_trait(counter, 'value', 2)
+        self.queue.set_trait(counter, 'value', 3)
+
+        self.assertEqual(len(self.queue), 3)
+        self.assertEqual(self.queue.drain(), 3)
+        self.assertEqual(counter.value, 3)
+        self.assertEqual(counter.changes, 1)
+        self.assertEqual(other.value, 5)
+        self.assertEqual(results, ['call'])
+
+        self.queue.set_trait(counter, 'value', 4)
+        self.queue.drain()
+        self.assertEqual(counter.value, 4)
+
+    def test_max_calls(self):
+        results = []
+        self.queue.max_calls = 2
+        for i in range(5):
+            self.queue.call(results.append, i)
+
+        self.assertEqual(self.queue.drain(), 2)
+        self.assertEqual(len(self.wakes), 2)
+        self.assertEqual(self.queue.drain(), 2)
+        self.assertEqual(self.queue.drain(), 1)
+        self.assertEqual(len(self.wakes), 3)
+        self.assertEqual(results, list(range(5)))
+
+    def test_max_time(self):
+        results = []
+        self.queue.max_time = 0.0
+        for i in range(3):
+            self.queue.call(results.append, i)
+
+        # At least one call is always made.
+        self.assertEqual(self.queue.drain(), 1)
+        self.assertEqual(results, [0])
+
+    def test_exception(self):
+        results = []
+
+        def fail():
+            raise ZeroDivisionError()
+
+        self.queue.call(fail)
+        self.queue.call(results.append, 1)
+
+        with self.assertLogs('pyface.call_queue', level='ERROR'):
+            self.queue.drain()
+
+        self.assertEqual(results, [1])
+
+    def test_threads(self):
+        results = []
+
+        def add(start):
+            for i in range(start, start + 1000):
+                self.queue.call(results.append, i)
+
+        threads = [
+            threading.Thread(target=add, args=(i * 1000,)) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.queue.drain()
+
+        self.assertEqual(sorted(results), list(range(4000)))
@@ -4,11 +4,14 @@ import os
 import platform
 import pkg_resources
 
+from traits.api import Any, HasTraits, List, Unicode
 from traits.testing.unittest_tools import unittest
 
 import pyface
 import pyface.tests
+from ..i_image_resource import MImageResource
 from ..image_resource import ImageResource
+from ..resource.resource_cache import image_cache
 from ..toolkit import toolkit_object
 
 
@@ -23,6 +26,16 @@ IMAGE_DIR = pkg_resources.resource_filename(__name__, 'images')
 IMAGE_PATH = os.path.join(IMAGE_DIR, 'core.png')
 
 
+class LegacyImageResource(MImageResource, HasTraits):
+    """ An image resource that does not keep references for each size. """
+
+    _ref = Any
+
+    name = Unicode
+
+    search_path = List
+
+
 class TestImageResource(unittest.TestCase):
 
     def setUp(self):
@@ -41,6 +54,24 @@ class TestImageResource(unittest.TestCase):
         self.assertIsNotNone(image)
         self.assertEqual(image_resource.absolute_path, IMAGE_PATH)
 
+    def test_create_image_cached(self):
+        image_cache.clear()
+        image_cache.reset_statistics()
+        image_resource = ImageResource('core')
+        image_resource.create_image()
+        image = ImageResource('core').create_image()
+        self.assertIsNotNone(image)
+        self.assertEqual(image_cache.misses, 1)
+        self.assertEqual(image_cache.hits, 1)
+        self.assertIn((IMAGE_PATH, None, 'image'), image_cache)
+
+    def test_create_image_size(self):
+        image_resource = ImageResource('core')
+        image = image_resource.create_image(size=(16, 16))
+        self.assertIsNotNone(image)
+        self.assertEqual(image_resource._refs[(16, 16)].filename, IMAGE_PATH)
+        self.assertEqual(image_resource.absolute_path, IMAGE_PATH)
+
     def test_create_image_search_path(self):
         image_resource = ImageResource('splash.jpg', [SEARCH_PATH])
         self.assertEqual(image_resource.search_path,
@@ -92,3 +123,9 @@ class TestImageResource(unittest.TestCase):
         self.assertEqual(image_resource.absolute_path,
                          os.path.join(SEARCH_PATH, 'splash.jpg'))
         self.assertEqual(size, (450, 296))
+
+    def test_get_ref_without_refs(self):
+        image_resource = LegacyImageResource('core', [IMAGE_DIR])
+        ref = image_resource._get_ref((64, 64))
+        self.assertEqual(ref.filename, IMAGE_PATH)
+        self.assertIs(image_resource._get_ref(), image_resource._ref)
@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 
+import threading
+
 from traits.testing.unittest_tools import unittest
 
 from ..progress_dialog import ProgressDialog
@@ -146,3 +148,79 @@ class TestProgressDialog(unittest.TestCase, GuiTestAssistant):
                 self.dialog.open()
 
         self.assertIsNone(self.dialog.control)
+
+    def test_update_throttled(self):
+        self.dialog.min = 0
+        self.dialog.max = 1000
+        self.dialog.update_rate = 1.0
+        self.dialog.open()
+        repaints = []
+        self.dialog._repaint_due = self._recording(
+            self.dialog._repaint_due, repaints
+        )
+        for i in range(1000):
+            result = self.dialog.update(i)
+            self.assertEqual(result, (True, False))
+        self.assertIsNotNone(self.dialog.control)
+
+        # The last update is never dropped.
+        with self.event_loop():
+            self.dialog.update(1000)
+        self.assertEqual(repaints.count(True), 2)
+        self.assertIsNone(self.dialog.control)
+
+    def test_update_threadsafe(self):
+        self.dialog.min = 0
+        self.dialog.max = 10
+        self.dialog.open()
+        values = []
+
+        def update():
+            for i in range(10):
+                values.append(self.dialog.update_threadsafe(i))
+
+        thread = threading.Thread(target=update)
+        thread.start()
+        thread.join()
+        self.assertEqual(values, [True] * 10)
+        self.assertIsNotNone(self.dialog.control)
+
+        # Updates made from the thread are coalesced, and completing the
+        # progress closes the dialog.
+        self.dialog.update_threadsafe(10)
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.dialog.control is None
+        )
+
+    def test_time_estimates(self):
+        self.dialog.min = 0
+        self.dialog.max = 10
+        self.dialog.open()
+        self.dialog._start_time -= 1.0
+
+        elapsed, estimated, remaining = self.dialog._time_estimates(5)
+
+        self.assertGreaterEqual(elapsed, 1.0)
+        self.assertAlmostEqual(estimated, 2 * elapsed, delta=0.1)
+        self.assertAlmostEqual(remaining, elapsed, delta=0.1)
+        with self.event_loop():
+            self.dialog.close()
+
+    def test_time_estimates_no_progress(self):
+        self.dialog.min = 0
+        self.dialog.max = 10
+        self.dialog.open()
+
+        elapsed, estimated, remaining = self.dialog._time_estimates(0)
+
+        self.assertIsNone(estimated)
+        self.assertIsNone(remaining)
+        with self.event_loop():
+            self.dialog.close()
+
+    def _recording(self, method, results):
+        def recorded(*args):
+            result = method(*args)
+            results.append(result)
+            return result
+        return recorded
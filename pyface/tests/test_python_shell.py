@@ -82,6 +82,43 @@ class TestPythonShell(unittest.TestCase, GuiTestAssistant):
         with self.event_loop():
             self.widget.destroy()
 
+    def test_execute_command_in_background(self):
+        # test that commands can be executed in a worker thread
+        with self.event_loop():
+            self.widget = PythonShell(self.window.control, background=True)
+
+        with self.assertTraitChanges(self.widget, 'command_executed', count=1):
+            self.widget.execute_command('x = 1', hidden=False)
+            self.assertTrue(self.widget.busy)
+            self.event_loop_helper.event_loop_until_condition(
+                lambda: not self.widget.busy
+            )
+
+        self.assertEqual(self.widget.interpreter().locals.get('x'), 1)
+
+        with self.event_loop():
+            self.widget.destroy()
+
+    def test_interrupt(self):
+        # test that a command executing in the background can be interrupted
+        with self.event_loop():
+            self.widget = PythonShell(self.window.control, background=True)
+
+        self.widget.bind('x', 0)
+        self.widget.execute_command(
+            'while True:\n    x += 1\n\n', hidden=False
+        )
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.widget.interpreter().locals.get('x', 0) > 0
+        )
+        self.widget.interrupt()
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: not self.widget.busy
+        )
+
+        with self.event_loop():
+            self.widget.destroy()
+
     def test_execute_file(self):
         # test that executing a file works
         with self.event_loop():
@@ -114,6 +151,27 @@ class TestPythonShell(unittest.TestCase, GuiTestAssistant):
         with self.event_loop():
             self.widget.destroy()
 
+    def test_execute_file_in_background(self):
+        # test that executing a file in a worker thread works
+        with self.event_loop():
+            self.widget = PythonShell(self.window.control)
+
+        stdout = sys.stdout
+        with self.assertTraitChanges(self.widget, 'command_executed', count=1):
+            future = self.widget.execute_file_in_background(PYTHON_SCRIPT)
+            self.event_loop_helper.event_loop_until_condition(
+                lambda: future.done
+            )
+
+        self.assertEqual(future.state, 'completed')
+        self.assertEqual(self.widget.interpreter().locals.get('x'), 1)
+        self.assertEqual(self.widget.interpreter().locals.get('sys'), sys)
+        # the output redirection has been removed
+        self.assertIs(sys.stdout, stdout)
+
+        with self.event_loop():
+            self.widget.destroy()
+
     def test_get_history(self):
         # test that executing a command works
         with self.event_loop():
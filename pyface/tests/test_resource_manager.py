@@ -1,9 +1,13 @@
 from __future__ import absolute_import
 
 import os
+import shutil
+import tempfile
+from zipfile import ZipFile
 
 from traits.testing.unittest_tools import unittest
 
+from ..resource.api import ResourceFactory, ResourceManager
 from ..resource_manager import PyfaceResourceFactory
 
 IMAGE_PATH = os.path.join(os.path.dirname(__file__), 'images', 'core.png')
@@ -21,3 +25,93 @@ class TestPyfaceResourceFactory(unittest.TestCase):
         with open(IMAGE_PATH, 'rb') as fp:
             data = fp.read()
         image = self.resource_factory.image_from_data(data)
+
+
+class TestResourceManager(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.resource_manager = ResourceManager(
+            resource_factory=ResourceFactory()
+        )
+
+    def tearDown(self):
+        for entry in self.resource_manager._zip_files.values():
+            if entry[1] is not None:
+                entry[1][0].close()
+        shutil.rmtree(self.tmpdir)
+
+    def _copy_image(self, *path):
+        filename = os.path.join(self.tmpdir, *path)
+        if not os.path.isdir(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename))
+        shutil.copy(IMAGE_PATH, filename)
+        return filename
+
+    def test_locate_image(self):
+        filename = self._copy_image('images', 'core.png')
+
+        reference = self.resource_manager.locate_image('core', [self.tmpdir])
+
+        self.assertEqual(reference.filename, filename)
+
+    def test_locate_image_extension(self):
+        self._copy_image('core.png')
+
+        reference = self.resource_manager.locate_image(
+            'core.jpg', [self.tmpdir]
+        )
+
+        self.assertIsNone(reference)
+
+    def test_locate_image_size(self):
+        self._copy_image('images', 'core.png')
+        filename = self._copy_image('images', '16x16', 'core.png')
+
+        reference = self.resource_manager.locate_image(
+            'core', [self.tmpdir], size=(16, 16)
+        )
+
+        self.assertEqual(reference.filename, filename)
+
+    def test_locate_image_relative_path(self):
+        filename = self._copy_image('images', 'actions', 'core.png')
+
+        reference = self.resource_manager.locate_image(
+            'actions/core', [self.tmpdir]
+        )
+
+        self.assertEqual(reference.filename, filename)
+
+    def test_locate_image_missing(self):
+        reference = self.resource_manager.locate_image(
+            'core', [self.tmpdir]
+        )
+
+        self.assertIsNone(reference)
+
+    def test_locate_image_added(self):
+        self._copy_image('images', 'other.png')
+        reference = self.resource_manager.locate_image('core', [self.tmpdir])
+        self.assertIsNone(reference)
+
+        filename = self._copy_image('images', 'core.png')
+        # ensure the modification time changes, whatever the resolution
+        os.utime(os.path.join(self.tmpdir, 'images'), (1, 1))
+        reference = self.resource_manager.locate_image('core', [self.tmpdir])
+
+        self.assertEqual(reference.filename, filename)
+
+    def test_locate_image_zip(self):
+        with open(IMAGE_PATH, 'rb') as fp:
+            data = fp.read()
+        zip_filename = os.path.join(self.tmpdir, 'images.zip')
+        with ZipFile(zip_filename, 'w') as zip_file:
+            zip_file.writestr('core.png', data)
+
+        reference = self.resource_manager.locate_image('core', [self.tmpdir])
+        again = self.resource_manager.locate_image('core', [self.tmpdir])
+
+        self.assertEqual(reference.data, data)
+        self.assertEqual(again.data, data)
+        self.assertEqual(len(self.resource_manager._zip_files), 1)
@@ -14,21 +14,38 @@
 #
 #------------------------------------------------------------------------------
 
+import gc
 import os
 import unittest
 
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
 from traits.api import HasTraits, TraitError
 from traits.testing.unittest_tools import UnittestTools
 
 from ..i_image_resource import IImageResource
 from ..image_resource import ImageResource
 from ..ui_traits import (Border, HasBorder, HasMargin, Image, Margin,
-                         image_resource_cache, image_bitmap_cache)
+                         convert_bitmap, convert_image, image_resource_cache,
+                         image_bitmap_cache, IMAGE_RESOURCE_CACHE_MAX_ITEMS)
 
 
 IMAGE_PATH = os.path.join(os.path.dirname(__file__), 'images', 'core.png')
 
 
+class UnsizedImageResource(object):
+    """ An image resource whose bitmaps have no known size. """
+
+    def create_bitmap(self):
+        return object()
+
+    def image_size(self, image):
+        raise NotImplementedError()
+
+
 class ImageClass(HasTraits):
 
     image = Image
@@ -90,6 +107,64 @@ class TestImageTrait(unittest.TestCase, UnittestTools):
         self.assertEqual(image_class.image._ref.file_name, 'dialog-warning.png')
         self.assertEqual(image_class.image._ref.volume_name, 'icons')
 
+    def test_convert_image_cached(self):
+        image_1 = convert_image('core.png')
+        image_2 = convert_image('core.png')
+
+        self.assertIs(image_1, image_2)
+        self.assertEqual(image_resource_cache.statistics()['items'], 1)
+
+    def test_convert_image_evicted_in_use(self):
+        image_class = ImageClass(image='core.png')
+        image = image_class.image
+        for i in range(IMAGE_RESOURCE_CACHE_MAX_ITEMS):
+            convert_image('image_{}'.format(i))
+
+        # The resource is no longer in the LRU part of the cache, but as it
+        # is still in use the same object is returned.
+        image_class.image = 'core.png'
+
+        self.assertIs(image_class.image, image)
+
+    def test_convert_bitmap_cached(self):
+        image = ImageResource('core.png')
+
+        bitmap_1 = convert_bitmap(image)
+        bitmap_2 = convert_bitmap(image)
+
+        self.assertIs(bitmap_1, bitmap_2)
+        self.assertIsNone(convert_bitmap(None))
+
+    def test_convert_bitmap_unsized_bounded(self):
+        for i in range(2 * IMAGE_RESOURCE_CACHE_MAX_ITEMS):
+            convert_bitmap(UnsizedImageResource())
+
+        statistics = image_bitmap_cache.statistics()
+        self.assertEqual(statistics['items'], IMAGE_RESOURCE_CACHE_MAX_ITEMS)
+        self.assertEqual(statistics['nbytes'], 0)
+
+    @unittest.skipIf(tracemalloc is None, "tracemalloc is not available")
+    def test_convert_image_memory_bounded(self):
+        # Many distinct conversions should not make memory grow without
+        # bound once the cache is full.
+        n_conversions = 100000
+        tracemalloc.start()
+        try:
+            for i in range(n_conversions):
+                convert_image('image_{}'.format(i))
+                if i == 2 * IMAGE_RESOURCE_CACHE_MAX_ITEMS:
+                    gc.collect()
+                    start_size = tracemalloc.get_traced_memory()[0]
+            gc.collect()
+            end_size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        statistics = image_resource_cache.statistics()
+        self.assertEqual(statistics['items'], IMAGE_RESOURCE_CACHE_MAX_ITEMS)
+        self.assertEqual(statistics['weak_items'], 0)
+        self.assertLess(end_size - start_size, 1024 * 1024)
+
 
 class TestMargin(unittest.TestCase):
 
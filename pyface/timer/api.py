@@ -17,3 +17,7 @@ from __future__ import absolute_import
 from .do_later import do_later, do_after, DoLaterTimer
 from .i_timer import ICallbackTimer, IEventTimer, ITimer
 from .timer import CallbackTimer, EventTimer, Timer
+from .i_scheduler import IScheduler, ScheduledCall
+from .scheduler import (
+    ScheduledCallbackTimer, ScheduledEventTimer, get_scheduler
+)
@@ -0,0 +1,296 @@
+#  Copyright (c) 2018, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+"""
+Interfaces and base classes for a shared timer scheduler
+
+A scheduler runs any number of timed callbacks from a single toolkit timer,
+which is always set to go off at the next deadline.  This is much cheaper
+than a toolkit timer (and a HasTraits timer object) for each callback when
+an application has hundreds of periodic timers, eg. one for each live
+updating widget.
+
+Deadlines are rounded up to a multiple of the scheduler's resolution, and
+callbacks which share a deadline are run together, highest priority first.
+Repeating callbacks are scheduled at a fixed rate, so that they don't drift.
+"""
+from heapq import heappop, heappush
+import logging
+import math
+
+from traits.api import ABCHasTraits, Float, Interface, provides
+
+from pyface.timer.i_timer import perf_counter
+
+
+logger = logging.getLogger(__name__)
+
+#: The fraction of a tick ignored when rounding times to ticks, so that
+#: floating point errors don't move a deadline into the next tick.
+_EPSILON = 1e-6
+
+
+class ScheduledCall(object):
+    """ A callback scheduled by a scheduler.
+
+    This is returned by :py:meth:`IScheduler.schedule`, and can be used to
+    cancel the callback.
+    """
+
+    __slots__ = (
+        'scheduler', 'callback', 'args', 'kwargs', 'deadline', 'interval',
+        'priority', 'active', 'sequence',
+    )
+
+    def __init__(self, scheduler, callback, args, kwargs, deadline, interval,
+                 priority, sequence):
+        #: The scheduler running the callback.
+        self.scheduler = scheduler
+
+        #: The callback and its arguments.
+        self.callback = callback
+        self.args = args
+        self.kwargs = kwargs
+
+        #: The time at which the callback is next due.
+        self.deadline = deadline
+
+        #: The interval at which to repeat the callback, or None.
+        self.interval = interval
+
+        #: Callbacks with higher priorities run first.
+        self.priority = priority
+
+        #: Whether the callback is still scheduled.
+        self.active = True
+
+        #: The order in which callbacks were scheduled.
+        self.sequence = sequence
+
+    def cancel(self):
+        """ Stop the callback from being called. """
+        self.scheduler.cancel(self)
+
+
+class IScheduler(Interface):
+    """ Interface for shared timer schedulers. """
+
+    #: The resolution of the deadlines, in seconds.
+    resolution = Float
+
+    def schedule(self, callback, delay, interval=None, priority=0,
+                 args=(), kwargs=None):
+        """ Schedule a callback.
+
+        Parameters
+        ----------
+        callback : callable
+            The callable to call.  A repeating callback can stop itself by
+            raising StopIteration.
+        delay : float
+            The time in seconds until the first call.
+        interval : float or None
+            The interval in seconds at which to repeat the call, or None to
+            only call once.
+        priority : int
+            Callbacks with higher priorities are called first when they share
+            a deadline.
+        args : tuple
+            Positional arguments to give the callback.
+        kwargs : dict or None
+            Keyword arguments to give the callback.
+
+        Returns
+        -------
+        call : ScheduledCall
+            An object which can be used to cancel the callback.
+        """
+
+    def cancel(self, call):
+        """ Stop a scheduled callback from being called.
+
+        Parameters
+        ----------
+        call : ScheduledCall
+            The callback to cancel.
+        """
+
+    def run_due(self):
+        """ Run the callbacks whose deadlines have passed.
+
+        Returns
+        -------
+        count : int
+            The number of callbacks run.
+        """
+
+
+@provides(IScheduler)
+class BaseScheduler(ABCHasTraits):
+    """ Base class for shared timer schedulers.
+
+    Toolkit implementations need to provide the methods which start and stop
+    the single toolkit timer, which should call :py:meth:`run_due` when it
+    goes off.  Callbacks must be scheduled and cancelled in the GUI thread.
+    """
+
+    # IScheduler interface ---------------------------------------------------
+
+    #: The resolution of the deadlines, in seconds.
+    resolution = Float(0.001)
+
+    # -------------------------------------------------------------------------
+    # 'object' interface
+    # -------------------------------------------------------------------------
+
+    def __init__(self, **traits):
+        super(BaseScheduler, self).__init__(**traits)
+
+        # The ticks (deadlines in units of the resolution) which have
+        # callbacks scheduled, as a heap.
+        self._ticks = []
+
+        # Maps ticks to the list of callbacks due at that tick.
+        self._buckets = {}
+
+        # The number of active callbacks.
+        self._count = 0
+
+        # The number of callbacks scheduled so far.
+        self._sequence = 0
+
+        # The tick at which the toolkit timer is set to go off, or None.
+        self._timer_tick = None
+
+    def __len__(self):
+        return self._count
+
+    # -------------------------------------------------------------------------
+    # IScheduler interface
+    # -------------------------------------------------------------------------
+
+    def schedule(self, callback, delay, interval=None, priority=0,
+                 args=(), kwargs=None):
+        """ Schedule a callback. """
+        self._sequence += 1
+        call = ScheduledCall(
+            self, callback, args, kwargs or {}, self._clock() + delay,
+            interval, priority, self._sequence,
+        )
+        self._count += 1
+        self._add(call)
+        self._update_timer()
+        return call
+
+    def cancel(self, call):
+        """ Stop a scheduled callback from being called. """
+        if call.active:
+            # The call is removed from its bucket when the bucket is run.
+            call.active = False
+            self._count -= 1
+
+    def run_due(self):
+        """ Run the callbacks whose deadlines have passed. """
+        self._timer_tick = None
+        now = self._clock()
+        now_tick = int(math.floor(now / self.resolution + _EPSILON))
+        ticks = self._ticks
+        buckets = self._buckets
+        count = 0
+        while ticks and ticks[0] <= now_tick:
+            calls = buckets.pop(heappop(ticks))
+            calls.sort(key=lambda call: (-call.priority, call.sequence))
+            for call in calls:
+                if not call.active:
+                    continue
+
+                if call.interval is None:
+                    call.active = False
+                    self._count -= 1
+                else:
+                    self._reschedule(call, now)
+
+                count += 1
+                try:
+                    call.callback(*call.args, **call.kwargs)
+                except StopIteration:
+                    self.cancel(call)
+                except Exception:
+                    logger.exception("Exception in scheduled callback")
+
+        self._update_timer()
+        return count
+
+    # -------------------------------------------------------------------------
+    # BaseScheduler Protected interface
+    # -------------------------------------------------------------------------
+
+    def _clock(self):
+        """ Return the current time in seconds. """
+        return perf_counter()
+
+    def _start_timer(self, delay):
+        """ Set the toolkit timer to call run_due after a delay in seconds.
+
+        Subclasses should override this method.
+        """
+        raise NotImplementedError()
+
+    def _stop_timer(self):
+        """ Stop the toolkit timer.
+
+        Subclasses should override this method.
+        """
+        raise NotImplementedError()
+
+    # -------------------------------------------------------------------------
+    # Private interface
+    # -------------------------------------------------------------------------
+
+    def _add(self, call):
+        """ Add a call to the bucket for its deadline. """
+        tick = int(math.ceil(call.deadline / self.resolution - _EPSILON))
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            self._buckets[tick] = [call]
+            heappush(self._ticks, tick)
+        else:
+            bucket.append(call)
+
+    def _reschedule(self, call, now):
+        """ Schedule the next call of a repeating callback at a fixed rate,
+        skipping any calls which have been missed.
+        """
+        interval = call.interval
+        deadline = call.deadline + interval
+        if deadline <= now:
+            if interval > 0:
+                missed = math.floor((now - call.deadline) / interval)
+                deadline = call.deadline + (missed + 1) * interval
+            else:
+                deadline = now + self.resolution
+        call.deadline = deadline
+        self._add(call)
+
+    def _update_timer(self):
+        """ Set the toolkit timer to go off at the next deadline. """
+        # Drop the ticks whose callbacks have all been cancelled.
+        ticks = self._ticks
+        while ticks and not any(
+                call.active for call in self._buckets[ticks[0]]):
+            del self._buckets[heappop(ticks)]
+
+        if not ticks:
+            if self._timer_tick is not None:
+                self._timer_tick = None
+                self._stop_timer()
+        elif ticks[0] != self._timer_tick:
+            self._timer_tick = ticks[0]
+            delay = ticks[0] * self.resolution - self._clock()
+            self._start_timer(max(delay, 0.0))
@@ -0,0 +1,80 @@
+#  Copyright (c) 2018, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+"""
+Timers which share a single toolkit timer.
+
+A :py:class:`ScheduledTimer` has the same API as the timers in
+:py:mod:`pyface.timer.timer`, but instead of each having a toolkit timer they
+are all run by a shared scheduler, which has one toolkit timer set to go off
+at the next deadline.  They should be preferred when an application has many
+timers running at once.
+"""
+
+from traits.api import Any, Instance, Int
+
+from pyface.toolkit import toolkit_object
+from pyface.timer.i_scheduler import IScheduler
+from pyface.timer.i_timer import BaseTimer, MCallbackTimer, MEventTimer
+
+PyfaceScheduler = toolkit_object('timer.scheduler:PyfaceScheduler')
+
+#: The scheduler shared by all timers which are not given one.
+_shared_scheduler = None
+
+
+def get_scheduler():
+    """ Return the scheduler shared by the application's timers.
+
+    The scheduler is created the first time this is called, which must be in
+    the GUI thread.
+    """
+    global _shared_scheduler
+
+    if _shared_scheduler is None:
+        _shared_scheduler = PyfaceScheduler()
+    return _shared_scheduler
+
+
+class ScheduledTimer(BaseTimer):
+    """ Base class for timers which are run by a shared scheduler. """
+
+    #: The scheduler which runs the timer.
+    scheduler = Instance(IScheduler, factory=get_scheduler)
+
+    #: Timers with higher priorities are run first when they are due at the
+    #: same time.
+    priority = Int
+
+    # Private interface ------------------------------------------------------
+
+    #: The ScheduledCall of the running timer.
+    _call = Any
+
+    # -------------------------------------------------------------------------
+    # BaseTimer interface
+    # -------------------------------------------------------------------------
+
+    def _start(self):
+        self._call = self.scheduler.schedule(
+            self.perform, self.interval, self.interval, self.priority,
+        )
+
+    def _stop(self):
+        if self._call is not None:
+            self._call.cancel()
+            self._call = None
+
+
+class ScheduledEventTimer(MEventTimer, ScheduledTimer):
+    pass
+
+
+class ScheduledCallbackTimer(MCallbackTimer, ScheduledTimer):
+    pass
@@ -0,0 +1,281 @@
+from __future__ import absolute_import
+
+from unittest import TestCase, skipIf
+
+from traits.testing.unittest_tools import UnittestTools
+
+from pyface.toolkit import toolkit_object
+from ..i_scheduler import BaseScheduler, IScheduler
+from ..i_timer import perf_counter
+from ..scheduler import (
+    ScheduledCallbackTimer, ScheduledEventTimer, get_scheduler
+)
+
+GuiTestAssistant = toolkit_object('util.gui_test_assistant:GuiTestAssistant')
+no_gui_test_assistant = (GuiTestAssistant.__name__ == 'Unimplemented')
+
+
+class FakeScheduler(BaseScheduler):
+    """ A scheduler with a fake clock and a fake toolkit timer. """
+
+    def __init__(self, **traits):
+        super(FakeScheduler, self).__init__(**traits)
+        self.now = 0.0
+        self.timer_delays = []
+        self.timer_running = False
+
+    def advance(self, seconds):
+        """ Move the clock on and run whatever is due. """
+        self.now += seconds
+        return self.run_due()
+
+    def run_due(self):
+        # Like a toolkit timer, the fake timer goes off only once.
+        self.timer_running = False
+        return super(FakeScheduler, self).run_due()
+
+    def _clock(self):
+        return self.now
+
+    def _start_timer(self, delay):
+        self.timer_delays.append(delay)
+        self.timer_running = True
+
+    def _stop_timer(self):
+        self.timer_running = False
+
+
+class TestBaseScheduler(TestCase):
+
+    def setUp(self):
+        self.scheduler = FakeScheduler()
+        self.calls = []
+
+    def record(self, name):
+        self.calls.append((name, self.scheduler.now))
+
+    def test_provides_interface(self):
+        self.assertIsInstance(self.scheduler, IScheduler)
+
+    def test_single_shot(self):
+        self.scheduler.schedule(self.record, 0.5, args=('a',))
+
+        self.assertEqual(len(self.scheduler), 1)
+        self.assertTrue(self.scheduler.timer_running)
+        self.assertAlmostEqual(self.scheduler.timer_delays[-1], 0.5)
+
+        self.assertEqual(self.scheduler.advance(0.25), 0)
+        self.assertEqual(self.scheduler.advance(0.25), 1)
+        self.assertEqual(self.calls, [('a', 0.5)])
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertFalse(self.scheduler.timer_running)
+
+        self.scheduler.advance(1.0)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_kwargs(self):
+        self.scheduler.schedule(self.record, 0.1, kwargs={'name': 'b'})
+        self.scheduler.advance(0.1)
+        self.assertEqual(self.calls, [('b', 0.1)])
+
+    def test_cancel(self):
+        call = self.scheduler.schedule(self.record, 0.5, args=('a',))
+        call.cancel()
+        # Cancelling twice is harmless.
+        call.cancel()
+
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertEqual(self.scheduler.advance(1.0), 0)
+        self.assertEqual(self.calls, [])
+
+    def test_timer_follows_next_deadline(self):
+        late = self.scheduler.schedule(self.record, 1.0, args=('late',))
+        self.scheduler.schedule(self.record, 0.2, args=('early',))
+
+        self.assertAlmostEqual(self.scheduler.timer_delays[-1], 0.2)
+
+        self.scheduler.advance(0.2)
+        self.assertAlmostEqual(self.scheduler.timer_delays[-1], 0.8)
+
+        late.cancel()
+        self.scheduler.schedule(self.record, 0.1, args=('other',))
+        self.assertAlmostEqual(self.scheduler.timer_delays[-1], 0.1)
+
+    def test_coalesced_deadlines_run_by_priority(self):
+        self.scheduler.resolution = 0.01
+        self.scheduler.schedule(self.record, 0.101, args=('low',))
+        self.scheduler.schedule(
+            self.record, 0.104, priority=10, args=('high',)
+        )
+        self.scheduler.schedule(self.record, 0.102, args=('low 2',))
+
+        # All three share one bucket, so the timer was only started once.
+        self.assertEqual(len(self.scheduler._ticks), 1)
+        self.assertEqual(len(self.scheduler.timer_delays), 1)
+
+        self.assertEqual(self.scheduler.advance(0.11), 3)
+        self.assertEqual(
+            [name for name, _ in self.calls], ['high', 'low', 'low 2']
+        )
+
+    def test_fixed_rate_without_drift(self):
+        self.scheduler.schedule(self.record, 0.1, interval=0.1, args=('a',))
+
+        # Each callback runs a little late, but the deadlines don't drift.
+        for i in range(1, 11):
+            self.scheduler.now = 0.1 * i + 0.003
+            self.scheduler.run_due()
+
+        self.assertEqual(len(self.calls), 10)
+        call, = self.scheduler._buckets[self.scheduler._ticks[0]]
+        self.assertAlmostEqual(call.deadline, 1.1)
+
+    def test_missed_intervals_are_skipped(self):
+        self.scheduler.schedule(self.record, 0.1, interval=0.1, args=('a',))
+
+        self.scheduler.advance(0.55)
+        self.assertEqual(len(self.calls), 1)
+        call, = self.scheduler._buckets[self.scheduler._ticks[0]]
+        self.assertAlmostEqual(call.deadline, 0.6)
+
+    def test_stop_iteration(self):
+        def callback():
+            self.record('a')
+            if len(self.calls) == 3:
+                raise StopIteration()
+
+        self.scheduler.schedule(callback, 0.1, interval=0.1)
+        for i in range(5):
+            self.scheduler.advance(0.1)
+
+        self.assertEqual(len(self.calls), 3)
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertFalse(self.scheduler.timer_running)
+
+    def test_exception_is_logged(self):
+        def callback():
+            raise ZeroDivisionError()
+
+        self.scheduler.schedule(callback, 0.1)
+        self.scheduler.schedule(self.record, 0.1, args=('a',))
+        with self.assertLogs('pyface.timer.i_scheduler', 'ERROR'):
+            self.scheduler.advance(0.1)
+
+        self.assertEqual(self.calls, [('a', 0.1)])
+
+    def test_schedule_from_callback(self):
+        def callback():
+            self.record('a')
+            self.scheduler.schedule(self.record, 0.0, args=('b',))
+
+        self.scheduler.schedule(callback, 0.1)
+        self.scheduler.advance(0.1)
+        self.scheduler.advance(0.001)
+
+        self.assertEqual([name for name, _ in self.calls], ['a', 'b'])
+
+    def test_many_callbacks(self):
+        for i in range(1000):
+            self.scheduler.schedule(
+                self.record, 0.001 * (i % 100), interval=0.1, args=(i,),
+            )
+
+        self.assertEqual(len(self.scheduler._ticks), 100)
+        self.assertEqual(self.scheduler.advance(0.1), 1000)
+        self.assertEqual(len(self.scheduler), 1000)
+
+
+class TestScheduledTimerWithFakeScheduler(TestCase, UnittestTools):
+
+    def setUp(self):
+        self.scheduler = FakeScheduler()
+        self.count = 0
+
+    def callback(self):
+        self.count += 1
+
+    def test_repeat(self):
+        timer = ScheduledCallbackTimer(
+            scheduler=self.scheduler, callback=self.callback, interval=0.1,
+            repeat=3,
+        )
+        timer.start()
+        self.assertTrue(timer.active)
+        self.assertEqual(len(self.scheduler), 1)
+
+        for i in range(5):
+            self.scheduler.advance(0.1)
+
+        self.assertEqual(self.count, 3)
+        self.assertFalse(timer.active)
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_stop(self):
+        timer = ScheduledCallbackTimer(
+            scheduler=self.scheduler, callback=self.callback, interval=0.1,
+        )
+        timer.start()
+        self.scheduler.advance(0.1)
+        timer.stop()
+        self.scheduler.advance(0.1)
+
+        self.assertEqual(self.count, 1)
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_event_timer(self):
+        timer = ScheduledEventTimer(scheduler=self.scheduler, interval=0.1)
+        timer.start()
+        try:
+            with self.assertTraitChanges(timer, 'timeout', count=2):
+                self.scheduler.advance(0.1)
+                self.scheduler.advance(0.1)
+        finally:
+            timer.stop()
+
+
+@skipIf(no_gui_test_assistant, 'No GuiTestAssistant')
+class TestScheduledCallbackTimer(TestCase, GuiTestAssistant):
+    """ Test the ScheduledCallbackTimer with the toolkit's scheduler. """
+
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+        self.times = []
+
+    def tearDown(self):
+        GuiTestAssistant.tearDown(self)
+
+    def callback(self):
+        self.times.append(perf_counter())
+
+    def test_shared_scheduler(self):
+        timer = ScheduledCallbackTimer(callback=self.callback)
+        self.assertIs(timer.scheduler, get_scheduler())
+
+    def test_interval(self):
+        timers = [
+            ScheduledCallbackTimer(
+                callback=self.callback, interval=0.1, repeat=4,
+            )
+            for i in range(3)
+        ]
+        start_time = perf_counter()
+        for timer in timers:
+            timer.start()
+        try:
+            self.event_loop_helper.event_loop_until_condition(
+                lambda: not any(timer.active for timer in timers)
+            )
+        finally:
+            for timer in timers:
+                timer.stop()
+
+        self.assertEqual(len(self.times), 12)
+        # The three timers are run together, no sooner than their deadlines.
+        expected_times = [start_time + 0.1 * (i // 3 + 1) for i in range(12)]
+        self.assertTrue(
+            all(
+                expected <= actual
+                for expected, actual in zip(expected_times, self.times)
+            ),
+            self.times,
+        )
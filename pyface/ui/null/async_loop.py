@@ -0,0 +1,17 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#------------------------------------------------------------------------------
+""" The null toolkit's asyncio event loop. """
+
+import asyncio
+
+
+class PyfaceEventLoop(asyncio.SelectorEventLoop):
+    """ A plain asyncio event loop, since there is no GUI event loop. """
@@ -17,7 +17,7 @@
 import os
 
 # Enthought library imports.
-from traits.api import Any, HasTraits, List, Property, provides
+from traits.api import Any, Dict, HasTraits, List, Property, provides
 from traits.api import Unicode
 
 # Local imports.
@@ -36,6 +36,9 @@ class ImageResource(MImageResource, HasTraits):
     # The resource manager reference for the image.
     _ref = Any
 
+    # The resource manager references for specific image sizes.
+    _refs = Dict
+
     #### 'ImageResource' interface ############################################
 
     absolute_path = Property(Unicode)
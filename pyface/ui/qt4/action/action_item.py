@@ -29,6 +29,15 @@ from traits.api import Any, Bool, HasTraits
 # Local imports.
 from pyface.action.action_event import ActionEvent
 
+# The handlers of the menu items and tools for changes to their action.
+_ACTION_TRAIT_HANDLERS = {
+    'enabled': '_on_action_enabled_changed',
+    'visible': '_on_action_visible_changed',
+    'checked': '_on_action_checked_changed',
+    'name': '_on_action_name_changed',
+    'accelerator': '_on_action_accelerator_changed',
+}
+
 
 class PyfaceWidgetAction(QtGui.QWidgetAction):
 
@@ -120,13 +129,9 @@ class _MenuItem(HasTraits):
             self.control.setChecked(action.checked)
 
         # Listen for trait changes on the action (so that we can update its
-        # enabled/disabled/checked state etc).
-        action.on_trait_change(self._on_action_enabled_changed, 'enabled')
-        action.on_trait_change(self._on_action_visible_changed, 'visible')
-        action.on_trait_change(self._on_action_checked_changed, 'checked')
-        action.on_trait_change(self._on_action_name_changed, 'name')
-        action.on_trait_change(self._on_action_accelerator_changed,
-                               'accelerator')
+        # enabled/disabled/checked state etc).  A single listener for all of
+        # the traits is much cheaper than one for each of them.
+        action.on_trait_change(self._on_action_trait_changed)
 
         # Detect if the control is destroyed.
         self.control.destroyed.connect(self._qt4_on_destroyed)
@@ -137,16 +142,10 @@ class _MenuItem(HasTraits):
 
     def dispose(self):
         action = self.item.action
-        action.on_trait_change(self._on_action_enabled_changed, 'enabled',
-            remove=True)
-        action.on_trait_change(self._on_action_visible_changed, 'visible',
-            remove=True)
-        action.on_trait_change(self._on_action_checked_changed, 'checked',
-            remove=True)
-        action.on_trait_change(self._on_action_name_changed, 'name',
-            remove=True)
-        action.on_trait_change(self._on_action_accelerator_changed,
-            'accelerator', remove=True)
+        action.on_trait_change(self._on_action_trait_changed, remove=True)
+
+        # The control is about to be removed.
+        self.control = None
 
     ###########################################################################
     # Private interface.
@@ -218,6 +217,12 @@ class _MenuItem(HasTraits):
         if self.control is not None:
             self.control.setChecked(self.checked)
 
+    def _on_action_trait_changed(self, action, trait_name, old, new):
+        """ Called when any trait is changed on an action. """
+        handler_name = _ACTION_TRAIT_HANDLERS.get(trait_name)
+        if handler_name is not None:
+            getattr(self, handler_name)(action, trait_name, old, new)
+
     def _on_action_enabled_changed(self, action, trait_name, old, new):
         """ Called when the enabled trait is changed on an action. """
         if self.control is not None:
@@ -321,13 +326,9 @@ class _Tool(HasTraits):
         self.control._tool_instance = self
 
         # Listen for trait changes on the action (so that we can update its
-        # enabled/disabled/checked state etc).
-        action.on_trait_change(self._on_action_enabled_changed, 'enabled')
-        action.on_trait_change(self._on_action_visible_changed, 'visible')
-        action.on_trait_change(self._on_action_checked_changed, 'checked')
-        action.on_trait_change(self._on_action_name_changed, 'name')
-        action.on_trait_change(self._on_action_accelerator_changed,
-                               'accelerator')
+        # enabled/disabled/checked state etc).  A single listener for all of
+        # the traits is much cheaper than one for each of them.
+        action.on_trait_change(self._on_action_trait_changed)
 
         # Detect if the control is destroyed.
         self.control.destroyed.connect(self._qt4_on_destroyed)
@@ -336,6 +337,13 @@ class _Tool(HasTraits):
             self.controller = controller
             controller.add_to_toolbar(self)
 
+    def dispose(self):
+        action = self.item.action
+        action.on_trait_change(self._on_action_trait_changed, remove=True)
+
+        # The control is about to be removed.
+        self.control = None
+
     ###########################################################################
     # Private interface.
     ###########################################################################
@@ -402,6 +410,12 @@ class _Tool(HasTraits):
         if self.control is not None:
             self.control.setChecked(self.checked)
 
+    def _on_action_trait_changed(self, action, trait_name, old, new):
+        """ Called when any trait is changed on an action. """
+        handler_name = _ACTION_TRAIT_HANDLERS.get(trait_name)
+        if handler_name is not None:
+            getattr(self, handler_name)(action, trait_name, old, new)
+
     def _on_action_enabled_changed(self, action, trait_name, old, new):
         """ Called when the enabled trait is changed on an action. """
         if self.control is not None:
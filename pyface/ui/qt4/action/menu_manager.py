@@ -12,11 +12,14 @@
 """ The PyQt specific implementation of a menu manager. """
 
 
+# Standard library imports.
+from difflib import SequenceMatcher
+
 # Major package imports.
 from pyface.qt import QtCore, QtGui
 
 # Enthought library imports.
-from traits.api import Instance, Unicode
+from traits.api import Bool, Instance, Unicode
 
 # Local imports.
 from pyface.action.action_manager import ActionManager
@@ -40,6 +43,12 @@ class MenuManager(ActionManager, ActionManagerItem):
     # The default action for tool button when shown in a toolbar (Qt only)
     action = Instance(Action)
 
+    # Are the items of the menu only created when it is about to be shown, and
+    # only updated when it is shown again after the manager has changed (Qt
+    # only)?  Note that the accelerators of the items of a lazy menu are not
+    # active until it has been shown.
+    lazy = Bool(False)
+
     ###########################################################################
     # 'MenuManager' interface.
     ###########################################################################
@@ -85,7 +94,134 @@ class MenuManager(ActionManager, ActionManagerItem):
                                  else tool_button.InstantPopup)
 
 
-class _Menu(QtGui.QMenu):
+class _ActionContainer(object):
+    """ A mixin for the controls that show the items of an action manager.
+
+    The actions of the control are kept as a list of entries, one for each
+    item and separator, so that when the items of the manager change only the
+    actions of the items that were removed or added have to be removed or
+    created.
+    """
+
+    #: The entries, as (key, actions, wrappers) tuples, in order.  The key is
+    #: the item, or a tuple for a separator, the actions are the QActions
+    #: created for it and the wrappers are the objects to dispose of with them.
+    _entries = ()
+
+    #: The QActions added to the control while an entry is being created.
+    _added_actions = None
+
+    ###########################################################################
+    # 'QWidget' interface.
+    ###########################################################################
+
+    def actionEvent(self, event):
+        """ Reimplemented to collect the actions created for an entry. """
+
+        if (self._added_actions is not None
+                and event.type() == QtCore.QEvent.ActionAdded):
+            self._added_actions.append(event.action())
+
+        super(_ActionContainer, self).actionEvent(event)
+
+    ###########################################################################
+    # Protected '_ActionContainer' interface.
+    ###########################################################################
+
+    def _add_entry(self, key):
+        """ Adds the actions for an entry and returns its wrappers. """
+
+        raise NotImplementedError
+
+    def _get_keys(self):
+        """ Returns the keys of the entries that the control should show. """
+
+        raise NotImplementedError
+
+    def _dispose_entries(self):
+        """ Removes all of the entries. """
+
+        for entry in self._entries:
+            self._dispose_entry(entry)
+
+        self._entries = []
+
+    def _update_entries(self):
+        """ Brings the entries up to date with the items of the manager.
+
+        Returns True if any entry was added or removed.
+        """
+
+        entries = list(self._entries)
+        keys = self._get_keys()
+        old_keys = [entry[0] for entry in entries]
+        if keys == old_keys:
+            return False
+
+        # Apply the changes from the last to the first, so that the entries
+        # that are yet to be changed keep their positions.
+        opcodes = SequenceMatcher(None, old_keys, keys, False).get_opcodes()
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == 'equal':
+                continue
+
+            for entry in entries[i1:i2]:
+                self._dispose_entry(entry)
+
+            before = None
+            for entry in entries[i2:]:
+                if len(entry[1]) > 0:
+                    before = entry[1][0]
+                    break
+
+            entries[i1:i2] = [
+                self._create_entry(key, before) for key in keys[j1:j2]
+            ]
+
+        self._entries = entries
+        return True
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _create_entry(self, key, before):
+        """ Creates the entry for a key, with its actions before an action. """
+
+        self._added_actions = actions = []
+        try:
+            wrappers = self._add_entry(key)
+        finally:
+            self._added_actions = None
+
+        if before is not None:
+            for action in actions:
+                self.removeAction(action)
+                self.insertAction(before, action)
+
+        return (key, actions, wrappers)
+
+    def _dispose_entry(self, entry):
+        """ Removes and destroys the actions of an entry. """
+
+        key, actions, wrappers = entry
+        for wrapper in wrappers:
+            wrapper.dispose()
+
+        for action in actions:
+            self.removeAction(action)
+
+            menu = action.menu()
+            if isinstance(menu, _Menu):
+                menu.dispose()
+                menu.deleteLater()
+                if action is menu.menuAction():
+                    continue
+
+            action.deleteLater()
+
+
+class _Menu(_ActionContainer, QtGui.QMenu):
     """ The toolkit-specific menu control. """
 
     ###########################################################################
@@ -110,8 +246,18 @@ class _Menu(QtGui.QMenu):
         # List of menu items
         self.menu_items = []
 
-        # Create the menu structure.
-        self.refresh()
+        # The entries for the items and separators in the menu.
+        self._entries = []
+
+        # Have the items of the manager changed since the menu was last shown
+        # (only used by lazy menus)?
+        self._dirty = True
+
+        # Create the menu structure, or wait until it is shown.
+        if getattr(manager, 'lazy', False):
+            self.aboutToShow.connect(self._on_about_to_show)
+        else:
+            self.refresh()
 
         # Listen to the manager being updated.
         self._manager.on_trait_change(self.refresh, 'changed')
@@ -130,32 +276,42 @@ class _Menu(QtGui.QMenu):
     def clear(self):
         """ Clears the items from the menu. """
 
-        for item in self.menu_items:
-            item.dispose()
-            
+        self._dispose_entries()
         self.menu_items = []
 
         super(_Menu, self).clear()
 
+    def dispose(self):
+        """ Stops listening to the manager and clears the menu. """
+
+        self._manager.on_trait_change(self.refresh, 'changed', remove=True)
+        self._manager.on_trait_change(self._on_enabled_changed, 'enabled',
+                                      remove=True)
+        self._manager.on_trait_change(self._on_visible_changed, 'visible',
+                                      remove=True)
+        self._manager.on_trait_change(self._on_name_changed, 'name',
+                                      remove=True)
+        self.clear()
+
     def is_empty(self):
         """ Is the menu empty? """
 
         return self.isEmpty()
 
     def refresh(self):
-        """ Ensures that the menu reflects the state of the manager. """
-
-        self.clear()
+        """ Ensures that the menu reflects the state of the manager.
 
-        manager = self._manager
-        parent  = self._parent
+        Only the actions of the items that have been added or removed since
+        the last refresh are created or destroyed.  A lazy menu is only
+        refreshed when it is about to be shown.
+        """
 
-        previous_non_empty_group = None
-        for group in manager.groups:
-            previous_non_empty_group = self._add_group(parent, group,
-                    previous_non_empty_group)
+        if getattr(self._manager, 'lazy', False) and not self.isVisible():
+            self._dirty = True
+            return
 
-        self.setEnabled(manager.enabled)
+        self._update_menu()
+        self.setEnabled(self._manager.enabled)
 
     def show(self, x=None, y=None):
         """ Show the menu at the specified location. """
@@ -189,30 +345,71 @@ class _Menu(QtGui.QMenu):
 
         return
 
-    def _add_group(self, parent, group, previous_non_empty_group=None):
-        """ Adds a group to a menu. """
+    def _on_about_to_show(self):
+        """ Creates or updates the items of a lazy menu. """
+
+        if self._dirty:
+            self._update_menu()
+
+    def _update_menu(self):
+        """ Brings the actions of the menu up to date with the manager. """
+
+        self._dirty = False
+        if self._update_entries():
+            self.menu_items = [
+                menu_item
+                for key, actions, menu_items in self._entries
+                for menu_item in menu_items
+            ]
+
+    def _add_entry(self, key):
+        """ Adds the actions for an item or separator to the menu. """
+
+        if isinstance(key, tuple):
+            self.addSeparator()
+            return []
+
+        n_menu_items = len(self.menu_items)
+        key.add_to_menu(self._parent, self, self._controller)
+        return self.menu_items[n_menu_items:]
+
+    def _get_keys(self):
+        """ Returns the items and separators that the menu should show. """
+
+        keys = []
+        previous_non_empty_group = None
+        for group in self._manager.groups:
+            previous_non_empty_group = self._add_group_keys(
+                keys, group, previous_non_empty_group
+            )
+
+        return keys
+
+    def _add_group_keys(self, keys, group, previous_non_empty_group=None):
+        """ Adds the keys for the items and separators of a group. """
 
-        if len(group.items) > 0:
+        items = group.items
+        if len(items) > 0:
             # Is a separator required?
             if previous_non_empty_group is not None and group.separator:
-                self.addSeparator()
+                keys.append(('separator', group))
 
-            # Create actions and sub-menus for each contribution item in
-            # the group.
-            for item in group.items:
+            # Add the contribution items and sub-menus in the group.
+            for item in items:
                 if isinstance(item, Group):
                     if len(item.items) > 0:
-                        self._add_group(parent, item, previous_non_empty_group)
+                        self._add_group_keys(keys, item,
+                                             previous_non_empty_group)
 
                         if previous_non_empty_group is not None \
                            and previous_non_empty_group.separator \
                            and item.separator:
-                            self.addSeparator()
+                            keys.append(('separator after', item))
 
                         previous_non_empty_group = item
 
                 else:
-                    item.add_to_menu(parent, self, self._controller)
+                    keys.append(item)
 
             previous_non_empty_group = group
 
@@ -16,6 +16,7 @@ from traits.api import Bool, Enum, Instance, Str, Tuple
 # Local imports.
 from pyface.image_cache import ImageCache
 from pyface.action.action_manager import ActionManager
+from pyface.ui.qt4.action.menu_manager import _ActionContainer
 
 
 class ToolBarManager(ActionManager):
@@ -80,7 +81,7 @@ class ToolBarManager(ActionManager):
             controller = self.controller
 
         # Create the control.
-        tool_bar = _ToolBar(self, parent)
+        tool_bar = _ToolBar(self, parent, controller)
         tool_bar.setObjectName(self.id)
         tool_bar.setWindowTitle(self.name)
 
@@ -98,61 +99,54 @@ class ToolBarManager(ActionManager):
         tool_bar.setIconSize(QtCore.QSize(w, h))
 
         # Add all of items in the manager's groups to the tool bar.
-        self._qt4_add_tools(parent, tool_bar, controller)
+        tool_bar.refresh()
 
         return tool_bar
 
-    ###########################################################################
-    # Private interface.
-    ###########################################################################
 
-    def _qt4_add_tools(self, parent, tool_bar, controller):
-        """ Adds tools for all items in the list of groups. """
+class _Separator(object):
+    """ A tool bar separator whose visibility follows that of its group. """
 
-        previous_non_empty_group = None
-        for group in self.groups:
-            if len(group.items) > 0:
-                # Is a separator required?
-                if previous_non_empty_group is not None and group.separator:
-                    separator = tool_bar.addSeparator()
-                    group.on_trait_change(self._separator_visibility_method(separator),
-                                          'visible')
+    def __init__(self, group, control):
+        self.group = group
+        self.control = control
+        group.on_trait_change(self._on_visible_changed, 'visible')
 
-                previous_non_empty_group = group
+    def dispose(self):
+        self.group.on_trait_change(self._on_visible_changed, 'visible',
+                                   remove=True)
 
-                # Create a tool bar tool for each item in the group.
-                for item in group.items:
-                    item.add_to_toolbar(
-                        parent,
-                        tool_bar,
-                        self._image_cache,
-                        controller,
-                        self.show_tool_names
-                    )
-
-        return
-
-    def _separator_visibility_method(self, separator):
-        """ Method to return closure to set visibility of group separators. """
-        return lambda visible: separator.setVisible(visible)
+    def _on_visible_changed(self, visible):
+        self.control.setVisible(visible)
 
 
-class _ToolBar(QtGui.QToolBar):
+class _ToolBar(_ActionContainer, QtGui.QToolBar):
     """ The toolkit-specific tool bar implementation. """
 
     ###########################################################################
     # 'object' interface.
     ###########################################################################
 
-    def __init__(self, tool_bar_manager, parent):
+    def __init__(self, tool_bar_manager, parent, controller=None):
         """ Constructor. """
 
         QtGui.QToolBar.__init__(self, parent)
 
-        # Listen for changes to the tool bar manager's enablement and
+        # The parent of the tools.
+        self._parent = parent
+
+        # The controller.
+        self._controller = controller
+
+        # The entries for the tools and separators in the tool bar.
+        self._entries = []
+
+        # Listen for changes to the tool bar manager's items, enablement and
         # visibility.
         self.tool_bar_manager = tool_bar_manager
 
+        self.tool_bar_manager.on_trait_change(self.refresh, 'changed')
+
         self.tool_bar_manager.on_trait_change(
             self._on_tool_bar_manager_enabled_changed, 'enabled'
         )
@@ -163,6 +157,76 @@ class _ToolBar(QtGui.QToolBar):
 
         return
 
+    ###########################################################################
+    # '_ToolBar' interface.
+    ###########################################################################
+
+    def dispose(self):
+        """ Stops listening to the manager and removes the tools. """
+
+        self.tool_bar_manager.on_trait_change(
+            self.refresh, 'changed', remove=True
+        )
+        self.tool_bar_manager.on_trait_change(
+            self._on_tool_bar_manager_enabled_changed, 'enabled', remove=True
+        )
+        self.tool_bar_manager.on_trait_change(
+            self._on_tool_bar_manager_visible_changed, 'visible', remove=True
+        )
+        self._dispose_entries()
+
+    def refresh(self):
+        """ Ensures that the tool bar reflects the state of the manager.
+
+        Only the tools of the items that have been added or removed since the
+        last refresh are created or destroyed.
+        """
+
+        self._update_entries()
+
+    ###########################################################################
+    # Protected '_ActionContainer' interface.
+    ###########################################################################
+
+    def _add_entry(self, key):
+        """ Adds the tools for an item or separator to the tool bar. """
+
+        if isinstance(key, tuple):
+            return [_Separator(key[1], self.addSeparator())]
+
+        manager = self.tool_bar_manager
+        key.add_to_toolbar(
+            self._parent,
+            self,
+            manager._image_cache,
+            self._controller,
+            manager.show_tool_names
+        )
+        return [
+            action._tool_instance
+            for action in self._added_actions
+            if hasattr(action, '_tool_instance')
+        ]
+
+    def _get_keys(self):
+        """ Returns the items and separators that the tool bar should show. """
+
+        keys = []
+        previous_non_empty_group = None
+        for group in self.tool_bar_manager.groups:
+            items = group.items
+            if len(items) > 0:
+                # Is a separator required?
+                if previous_non_empty_group is not None and group.separator:
+                    keys.append(('separator', group))
+
+                previous_non_empty_group = group
+
+                # Add a tool bar tool for each item in the group.
+                keys.extend(items)
+
+        return keys
+
     ###########################################################################
     # Trait change handlers.
     ###########################################################################
@@ -120,6 +120,16 @@ class ApplicationWindow(MApplicationWindow, Window):
 
         return (800, 600)
 
+    ###########################################################################
+    # 'IWidget' interface.
+    ###########################################################################
+
+    def destroy(self):
+        if self.control is not None:
+            self._remove_tool_bars()
+
+        super(ApplicationWindow, self).destroy()
+
     ###########################################################################
     # Protected 'IWidget' interface.
     ###########################################################################
@@ -157,6 +167,19 @@ class ApplicationWindow(MApplicationWindow, Window):
 
         return tool_bar_managers
 
+    def _remove_tool_bars(self):
+        """ Remove the tool bars, which stop following their managers. """
+
+        for child in self.control.children():
+            if isinstance(child, QtGui.QToolBar):
+                # The managers can outlive the tool bars (a task window
+                # creates the tool bars of a task again whenever the task
+                # is activated).
+                if hasattr(child, 'dispose'):
+                    child.dispose()
+                self.control.removeToolBar(child)
+                child.deleteLater()
+
     #### Trait change handlers ################################################
 
     # QMainWindow takes ownership of the menu bar and the status bar upon
@@ -177,10 +200,7 @@ class ApplicationWindow(MApplicationWindow, Window):
     def _update_tool_bar_managers(self):
         if self.control is not None:
             # Remove the old toolbars.
-            for child in self.control.children():
-                if isinstance(child, QtGui.QToolBar):
-                    self.control.removeToolBar(child)
-                    child.deleteLater()
+            self._remove_tool_bars()
 
             # Add the new toolbars.
             self._create_tool_bar(self.control)
@@ -0,0 +1,72 @@
+# Copyright (c) 2018, Enthought Inc
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license.  However, when used with the GPL version of PyQt the additional
+# terms described in the PyQt GPL exception also apply
+""" An asyncio event loop run by the Qt event loop. """
+
+import math
+
+from pyface.qt.QtCore import QEventLoop, QSocketNotifier, Qt, QTimer
+from pyface.i_async_loop import BaseGuiEventLoop
+
+
+class PyfaceEventLoop(BaseGuiEventLoop):
+    """ An asyncio event loop run by the Qt event loop.
+
+    The loop is run from a single-shot QTimer set for the next asyncio
+    deadline, and from a QSocketNotifier on the selector's file descriptor
+    (where the selector has one, eg. epoll and kqueue), so that I/O is
+    handled as soon as it is ready.  ``run_forever`` runs a nested QEventLoop.
+    """
+
+    def __init__(self, selector=None):
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+        self._notifier = None
+        self._qt_loops = []
+
+        super(PyfaceEventLoop, self).__init__(selector)
+
+    ###########################################################################
+    # Protected 'BaseGuiEventLoop' interface.
+    ###########################################################################
+
+    def _start_timer(self, delay):
+        self._timer.start(int(math.ceil(delay * 1000)))
+
+    def _stop_timer(self):
+        self._timer.stop()
+
+    def _run_gui_loop(self):
+        qt_loop = QEventLoop()
+        self._qt_loops.append(qt_loop)
+        try:
+            qt_loop.exec_()
+        finally:
+            self._qt_loops.pop()
+
+    def _quit_gui_loop(self):
+        self._qt_loops[-1].exit()
+
+    def _watch_selector(self, fileno):
+        self._notifier = QSocketNotifier(fileno, QSocketNotifier.Read)
+        self._notifier.activated.connect(self._on_activated)
+        return True
+
+    def _unwatch_selector(self):
+        self._notifier.setEnabled(False)
+        self._notifier.activated.disconnect(self._on_activated)
+        self._notifier = None
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _on_activated(self, *args):
+        """ Called when the selector is readable. """
+        self._tick()
@@ -11,6 +11,7 @@
 
 # Standard library imports
 import math
+import re
 import sys
 
 # System library imports
@@ -21,6 +22,9 @@ from .find_widget import FindWidget
 from .gutters import LineNumberWidget, StatusGutterWidget
 from .replace_widget import ReplaceWidget
 from .pygments_highlighter import PygmentsHighlighter
+from .search import (
+    MatchIndex, PositionMap, find_matches, replace_matches, search_pattern
+)
 import six
 
 
@@ -37,7 +41,9 @@ class CodeWidget(QtGui.QPlainTextEdit):
                  lexer=None):
         super(CodeWidget, self).__init__(parent)
 
-        self.highlighter = PygmentsHighlighter(self.document(), lexer)
+        self.highlighter = PygmentsHighlighter(
+            self.document(), lexer, editor=self
+        )
         self.line_number_widget = LineNumberWidget(self)
         self.status_widget = StatusGutterWidget(self)
 
@@ -62,6 +68,10 @@ class CodeWidget(QtGui.QPlainTextEdit):
         # What that highlight color should be.
         self.line_highlight_color = QtGui.QColor(QtCore.Qt.yellow).lighter(160)
 
+        # Extra selections shown along with the current line, eg. to highlight
+        # search matches.
+        self._match_selections = []
+
         # Auto-indentation behavior
         self.auto_indent = True
         self.smart_backspace = True
@@ -169,9 +179,23 @@ class CodeWidget(QtGui.QPlainTextEdit):
         self.status_widget.error_lines = error_lines
         self.status_widget.update()
 
+    def add_status_markers(self, kind, start, end=None):
+        """ Add status markers to the lines from start to end, inclusive.
+
+        The kind of marker is one of 'info', 'warn' or 'error'.
+        """
+        self.status_widget.add_markers(kind, start, end)
+
+    def remove_status_markers(self, kind, start, end=None):
+        """ Remove the status markers of a kind from the lines from start to
+        end, inclusive.
+        """
+        self.status_widget.remove_markers(kind, start, end)
+
     def highlight_current_line(self):
         """ Highlight the line with the cursor.
         """
+        selections = []
         if self.should_highlight_current_line:
             selection = QtGui.QTextEdit.ExtraSelection()
             selection.format.setBackground(self.line_highlight_color)
@@ -179,7 +203,22 @@ class CodeWidget(QtGui.QPlainTextEdit):
                 QtGui.QTextFormat.FullWidthSelection, True)
             selection.cursor = self.textCursor()
             selection.cursor.clearSelection()
-            self.setExtraSelections([selection])
+            selections.append(selection)
+        self.setExtraSelections(selections + self._match_selections)
+
+    def set_match_selections(self, selections):
+        """ Set the extra selections to show along with the current line.
+        """
+        self._match_selections = selections
+        self.highlight_current_line()
+
+    def visible_span(self):
+        """ Return the (start, end) positions of the visible text.
+        """
+        first = self.firstVisibleBlock()
+        bottom = QtCore.QPoint(0, self.viewport().height() - 1)
+        last = self.cursorForPosition(bottom).block()
+        return first.position(), last.position() + last.length()
 
     def autoindent_newline(self):
         tab = '\t'
@@ -515,6 +554,10 @@ class AdvancedCodeWidget(QtGui.QWidget):
         for search & replace
     """
 
+    # Documents of at least this many characters are searched in a worker
+    # thread when the search text or options change.
+    background_search_size = 1000000
+
     ###########################################################################
     # AdvancedCodeWidget interface
     ###########################################################################
@@ -533,7 +576,29 @@ class AdvancedCodeWidget(QtGui.QWidget):
         self.active_find_widget = None
         self.previous_find_widget = None
 
+        # The index of the matches of the current search, or None.
+        self.match_index = None
+
+        # The color the matches of the current search are highlighted in.
+        self.match_highlight_color = QtGui.QColor(QtCore.Qt.cyan).lighter(160)
+
+        # The future of the background search, if one is running.
+        self._search_future = None
+
         self.code.selectionChanged.connect(self._update_replace_enabled)
+        self.code.cursorPositionChanged.connect(self._update_match_count)
+        self.code.verticalScrollBar().valueChanged.connect(
+            self._update_match_highlights)
+        self.code.document().contentsChange.connect(self._contents_changed)
+
+        for widget in (self.find, self.replace):
+            widget.line_edit.textChanged.connect(self._search_changed)
+            widget.case_action.toggled.connect(self._search_changed)
+            widget.word_action.toggled.connect(self._search_changed)
+            widget.regex_action.toggled.connect(self._search_changed)
+            widget.highlight_action.toggled.connect(
+                self._update_match_highlights)
+            widget.close_button.clicked.connect(self._close_find_widget)
 
         self.find.line_edit.returnPressed.connect(self.find_next)
         self.find.next_button.clicked.connect(self.find_next)
@@ -585,6 +650,12 @@ class AdvancedCodeWidget(QtGui.QWidget):
     def set_error_lines(self, error_lines):
         self.code.set_error_lines(error_lines)
 
+    def add_status_markers(self, kind, start, end=None):
+        self.code.add_status_markers(kind, start, end)
+
+    def remove_status_markers(self, kind, start, end=None):
+        self.code.remove_status_markers(kind, start, end)
+
     def enable_find(self):
         self.replace.hide()
         self.find.show()
@@ -595,6 +666,7 @@ class AdvancedCodeWidget(QtGui.QWidget):
             self.find.line_edit.setText(self.replace.line_edit.text())
         self.find.line_edit.selectAll()
         self.active_find_widget = self.find
+        self._search_changed()
 
     def enable_replace(self):
         self.find.hide()
@@ -606,6 +678,7 @@ class AdvancedCodeWidget(QtGui.QWidget):
             self.replace.line_edit.setText(self.find.line_edit.text())
         self.replace.line_edit.selectAll()
         self.active_find_widget = self.replace
+        self._search_changed()
 
     def find_in_document(self, search_text, direction='forward', replace=None):
         """ Finds the next occurance of the desired text and optionally
@@ -613,49 +686,46 @@ class AdvancedCodeWidget(QtGui.QWidget):
             be executed, otherwise it will replace the occurance with
             the value of 'replace'.
 
-            Returns the number of occurances found (0 or 1)
+            Returns a cursor selecting the occurance (or its replacement), or
+            None if there is no occurance.
         """
 
         if not search_text:
             return
-        wrap = self.active_find_widget.wrap_action.isChecked()
+        widget = self.active_find_widget
+        pattern = self._search_pattern(widget, search_text)
+        if pattern is None:
+            return None
 
-        document = self.code.document()
-        find_cursor = None
-
-        flags = QtGui.QTextDocument.FindFlags(0)
-        if self.active_find_widget.case_action.isChecked():
-            flags |= QtGui.QTextDocument.FindCaseSensitively
-        if self.active_find_widget.word_action.isChecked():
-            flags |= QtGui.QTextDocument.FindWholeWords
-        if direction == 'backward':
-            flags |= QtGui.QTextDocument.FindBackward
-
-        find_cursor = document.find(search_text, self.code.textCursor(), flags)
-        if find_cursor.isNull() and wrap:
-            if direction == 'backward':
-                find_cursor = document.find(search_text, document.characterCount()-1, flags)
-            else:
-                find_cursor = document.find(search_text, 0, flags)
-
-        if not find_cursor.isNull():
-            if replace is not None:
-                find_cursor.beginEditBlock()
-                find_cursor.removeSelectedText()
-                find_cursor.insertText(replace)
-                find_cursor.endEditBlock()
-                find_cursor.movePosition(
-                    QtGui.QTextCursor.Left, QtGui.QTextCursor.MoveAnchor,len(replace))
-                find_cursor.movePosition(
-                    QtGui.QTextCursor.Right, QtGui.QTextCursor.KeepAnchor,len(replace))
-                self.code.setTextCursor(find_cursor)
-            else:
-                self.code.setTextCursor(find_cursor)
-            return find_cursor
+        cursor = self.code.textCursor()
+        backward = (direction == 'backward')
+        if backward:
+            position = cursor.selectionStart()
         else:
+            position = cursor.selectionEnd()
+        span = self._get_match_index(pattern).next_span(
+            position, backward, widget.wrap_action.isChecked())
+
+        if span is None:
             #else not found: beep or indicate?
             return None
 
+        start, end = span
+        find_cursor = QtGui.QTextCursor(self.code.document())
+        find_cursor.setPosition(start)
+        find_cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+        if replace is not None:
+            if widget.regex_action.isChecked():
+                replace = self._expand_replacement(pattern, start, replace)
+            find_cursor.beginEditBlock()
+            find_cursor.insertText(replace)
+            find_cursor.endEditBlock()
+            end = find_cursor.position()
+            find_cursor.setPosition(start)
+            find_cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+        self.code.setTextCursor(find_cursor)
+        return find_cursor
+
     def find_next(self):
         if not self.active_find_widget:
             self.enable_find()
@@ -677,11 +747,15 @@ class AdvancedCodeWidget(QtGui.QWidget):
         return 0
 
     def replace_next(self):
-        search_text = self.replace.line_edit.text()
-        replace_text = self.replace.replace_edit.text()
+        search_text = six.text_type(self.replace.line_edit.text())
+        replace_text = six.text_type(self.replace.replace_edit.text())
+        pattern = self._search_pattern(self.replace, search_text)
 
         cursor = self.code.textCursor()
-        if cursor.selectedText() == search_text:
+        if self._selection_matches(pattern):
+            if self.replace.regex_action.isChecked():
+                replace_text = self._expand_replacement(
+                    pattern, cursor.selectionStart(), replace_text)
             cursor.beginEditBlock()
             cursor.removeSelectedText()
             cursor.insertText(replace_text)
@@ -690,16 +764,30 @@ class AdvancedCodeWidget(QtGui.QWidget):
         return 0
 
     def replace_all(self):
+        """ Replace every occurance in the document, as a single edit which
+            can be undone in one step.
+
+            Returns the number of occurances replaced.
+        """
         search_text = six.text_type(self.replace.line_edit.text())
         replace_text = six.text_type(self.replace.replace_edit.text())
+        pattern = self._search_pattern(self.replace, search_text)
+        if not search_text or pattern is None:
+            return 0
 
-        count = 0
-        cursor = self.code.textCursor()
-        cursor.beginEditBlock()
-        while self.find_in_document(search_text=search_text,
-                                    replace=replace_text) != None:
-            count += 1
-        cursor.endEditBlock()
+        document = self.code.document()
+        start, end, new_text, count = replace_matches(
+            document.toPlainText(), pattern, replace_text,
+            self.replace.regex_action.isChecked())
+
+        if count:
+            # Replace everything from the first occurance to the last at once.
+            cursor = QtGui.QTextCursor(document)
+            cursor.setPosition(start)
+            cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+            cursor.beginEditBlock()
+            cursor.insertText(new_text)
+            cursor.endEditBlock()
         return count
 
     def print_(self, printer):
@@ -729,8 +817,7 @@ class AdvancedCodeWidget(QtGui.QWidget):
                 self.find.hide()
                 self.replace.hide()
                 self.code.setFocus()
-                self.previous_find_widget = self.active_find_widget
-                self.active_find_widget = None
+                self._close_find_widget()
 
         return super(AdvancedCodeWidget, self).keyPressEvent(event)
 
@@ -739,13 +826,214 @@ class AdvancedCodeWidget(QtGui.QWidget):
     ###########################################################################
 
     def _update_replace_enabled(self):
-        selection = self.code.textCursor().selectedText()
-        find_text = self.replace.line_edit.text()
-        self.replace.replace_button.setEnabled(selection == find_text)
+        find_text = six.text_type(self.replace.line_edit.text())
+        pattern = None
+        if find_text:
+            pattern = self._search_pattern(self.replace, find_text)
+        self.replace.replace_button.setEnabled(
+            self._selection_matches(pattern))
 
     def _update_replace_all_enabled(self, text):
         self.replace.replace_all_button.setEnabled(len(text))
 
+    def _close_find_widget(self):
+        """ Forget the active find widget once it has been hidden. """
+        if self.active_find_widget:
+            self.previous_find_widget = self.active_find_widget
+            self.active_find_widget = None
+        self._search_changed()
+
+    def _search_pattern(self, widget, search_text):
+        """ Return the pattern for a search with the options of a find
+            widget, or None if the text isn't a valid regular expression.
+        """
+        try:
+            return search_pattern(
+                search_text,
+                regex=widget.regex_action.isChecked(),
+                case_sensitive=widget.case_action.isChecked(),
+                whole_words=widget.word_action.isChecked(),
+            )
+        except re.error:
+            return None
+
+    def _get_match_index(self, pattern):
+        """ Return an index of the matches of a pattern, searching the
+            document if the current index is for another search.
+        """
+        index = self.match_index
+        if (index is None or self._search_future is not None
+                or index.pattern.pattern != pattern.pattern
+                or index.pattern.flags != pattern.flags):
+            text = self.code.document().toPlainText()
+            index = MatchIndex(pattern, find_matches(text, pattern))
+        return index
+
+    def _selection_matches(self, pattern):
+        """ Whether the selection is a match of a pattern.
+        """
+        cursor = self.code.textCursor()
+        if pattern is None or not cursor.hasSelection():
+            return False
+
+        document = self.code.document()
+        first = document.findBlock(cursor.selectionStart())
+        last = document.findBlock(cursor.selectionEnd())
+        offset = first.position()
+        text = self._text_between(first, last)
+        position_map = PositionMap(text)
+        match = pattern.match(
+            text, position_map.offset(cursor.selectionStart() - offset))
+        return (match is not None and position_map.position(match.end())
+                == cursor.selectionEnd() - offset)
+
+    def _expand_replacement(self, pattern, position, replace_text):
+        """ Expand the group references in the replacement for a regular
+            expression match at a position.
+        """
+        text = self.code.document().toPlainText()
+        match = pattern.match(text, PositionMap(text).offset(position))
+        if match is None:
+            return replace_text
+        return match.expand(replace_text)
+
+    def _text_between(self, first, last):
+        """ Return the text of the blocks from first to last, as it appears
+            in the document's plain text.
+        """
+        cursor = QtGui.QTextCursor(first)
+        cursor.setPosition(last.position() + last.length() - 1,
+                           QtGui.QTextCursor.KeepAnchor)
+        text = six.text_type(cursor.selectedText())
+        return text.replace(u'\u2029', u'\n').replace(u'\u00a0', u' ')
+
+    def _search_changed(self, value=None):
+        """ Find the matches of the current search, to highlight and count.
+        """
+        self._cancel_search()
+        self.match_index = None
+
+        widget = self.active_find_widget
+        search_text = u''
+        if widget is not None:
+            search_text = six.text_type(widget.line_edit.text())
+        pattern = None
+        if search_text:
+            pattern = self._search_pattern(widget, search_text)
+
+        if pattern is not None:
+            text = self.code.document().toPlainText()
+            if len(text) < self.background_search_size:
+                self.match_index = MatchIndex(
+                    pattern, find_matches(text, pattern))
+            else:
+                self._start_background_search(pattern, text)
+
+        self._update_match_highlights()
+        self._update_match_count()
+
+    def _start_background_search(self, pattern, text):
+        """ Find the matches of a pattern in a worker thread.
+        """
+        from pyface.concurrent.api import get_executor
+
+        future = get_executor().submit_progress(find_matches, text, pattern)
+        self._search_future = future
+
+        def state_changed():
+            if future.done:
+                self._background_search_done(future, pattern)
+
+        future.on_trait_change(state_changed, 'state')
+
+    def _background_search_done(self, future, pattern):
+        from pyface.concurrent.api import COMPLETED
+
+        if future is not self._search_future:
+            return
+
+        self._search_future = None
+        if future.state == COMPLETED:
+            self.match_index = MatchIndex(pattern, future.result)
+        self._update_match_highlights()
+        self._update_match_count()
+
+    def _cancel_search(self):
+        if self._search_future is not None:
+            self._search_future.cancel()
+            self._search_future = None
+
+    def _contents_changed(self, position, removed, added):
+        """ Update the index of the matches when the document is edited.
+        """
+        if self._search_future is not None or (
+                self.match_index is not None
+                and added >= self.background_search_size):
+            # Search the new text from scratch.
+            self._search_changed()
+            return
+
+        if self.match_index is None:
+            return
+
+        document = self.code.document()
+        first = document.findBlock(position)
+        last = document.findBlock(position + added)
+        if not first.isValid():
+            first = document.firstBlock()
+        if not last.isValid():
+            last = document.lastBlock()
+        self.match_index.text_changed(
+            position, removed, added, first.position(),
+            self._text_between(first, last))
+
+        self._update_match_highlights()
+        self._update_match_count()
+
+    def _update_match_highlights(self, value=None):
+        """ Highlight the visible matches of the current search.
+        """
+        widget = self.active_find_widget
+        selections = []
+        if (self.match_index is not None and widget is not None
+                and not widget.isHidden()
+                and widget.highlight_action.isChecked()):
+            document = self.code.document()
+            start, end = self.code.visible_span()
+            for span in self.match_index.spans_between(start, end):
+                selection = QtGui.QTextEdit.ExtraSelection()
+                selection.format.setBackground(self.match_highlight_color)
+                selection.cursor = QtGui.QTextCursor(document)
+                selection.cursor.setPosition(span[0])
+                selection.cursor.setPosition(
+                    span[1], QtGui.QTextCursor.KeepAnchor)
+                selections.append(selection)
+        self.code.set_match_selections(selections)
+
+    def _update_match_count(self):
+        """ Show the number of matches, and which one is selected.
+        """
+        widget = self.active_find_widget
+        if widget is None:
+            return
+
+        if self._search_future is not None:
+            text = 'Searching...'
+        elif self.match_index is None:
+            text = ''
+        else:
+            cursor = self.code.textCursor()
+            count = len(self.match_index)
+            index = self.match_index.index(
+                cursor.selectionStart(), cursor.selectionEnd())
+            if index is not None:
+                text = '{} of {}'.format(index + 1, count)
+            elif count == 1:
+                text = '1 match'
+            else:
+                text = '{} matches'.format(count)
+        widget.count_label.setText(text)
+
 
 if __name__ == '__main__':
 
@@ -28,9 +28,9 @@ class FindWidget(QtGui.QWidget):
         layout = QtGui.QHBoxLayout()
         layout.addLayout(form_layout)
 
-        close_button = QtGui.QPushButton('Close')
-        layout.addWidget(close_button, 1, QtCore.Qt.AlignRight)
-        close_button.clicked.connect(self.hide)
+        self.close_button = QtGui.QPushButton('Close')
+        layout.addWidget(self.close_button, 1, QtCore.Qt.AlignRight)
+        self.close_button.clicked.connect(self.hide)
 
         self.setLayout(layout)
 
@@ -56,16 +56,28 @@ class FindWidget(QtGui.QWidget):
         self.wrap_action = QtGui.QAction('Wrap search', options_menu)
         self.wrap_action.setCheckable(True)
         self.wrap_action.setChecked(True)
+        self.regex_action = QtGui.QAction('Regular e&xpression', options_menu)
+        self.regex_action.setCheckable(True)
+        self.highlight_action = QtGui.QAction('&Highlight all matches',
+                                              options_menu)
+        self.highlight_action.setCheckable(True)
+        self.highlight_action.setChecked(True)
         options_menu.addAction(self.case_action)
         options_menu.addAction(self.word_action)
         options_menu.addAction(self.wrap_action)
+        options_menu.addAction(self.regex_action)
+        options_menu.addAction(self.highlight_action)
         self.options_button.setMenu(options_menu)
 
+        # Shows the number of matches, and which one is selected.
+        self.count_label = QtGui.QLabel()
+
         layout = QtGui.QHBoxLayout()
         layout.addWidget(self.line_edit)
         layout.addWidget(self.next_button)
         layout.addWidget(self.prev_button)
         layout.addWidget(self.options_button)
+        layout.addWidget(self.count_label)
         layout.addStretch(2)
         layout.setContentsMargins(0, 0, 0, 0)
 
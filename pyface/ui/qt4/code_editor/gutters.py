@@ -9,6 +9,7 @@
 # Description: <Enthought pyface code editor>
 #------------------------------------------------------------------------------
 
+from bisect import bisect_left, bisect_right
 import math
 
 from pyface.qt import QtCore, QtGui
@@ -33,41 +34,195 @@ class GutterWidget(QtGui.QWidget):
         """
         self.parent().wheelEvent(event)
 
+class MarkerIndex(object):
+    """ A sorted index of the block numbers of a kind of status marker.
+
+    Markers can be added and removed a range of blocks at a time, and the
+    markers of a range of blocks are found by bisection, so painting doesn't
+    depend on the total number of markers.
+    """
+
+    def __init__(self, lines=()):
+        self._lines = sorted(set(lines))
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __iter__(self):
+        return iter(self._lines)
+
+    def add(self, start, end=None):
+        """ Add markers to the blocks from start to end, inclusive. """
+        if end is None:
+            end = start
+        first = bisect_left(self._lines, start)
+        last = bisect_right(self._lines, end)
+        self._lines[first:last] = range(start, end + 1)
+
+    def remove(self, start, end=None):
+        """ Remove the markers from the blocks from start to end, inclusive.
+        """
+        if end is None:
+            end = start
+        first = bisect_left(self._lines, start)
+        last = bisect_right(self._lines, end)
+        del self._lines[first:last]
+
+    def lines_between(self, start, end):
+        """ Return the marked block numbers from start up to but not
+        including end.
+        """
+        return self._lines[
+            bisect_left(self._lines, start):bisect_left(self._lines, end)
+        ]
+
+    def any_between(self, start, end):
+        """ Whether any block from start up to but not including end is
+        marked.
+        """
+        index = bisect_left(self._lines, start)
+        return index < len(self._lines) and self._lines[index] < end
+
+
 class StatusGutterWidget(GutterWidget):
     """ Draws status markers
     """
 
+    #: The kinds of marker, in the order they are painted.
+    marker_kinds = ('info', 'warn', 'error')
+
+    #: The colors of the kinds of marker.
+    marker_colors = {
+        'info': QtCore.Qt.green,
+        'warn': QtCore.Qt.yellow,
+        'error': QtCore.Qt.red,
+    }
+
+    #: The height of a marker, in pixels.
+    marker_height = 3
+
     def __init__(self, *args, **kw):
         super(StatusGutterWidget, self).__init__(*args, **kw)
 
-        self.error_lines = []
-        self.warn_lines = []
-        self.info_lines = []
+        self._markers = dict(
+            (kind, MarkerIndex()) for kind in self.marker_kinds
+        )
+
+    def _get_error_lines(self):
+        return list(self._markers['error'])
+
+    def _set_error_lines(self, lines):
+        self._markers['error'] = MarkerIndex(lines)
+
+    error_lines = property(_get_error_lines, _set_error_lines)
+
+    def _get_warn_lines(self):
+        return list(self._markers['warn'])
+
+    def _set_warn_lines(self, lines):
+        self._markers['warn'] = MarkerIndex(lines)
+
+    warn_lines = property(_get_warn_lines, _set_warn_lines)
+
+    def _get_info_lines(self):
+        return list(self._markers['info'])
+
+    def _set_info_lines(self, lines):
+        self._markers['info'] = MarkerIndex(lines)
+
+    info_lines = property(_get_info_lines, _set_info_lines)
+
+    def add_markers(self, kind, start, end=None):
+        """ Add markers of a kind to the blocks from start to end, inclusive,
+        and repaint them.
+        """
+        self._markers[kind].add(start, end)
+        self._update_lines(start, end)
+
+    def remove_markers(self, kind, start, end=None):
+        """ Remove the markers of a kind from the blocks from start to end,
+        inclusive, and repaint them.
+        """
+        self._markers[kind].remove(start, end)
+        self._update_lines(start, end)
 
     def sizeHint(self):
         return QtCore.QSize(10, 0)
 
     def paintEvent(self, event):
-        """ Paint the line numbers.
+        """ Paint the status markers.
+
+        The blocks of the document are scaled to the height of the widget,
+        so many blocks can share a pixel row.  Only the rows in the event's
+        rectangle are painted, once for each kind of marker.
         """
         painter = QtGui.QPainter(self)
-        painter.fillRect(event.rect(), self.background_color)
+        rect = event.rect()
+        painter.fillRect(rect, self.background_color)
 
-        cw = self.parent()
+        pixels_per_block = self._pixels_per_block()
+        # A marker is painted on the rows below its own too.
+        first_row = max(rect.top() - self.marker_height + 1, 0)
+        last_row = rect.bottom() + 1
+        width = self.width()
+
+        for kind in self.marker_kinds:
+            rows = self._marked_rows(
+                self._markers[kind], first_row, last_row, pixels_per_block)
+            color = self.marker_colors[kind]
+            for top, bottom in _runs(rows):
+                painter.fillRect(
+                    QtCore.QRect(0, top, width,
+                                 bottom - top + self.marker_height),
+                    color)
+
+    def _pixels_per_block(self):
+        return self.height()/float(max(self.parent().blockCount(), 1))
+
+    def _marked_rows(self, markers, first_row, last_row, pixels_per_block):
+        """ Return the sorted rows from first_row to last_row, exclusive,
+        which have markers.
+        """
+        first_block = int(math.ceil(first_row / pixels_per_block))
+        last_block = int(math.ceil(last_row / pixels_per_block))
+        lines = markers.lines_between(first_block, last_block)
+
+        if len(lines) <= last_row - first_row:
+            rows = sorted(set(int(line*pixels_per_block) for line in lines))
+            return [row for row in rows if first_row <= row < last_row]
+
+        # There are more markers than rows, so look for markers row by row.
+        rows = []
+        for row in range(first_row, last_row):
+            start = int(math.ceil(row / pixels_per_block))
+            end = int(math.ceil((row + 1) / pixels_per_block))
+            if markers.any_between(start, end):
+                rows.append(row)
+        return rows
 
-        pixels_per_block = self.height()/float(cw.blockCount())
+    def _update_lines(self, start, end=None):
+        """ Repaint the rows of the blocks from start to end, inclusive. """
+        if end is None:
+            end = start
+        pixels_per_block = self._pixels_per_block()
+        top = int(start*pixels_per_block)
+        bottom = int(end*pixels_per_block) + self.marker_height
+        self.update(0, top, self.width(), bottom - top)
 
-        for line in self.info_lines:
-            painter.fillRect(QtCore.QRect(0, line*pixels_per_block, self.width(), 3),
-                            QtCore.Qt.green)
 
-        for line in self.warn_lines:
-            painter.fillRect(QtCore.QRect(0, line*pixels_per_block, self.width(), 3),
-                            QtCore.Qt.yellow)
+def _runs(rows):
+    """ Yield the (first, last) rows of the runs of consecutive rows. """
+    first = last = None
+    for row in rows:
+        if last is not None and row == last + 1:
+            last = row
+            continue
+        if first is not None:
+            yield first, last
+        first = last = row
+    if first is not None:
+        yield first, last
 
-        for line in self.error_lines:
-            painter.fillRect(QtCore.QRect(0, line*pixels_per_block, self.width(), 3),
-                            QtCore.Qt.red)
 
 class LineNumberWidget(GutterWidget):
     """ Draw line numbers.
@@ -96,26 +251,32 @@ class LineNumberWidget(GutterWidget):
 
     def paintEvent(self, event):
         """ Paint the line numbers.
+
+        Only the blocks in the event's rectangle are painted.
         """
         painter = QtGui.QPainter(self)
         painter.setFont(self.font)
-        painter.fillRect(event.rect(), self.background_color)
+        rect = event.rect()
+        painter.fillRect(rect, self.background_color)
+        painter.setPen(QtCore.Qt.black)
 
         cw = self.parent()
-        block = cw.firstVisibleBlock()
+        offset = cw.contentOffset()
+        # Start with the first block in the rectangle.
+        block = cw.cursorForPosition(QtCore.QPoint(0, rect.top())).block()
+        if not block.isValid():
+            block = cw.firstVisibleBlock()
         blocknum = block.blockNumber()
-        top = cw.blockBoundingGeometry(block).translated(
-            cw.contentOffset()).top()
+        top = cw.blockBoundingGeometry(block).translated(offset).top()
         bottom = top + int(cw.blockBoundingRect(block).height())
+        width = self.width() - 2
+        height = self.fontMetrics().height()
 
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                painter.setPen(QtCore.Qt.black)
-                painter.drawText(0, top, self.width() - 2,
-                                 self.fontMetrics().height(),
+        while block.isValid() and top <= rect.bottom():
+            if block.isVisible() and bottom >= rect.top():
+                painter.drawText(0, top, width, height,
                                  QtCore.Qt.AlignRight, str(blocknum + 1))
             block = block.next()
             top = bottom
             bottom = top + int(cw.blockBoundingRect(block).height())
             blocknum += 1
-
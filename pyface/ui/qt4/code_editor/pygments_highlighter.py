@@ -9,7 +9,9 @@
 # Description: <Enthought pyface code editor>
 #------------------------------------------------------------------------------
 
-from pyface.qt import QtGui
+import time
+
+from pyface.qt import QtCore, QtGui
 
 from pygments.lexer import RegexLexer, _TokenType, Text, Error
 from pygments.lexers import CLexer, CppLexer, PythonLexer, get_lexer_by_name
@@ -115,24 +117,61 @@ class BlockUserData(QtGui.QTextBlockUserData):
     """ Storage for the user data associated with each line.
     """
 
+    #: The lexer state stack at the end of the block.
     syntax_stack = ('root',)
 
+    #: The lexer state stack at the start of the block, or None if the block
+    #: was highlighted without knowing it.
+    start_stack = ('root',)
+
     def __init__(self, **kwds):
         QtGui.QTextBlockUserData.__init__(self)
         for key, value in kwds.items():
             setattr(self, key, value)
 
     def __repr__(self):
-        attrs = ['syntax_stack']
+        attrs = ['syntax_stack', 'start_stack']
         kwds = ', '.join([ '%s=%r' % (attr, getattr(self, attr))
                            for attr in attrs ])
         return 'BlockUserData(%s)' % kwds
 
 
+#: The lexer state stack at the start of the document.
+ROOT_STACK = ('root',)
+
+#: The block state of a block which has not been highlighted yet.
+DEFERRED = -2
+
+#: The largest block state.  Block states are signed 32 bit integers.
+MAX_STATE = 0x7fffffff
+
+#: The largest number of lexer state stacks whose block states are kept.
+MAX_STACKS = 4096
+
+
 class PygmentsHighlighter(QtGui.QSyntaxHighlighter):
-    """ Syntax highlighter that uses Pygments for parsing. """
+    """ Syntax highlighter that uses Pygments for parsing.
+
+    The lexer state stacks at the start and end of each block are stored in
+    the block's user data, and the block's state is a number standing for
+    the stack at its end, so Qt stops re-highlighting the blocks after an
+    edit as soon as a block ends in the same state as before.  The tokens of
+    a block are cached by its text and starting stack.
+
+    Lexing in one pass through the event loop is limited to ``time_slice``
+    seconds.  The blocks which don't get lexed in time keep their old
+    highlighting, if any, and are highlighted later in further time slices,
+    starting with the visible blocks of ``editor`` if it is given.
+    """
 
-    def __init__(self, parent, lexer=None):
+    #: The maximum number of blocks whose tokens are cached.
+    cache_size = 50000
+
+    #: The maximum time, in seconds, spent lexing in one pass through the
+    #: event loop.
+    time_slice = 0.02
+
+    def __init__(self, parent, lexer=None, editor=None):
         super(PygmentsHighlighter, self).__init__(parent)
 
         try:
@@ -145,42 +184,235 @@ class PygmentsHighlighter(QtGui.QSyntaxHighlighter):
         self._brushes = {}
         self._formats = {}
 
+        # The QPlainTextEdit whose visible blocks are highlighted first.
+        self.editor = editor
+
+        # The block states standing for recently seen lexer state stacks, and
+        # the next block state to use.  States are not reused (until they
+        # run out), so that a block state is never mistaken for another
+        # stack's when the table is emptied.
+        self._states = {}
+        self._next_state = 0
+
+        # The cached (runs, end stack) of blocks, by (start stack, text).
+        self._cache = {}
+
+        # The start of the current time slice, or None.
+        self._slice_start = None
+
+        # A cursor at or before the first block waiting to be highlighted, or
+        # None.  A cursor is used since it keeps its place through edits.
+        self._pending_cursor = None
+
+        self._pending_timer = QtCore.QTimer(self)
+        self._pending_timer.setSingleShot(True)
+        self._pending_timer.timeout.connect(self._highlight_pending)
+
     def highlightBlock(self, qstring):
         """ Highlight a block of text.
         """
-        qstring = six.text_type(qstring)
-        prev_data = self.previous_block_data()
-
-        if prev_data is not None:
-            self._lexer._saved_state_stack = prev_data.syntax_stack
-        elif hasattr(self._lexer, '_saved_state_stack'):
-            del self._lexer._saved_state_stack
-
-        index = 0
-        # Lex the text using Pygments
-        for token, text in self._lexer.get_tokens(qstring):
-            l = len(text)
-            format = self._get_format(token)
-            if format is not None:
-                self.setFormat(index, l, format)
-            index += l
-
-        if hasattr(self._lexer, '_saved_state_stack'):
-            data = BlockUserData(syntax_stack=self._lexer._saved_state_stack)
-            self.currentBlock().setUserData(data)
+        text = six.text_type(qstring)
+        start = self._end_stack(self.currentBlock().previous())
+        key = (ROOT_STACK if start is None else start, text)
+        result = self._cache.get(key)
 
-            # there is a bug in pyside and it will crash unless we
-            # hold on to the reference a little longer
-            data = self.currentBlock().userData()
+        # Guessing is limited too, so that it doesn't run on to the end of
+        # the document.
+        if (result is None or start is None) and self._slice_used():
+            self._defer(text)
+            return
 
-            # Clean up for the next go-round.
-            del self._lexer._saved_state_stack
+        if result is None:
+            result = self._lex(key[0], text)
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[key] = result
+
+        runs, end = result
+        self._apply_runs(runs)
+
+        data = self.currentBlockUserData()
+        if not isinstance(data, BlockUserData):
+            data = BlockUserData()
+            self.setCurrentBlockUserData(data)
+        data.syntax_stack = end
+        data.start_stack = start
+        self.setCurrentBlockState(self._state_for(end))
+        if start is None:
+            self._add_pending(self.currentBlock())
 
     def previous_block_data(self):
         """ Convenience method for returning the previous block's user data.
         """
         return self.currentBlock().previous().userData()
 
+    def _lex(self, stack, text):
+        """ Lex the text of a block, starting with the given state stack.
+
+        Returns the runs of (index, length, token) to format, with adjacent
+        tokens of the same type merged, and the state stack at the end of the
+        text.
+        """
+        self._lexer._saved_state_stack = stack
+        runs = []
+        # Call the lexer directly, rather than through get_tokens, since the
+        # block text only needs the newline which get_tokens would add.
+        tokens = self._lexer.get_tokens_unprocessed(text + u'\n')
+        for index, token, value in tokens:
+            if index >= len(text):
+                continue
+            if runs and runs[-1][2] is token:
+                last_index, last_length, _ = runs[-1]
+                runs[-1] = (last_index, last_length + len(value), token)
+            else:
+                runs.append((index, len(value), token))
+
+        end = tuple(self._lexer._saved_state_stack)
+        del self._lexer._saved_state_stack
+        return runs, end
+
+    def _state_for(self, stack):
+        """ Return the block state standing for a lexer state stack. """
+        state = self._states.get(stack)
+        if state is None:
+            if len(self._states) >= MAX_STACKS:
+                self._states.clear()
+            if self._next_state > MAX_STATE:
+                # The old states may now be reused, so everything has to be
+                # highlighted again (once this pass is over).
+                self._states.clear()
+                self._next_state = 0
+                QtCore.QTimer.singleShot(0, self.rehighlight)
+            state = self._states[stack] = self._next_state
+            self._next_state += 1
+        return state
+
+    def _apply_runs(self, runs):
+        """ Format the current block with runs from the lexer. """
+        for index, length, token in runs:
+            format = self._get_format(token)
+            if format is not None:
+                self.setFormat(index, length, format)
+
+    def _end_stack(self, block):
+        """ Return the lexer state stack at the end of a block, or None if it
+        is not known.
+        """
+        if not block.isValid():
+            return ROOT_STACK
+        state = block.userState()
+        if state == -1:
+            # A block which wasn't highlighted.
+            return ROOT_STACK
+        data = block.userData()
+        if state < 0 or data is None or data.start_stack is None:
+            return None
+        return data.syntax_stack
+
+    def _slice_used(self):
+        """ Whether the time for lexing in this time slice has been used. """
+        now = time.time()
+        if self._slice_start is None:
+            self._slice_start = now
+            # The slice ends when control returns to the event loop.
+            QtCore.QTimer.singleShot(0, self._end_slice)
+        return now - self._slice_start > self.time_slice
+
+    def _end_slice(self):
+        self._slice_start = None
+
+    def _defer(self, text):
+        """ Leave the current block to be highlighted later.
+
+        If the block was highlighted before, and its old highlighting is
+        cached, that is kept along with its old state, so that Qt doesn't go
+        on to the next block.
+        """
+        data = self.currentBlockUserData()
+        if self.currentBlockState() >= 0 and data is not None:
+            start = data.start_stack
+            result = self._cache.get(
+                (ROOT_STACK if start is None else start, text)
+            )
+            if result is not None:
+                self._apply_runs(result[0])
+                self._add_pending(self.currentBlock())
+                return
+
+        self.setCurrentBlockState(DEFERRED)
+        self._add_pending(self.currentBlock())
+
+    def _add_pending(self, block):
+        """ Note that a block is waiting to be highlighted. """
+        cursor = self._pending_cursor
+        if cursor is None:
+            cursor = self._pending_cursor = QtGui.QTextCursor(block)
+        elif block.position() < cursor.position():
+            cursor.setPosition(block.position())
+
+        if not self._pending_timer.isActive():
+            self._pending_timer.start(0)
+
+    def _highlight_pending(self):
+        """ Highlight some of the blocks waiting to be highlighted. """
+        self._slice_start = None
+
+        block = self._next_visible_deferred_block()
+        if block is None:
+            block = self._next_pending_block()
+        if block is None:
+            return
+
+        # Qt carries on highlighting the following blocks while their state
+        # changes, until the time slice runs out.
+        self.rehighlightBlock(block)
+        if self._next_pending_block() is not None:
+            self._pending_timer.start(0)
+
+    def _next_pending_block(self):
+        """ Return the first block waiting to be highlighted, or None. """
+        if self._pending_cursor is None:
+            return None
+
+        block = self._pending_cursor.block()
+        end = self._end_stack(block.previous())
+        while block.isValid():
+            state = block.userState()
+            if state >= 0:
+                data = block.userData()
+                pending = (data is None or data.start_stack is None
+                           or data.start_stack != end)
+            else:
+                pending = state == DEFERRED
+            if pending:
+                self._pending_cursor.setPosition(block.position())
+                return block
+            end = self._end_stack(block)
+            block = block.next()
+
+        self._pending_cursor = None
+        return None
+
+    def _next_visible_deferred_block(self):
+        """ Return the first visible block of the editor which hasn't been
+        highlighted at all, or None.
+        """
+        editor = self.editor
+        if editor is None or not editor.isVisible():
+            return None
+
+        height = editor.viewport().height()
+        offset = editor.contentOffset()
+        block = editor.firstVisibleBlock()
+        while block.isValid():
+            geometry = editor.blockBoundingGeometry(block).translated(offset)
+            if geometry.top() > height:
+                break
+            if block.userState() == DEFERRED:
+                return block
+            block = block.next()
+        return None
+
     def _get_format(self, token):
         """ Returns a QTextCharFormat for token or None.
         """
@@ -30,9 +30,9 @@ class ReplaceWidget(FindWidget):
         layout = QtGui.QHBoxLayout()
         layout.addLayout(form_layout)
 
-        close_button = QtGui.QPushButton('Close')
-        layout.addWidget(close_button, 1, QtCore.Qt.AlignRight)
-        close_button.clicked.connect(self.hide)
+        self.close_button = QtGui.QPushButton('Close')
+        layout.addWidget(self.close_button, 1, QtCore.Qt.AlignRight)
+        self.close_button.clicked.connect(self.hide)
 
         self.setLayout(layout)
 
@@ -0,0 +1,312 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought Inc
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD license.
+
+#
+# Author: Enthought Inc
+# Description: <Enthought pyface code editor>
+#------------------------------------------------------------------------------
+""" A search engine for the text of the code editor.
+
+The engine works on plain text, using Python regular expressions, so that a
+whole document is searched or replaced in a single pass.  The text is that
+returned by ``QTextDocument.toPlainText()``, and the spans found are
+positions in the document.  These count UTF-16 code units, so a character
+outside the Basic Multilingual Plane counts twice where a (wide build)
+Python string counts it once: :py:class:`PositionMap` converts between them.
+"""
+
+from bisect import bisect_left, bisect_right
+import re
+import sys
+
+#: The (approximate) number of characters searched between calls to the
+#: progress callable.  The text is searched a block of whole lines at a time.
+PROGRESS_INTERVAL = 64 * 1024
+
+#: Matches the characters outside the Basic Multilingual Plane, or is None if
+#: Python strings are UTF-16 already (narrow Python 2 builds).
+if sys.maxunicode > 0xFFFF:
+    _ASTRAL = re.compile(u'[\U00010000-\U0010FFFF]')
+else:
+    _ASTRAL = None
+
+
+class PositionMap(object):
+    """ Converts between the offsets in the plain text of a document and the
+    positions in the document.
+    """
+
+    def __init__(self, text):
+        if _ASTRAL is None:
+            self._offsets = []
+        else:
+            self._offsets = [match.start() for match in _ASTRAL.finditer(text)]
+        self._positions = [
+            offset + i for i, offset in enumerate(self._offsets)
+        ]
+
+    def __bool__(self):
+        """ Whether any offset differs from the position. """
+        return bool(self._offsets)
+
+    __nonzero__ = __bool__
+
+    def position(self, offset):
+        """ Return the position in the document of an offset in the text. """
+        return offset + bisect_left(self._offsets, offset)
+
+    def offset(self, position):
+        """ Return the offset in the text of a position in the document. """
+        return position - bisect_left(self._positions, position)
+
+
+def search_pattern(search_text, regex=False, case_sensitive=False,
+                   whole_words=False):
+    """ Compile the pattern for a search.
+
+    Parameters
+    ----------
+    search_text : unicode
+        The text to search for, or a regular expression.
+    regex : bool
+        Whether the search text is a regular expression.
+    case_sensitive : bool
+        Whether the case of letters must match.
+    whole_words : bool
+        Whether matches must not be part of a longer word.
+
+    Returns
+    -------
+    pattern : compiled regular expression
+
+    Raises
+    ------
+    re.error
+        If the search text is not a valid regular expression.
+    """
+    if regex:
+        expression = search_text
+    else:
+        expression = re.escape(search_text)
+
+    if whole_words:
+        expression = r'(?<!\w)(?:{})(?!\w)'.format(expression)
+
+    flags = re.UNICODE | re.MULTILINE
+    if not case_sensitive:
+        flags |= re.IGNORECASE
+    return re.compile(expression, flags)
+
+
+def find_matches(text, pattern, start=0, end=None, progress=None):
+    """ Find the (start, end) spans of the matches of a pattern in the text.
+
+    Empty matches are ignored.
+
+    Parameters
+    ----------
+    text : unicode
+        The text to search.
+    pattern : compiled regular expression
+        The pattern to search for.
+    start, end : int
+        The part of the text to search.
+    progress : callable or None
+        Called with the position reached after each block of about
+        PROGRESS_INTERVAL characters.  Searches run by a BackgroundExecutor
+        can pass their ``progress`` callable to be cancellable.  The blocks
+        end at line ends, so only a match of a regular expression which
+        spans lines may be missed, if it starts in one block and ends in the
+        next.
+
+    Returns
+    -------
+    spans : list of (int, int)
+        The spans as positions in the document.
+    """
+    if end is None:
+        end = len(text)
+
+    if progress is None:
+        return _document_spans(text, _find_spans(text, pattern, start, end))
+
+    spans = []
+    position = start
+    while position < end:
+        block_end = text.find(u'\n', min(position + PROGRESS_INTERVAL, end),
+                              end)
+        if block_end == -1:
+            block_end = end
+
+        block_spans = _find_spans(text, pattern, position, block_end)
+        position = block_end
+        if block_spans and block_spans[-1][1] == block_end < end:
+            # The last match may continue into the next block.
+            match = pattern.match(text, block_spans[-1][0], end)
+            if match is not None:
+                block_spans[-1] = match.span()
+                position = match.end()
+
+        spans.extend(block_spans)
+        progress(position)
+    return _document_spans(text, spans)
+
+
+def _find_spans(text, pattern, start, end):
+    """ Find the spans of the non-empty matches in part of the text. """
+    return [
+        match.span() for match in pattern.finditer(text, start, end)
+        if match.end() > match.start()
+    ]
+
+
+def _document_spans(text, spans):
+    """ Convert the spans of matches in the text to document positions. """
+    position_map = PositionMap(text)
+    if not position_map:
+        return spans
+    position = position_map.position
+    return [(position(start), position(end)) for start, end in spans]
+
+
+def replace_matches(text, pattern, replacement, regex=False):
+    """ Replace every match of a pattern in the text.
+
+    Parameters
+    ----------
+    text : unicode
+        The text to search.
+    pattern : compiled regular expression
+        The pattern to search for.
+    replacement : unicode
+        The replacement text.  If ``regex`` is true, backslash escapes and
+        group references in it are expanded, as for ``re.sub``.
+    regex : bool
+        Whether the search is a regular expression search.
+
+    Returns
+    -------
+    start, end : int
+        The positions in the document of the start of the first match and
+        the end of the last match, or (0, 0) if there are no matches.
+    new_text : unicode
+        The text to replace that span with.
+    count : int
+        The number of matches replaced.
+    """
+    pieces = []
+    first = last = None
+    count = 0
+    for match in pattern.finditer(text):
+        if match.end() == match.start():
+            continue
+        count += 1
+        if first is None:
+            first = match.start()
+        else:
+            pieces.append(text[last:match.start()])
+        pieces.append(match.expand(replacement) if regex else replacement)
+        last = match.end()
+
+    if first is None:
+        return 0, 0, u'', 0
+    position_map = PositionMap(text)
+    return (position_map.position(first), position_map.position(last),
+            u''.join(pieces), count)
+
+
+class MatchIndex(object):
+    """ The sorted spans of the matches of a pattern in a document.
+
+    The index is kept up to date as the document is edited by
+    :py:meth:`text_changed`, which only searches the changed lines.  Matches
+    of regular expressions which span lines are only found again if they
+    lie within the changed lines.
+    """
+
+    def __init__(self, pattern, spans):
+        #: The pattern whose matches are indexed.
+        self.pattern = pattern
+
+        self._starts = [start for start, end in spans]
+        self._ends = [end for start, end in spans]
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        return self._starts[index], self._ends[index]
+
+    def index(self, start, end):
+        """ Return the index of the match with the given span, or None. """
+        index = bisect_left(self._starts, start)
+        if (index < len(self._starts) and self._starts[index] == start
+                and self._ends[index] == end):
+            return index
+        return None
+
+    def spans_between(self, start, end):
+        """ Return the spans of the matches which overlap [start, end). """
+        first = bisect_right(self._ends, start)
+        last = bisect_left(self._starts, end)
+        return list(zip(self._starts[first:last], self._ends[first:last]))
+
+    def next_span(self, position, backward=False, wrap=True):
+        """ Return the span of the next match, or None.
+
+        Searching forward, this is the first match starting at or after the
+        position.  Searching backward, it is the last match ending at or
+        before it.
+        """
+        if not self._starts:
+            return None
+
+        if backward:
+            index = bisect_right(self._ends, position) - 1
+            if index < 0:
+                if not wrap:
+                    return None
+                index = len(self._starts) - 1
+        else:
+            index = bisect_left(self._starts, position)
+            if index == len(self._starts):
+                if not wrap:
+                    return None
+                index = 0
+        return self._starts[index], self._ends[index]
+
+    def text_changed(self, position, removed, added, lines_start, lines_text):
+        """ Update the index for an edit of the document.
+
+        Parameters
+        ----------
+        position, removed, added : int
+            The position of the edit, and the numbers of characters removed
+            and added, as given by ``QTextDocument.contentsChange``.
+        lines_start : int
+            The position in the edited document of the start of the lines
+            containing the edit.
+        lines_text : unicode
+            The text of those lines.
+        """
+        delta = added - removed
+        lines_end = lines_start + PositionMap(lines_text).position(
+            len(lines_text))
+
+        # The matches before the edited lines are kept as they are, and those
+        # after them are shifted.
+        first = bisect_right(self._ends, lines_start)
+        last = bisect_left(self._starts, lines_end - delta)
+        spans = find_matches(lines_text, self.pattern)
+
+        self._starts[first:] = (
+            [lines_start + start for start, end in spans]
+            + [start + delta for start in self._starts[last:]]
+        )
+        self._ends[first:] = (
+            [lines_start + end for start, end in spans]
+            + [end + delta for end in self._ends[last:]]
+        )
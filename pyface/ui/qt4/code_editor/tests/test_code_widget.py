@@ -9,6 +9,7 @@
 #------------------------------------------------------------------------------
 
 # Standard library imports.
+import time
 import unittest
 import mock
 
@@ -101,5 +102,188 @@ class TestCodeWidget(unittest.TestCase):
         self.assertFalse(acw.replace.isVisible())
 
 
+class TestAdvancedCodeWidgetSearch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.qapp = QtGui.QApplication.instance() or QtGui.QApplication([])
+
+    def setUp(self):
+        self.acw = AdvancedCodeWidget(None)
+        self.acw.code.setPlainText(u'foo bar\nFoo food\nbar foo\n')
+
+    def tearDown(self):
+        self.acw.close()
+        self.qapp.processEvents()
+
+    def search(self, text, widget=None):
+        if widget is None or widget is self.acw.find:
+            self.acw.enable_find()
+        else:
+            self.acw.enable_replace()
+        self.acw.active_find_widget.line_edit.setText(text)
+
+    def test_match_count(self):
+        self.search(u'foo')
+        self.assertEqual(len(self.acw.match_index), 4)
+        self.assertEqual(self.acw.find.count_label.text(), '4 matches')
+
+        self.acw.find_next()
+        self.assertEqual(self.acw.find.count_label.text(), '1 of 4')
+        self.acw.find_next()
+        self.assertEqual(self.acw.find.count_label.text(), '2 of 4')
+        self.acw.find_prev()
+        self.assertEqual(self.acw.find.count_label.text(), '1 of 4')
+
+    def test_options(self):
+        self.search(u'foo')
+        self.acw.find.case_action.setChecked(True)
+        self.assertEqual(len(self.acw.match_index), 3)
+        self.acw.find.word_action.setChecked(True)
+        self.assertEqual(len(self.acw.match_index), 2)
+
+    def test_regex_find(self):
+        self.acw.find.regex_action.setChecked(True)
+        self.search(u'^[a-z]+')
+
+        self.acw.find_next()
+        self.assertEqual(self.acw.get_selected_text(), u'foo')
+        # Searches ignore case by default.
+        self.acw.find_next()
+        self.assertEqual(self.acw.get_selected_text(), u'Foo')
+
+        # Invalid regular expressions find nothing.
+        self.search(u'(foo')
+        self.assertIsNone(self.acw.match_index)
+        self.assertEqual(self.acw.find_next(), 0)
+
+    def test_highlight_matches(self):
+        self.acw.resize(400, 300)
+        self.acw.show()
+        self.search(u'foo')
+
+        selections = self.acw.code.extraSelections()
+        # The current line, and the matches.
+        self.assertEqual(len(selections), 5)
+
+        self.acw.find.highlight_action.setChecked(False)
+        self.assertEqual(len(self.acw.code.extraSelections()), 1)
+        self.acw.find.highlight_action.setChecked(True)
+
+        self.acw.find.close_button.click()
+        self.assertEqual(len(self.acw.code.extraSelections()), 1)
+
+    def test_index_updated_by_edits(self):
+        self.search(u'foo')
+        cursor = QtGui.QTextCursor(self.acw.code.document())
+        cursor.setPosition(8)
+        cursor.insertText(u'foo ')
+        self.assertEqual(len(self.acw.match_index), 5)
+
+        cursor.setPosition(0)
+        cursor.setPosition(8, QtGui.QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+        self.assertEqual(len(self.acw.match_index), 4)
+        self.assertEqual(self.acw.match_index[0], (0, 3))
+
+    def test_replace_all(self):
+        self.search(u'foo', self.acw.replace)
+        self.acw.replace.replace_edit.setText(u'baz')
+
+        self.assertEqual(self.acw.replace_all(), 4)
+        self.assertEqual(
+            self.acw.code.toPlainText(), u'baz bar\nbaz bazd\nbar baz\n'
+        )
+        self.assertEqual(len(self.acw.match_index), 0)
+
+        # The replacements are undone in one step.
+        self.acw.code.document().undo()
+        self.assertEqual(
+            self.acw.code.toPlainText(), u'foo bar\nFoo food\nbar foo\n'
+        )
+
+    def test_replace_all_regex(self):
+        self.acw.replace.regex_action.setChecked(True)
+        self.search(u'(\\w+) (\\w+)', self.acw.replace)
+        self.acw.replace.replace_edit.setText(u'\\2 \\1')
+
+        self.assertEqual(self.acw.replace_all(), 3)
+        self.assertEqual(
+            self.acw.code.toPlainText(), u'bar foo\nfood Foo\nfoo bar\n'
+        )
+
+    def test_replace_next(self):
+        self.search(u'foo', self.acw.replace)
+        self.acw.replace.replace_edit.setText(u'baz')
+        self.acw.find_next()
+        self.assertTrue(self.acw.replace.replace_button.isEnabled())
+
+        self.acw.replace_next()
+        self.assertEqual(
+            self.acw.code.toPlainText(), u'baz bar\nFoo food\nbar foo\n'
+        )
+        self.assertEqual(self.acw.get_selected_text(), u'Foo')
+
+    def test_find_outside_bmp(self):
+        self.acw.code.setPlainText(u'\U0001F600 foo bar foo\n')
+        self.search(u'foo')
+
+        self.acw.find_next()
+        self.assertEqual(self.acw.get_selected_text(), u'foo')
+        self.assertEqual(self.acw.find.count_label.text(), '1 of 2')
+        self.acw.find_next()
+        self.assertEqual(self.acw.get_selected_text(), u'foo')
+        self.assertEqual(self.acw.find.count_label.text(), '2 of 2')
+
+    def test_replace_next_outside_bmp(self):
+        self.acw.code.setPlainText(u'\U0001F600 foo bar foo\n')
+        self.acw.replace.regex_action.setChecked(True)
+        self.search(u'f(o)o', self.acw.replace)
+        self.acw.replace.replace_edit.setText(u'X\\1')
+        self.acw.find_next()
+        self.assertTrue(self.acw.replace.replace_button.isEnabled())
+
+        self.acw.replace_next()
+        self.assertEqual(
+            self.acw.code.toPlainText(), u'\U0001F600 Xo bar foo\n'
+        )
+        self.assertEqual(self.acw.get_selected_text(), u'foo')
+
+        # The index is kept up to date by the edit.
+        self.assertEqual(len(self.acw.match_index), 1)
+
+    def test_replace_all_outside_bmp(self):
+        self.acw.code.setPlainText(u'\U0001F600 foo bar foo\n')
+        self.search(u'foo', self.acw.replace)
+        self.acw.replace.replace_edit.setText(u'X')
+
+        self.assertEqual(self.acw.replace_all(), 2)
+        self.assertEqual(
+            self.acw.code.toPlainText(), u'\U0001F600 X bar X\n'
+        )
+
+    def test_background_search(self):
+        self.acw.background_search_size = 10
+        self.search(u'foo')
+        self.assertIsNone(self.acw.match_index)
+        self.assertEqual(self.acw.find.count_label.text(), 'Searching...')
+
+        end = time.time() + 5.0
+        while self.acw.match_index is None and time.time() < end:
+            self.qapp.processEvents()
+        self.assertEqual(len(self.acw.match_index), 4)
+
+    def test_background_search_restarted(self):
+        self.acw.background_search_size = 10
+        self.search(u'foo')
+        future = self.acw._search_future
+        self.search(u'bar')
+
+        self.assertTrue(future.state in ('cancelling', 'cancelled'))
+        end = time.time() + 5.0
+        while self.acw.match_index is None and time.time() < end:
+            self.qapp.processEvents()
+        self.assertEqual(len(self.acw.match_index), 2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,107 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought Inc
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD license.
+#
+# Author: Enthought Inc
+# Description: <Enthought pyface code editor>
+#------------------------------------------------------------------------------
+
+# Standard library imports.
+import unittest
+
+# System library imports.
+from pyface.qt import QtGui
+
+# Local imports.
+from pyface.ui.qt4.code_editor.code_widget import CodeWidget
+from pyface.ui.qt4.code_editor.gutters import MarkerIndex, _runs
+
+
+class TestMarkerIndex(unittest.TestCase):
+
+    def test_lines(self):
+        markers = MarkerIndex([5, 1, 3, 3])
+        self.assertEqual(list(markers), [1, 3, 5])
+        self.assertEqual(len(markers), 3)
+
+    def test_add(self):
+        markers = MarkerIndex([1, 10])
+        markers.add(4)
+        markers.add(3, 6)
+        markers.add(5, 11)
+        self.assertEqual(list(markers), [1, 3, 4, 5, 6, 7, 8, 9, 10, 11])
+
+    def test_remove(self):
+        markers = MarkerIndex(range(10))
+        markers.remove(0)
+        markers.remove(3, 5)
+        markers.remove(20, 30)
+        self.assertEqual(list(markers), [1, 2, 6, 7, 8, 9])
+
+    def test_lines_between(self):
+        markers = MarkerIndex([1, 3, 5, 7])
+        self.assertEqual(markers.lines_between(3, 7), [3, 5])
+        self.assertTrue(markers.any_between(2, 4))
+        self.assertFalse(markers.any_between(8, 100))
+
+    def test_runs(self):
+        self.assertEqual(
+            list(_runs([1, 2, 3, 5, 7, 8])), [(1, 3), (5, 5), (7, 8)]
+        )
+        self.assertEqual(list(_runs([])), [])
+
+
+class TestStatusGutterWidget(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.qapp = QtGui.QApplication.instance() or QtGui.QApplication([])
+
+    def setUp(self):
+        self.cw = CodeWidget(None)
+        self.cw.setPlainText(u'\n'.join(u'x = 1' for i in range(10000)))
+        self.cw.resize(400, 300)
+        self.cw.show()
+        self.gutter = self.cw.status_widget
+
+    def tearDown(self):
+        self.cw.close()
+        self.qapp.processEvents()
+
+    def test_set_lines(self):
+        self.cw.set_warn_lines([3, 1, 2])
+        self.assertEqual(self.gutter.warn_lines, [1, 2, 3])
+
+    def test_add_remove_markers(self):
+        self.cw.add_status_markers('error', 10, 19)
+        self.cw.remove_status_markers('error', 15)
+        self.assertEqual(
+            self.gutter.error_lines, [10, 11, 12, 13, 14, 16, 17, 18, 19]
+        )
+
+    def test_marked_rows_aggregated(self):
+        markers = MarkerIndex(range(0, 10000, 2))
+        pixels_per_block = 0.03
+
+        rows = self.gutter._marked_rows(markers, 0, 300, pixels_per_block)
+
+        self.assertEqual(rows, list(range(0, 300)))
+
+    def test_marked_rows_sparse(self):
+        markers = MarkerIndex([0, 100, 5000])
+        pixels_per_block = 0.03
+
+        rows = self.gutter._marked_rows(markers, 2, 300, pixels_per_block)
+
+        self.assertEqual(rows, [3, 150])
+
+    def test_paint_many_markers(self):
+        for kind in ('info', 'warn', 'error'):
+            self.cw.add_status_markers(kind, 0, 9999)
+        self.gutter.repaint()
+        self.cw.line_number_widget.repaint()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought Inc
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD license.
+#
+# Author: Enthought Inc
+# Description: <Enthought pyface code editor>
+#------------------------------------------------------------------------------
+
+# Standard library imports.
+import time
+import unittest
+
+# System library imports.
+from pyface.qt import QtGui
+from pygments.token import String
+
+# Local imports.
+from pyface.ui.qt4.code_editor.code_widget import CodeWidget
+from pyface.ui.qt4.code_editor.pygments_highlighter import (
+    DEFERRED, MAX_STACKS, MAX_STATE, PygmentsHighlighter
+)
+
+SOURCE = '\n'.join([
+    'def f(x):',
+    '    """ A docstring',
+    '    over several lines.',
+    '    """',
+    '    return x + 1',
+] * 20)
+
+
+class TestPygmentsHighlighter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.qapp = QtGui.QApplication.instance() or QtGui.QApplication([])
+
+    def setUp(self):
+        self.document = self.create_document()
+        self.highlighter = PygmentsHighlighter(self.document)
+        # Only the tests of time slicing may run out of time.
+        self.highlighter.time_slice = 10.0
+        self.lexed = []
+        lex = self.highlighter._lex
+
+        def recording_lex(state, text):
+            self.lexed.append(text)
+            return lex(state, text)
+
+        self.highlighter._lex = recording_lex
+
+    def tearDown(self):
+        self.qapp.processEvents()
+
+    def create_document(self):
+        document = QtGui.QTextDocument()
+        # Blocks are only highlighted once the document has a layout.
+        document.setDocumentLayout(QtGui.QPlainTextDocumentLayout(document))
+        return document
+
+    def block_states(self):
+        block = self.document.firstBlock()
+        states = []
+        while block.isValid():
+            states.append(block.userState())
+            block = block.next()
+        return states
+
+    def block_format(self, number):
+        block = self.document.findBlockByNumber(number)
+        return [
+            (format_range.start, format_range.length,
+             format_range.format.foreground().color().name())
+            for format_range in block.layout().additionalFormats()
+        ]
+
+    def wait_until_highlighted(self):
+        end = time.time() + 5.0
+        while (self.highlighter._next_pending_block() is not None
+                and time.time() < end):
+            self.qapp.processEvents()
+
+    def test_multiline_string(self):
+        self.document.setPlainText(SOURCE)
+
+        string_format = self.highlighter._get_format(String.Doc)
+        color = string_format.foreground().color().name()
+        self.assertEqual(self.block_format(2), [(0, 23, color)])
+        self.assertNotEqual(self.block_states()[2], 0)
+        self.assertEqual(self.block_states()[4], 0)
+
+    def test_edit_stops_when_state_unchanged(self):
+        self.document.setPlainText(SOURCE)
+        del self.lexed[:]
+
+        cursor = QtGui.QTextCursor(self.document.findBlockByNumber(4))
+        cursor.insertText('y = 2 ')
+
+        self.assertEqual(self.lexed, ['y = 2     return x + 1'])
+
+    def test_edit_changing_state_propagates(self):
+        self.document.setPlainText('x = 1\ny = 2\nz = 3')
+        del self.lexed[:]
+
+        cursor = QtGui.QTextCursor(self.document.firstBlock())
+        cursor.insertText('"""')
+
+        self.assertEqual(self.lexed, ['"""x = 1', 'y = 2', 'z = 3'])
+
+    def test_many_edits_in_one_pass(self):
+        self.document.setPlainText(SOURCE)
+        self.highlighter.time_slice = -1.0
+        del self.lexed[:]
+
+        # Once the time slice is used up, edited blocks wait to be
+        # highlighted, but the blocks after them are left alone.
+        for number in [10, 20]:
+            block = self.document.findBlockByNumber(number)
+            QtGui.QTextCursor(block).insertText('x = 1 ')
+
+        states = self.block_states()
+        self.assertEqual(self.lexed, [])
+        self.assertEqual(states.count(DEFERRED), 2)
+        pending = self.highlighter._next_pending_block()
+        self.assertEqual(pending.blockNumber(), 10)
+
+        self.highlighter.time_slice = 0.02
+        self.wait_until_highlighted()
+        # The second block is the same as the first, so it is cached.
+        self.assertEqual(self.lexed, ['x = 1 def f(x):'])
+        states[10] = states[20] = 0
+        self.assertEqual(self.block_states(), states)
+
+    def test_many_stacks(self):
+        stacks = [('root',) + ('string',) * i for i in range(MAX_STACKS * 2)]
+        states = [self.highlighter._state_for(stack) for stack in stacks]
+
+        # The states are not reused, but only the latest ones are kept.
+        self.assertEqual(len(set(states)), len(states))
+        self.assertLessEqual(len(self.highlighter._states), MAX_STACKS)
+
+    def test_states_run_out(self):
+        self.highlighter._next_state = MAX_STATE
+        self.document.setPlainText('x = """\ny = 1\n"""')
+
+        states = self.block_states()
+        self.assertTrue(all(0 <= state <= MAX_STATE for state in states))
+
+        # The states start again, and everything is highlighted again (from
+        # the cache).
+        del self.lexed[:]
+        self.qapp.processEvents()
+        self.assertLess(max(self.block_states()), 10)
+        self.assertEqual(self.lexed, [])
+
+    def test_tokens_cached(self):
+        self.document.setPlainText(SOURCE)
+        del self.lexed[:]
+
+        self.highlighter.rehighlight()
+
+        self.assertEqual(self.lexed, [])
+
+    def test_time_sliced(self):
+        self.document.setPlainText(SOURCE)
+        expected = self.block_states()
+        formats = [self.block_format(i) for i in range(len(expected))]
+
+        document = self.create_document()
+        highlighter = PygmentsHighlighter(document)
+        highlighter.time_slice = -1.0
+        self.document, self.highlighter = document, highlighter
+        document.setPlainText(SOURCE)
+
+        self.assertEqual(set(self.block_states()), {DEFERRED})
+
+        highlighter.time_slice = 0.0
+        self.wait_until_highlighted()
+
+        self.assertEqual(self.block_states(), expected)
+        self.assertEqual(
+            [self.block_format(i) for i in range(len(expected))], formats
+        )
+
+    def test_visible_blocks_first(self):
+        code_widget = CodeWidget(None)
+        code_widget.resize(400, 300)
+        code_widget.show()
+        highlighter = code_widget.highlighter
+        highlighter.time_slice = -1.0
+        code_widget.setPlainText(SOURCE * 10)
+        code_widget.verticalScrollBar().setValue(500)
+        self.qapp.processEvents()
+        first_visible = code_widget.firstVisibleBlock()
+        self.assertEqual(first_visible.userState(), DEFERRED)
+
+        highlighter.time_slice = 0.0
+        highlighter._highlight_pending()
+
+        self.assertGreaterEqual(first_visible.userState(), 0)
+        self.assertIsNone(first_visible.userData().start_stack)
+        first_block = code_widget.document().firstBlock()
+        self.assertEqual(first_block.userState(), DEFERRED)
+        code_widget.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought Inc
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD license.
+#
+# Author: Enthought Inc
+# Description: <Enthought pyface code editor>
+#------------------------------------------------------------------------------
+
+# Standard library imports.
+import re
+import unittest
+import mock
+
+# Local imports.
+from pyface.ui.qt4.code_editor import search
+from pyface.ui.qt4.code_editor.search import (
+    MatchIndex, PositionMap, find_matches, replace_matches, search_pattern
+)
+
+TEXT = u'foo bar Foo\nfood foo_bar foo\n'
+
+
+class TestSearch(unittest.TestCase):
+
+    def test_plain_search(self):
+        pattern = search_pattern(u'foo')
+        self.assertEqual(
+            find_matches(TEXT, pattern),
+            [(0, 3), (8, 11), (12, 15), (17, 20), (25, 28)],
+        )
+
+    def test_case_sensitive(self):
+        pattern = search_pattern(u'Foo', case_sensitive=True)
+        self.assertEqual(find_matches(TEXT, pattern), [(8, 11)])
+
+    def test_whole_words(self):
+        pattern = search_pattern(u'foo', whole_words=True)
+        self.assertEqual(
+            find_matches(TEXT, pattern), [(0, 3), (8, 11), (25, 28)]
+        )
+
+    def test_special_characters_escaped(self):
+        pattern = search_pattern(u'a.b')
+        self.assertEqual(find_matches(u'a.b axb', pattern), [(0, 3)])
+
+    def test_regex(self):
+        pattern = search_pattern(u'^fo+d?', regex=True)
+        self.assertEqual(find_matches(TEXT, pattern), [(0, 3), (12, 16)])
+
+    def test_invalid_regex(self):
+        with self.assertRaises(re.error):
+            search_pattern(u'(foo', regex=True)
+
+    def test_empty_matches_ignored(self):
+        pattern = search_pattern(u'x*', regex=True)
+        self.assertEqual(find_matches(u'axxb', pattern), [(1, 3)])
+
+    def test_progress(self):
+        positions = []
+        pattern = search_pattern(u'b')
+        text = u'a' * 99 + u'\n'
+        with mock.patch.object(search, 'PROGRESS_INTERVAL', 250):
+            spans = find_matches(text * 10, pattern, progress=positions.append)
+
+        # Progress is reported by position, even without any matches.
+        self.assertEqual(spans, [])
+        self.assertEqual(positions, [299, 599, 899, 1000])
+
+    def test_progress_cancelled(self):
+        def progress(position):
+            raise RuntimeError('cancelled')
+
+        pattern = search_pattern(u'b')
+        with self.assertRaises(RuntimeError):
+            find_matches(u'a' * 10, pattern, progress=progress)
+
+    def test_progress_same_matches(self):
+        pattern = search_pattern(u'a\\s*', regex=True)
+        text = (u'xa\n' * 3 + u'a\n\n') * 20
+        with mock.patch.object(search, 'PROGRESS_INTERVAL', 10):
+            spans = find_matches(text, pattern, progress=lambda pos: None)
+
+        self.assertEqual(spans, find_matches(text, pattern))
+
+    def test_spans_outside_bmp(self):
+        # Document positions count characters outside the BMP twice.
+        pattern = search_pattern(u'foo')
+        text = u'\U0001F600 foo \U0001F600\U0001F600 foo\n'
+        self.assertEqual(find_matches(text, pattern), [(3, 6), (12, 15)])
+        self.assertEqual(
+            find_matches(text, pattern, progress=lambda position: None),
+            [(3, 6), (12, 15)],
+        )
+
+        start, end, new_text, count = replace_matches(text, pattern, u'X')
+        self.assertEqual((start, end, count), (3, 15, 2))
+
+    def test_position_map(self):
+        position_map = PositionMap(u'a\U0001F600b\U0001F600')
+        self.assertEqual(
+            [position_map.position(offset) for offset in range(5)],
+            [0, 1, 3, 4, 6],
+        )
+        self.assertEqual(
+            [position_map.offset(position) for position in [0, 1, 3, 4, 6]],
+            [0, 1, 2, 3, 4],
+        )
+
+    def test_replace_matches(self):
+        pattern = search_pattern(u'foo', whole_words=True)
+        start, end, new_text, count = replace_matches(TEXT, pattern, u'baz')
+
+        self.assertEqual((start, end, count), (0, 28, 3))
+        self.assertEqual(
+            TEXT[:start] + new_text + TEXT[end:],
+            u'baz bar baz\nfood foo_bar baz\n',
+        )
+
+    def test_replace_matches_regex(self):
+        pattern = search_pattern(u'(\\w+)_(\\w+)', regex=True)
+        start, end, new_text, count = replace_matches(
+            TEXT, pattern, u'\\2_\\1', regex=True)
+
+        self.assertEqual(count, 1)
+        self.assertEqual(new_text, u'bar_foo')
+
+    def test_replace_no_matches(self):
+        pattern = search_pattern(u'xyz')
+        self.assertEqual(replace_matches(TEXT, pattern, u'a'), (0, 0, u'', 0))
+
+
+class TestMatchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.pattern = search_pattern(u'foo')
+        self.index = MatchIndex(self.pattern, find_matches(TEXT, self.pattern))
+
+    def test_index(self):
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(self.index[1], (8, 11))
+        self.assertEqual(self.index.index(8, 11), 1)
+        self.assertIsNone(self.index.index(8, 10))
+
+    def test_spans_between(self):
+        self.assertEqual(
+            self.index.spans_between(10, 18), [(8, 11), (12, 15), (17, 20)]
+        )
+        self.assertEqual(self.index.spans_between(3, 8), [])
+
+    def test_next_span(self):
+        self.assertEqual(self.index.next_span(1), (8, 11))
+        self.assertEqual(self.index.next_span(26), (0, 3))
+        self.assertIsNone(self.index.next_span(26, wrap=False))
+        self.assertEqual(self.index.next_span(12, backward=True), (8, 11))
+        self.assertEqual(self.index.next_span(2, backward=True), (25, 28))
+        self.assertIsNone(self.index.next_span(2, backward=True, wrap=False))
+
+    def test_text_changed(self):
+        # Insert "foo " at the start of the second line.
+        text = TEXT[:12] + u'foo ' + TEXT[12:]
+        self.index.text_changed(12, 0, 4, 12, text[12:32])
+
+        self.assertEqual(
+            [self.index[i] for i in range(len(self.index))],
+            find_matches(text, self.pattern),
+        )
+
+    def test_text_changed_removal(self):
+        # Remove "bar Foo\nfood " across the line break.
+        text = TEXT[:4] + TEXT[17:]
+        self.index.text_changed(4, 13, 0, 0, text[:15])
+
+        self.assertEqual(
+            [self.index[i] for i in range(len(self.index))],
+            find_matches(text, self.pattern),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,7 +12,9 @@
 
 
 # Standard library imports.
+from functools import partial
 import logging
+from threading import Lock
 
 # Major package imports.
 from pyface.qt import QtCore, QtGui
@@ -22,6 +24,7 @@ from traits.api import Bool, HasTraits, provides, Unicode
 from pyface.util.guisupport import start_event_loop_qt4
 
 # Local imports.
+from pyface.call_queue import CallQueue
 from pyface.i_gui import IGUI, MGUI
 
 
@@ -60,25 +63,36 @@ class GUI(MGUI, HasTraits):
     ###########################################################################
 
     def invoke_after(cls, millisecs, callable, *args, **kw):
-        _FutureCall(millisecs, callable, *args, **kw)
+        # Start the timer in the main GUI thread.
+        _call_queue().call(
+            QtCore.QTimer.singleShot, millisecs,
+            partial(callable, *args, **kw)
+        )
 
     invoke_after = classmethod(invoke_after)
 
     def invoke_later(cls, callable, *args, **kw):
-        _FutureCall(0, callable, *args, **kw)
+        _call_queue().call(callable, *args, **kw)
 
     invoke_later = classmethod(invoke_later)
 
     def set_trait_after(cls, millisecs, obj, trait_name, new):
-        _FutureCall(millisecs, setattr, obj, trait_name, new)
+        cls.invoke_after(millisecs, setattr, obj, trait_name, new)
 
     set_trait_after = classmethod(set_trait_after)
 
     def set_trait_later(cls, obj, trait_name, new):
-        _FutureCall(0, setattr, obj, trait_name, new)
+        _call_queue().set_trait(obj, trait_name, new)
 
     set_trait_later = classmethod(set_trait_later)
 
+    def set_call_limits(cls, max_calls=None, max_time=None):
+        queue = _call_queue()
+        queue.max_calls = max_calls
+        queue.max_time = max_time
+
+    set_call_limits = classmethod(set_call_limits)
+
     def process_events(allow_user_events=True):
         if allow_user_events:
             events = QtCore.QEventLoop.AllEvents
@@ -136,76 +150,59 @@ class GUI(MGUI, HasTraits):
             QtGui.QApplication.restoreOverrideCursor()
 
 
-class _FutureCall(QtCore.QObject):
-    """ This is a helper class that is similar to the wx FutureCall class. """
-
-    # Keep a list of references so that they don't get garbage collected.
-    _calls = []
+class _CallDispatcher(QtCore.QObject):
+    """ Makes the calls queued by invoke_later and set_trait_later in the
+    main GUI thread.
 
-    # Manage access to the list of instances.
-    _calls_mutex = QtCore.QMutex()
+    A single event is posted to the dispatcher whenever its queue goes from
+    empty to non-empty, and all of the queued calls (up to the limits of the
+    queue) are made when it is handled.
+    """
 
-    # A new Qt event type for _FutureCalls
+    # A new Qt event type for draining the queue.
     _pyface_event = QtCore.QEvent.Type(QtCore.QEvent.registerEventType())
 
-    def __init__(self, ms, callable, *args, **kw):
-        super(_FutureCall, self).__init__()
-
-        # Save the arguments.
-        self._ms = ms
-        self._callable = callable
-        self._args = args
-        self._kw = kw
+    def __init__(self):
+        super(_CallDispatcher, self).__init__()
 
-        # Save the instance.
-        self._calls_mutex.lock()
-        try:
-            self._calls.append(self)
-        finally:
-            self._calls_mutex.unlock()
+        #: The queue of calls to make.
+        self.queue = CallQueue(self._wake)
 
         # Move to the main GUI thread.
         self.moveToThread(QtGui.QApplication.instance().thread())
 
-        # Post an event to be dispatched on the main GUI thread. Note that
-        # we do not call QTimer.singleShot here, which would be simpler, because
-        # that only works on QThreads. We want regular Python threads to work.
-        event = QtCore.QEvent(self._pyface_event)
-        QtGui.QApplication.postEvent(self, event)
-
     def event(self, event):
         """ QObject event handler.
         """
         if event.type() == self._pyface_event:
-            if self._ms == 0:
-                # Invoke the callable now
-                try:
-                    self._callable(*self._args, **self._kw)
-                finally:
-                    # We cannot remove from self._calls here. QObjects don't like being
-                    # garbage collected during event handlers (there are tracebacks,
-                    # plus maybe a memory leak, I think).
-                    QtCore.QTimer.singleShot(0, self._finished)
-            else:
-                # Invoke the callable (puts it at the end of the event queue)
-                QtCore.QTimer.singleShot(self._ms, self._dispatch)
+            self.queue.drain()
             return True
 
-        return super(_FutureCall, self).event(event)
+        return super(_CallDispatcher, self).event(event)
 
-    def _dispatch(self):
-        """ Invoke the callable.
+    def _wake(self):
+        """ Post an event to be dispatched on the main GUI thread. Note that
+        we do not call QTimer.singleShot here, which would be simpler, because
+        that only works on QThreads. We want regular Python threads to work.
         """
-        try:
-            self._callable(*self._args, **self._kw)
-        finally:
-            self._finished()
+        event = QtCore.QEvent(self._pyface_event)
+        QtGui.QApplication.postEvent(self, event)
 
-    def _finished(self):
-        """ Remove the call from the list, so it can be garbage collected.
-        """
-        self._calls_mutex.lock()
-        try:
-            self._calls.remove(self)
-        finally:
-            self._calls_mutex.unlock()
+
+# The dispatcher, created on first use.
+_dispatcher = None
+
+# Manage the creation of the dispatcher.
+_dispatcher_lock = Lock()
+
+
+def _call_queue():
+    """ Return the queue of calls to make in the main GUI thread. """
+    global _dispatcher
+
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = _CallDispatcher()
+
+    return _dispatcher.queue
@@ -18,11 +18,13 @@ import os
 from pyface.qt import QtGui
 
 # Enthought library imports.
-from traits.api import Any, HasTraits, List, Property, provides
+from traits.api import Any, Dict, HasTraits, List, Property, provides
 from traits.api import Unicode
 
 # Local imports.
 from pyface.i_image_resource import IImageResource, MImageResource
+from pyface.resource.resource_cache import image_cache
+from .resource_manager import image_nbytes
 
 
 @provides(IImageResource)
@@ -37,6 +39,9 @@ class ImageResource(MImageResource, HasTraits):
     # The resource manager reference for the image.
     _ref = Any
 
+    # The resource manager references for specific image sizes.
+    _refs = Dict
+
     #### 'ImageResource' interface ############################################
 
     absolute_path = Property(Unicode)
@@ -56,7 +61,15 @@ class ImageResource(MImageResource, HasTraits):
         ref = self._get_ref(size)
 
         if ref is not None:
-            image = ref.load()
+            key = self._get_cache_key(ref, size, 'icon')
+            icon = image_cache.get(key)
+            if icon is None:
+                icon = QtGui.QIcon(ref.load())
+                image_cache.set(key, icon, image_nbytes(icon))
+
+            # Hand out a (cheap, implicitly shared) copy of the cached icon.
+            return QtGui.QIcon(icon)
+
         else:
             image = self._get_image_not_found_image()
 
@@ -17,7 +17,7 @@ import time
 
 from pyface.qt import QtGui, QtCore
 
-from traits.api import Bool, Instance, Int, Unicode, provides
+from traits.api import Bool, Float, Instance, Int, Unicode, provides
 
 from pyface.i_progress_dialog import IProgressDialog, MProgressDialog
 from .window import Window
@@ -68,6 +68,10 @@ class ProgressDialog(MProgressDialog, Window):
     #: Label for the 'cancel' button
     cancel_button_label = Unicode('Cancel')
 
+    #: The maximum number of repaints per second, or 0 to repaint on every
+    #: update
+    update_rate = Float(0.0)
+
     #: Whether or not the dialog was cancelled by the user
     _user_cancelled = Bool(False)
 
@@ -118,23 +122,49 @@ class ProgressDialog(MProgressDialog, Window):
         if self.progress_bar is None:
             return None, None
 
-        if self.max > 0:
-            self.progress_bar.setValue(value)
+        # An update made from inside processEvents is made once this one is
+        # done, rather than recursively.
+        if self._updating:
+            self._nested_values.append(value)
+            return (not self._user_cancelled, False)
+
+        # Don't repaint more often than asked.  Without a maximum, the values
+        # are increments, so those skipped are added to the next one shown.
+        if not self._repaint_due(value):
+            if self.max <= 0:
+                self._skipped_increment += value
+            return (not self._user_cancelled, False)
+
+        if self.max <= 0:
+            value += self._skipped_increment
+            self._skipped_increment = 0
+
+        self._updating = True
+        try:
+            self._show_update(value)
+            while self._nested_values and self.progress_bar is not None:
+                values, self._nested_values = self._nested_values, []
+                # Without a maximum, the values are increments.
+                self._show_update(values[-1] if self.max > 0 else sum(values))
+        finally:
+            self._updating = False
+            self._nested_values = []
+
+        return (not self._user_cancelled, False)
 
-            if (self.max != self.min):
-                percent = (float(value) - self.min)/(self.max - self.min)
-            else:
-                percent = 1.0
+    #-------------------------------------------------------------------------
+    # Private Interface
+    #-------------------------------------------------------------------------
 
-            if self.show_time and (percent != 0):
-                current_time = time.time()
-                elapsed = current_time - self._start_time
-                estimated = elapsed/percent
-                remaining = estimated - elapsed
+    def _show_update(self, value):
+        """ Show the progress value and process the pending events. """
 
-                self._set_time_label(elapsed, self._elapsed_control)
-                self._set_time_label(estimated, self._estimated_control)
-                self._set_time_label(remaining, self._remaining_control)
+        if self.max > 0:
+            if value != self.progress_bar.value():
+                self.progress_bar.setValue(value)
+
+            if self.show_time:
+                self._update_time_labels(value)
 
             if value >= self.max or self._user_cancelled:
                 self.close()
@@ -146,12 +176,6 @@ class ProgressDialog(MProgressDialog, Window):
 
         QtGui.QApplication.processEvents()
 
-        return (not self._user_cancelled, False)
-
-    #-------------------------------------------------------------------------
-    # Private Interface
-    #-------------------------------------------------------------------------
-
     def reject(self, event):
         self._user_cancelled = True
         self.close()
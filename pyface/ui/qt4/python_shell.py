@@ -13,28 +13,44 @@
 # Standard library imports.
 import six.moves.builtins
 from code import compile_command, InteractiveInterpreter
-from six.moves import cStringIO as StringIO
+from collections import deque
+from functools import partial
 import sys
+import threading
 from time import time
 
+from six.moves._thread import get_ident
+
 # System package imports.
 from pyface.qt import QtCore, QtGui
 from pygments.lexers import PythonLexer
 
 # Enthought library imports.
-from traits.api import Event, provides
+from traits.api import Bool, Event, provides
 from traits.util.clean_strings import python_name
 
 # Local imports.
 from .code_editor.pygments_highlighter import PygmentsHighlighter
 from .console.api import BracketMatcher, CallTipWidget, CompletionLexer, \
     HistoryConsoleWidget
-from pyface.i_python_shell import IPythonShell, MPythonShell
+from .gui import GUI
+from pyface.i_python_shell import (
+    IPythonShell, MPythonShell, _InterruptibleJob, _run_source
+)
 from pyface.key_pressed_event import KeyPressedEvent
 from .widget import Widget
 import six
 
 
+def _text_length(text):
+    """ The length of some text in a QTextDocument, whose positions count
+        UTF-16 code units, so characters outside the BMP count twice.
+    """
+    if not isinstance(text, six.text_type):
+        return len(text)
+    return len(text.encode('utf-16-le')) // 2
+
+
 @provides(IPythonShell)
 class PythonShell(MPythonShell, Widget):
     """ The toolkit specific implementation of a PythonShell.  See the
@@ -48,6 +64,10 @@ class PythonShell(MPythonShell, Widget):
 
     key_pressed = Event(KeyPressedEvent)
 
+    background = Bool(False)
+
+    busy = Bool(False)
+
     #--------------------------------------------------------------------------
     # 'object' interface
     #--------------------------------------------------------------------------
@@ -104,19 +124,23 @@ class PythonShell(MPythonShell, Widget):
     #--------------------------------------------------------------------------
 
     def _create_control(self, parent):
-        return PyfacePythonWidget(self, parent)
+        control = PyfacePythonWidget(self, parent)
+        control.background = self.background
+        return control
 
     def _add_event_listeners(self):
         super(PythonShell, self)._add_event_listeners()
 
         # Connect signals for events.
         self.control.executed.connect(self._on_command_executed)
+        self.control.busy_changed.connect(self._on_busy_changed)
         self._event_filter.signal.connect(self._on_obj_drop)
 
     def _remove_event_listeners(self):
         if self.control is not None:
             # Disconnect signals for events.
             self.control.executed.connect(self._on_command_executed)
+            self.control.busy_changed.disconnect(self._on_busy_changed)
             self._event_filter.signal.disconnect(self._on_obj_drop)
 
         super(PythonShell, self)._remove_event_listeners()
@@ -128,6 +152,14 @@ class PythonShell(MPythonShell, Widget):
     # 'Private' interface.
     #--------------------------------------------------------------------------
 
+    def _on_busy_changed(self, busy):
+        """ Handle the start and end of execution in the background. """
+        self.busy = busy
+
+    def _background_changed(self, new):
+        if self.control is not None:
+            self.control.background = new
+
     def _on_obj_drop(self, obj):
         """ Handle dropped objects and add to interpreter local namespace. """
         # If we can't create a valid Python identifier for the name of an
@@ -152,11 +184,45 @@ class PythonShell(MPythonShell, Widget):
 
 class PythonWidget(HistoryConsoleWidget):
     """ A basic in-process Python interpreter.
+
+    Output is written to a ring buffer of lines, which holds no more lines
+    than the console keeps, and is inserted into the console in batches.
+    While a command executes, output is shown as it is written (at most every
+    0.05 seconds); otherwise it is inserted above the prompt by a timer, at
+    most 'output_lines_per_frame' lines at a time, so that the GUI stays
+    responsive.  'write' can be called from any thread.
+
+    If 'background' is set, commands entered in the console are executed in
+    a worker thread, and can be interrupted with Ctrl+C.  Completions and call
+    tips are then looked up in a worker thread too.
     """
 
     # Emitted when a command has been executed in the interpeter.
     executed = QtCore.Signal()
 
+    # Emitted when a command starts or stops executing in the background.
+    busy_changed = QtCore.Signal(bool)
+
+    #------ Configuration ------------------------------------------------------
+
+    # Whether a run of identical lines of output is shown as a single line
+    # followed by the number of times it was written.
+    collapse_repeats = False
+
+    # The maximum number of lines of output inserted in one go by the output
+    # timer.
+    output_lines_per_frame = 1000
+
+    # The interval in milliseconds between the inserts of the output timer.
+    output_interval = 16
+
+    # Whether commands which are not hidden are executed in a worker thread.
+    background = False
+
+    # The BackgroundExecutor used to execute commands in the background, or
+    # None to use the shared executor.
+    executor = None
+
     #--------------------------------------------------------------------------
     # 'object' interface
     #--------------------------------------------------------------------------
@@ -169,7 +235,6 @@ class PythonWidget(HistoryConsoleWidget):
         self.interpreter = InteractiveInterpreter(self.locals)
 
         # PythonWidget protected attributes.
-        self._buffer = StringIO()
         self._bracket_matcher = BracketMatcher(self._control)
         self._call_tip_widget = CallTipWidget(self._control)
         self._completion_lexer = CompletionLexer(PythonLexer())
@@ -177,6 +242,45 @@ class PythonWidget(HistoryConsoleWidget):
         self._highlighter = PythonWidgetHighlighter(self)
         self._last_refresh_time = 0
 
+        # The output pipeline.  The pending lines are [text, count, shown]
+        # lists, where 'shown' is the number of characters of the line
+        # already inserted, and are guarded by the lock, as are the partial
+        # line and the scheduled flag.
+        self._gui_thread = get_ident()
+        self._output_lock = threading.Lock()
+        maxlen = self.buffer_size if self.buffer_size > 0 else None
+        self._pending_output = deque(maxlen=maxlen)
+        self._partial_line = ''
+        self._partial_shown = 0
+        self._output_scheduled = False
+        self._line_open = False
+        self._repeat_cursor = None
+        self._repeat_line = None
+        self._repeat_count = 0
+        self._output_timer = QtCore.QTimer(self)
+        self._output_timer.setSingleShot(True)
+        self._output_timer.setInterval(self.output_interval)
+        self._output_timer.timeout.connect(self._insert_output_frame)
+
+        # The undo history of the input buffer.  Output is inserted above the
+        # prompt while the user types, so the document's own undo history,
+        # which can't leave the output out, is turned off at the prompt.  The
+        # states are (input buffer, cursor offset from the prompt) tuples,
+        # and the typing offset is where a typed character continues the
+        # last undo step.
+        self._input_undo = []
+        self._input_redo = []
+        self._input_state = (u'', 0)
+        self._typing_offset = None
+        self._restoring_input = False
+
+        # Execution in the background.  The job can be interrupted, and the
+        # lookup is the future, callback and cursor position of the latest
+        # completion or call tip lookup.
+        self._job = None
+        self._future = None
+        self._lookup = None
+
         # file-like object attributes.
         self.encoding = sys.stdin.encoding
 
@@ -202,13 +306,10 @@ class PythonWidget(HistoryConsoleWidget):
     def flush(self):
         """ Flush the buffer by writing its contents to the screen.
         """
-        self._buffer.seek(0)
-        text = self._buffer.getvalue()
-        self._buffer.close()
-        self._buffer = StringIO()
-
-        self._append_plain_text(text)
-        self._control.moveCursor(QtGui.QTextCursor.End)
+        self._output_timer.stop()
+        self._insert_output(*self._take_output())
+        if self._executing:
+            self._control.moveCursor(QtGui.QTextCursor.End)
 
     def readline(self, prompt=None):
         """ Read and return one line of input from the user.
@@ -217,14 +318,30 @@ class PythonWidget(HistoryConsoleWidget):
 
     def write(self, text, refresh=True):
         """ Write text to the buffer, possibly flushing it if 'refresh' is set.
+
+        This can be called from any thread.  Text written from other threads
+        is shown once the GUI thread next handles events.
         """
-        if not self._hidden:
-            self._buffer.write(text)
-            if refresh:
-                current_time = time()
-                if current_time - self._last_refresh_time > 0.05:
-                    self.flush()
-                    self._last_refresh_time = current_time
+        if self._hidden:
+            return
+
+        gui_thread = get_ident() == self._gui_thread
+        with self._output_lock:
+            self._queue_output(text)
+            if not gui_thread:
+                schedule = not self._output_scheduled
+                self._output_scheduled = True
+        if not gui_thread:
+            if schedule:
+                GUI.invoke_later(self._output_written)
+        elif not self._executing:
+            if not self._output_timer.isActive():
+                self._output_timer.start()
+        elif refresh:
+            current_time = time()
+            if current_time - self._last_refresh_time > 0.05:
+                self.flush()
+                self._last_refresh_time = current_time
 
     def writelines(self, lines, refresh=True):
         """ Write a list of lines to the buffer.
@@ -259,6 +376,10 @@ class PythonWidget(HistoryConsoleWidget):
 
         See parent class :meth:`execute` docstring for full details.
         """
+        if self.background and not hidden:
+            self._execute_in_background(source)
+            return
+
         # Save the current std* and point them here
         old_stdin = sys.stdin
         old_stdout = sys.stdout
@@ -286,9 +407,23 @@ class PythonWidget(HistoryConsoleWidget):
     def _prompt_started_hook(self):
         """ Called immediately after a new prompt is displayed.
         """
+        # Output written from now on goes above the prompt, on a new line.
+        with self._output_lock:
+            self._partial_line = self._partial_line[self._partial_shown:]
+            self._partial_shown = 0
+            if self._pending_output:
+                self._pending_output[0][2] = 0
+        self._line_open = False
+        self._repeat_cursor = None
+        if self._pending_output and not self._output_timer.isActive():
+            self._output_timer.start()
+
         if not self._reading:
             self._highlighter.highlighting_on = True
 
+        self._control.setUndoRedoEnabled(False)
+        self._reset_input_history()
+
     def _prompt_finished_hook(self):
         """ Called immediately after a prompt is finished, i.e. when some input
             will be processed and a new prompt displayed.
@@ -316,8 +451,22 @@ class PythonWidget(HistoryConsoleWidget):
     #---------------------------------------------------------------------------
 
     def _event_filter_console_keypress(self, event):
-        """ Reimplemented for smart backspace.
+        """ Reimplemented for smart backspace, keyboard interrupts and the
+            undo history of the input buffer.
         """
+        if event.matches(QtGui.QKeySequence.Undo):
+            self.undo()
+            return True
+        elif event.matches(QtGui.QKeySequence.Redo):
+            self.redo()
+            return True
+
+        if (self._future is not None and event.key() == QtCore.Qt.Key_C
+                and self._control_key_down(event.modifiers())
+                and not self._control.textCursor().hasSelection()):
+            self.interrupt()
+            return True
+
         if event.key() == QtCore.Qt.Key_Backspace and \
                 not event.modifiers() & QtCore.Qt.AltModifier:
             # Smart backspace: remove four characters in one backspace if:
@@ -352,6 +501,25 @@ class PythonWidget(HistoryConsoleWidget):
             space += 4
         cursor.insertText(' ' * space)
 
+    #---------------------------------------------------------------------------
+    # 'ConsoleWidget' public interface
+    #---------------------------------------------------------------------------
+
+    def redo(self):
+        """ Reimplemented to redo an edit of the input buffer.
+        """
+        if not self._executing and self._input_redo:
+            self._input_undo.append(self._input_state)
+            self._restore_input(self._input_redo.pop())
+
+    def undo(self):
+        """ Reimplemented to undo an edit of the input buffer, leaving the
+            output alone.
+        """
+        if not self._executing and self._input_undo:
+            self._input_redo.append(self._input_state)
+            self._restore_input(self._input_undo.pop())
+
     #---------------------------------------------------------------------------
     # 'PythonWidget' public interface
     #---------------------------------------------------------------------------
@@ -363,6 +531,13 @@ class PythonWidget(HistoryConsoleWidget):
 
         self.execute("exec(open(%s).read())" % repr(path), hidden=hidden)
 
+    def interrupt(self):
+        """ Interrupt the command executing in the background, if any.
+        """
+        if self._future is not None and not self._job.interrupt():
+            # The command is still waiting for a worker.
+            self._future.cancel()
+
     def reset(self):
         """ Resets the widget to its initial state. Similar to ``clear``, but
             also re-writes the banner.
@@ -371,6 +546,8 @@ class PythonWidget(HistoryConsoleWidget):
         self._highlighter.highlighting_on = False
 
         self._control.clear()
+        self._repeat_cursor = None
+        self._line_open = False
         self._append_plain_text(self._get_banner())
         self._show_interpreter_prompt()
 
@@ -391,32 +568,88 @@ class PythonWidget(HistoryConsoleWidget):
             return False
 
         # Look up the context and show a tip for it
-        symbol, leftover = self._get_symbol_from_context(context)
-        doc = getattr(symbol, '__doc__', None)
-        if doc is not None and not leftover:
-            self._call_tip_widget.show_call_info(doc=doc)
-            return True
-        return False
+        self._look_up(self._get_call_tip_doc, context, self._show_call_tip)
+        return True
 
     def _complete(self):
         """ Performs completion at the current cursor location.
         """
         context = self._get_context()
         if context:
-            symbol, leftover = self._get_symbol_from_context(context)
-            if len(leftover) == 1:
-                leftover = leftover[0]
-                if symbol is None:
-                    names = list(self.interpreter.locals.keys())
-                    names += list(six.moves.builtins.__dict__.keys())
-                else:
-                    names = dir(symbol)
-                completions = [ n for n in names if n.startswith(leftover) ]
-                if completions:
-                    cursor = self._get_cursor()
-                    cursor.movePosition(QtGui.QTextCursor.Left,
-                                        n=len(context[-1]))
-                    self._complete_with_items(cursor, completions)
+            self._look_up(
+                self._get_completions, context,
+                partial(self._show_completions, context),
+            )
+
+    def _get_call_tip_doc(self, context):
+        """ Return the docstring of the object named by a context, or None.
+        """
+        symbol, leftover = self._get_symbol_from_context(context)
+        if leftover:
+            return None
+        return getattr(symbol, '__doc__', None)
+
+    def _get_completions(self, context):
+        """ Return the names completing the last name of a context.
+        """
+        symbol, leftover = self._get_symbol_from_context(context)
+        if len(leftover) != 1:
+            return []
+        leftover = leftover[0]
+        if symbol is None:
+            names = list(self.interpreter.locals.keys())
+            names += list(six.moves.builtins.__dict__.keys())
+        else:
+            names = dir(symbol)
+        return [n for n in names if n.startswith(leftover)]
+
+    def _look_up(self, function, context, callback):
+        """ Call a function with a context, then a callback with the result.
+
+        In background mode the function is called in a worker thread, so that
+        lookups don't wait for a command executing in the background, and
+        the callback is only called if the cursor hasn't moved since.
+        """
+        if not self.background:
+            callback(function(context))
+            return
+
+        from pyface.concurrent.api import get_executor
+
+        executor = self.executor if self.executor is not None \
+            else get_executor()
+        future = executor.submit(function, context)
+        self._lookup = (future, callback, self._get_cursor().position())
+        future.on_trait_change(self._lookup_done, 'state')
+
+    def _show_call_tip(self, doc):
+        """ Show a call tip with a docstring.
+        """
+        if doc is not None:
+            self._call_tip_widget.show_call_info(doc=doc)
+
+    def _show_completions(self, context, completions):
+        """ Offer completions for the last name of a context.
+        """
+        if completions:
+            cursor = self._get_cursor()
+            cursor.movePosition(QtGui.QTextCursor.Left, n=len(context[-1]))
+            self._complete_with_items(cursor, completions)
+
+    def _execute_in_background(self, source):
+        """ Execute 'source' in a worker thread.
+        """
+        from pyface.concurrent.api import get_executor
+
+        executor = self.executor if self.executor is not None \
+            else get_executor()
+        self._job = _InterruptibleJob(_run_source)
+        self._future = executor.submit(
+            self._job, self.interpreter, source, self.write
+        )
+        self._future.on_trait_change(self._background_execution_done, 'state')
+        self._control.viewport().setCursor(QtCore.Qt.BusyCursor)
+        self.busy_changed.emit(True)
 
     def _get_banner(self):
         """ Gets a banner to display at the beginning of a session.
@@ -440,7 +673,7 @@ class PythonWidget(HistoryConsoleWidget):
         """ Find a python object in the interpeter namespace from a context (a
             list of names).
         """
-        context = map(str, context)
+        context = list(map(str, context))
         if len(context) == 0:
             return None, context
 
@@ -461,6 +694,220 @@ class PythonWidget(HistoryConsoleWidget):
 
         return symbol, []
 
+    def _queue_output(self, text):
+        """ Add text to the pending output.  The output lock must be held.
+        """
+        if '\n' not in text:
+            self._partial_line += text
+            return
+
+        lines = (self._partial_line + text).split('\n')
+        self._partial_line = lines.pop()
+        if not lines:
+            return
+
+        pending = self._pending_output
+        shown = self._partial_shown
+        self._partial_shown = 0
+        for line in lines:
+            if (self.collapse_repeats and pending and shown == 0
+                    and pending[-1][0] == line):
+                pending[-1][1] += 1
+            else:
+                pending.append([line, 1, shown])
+            shown = 0
+
+    def _take_output(self, max_lines=None):
+        """ Remove pending output, returning the lines and, if all the lines
+            were taken, the part of the partial line not yet shown.
+        """
+        with self._output_lock:
+            pending = self._pending_output
+            if max_lines is None or len(pending) <= max_lines:
+                entries = list(pending)
+                pending.clear()
+                partial = ''
+                if self._executing:
+                    # Only show partial lines at the end of the console.
+                    partial = self._partial_line[self._partial_shown:]
+                    self._partial_shown = len(self._partial_line)
+            else:
+                entries = [pending.popleft() for i in range(max_lines)]
+                partial = ''
+        return entries, partial
+
+    def _insert_output(self, entries, partial=''):
+        """ Insert lines of output, and the start of a line, into the console.
+
+        While executing, output goes at the end of the console, where the
+        document's maximum block count trims the oldest lines.  Otherwise it
+        goes above the prompt, and the oldest lines are trimmed here.
+        """
+        if self.collapse_repeats and entries:
+            entries = self._collapse_repeated_output(entries)
+        if not entries and not partial:
+            return
+
+        pieces = []
+        if self._line_open and entries and entries[0][2] == 0:
+            # The start of the line being continued was dropped from the
+            # ring buffer.
+            pieces.append('\n')
+        for text, count, shown in entries:
+            pieces.append(self._repeated_line_text(text, count)[shown:])
+            pieces.append('\n')
+        pieces.append(partial)
+        text = ''.join(pieces)
+
+        document = self._control.document()
+        if self._executing:
+            cursor = self._get_end_cursor()
+            cursor.insertText(text)
+            line_end = cursor.position() - _text_length(partial) - 1
+        else:
+            block = document.findBlock(self._prompt_pos)
+            cursor = QtGui.QTextCursor(document)
+            if block.position() > 0:
+                # Insert after the end of the line before the prompt, so that
+                # the prompt's block is left alone.
+                text = '\n' + text[:-1]
+                cursor.setPosition(block.position() - 1)
+            self._insert_above_prompt(cursor, text)
+            line_end = cursor.position()
+            if block.position() == 0:
+                line_end -= 1
+
+        self._line_open = bool(partial) or (self._line_open and not entries)
+        if self.collapse_repeats and entries and not partial:
+            text, count, shown = entries[-1]
+            line_start = line_end - _text_length(
+                self._repeated_line_text(text, count)
+            )
+            self._repeat_cursor = QtGui.QTextCursor(document)
+            self._repeat_cursor.setPosition(line_start)
+            self._repeat_cursor.setPosition(
+                line_end, QtGui.QTextCursor.KeepAnchor
+            )
+            self._repeat_line = text
+            self._repeat_count = count
+        elif entries or partial:
+            self._repeat_cursor = None
+
+        if not self._executing:
+            self._trim_output()
+
+    def _collapse_repeated_output(self, entries):
+        """ Add the first of some lines to the last line shown if they are the
+            same, returning the lines left to insert.
+        """
+        cursor = self._repeat_cursor
+        text, count, shown = entries[0]
+        if (cursor is None or not cursor.hasSelection() or self._line_open
+                or shown != 0 or text != self._repeat_line):
+            return entries
+
+        self._repeat_count += count
+        start = cursor.selectionStart()
+        new_text = self._repeated_line_text(text, self._repeat_count)
+        self._insert_above_prompt(cursor, new_text)
+        cursor.setPosition(start, QtGui.QTextCursor.KeepAnchor)
+        return entries[1:]
+
+    def _insert_above_prompt(self, cursor, text):
+        """ Insert output text before the prompt, without highlighting it.
+        """
+        if self._executing:
+            cursor.insertText(text)
+            return
+
+        highlighting_on = self._highlighter.highlighting_on
+        self._highlighter.highlighting_on = False
+        try:
+            # The prompt moves by the change in the document's positions,
+            # which count UTF-16 code units rather than characters.
+            end = cursor.selectionEnd()
+            cursor.insertText(text)
+            if end < self._prompt_pos:
+                self._prompt_pos += cursor.position() - end
+        finally:
+            self._highlighter.highlighting_on = highlighting_on
+
+    def _repeated_line_text(self, text, count):
+        """ The text showing a line of output which was written 'count' times.
+        """
+        if count == 1:
+            return text
+        return '%s [x%d]' % (text, count)
+
+    def _trim_output(self):
+        """ Remove the oldest lines above the prompt so that there are no more
+            than 'buffer_size' lines.
+        """
+        if self.buffer_size <= 0:
+            return
+
+        document = self._control.document()
+        prompt_block = document.findBlock(self._prompt_pos).blockNumber()
+        excess = min(document.blockCount() - self.buffer_size, prompt_block)
+        if excess > 0:
+            cursor = QtGui.QTextCursor(document)
+            end = document.findBlockByNumber(excess).position()
+            cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+            self._insert_above_prompt(cursor, '')
+
+    def _reset_input_history(self):
+        """ Forget the undo history of the input buffer.
+        """
+        self._input_undo = []
+        self._input_redo = []
+        self._input_state = (self.input_buffer, self._input_cursor_offset())
+        self._typing_offset = None
+        self.undo_available.emit(False)
+        self.redo_available.emit(False)
+
+    def _input_changed(self, position, removed, added):
+        """ Add an edit of the input buffer to its undo history.
+        """
+        input_buffer = self.input_buffer
+        if input_buffer == self._input_state[0]:
+            # Only the formatting changed.
+            return
+
+        # Typing continues the last undo step, as in the document's history.
+        offset = position - self._prompt_pos
+        typing = removed == 0 and added == 1
+        if not typing or offset != self._typing_offset:
+            self._input_undo.append(self._input_state)
+        self._input_redo = []
+        self._typing_offset = offset + 1 if typing else None
+        self._input_state = (input_buffer, offset + added)
+        self.undo_available.emit(True)
+        self.redo_available.emit(False)
+
+    def _input_cursor_offset(self):
+        """ The position of the cursor relative to the prompt.
+        """
+        return max(self._get_cursor().position() - self._prompt_pos, 0)
+
+    def _restore_input(self, state):
+        """ Restore a state from the undo history of the input buffer.
+        """
+        input_buffer, offset = state
+        self._restoring_input = True
+        try:
+            self.input_buffer = input_buffer
+        finally:
+            self._restoring_input = False
+
+        cursor = self._get_cursor()
+        cursor.setPosition(min(self._prompt_pos + offset,
+                               self._get_end_cursor().position()))
+        self._control.setTextCursor(cursor)
+        self._input_state = (input_buffer, self._input_cursor_offset())
+        self._typing_offset = None
+        self.undo_available.emit(bool(self._input_undo))
+        self.redo_available.emit(bool(self._input_redo))
+
     def _show_interpreter_prompt(self):
         """ Shows a prompt for the interpreter.
         """
@@ -469,10 +916,74 @@ class PythonWidget(HistoryConsoleWidget):
 
     #------ Signal handlers ----------------------------------------------------
 
+    def _insert_output_frame(self):
+        """ Insert a batch of pending output; called by the output timer.
+        """
+        self._insert_output(*self._take_output(self.output_lines_per_frame))
+        if self._executing:
+            self._control.moveCursor(QtGui.QTextCursor.End)
+        if self._pending_output:
+            self._output_timer.start()
+
+    def _output_written(self):
+        """ Start the output timer for output written from other threads.
+        """
+        with self._output_lock:
+            self._output_scheduled = False
+        if not self._output_timer.isActive():
+            self._output_timer.start()
+
+    def _background_execution_done(self, future, name, new):
+        """ Called when the state of the background execution changes.
+        """
+        from pyface.concurrent.api import CANCELLED
+
+        if not future.done:
+            return
+
+        future.on_trait_change(
+            self._background_execution_done, 'state', remove=True
+        )
+        self._job = self._future = None
+        if future.state == CANCELLED or \
+                isinstance(future.exception, KeyboardInterrupt):
+            # Interrupted before or after the interpreter ran the command.
+            self.write('KeyboardInterrupt\n')
+        elif future.traceback:
+            self.write(future.traceback)
+
+        self._control.viewport().unsetCursor()
+        self.busy_changed.emit(False)
+        self.executed.emit()
+        self._show_interpreter_prompt()
+
+    def _lookup_done(self, future, name, new):
+        """ Called when the state of a completion or call tip lookup changes.
+        """
+        from pyface.concurrent.api import COMPLETED
+
+        if not future.done:
+            return
+
+        future.on_trait_change(self._lookup_done, 'state', remove=True)
+        if self._lookup is None or self._lookup[0] is not future:
+            # A later lookup has replaced this one.
+            return
+
+        future, callback, position = self._lookup
+        self._lookup = None
+        if (future.state == COMPLETED
+                and self._get_cursor().position() == position):
+            callback(future.result)
+
     def _document_contents_change(self, position, removed, added):
         """ Called whenever the document's content changes. Display a call tip
             if appropriate.
         """
+        if (position >= self._prompt_pos and not self._executing
+                and not self._restoring_input):
+            self._input_changed(position, removed, added)
+
         # Calculate where the cursor should be *after* the change:
         position += added
 
@@ -16,6 +16,7 @@ from pyface.qt import QtCore, QtGui, QtSvg
 
 # Enthought library imports.
 from pyface.resource.api import ResourceFactory
+from pyface.resource.resource_cache import data_cache_key, image_cache
 
 
 class PyfaceResourceFactory(ResourceFactory):
@@ -28,6 +29,41 @@ class PyfaceResourceFactory(ResourceFactory):
     def image_from_file(self, filename):
         """ Creates an image from the data in the specified filename. """
 
+        key = (filename, None, 'image')
+        pixmap = image_cache.get(key)
+        if pixmap is None:
+            pixmap = self._pixmap_from_file(filename)
+            if not pixmap.isNull():
+                image_cache.set(key, pixmap, image_nbytes(pixmap))
+
+        # QPixmaps are implicitly shared, so handing out a copy is cheap and
+        # stops callers from modifying the cached image.
+        return QtGui.QPixmap(pixmap)
+
+    def image_from_data(self, data, filename=None):
+        """ Creates an image from the specified data.
+
+        The data can be any bytes-like object (eg. a memoryview of a zip file
+        member), and is decoded without being written to disk.
+        """
+
+        key = (data_cache_key(data), None, 'image')
+        image = image_cache.get(key)
+        if image is None:
+            image = QtGui.QPixmap()
+            image.loadFromData(data)
+            if not image.isNull():
+                image_cache.set(key, image, image_nbytes(image) + len(data))
+
+        return QtGui.QPixmap(image)
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _pixmap_from_file(self, filename):
+        """ Decodes the image in the specified file. """
+
         # Although QPixmap can load SVG directly, it does not respect the
         # default size, so we use a QSvgRenderer to get the default size.
         if filename.endswith(('.svg', '.SVG')):
@@ -42,12 +78,14 @@ class PyfaceResourceFactory(ResourceFactory):
 
         return pixmap
 
-    def image_from_data(self, data, filename=None):
-        """ Creates an image from the specified data. """
 
-        image = QtGui.QPixmap()
-        image.loadFromData(data)
+def image_nbytes(image):
+    """ Returns the approximate memory used by a QPixmap, QImage or QIcon. """
+
+    if isinstance(image, QtGui.QIcon):
+        return sum(size.width() * size.height() * 4
+                   for size in image.availableSizes())
 
-        return image
+    return image.width() * image.height() * max(image.depth(), 8) // 8
 
 #### EOF ######################################################################
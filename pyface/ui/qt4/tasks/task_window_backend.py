@@ -57,6 +57,9 @@ class TaskWindowBackend(MTaskWindowBackend):
         # Now hide its controls.
         self.control.centralWidget().removeWidget(state.central_pane.control)
         for dock_pane in state.dock_panes:
+            if dock_pane.control is None:
+                # The pane has never been shown.
+                continue
             # Warning: The layout behavior is subtly different (and wrong!) if
             # the order of these two statement is switched.
             dock_pane.control.hide()
@@ -72,6 +75,14 @@ class TaskWindowBackend(MTaskWindowBackend):
         # Show the dock panes.
         self._layout_state(state)
 
+    def show_dock_pane(self, dock_pane):
+        """ Show a dock pane of the active task whose control has just been
+            created, in its dock area.
+        """
+        self.control.addDockWidget(AREA_MAP[dock_pane.dock_area],
+                                   dock_pane.control)
+        dock_pane.control.show()
+
     #### Methods for saving and restoring the layout ##########################
 
     def get_layout(self):
@@ -115,6 +126,11 @@ class TaskWindowBackend(MTaskWindowBackend):
 
         # Add all panes not assigned an area by the TaskLayout.
         for dock_pane in state.dock_panes:
+            if dock_pane.control is None:
+                # In lazy mode, only create the panes which are shown.
+                if not dock_pane.visible:
+                    continue
+                self.window._create_dock_pane(dock_pane)
             if dock_pane.control not in self._main_window_layout.consumed:
                 dock_area = AREA_MAP[dock_pane.dock_area]
                 self.control.addDockWidget(dock_area, dock_pane.control)
@@ -134,6 +150,8 @@ class TaskWindowBackend(MTaskWindowBackend):
         if self.window.active_task:
             panes = [self.window.central_pane] + self.window.dock_panes
             for pane in panes:
+                if pane.control is None:
+                    continue
                 if new and pane.control.isAncestorOf(new):
                     pane.has_focus = True
                 elif old and pane.control.isAncestorOf(old):
@@ -168,6 +186,8 @@ class TaskWindowLayout(MainWindowLayout):
         """
         for dock_pane in self.state.dock_panes:
             if dock_pane.id == pane.id:
+                # In lazy mode, the pane may not have been shown before.
+                dock_pane.task.window._create_dock_pane(dock_pane)
                 self.consumed.append(dock_pane.control)
                 return dock_pane.control
         return None
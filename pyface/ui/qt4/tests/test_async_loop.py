@@ -0,0 +1,138 @@
+"""
+Qt-specific tests for the asyncio event loop run by Qt.
+"""
+from __future__ import absolute_import
+
+import socket
+
+from traits.testing.unittest_tools import unittest
+
+from pyface.constant import CANCEL, OK
+from pyface.qt import QtCore
+from ..dialog import Dialog
+from ..progress_dialog import ProgressDialog
+from ..util.gui_test_assistant import GuiTestAssistant
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+else:
+    from pyface.async_loop import gather_with_progress, open_dialog
+    from ..async_loop import PyfaceEventLoop
+
+
+@unittest.skipIf(asyncio is None, 'asyncio is not available')
+class TestPyfaceEventLoop(unittest.TestCase, GuiTestAssistant):
+
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+        self.loop = PyfaceEventLoop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+        GuiTestAssistant.tearDown(self)
+
+    def run_loop(self, future):
+        return self.loop.run_until_complete(
+            asyncio.wait_for(future, 5.0, loop=self.loop)
+        )
+
+    def test_run_by_qt_event_loop(self):
+        # Nothing calls run_forever: the Qt event loop runs the coroutines.
+        future = asyncio.gather(
+            asyncio.sleep(0.01, result=1, loop=self.loop),
+            asyncio.sleep(0.02, result=2, loop=self.loop),
+            loop=self.loop,
+        )
+
+        self.event_loop_helper.event_loop_until_condition(future.done)
+        self.assertEqual(future.result(), [1, 2])
+        self.assertFalse(self.loop._timer.isActive())
+
+    def test_qt_events_handled_while_running(self):
+        calls = []
+        QtCore.QTimer.singleShot(10, lambda: calls.append(True))
+
+        self.run_loop(asyncio.sleep(0.1, loop=self.loop))
+
+        self.assertEqual(calls, [True])
+
+    def test_socket_io_wakes_loop(self):
+        self.assertTrue(self.loop._watching_selector)
+        reader, writer = socket.socketpair()
+        received = self.loop.create_future()
+
+        def readable():
+            received.set_result(reader.recv(16))
+
+        try:
+            self.loop.add_reader(reader.fileno(), readable)
+            QtCore.QTimer.singleShot(10, lambda: writer.send(b'ping'))
+            # There is no asyncio timer, so only the notifier can wake it.
+            self.event_loop_helper.event_loop_until_condition(received.done)
+            self.assertEqual(received.result(), b'ping')
+        finally:
+            self.loop.remove_reader(reader.fileno())
+            reader.close()
+            writer.close()
+
+    def test_stop_and_restart(self):
+        self.loop.call_later(0.01, self.loop.stop)
+        self.loop.run_forever()
+        self.assertEqual(
+            self.run_loop(asyncio.sleep(0, result=1, loop=self.loop)), 1
+        )
+
+    def test_run_forever_in_callback(self):
+        def nested():
+            with self.assertRaises(RuntimeError):
+                self.loop.run_forever()
+
+        self.run_loop(asyncio.sleep(0, loop=self.loop))
+        self.loop.call_soon(nested)
+        self.run_loop(asyncio.sleep(0.01, loop=self.loop))
+
+    def test_open_dialog(self):
+        dialog = Dialog()
+        future = open_dialog(dialog)
+        self.loop.call_later(0.01, dialog.control.accept)
+
+        self.assertEqual(self.run_loop(future), OK)
+        self.assertIsNone(dialog.control)
+
+    def test_open_dialog_cancelled(self):
+        dialog = Dialog()
+        future = open_dialog(dialog)
+        self.loop.call_later(0.01, dialog.control.reject)
+
+        self.assertEqual(self.run_loop(future), CANCEL)
+
+    def test_gather_with_progress(self):
+        dialog = ProgressDialog()
+        coroutines = [
+            asyncio.sleep(0.001 * (i % 10), result=i, loop=self.loop)
+            for i in range(100)
+        ]
+
+        future = gather_with_progress(dialog, coroutines)
+        self.assertEqual(dialog.max, 100)
+
+        self.assertEqual(self.run_loop(future), list(range(100)))
+        self.assertIsNone(dialog.control)
+
+    def test_gather_with_progress_user_cancel(self):
+        dialog = ProgressDialog(can_cancel=True)
+        sleep = asyncio.ensure_future(
+            asyncio.sleep(1.0, loop=self.loop), loop=self.loop
+        )
+
+        future = gather_with_progress(dialog, [sleep])
+        self.loop.call_later(0.01, dialog.reject, None)
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.run_loop(future)
+        self.assertTrue(sleep.cancelled())
+        self.assertIsNone(dialog.control)
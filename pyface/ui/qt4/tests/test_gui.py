@@ -3,9 +3,10 @@ Qt-specific tests for the Qt GUI implementation.
 """
 from __future__ import absolute_import
 
+import threading
 import unittest
 
-from traits.api import Event, HasStrictTraits, Instance
+from traits.api import Event, HasStrictTraits, HasTraits, Instance, Int
 
 from pyface.api import GUI
 from pyface.i_gui import IGUI
@@ -74,3 +75,56 @@ class TestGui(unittest.TestCase):
             qt_app.flush()
 
         self.assertTrue(application_running[0])
+
+    def test_invoke_later_from_threads(self):
+        qt_app = get_app_qt4()
+        results = []
+
+        def add(start):
+            for i in range(start, start + 100):
+                GUI.invoke_later(results.append, i)
+
+        threads = [threading.Thread(target=add, args=(i * 100,))
+                   for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        qt_app.sendPostedEvents()
+
+        self.assertEqual(sorted(results), list(range(400)))
+
+    def test_set_trait_later_coalesced(self):
+        qt_app = get_app_qt4()
+
+        class Counter(HasTraits):
+            value = Int
+            changes = Int
+
+            def _value_changed(self):
+                self.changes += 1
+
+        counter = Counter()
+        for i in range(100):
+            GUI.set_trait_later(counter, 'value', i)
+        qt_app.sendPostedEvents()
+
+        self.assertEqual(counter.value, 99)
+        self.assertEqual(counter.changes, 1)
+
+    def test_set_call_limits(self):
+        qt_app = get_app_qt4()
+        results = []
+
+        GUI.set_call_limits(max_calls=10)
+        try:
+            for i in range(25):
+                GUI.invoke_later(results.append, i)
+            qt_app.sendPostedEvents()
+            self.assertEqual(len(results), 10)
+        finally:
+            GUI.set_call_limits()
+            qt_app.sendPostedEvents()
+            qt_app.sendPostedEvents()
+
+        self.assertEqual(results, list(range(25)))
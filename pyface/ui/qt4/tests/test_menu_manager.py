@@ -0,0 +1,152 @@
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from pyface.action.api import (
+    Action, Group, MenuManager, ToolBarManager
+)
+from pyface.qt import QtGui
+from ..util.gui_test_assistant import GuiTestAssistant
+
+
+class TestMenuRefresh(unittest.TestCase, GuiTestAssistant):
+
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+        self.parent = QtGui.QWidget()
+
+    def tearDown(self):
+        with self.delete_widget(self.parent):
+            self.parent.deleteLater()
+        GuiTestAssistant.tearDown(self)
+
+    def action_texts(self, control):
+        return [
+            '-' if action.isSeparator() else action.text()
+            for action in control.actions()
+        ]
+
+    def test_add_item(self):
+        group = Group(Action(name='A'), Action(name='C'))
+        manager = MenuManager(group, Group(Action(name='D')))
+        menu = manager.create_menu(self.parent)
+        first, second, separator, last = menu.actions()
+
+        group.insert(1, Action(name='B'))
+        manager.changed = True
+
+        self.assertEqual(self.action_texts(menu), ['A', 'B', 'C', '-', 'D'])
+        actions = menu.actions()
+        self.assertIs(actions[0], first)
+        self.assertIs(actions[2], second)
+        self.assertIs(actions[3], separator)
+        self.assertIs(actions[4], last)
+        self.assertEqual(len(menu.menu_items), 4)
+
+    def test_remove_item(self):
+        group = Group(Action(name='A'), Action(name='B'))
+        manager = MenuManager(group)
+        menu = manager.create_menu(self.parent)
+        first = menu.actions()[0]
+        item = group.items[1]
+
+        group.remove(item)
+        manager.changed = True
+        self.gui.process_events()
+
+        self.assertEqual(menu.actions(), [first])
+        self.assertEqual(len(menu.menu_items), 1)
+        self.assertEqual(item._wrappers, [])
+
+    def test_add_and_empty_groups(self):
+        group = Group(Action(name='B'))
+        manager = MenuManager(Group(Action(name='A')))
+        menu = manager.create_menu(self.parent)
+
+        manager.append(group)
+        manager.changed = True
+        self.assertEqual(self.action_texts(menu), ['A', '-', 'B'])
+
+        group.remove(group.items[0])
+        manager.changed = True
+        self.assertEqual(self.action_texts(menu), ['A'])
+
+    def test_remove_submenu(self):
+        submenu_manager = MenuManager(Action(name='B'), name='Sub')
+        group = Group(Action(name='A'), submenu_manager)
+        manager = MenuManager(group)
+        menu = manager.create_menu(self.parent)
+        submenu = menu.actions()[1].menu()
+        self.assertEqual(self.action_texts(submenu), ['B'])
+
+        group.remove(submenu_manager)
+        manager.changed = True
+        self.assertEqual(self.action_texts(menu), ['A'])
+
+        # The removed sub-menu no longer follows its manager.
+        with self.delete_widget(submenu):
+            pass
+        submenu_manager.name = 'Renamed'
+
+    def test_lazy_menu(self):
+        group = Group(Action(name='A'))
+        manager = MenuManager(group, lazy=True)
+        menu = manager.create_menu(self.parent)
+        self.assertEqual(menu.actions(), [])
+
+        menu.aboutToShow.emit()
+        self.assertEqual(self.action_texts(menu), ['A'])
+        first = menu.actions()[0]
+
+        # Changes are only applied when the menu is shown again.
+        group.append(Action(name='B'))
+        manager.changed = True
+        self.assertEqual(self.action_texts(menu), ['A'])
+
+        menu.aboutToShow.emit()
+        self.assertEqual(self.action_texts(menu), ['A', 'B'])
+        self.assertIs(menu.actions()[0], first)
+
+    def test_tool_bar_refresh(self):
+        group = Group(Action(name='A'), Action(name='C'))
+        manager = ToolBarManager(group, Group(Action(name='D')))
+        tool_bar = manager.create_tool_bar(self.parent)
+        first = tool_bar.actions()[0]
+
+        group.insert(1, Action(name='B'))
+        manager.changed = True
+        self.assertEqual(self.action_texts(tool_bar),
+                         ['A', 'B', 'C', '-', 'D'])
+        self.assertIs(tool_bar.actions()[0], first)
+
+        item = group.items[0]
+        group.remove(item)
+        manager.changed = True
+        self.assertEqual(self.action_texts(tool_bar), ['B', 'C', '-', 'D'])
+
+        # The removed tool no longer follows its action.
+        item.action.name = 'Renamed'
+        self.assertEqual(self.action_texts(tool_bar), ['B', 'C', '-', 'D'])
+
+        # The separator follows the visibility of its group.
+        tool_bar.setVisible(True)
+        separator = tool_bar.actions()[2]
+        manager.groups[1].visible = False
+        self.assertFalse(separator.isVisible())
+
+    def test_tool_bar_dispose(self):
+        group = Group(Action(name='A'))
+        manager = ToolBarManager(group)
+        tool_bar = manager.create_tool_bar(self.parent)
+        item = group.items[0]
+
+        tool_bar.dispose()
+        self.assertEqual(tool_bar.actions(), [])
+        self.assertEqual(item._wrappers, [])
+
+        # The tool bar no longer follows its manager.
+        group.append(Action(name='B'))
+        manager.changed = True
+        manager.enabled = False
+        self.assertEqual(tool_bar.actions(), [])
+        self.assertTrue(tool_bar.isEnabled())
@@ -116,3 +116,71 @@ class TestProgressDialog(unittest.TestCase, GuiTestAssistant):
             self.assertNotEqual(self.dialog._remaining_control.text(), "")
         self.assertIsNone(self.dialog.control)
         self.gui.process_events()
+
+    def test_update_same_value(self):
+        self.dialog.min = 0
+        self.dialog.max = 10
+        self.dialog.open()
+        values = []
+        self.dialog.progress_bar.valueChanged.connect(values.append)
+        for i in [1, 1, 1, 2, 2]:
+            self.dialog.update(i)
+        self.assertEqual(values, [1, 2])
+        self.dialog.close()
+        self.gui.process_events()
+
+    def test_update_not_reentrant(self):
+        self.dialog.min = 0
+        self.dialog.max = 10
+        self.dialog.open()
+        results = []
+
+        # An update made while the dialog is processing events is made once
+        # the outer update is done.
+        def nested():
+            results.append(self.dialog.update(5))
+
+        self.gui.invoke_later(nested)
+        self.dialog.update(1)
+
+        self.assertEqual(results, [(True, False)])
+        self.assertEqual(self.dialog.progress_bar.value(), 5)
+        self.dialog.close()
+        self.gui.process_events()
+
+    def test_throttled_increments_kept(self):
+        self.dialog.min = 0
+        self.dialog.max = 0
+        self.dialog.update_rate = 1.0
+        self.dialog.open()
+        shown = []
+        show_update = self.dialog._show_update
+
+        def record(value):
+            shown.append(value)
+            show_update(value)
+
+        self.dialog._show_update = record
+
+        # Without a maximum the values are increments, so those of the
+        # updates which don't repaint are added to the next repaint.
+        self.dialog.update(1)
+        self.dialog.update(2)
+        self.dialog.update(3)
+        self.dialog._last_repaint = None
+        self.dialog.update(4)
+
+        self.assertEqual(shown, [1, 9])
+        self.dialog.close()
+        self.gui.process_events()
+
+    def test_nested_final_update_closes(self):
+        self.dialog.min = 0
+        self.dialog.max = 10
+        self.dialog.open()
+
+        self.gui.invoke_later(self.dialog.update, 10)
+        self.dialog.update(1)
+
+        self.assertIsNone(self.dialog.control)
+        self.gui.process_events()
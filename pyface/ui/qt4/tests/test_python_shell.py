@@ -0,0 +1,276 @@
+"""
+Qt-specific tests for the output of the Python shell.
+"""
+from __future__ import absolute_import
+
+import threading
+
+from traits.testing.unittest_tools import unittest
+
+from pyface.concurrent.api import BackgroundExecutor
+from pyface.qt import QtCore
+from pyface.qt.QtTest import QTest
+from ..python_shell import PythonWidget
+from ..util.gui_test_assistant import GuiTestAssistant
+
+
+class TestPythonWidgetOutput(unittest.TestCase, GuiTestAssistant):
+
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+        self.widget = PythonWidget()
+
+    def tearDown(self):
+        with self.delete_widget(self.widget):
+            self.widget.deleteLater()
+        del self.widget
+        GuiTestAssistant.tearDown(self)
+
+    def text(self):
+        return self.widget._control.toPlainText()
+
+    def wait_for_output(self):
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: not self.widget._pending_output
+        )
+
+    def test_output_while_executing(self):
+        self.widget.execute(
+            "import sys; sys.stdout.write('par'); print('tial')", hidden=False
+        )
+
+        self.assertTrue(self.text().endswith('\npartial\n>>> '))
+
+    def test_output_above_prompt(self):
+        self.widget.input_buffer = 'x = 1'
+
+        self.widget.write('hello\nwor')
+        self.widget.write('ld\n')
+        self.wait_for_output()
+
+        self.assertTrue(self.text().endswith('\nhello\nworld\n>>> x = 1'))
+        self.assertEqual(self.widget.input_buffer, 'x = 1')
+
+    def test_undo_leaves_output(self):
+        self.widget.input_buffer = 'x = 1'
+        self.widget.write('out1\n')
+        self.widget.flush()
+
+        # Undo only reverts the user's edit, not the output.
+        self.widget.undo()
+        self.assertTrue(self.text().endswith('\nout1\n>>> '))
+        self.assertEqual(self.widget.input_buffer, '')
+
+        self.widget.redo()
+        self.assertTrue(self.text().endswith('\nout1\n>>> x = 1'))
+        self.assertEqual(self.widget.input_buffer, 'x = 1')
+
+    def test_undo_typing_leaves_output(self):
+        control = self.widget._control
+        QTest.keyClicks(control, 'abc')
+        self.widget.write('out1\n')
+        self.widget.flush()
+        QTest.keyClicks(control, 'd')
+
+        QTest.keyClick(control, QtCore.Qt.Key_Z, QtCore.Qt.ControlModifier)
+        self.assertEqual(self.widget.input_buffer, '')
+        self.assertTrue(self.text().endswith('\nout1\n>>> '))
+
+    def test_undo_leaves_trimmed_output(self):
+        self.widget.input_buffer = 'x = 1'
+        for i in range(self.widget.buffer_size * 2):
+            self.widget.write('{}\n'.format(i))
+        self.widget.flush()
+        text = self.text()
+
+        # The trimmed lines don't come back.
+        self.widget.undo()
+        self.assertEqual(self.text(), text[:-len('x = 1')])
+
+    def test_output_outside_bmp(self):
+        self.widget.collapse_repeats = True
+        self.widget.input_buffer = 'abc'
+
+        self.widget.write(u'\U0001F600\U0001F600\n')
+        self.widget.flush()
+        self.widget.write(u'\U0001F600\U0001F600\n')
+        self.widget.flush()
+
+        self.assertEqual(self.widget.input_buffer, 'abc')
+        self.assertTrue(
+            self.text().endswith(u'\n\U0001F600\U0001F600 [x2]\n>>> abc')
+        )
+
+    def test_partial_line_waits_for_newline(self):
+        self.widget.write('wor')
+        self.widget.flush()
+        self.assertTrue(self.text().endswith('information.\n>>> '))
+
+        self.widget.write('ld\n')
+        self.widget.flush()
+        self.assertTrue(self.text().endswith('\nworld\n>>> '))
+
+    def test_output_in_batches(self):
+        self.widget.output_lines_per_frame = 10
+        for i in range(25):
+            self.widget.write('{}\n'.format(i))
+
+        self.widget._insert_output_frame()
+        self.assertEqual(len(self.widget._pending_output), 15)
+        self.wait_for_output()
+
+        self.assertTrue(self.text().endswith('\n23\n24\n>>> '))
+
+    def test_truncation_keeps_prompt(self):
+        self.widget.input_buffer = 'x = 1'
+        for i in range(self.widget.buffer_size * 3):
+            self.widget.write('{}\n'.format(i))
+        self.widget.flush()
+
+        document = self.widget._control.document()
+        self.assertEqual(document.blockCount(), self.widget.buffer_size)
+        self.assertEqual(self.widget.input_buffer, 'x = 1')
+        last = self.widget.buffer_size * 3 - 1
+        self.assertTrue(
+            self.text().endswith('\n{}\n>>> x = 1'.format(last))
+        )
+
+    def test_ring_buffer_holds_buffer_size_lines(self):
+        for i in range(self.widget.buffer_size * 2):
+            self.widget.write('{}\n'.format(i))
+
+        self.assertEqual(
+            len(self.widget._pending_output), self.widget.buffer_size
+        )
+
+    def test_collapse_repeats(self):
+        self.widget.collapse_repeats = True
+        self.widget.input_buffer = 'x = 1'
+
+        self.widget.write('start\nsame\nsame\n')
+        self.widget.flush()
+        self.widget.write('same\n')
+        self.widget.flush()
+        self.widget.write('same\nend\n')
+        self.widget.flush()
+
+        self.assertTrue(
+            self.text().endswith('\nstart\nsame [x4]\nend\n>>> x = 1')
+        )
+        self.assertEqual(self.widget.input_buffer, 'x = 1')
+
+    def test_no_collapse_by_default(self):
+        self.widget.write('same\nsame\n')
+        self.widget.flush()
+
+        self.assertTrue(self.text().endswith('\nsame\nsame\n>>> '))
+
+    def test_write_from_thread(self):
+        threads = [
+            threading.Thread(
+                target=self.widget.write, args=('thread {}\n'.format(i),)
+            )
+            for i in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.text().count('thread') == 5
+        )
+        self.assertTrue(self.text().endswith('\n>>> '))
+
+
+class TestPythonWidgetBackground(unittest.TestCase, GuiTestAssistant):
+
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+        self.widget = PythonWidget()
+        self.widget.background = True
+        self.widget.executor = BackgroundExecutor(max_workers=2)
+        self.busy = []
+        self.widget.busy_changed.connect(self.busy.append)
+
+    def tearDown(self):
+        self.widget.executor.shutdown()
+        with self.delete_widget(self.widget):
+            self.widget.deleteLater()
+        del self.widget
+        GuiTestAssistant.tearDown(self)
+
+    def text(self):
+        return self.widget._control.toPlainText()
+
+    def execute(self, source):
+        self.widget.execute(source, hidden=False)
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.widget._future is None
+        )
+
+    def test_output_streamed(self):
+        self.execute("for i in range(3):\n    print('line', i)\n\n")
+
+        self.assertEqual(self.busy, [True, False])
+        self.assertTrue(
+            self.text().endswith('\nline 0\nline 1\nline 2\n>>> ')
+        )
+
+    def test_exception(self):
+        self.execute('1/0')
+
+        self.assertTrue(
+            self.text().endswith('ZeroDivisionError: division by zero\n>>> ')
+            or self.text().endswith('ZeroDivisionError: integer division '
+                                    'or modulo by zero\n>>> ')
+        )
+
+    def test_interrupt(self):
+        self.widget.execute('while True:\n    pass\n\n', hidden=False)
+        self.assertTrue(self.widget._control.isReadOnly())
+
+        self.widget.interrupt()
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.widget._future is None
+        )
+
+        self.assertTrue(self.text().endswith('KeyboardInterrupt\n>>> '))
+        self.assertFalse(self.widget._control.isReadOnly())
+
+    def test_hidden_commands_run_in_gui_thread(self):
+        self.widget.execute('x = 1', hidden=True)
+
+        self.assertEqual(self.widget.interpreter.locals['x'], 1)
+        self.assertEqual(self.busy, [])
+
+    def test_completion_in_background(self):
+        completions = []
+        self.widget._complete_with_items = (
+            lambda cursor, items: completions.append(items)
+        )
+        self.widget.interpreter.locals['spam_eggs'] = 1
+        self.widget.input_buffer = 'spam_'
+
+        self.widget._complete()
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.widget._lookup is None
+        )
+
+        self.assertEqual(completions, [['spam_eggs']])
+
+    def test_stale_completion_dropped(self):
+        completions = []
+        self.widget._complete_with_items = (
+            lambda cursor, items: completions.append(items)
+        )
+        self.widget.interpreter.locals['spam_eggs'] = 1
+        self.widget.input_buffer = 'spam_'
+
+        self.widget._complete()
+        self.widget.input_buffer = 'spam_e'
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.widget._lookup is None
+        )
+
+        self.assertEqual(completions, [])
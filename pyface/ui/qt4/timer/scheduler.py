@@ -0,0 +1,33 @@
+# Copyright (c) 2018, Enthought Inc
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license.  However, when used with the GPL version of PyQt the additional
+# terms described in the PyQt GPL exception also apply
+
+from traits.api import Instance
+
+from pyface.qt.QtCore import Qt, QTimer
+from pyface.timer.i_scheduler import BaseScheduler
+
+
+class PyfaceScheduler(BaseScheduler):
+    """ A scheduler which runs its callbacks from a single QTimer. """
+
+    #: The single-shot QTimer for the scheduler.
+    _timer = Instance(QTimer, allow_none=False)
+
+    def __init__(self, **traits):
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.setTimerType(Qt.PreciseTimer)
+        traits.setdefault('_timer', timer)
+        super(PyfaceScheduler, self).__init__(**traits)
+        self._timer.timeout.connect(self.run_due)
+
+    def _start_timer(self, delay):
+        # Round up, so that the timer doesn't go off before the deadline.
+        self._timer.start(int(delay * 1000 + 0.999))
+
+    def _stop_timer(self):
+        self._timer.stop()
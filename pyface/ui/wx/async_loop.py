@@ -0,0 +1,73 @@
+#  Copyright (c) 2018, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+""" An asyncio event loop run by the wx event loop. """
+
+import math
+
+import wx
+
+from pyface.i_async_loop import BaseGuiEventLoop
+
+
+class LoopTimer(wx.Timer):
+    def __init__(self, loop):
+        super(LoopTimer, self).__init__()
+        self.loop = loop
+
+    def Notify(self):
+        self.loop._tick()
+
+
+class PyfaceEventLoop(BaseGuiEventLoop):
+    """ An asyncio event loop run by the wx event loop.
+
+    wx can't watch file descriptors, so the loop is run when the wx event
+    loop is next idle if callbacks are ready, and otherwise from a one-shot
+    wx.Timer set for the next asyncio deadline, or for the next poll of the
+    selector if there are readers or writers.  ``run_forever`` runs a nested
+    wx.GUIEventLoop.
+    """
+
+    def __init__(self, selector=None):
+        self._timer = LoopTimer(self)
+        self._wx_loops = []
+
+        super(PyfaceEventLoop, self).__init__(selector)
+
+    ###########################################################################
+    # Protected 'BaseGuiEventLoop' interface.
+    ###########################################################################
+
+    def _start_timer(self, delay):
+        milliseconds = int(math.ceil(delay * 1000))
+        if milliseconds <= 0:
+            self._timer.Stop()
+            wx.CallAfter(self._tick)
+        else:
+            self._timer.Start(milliseconds, wx.TIMER_ONE_SHOT)
+
+    def _stop_timer(self):
+        self._timer.Stop()
+
+    def _run_gui_loop(self):
+        wx_loop = wx.GUIEventLoop()
+        self._wx_loops.append(wx_loop)
+        activator = wx.EventLoopActivator(wx_loop)
+        try:
+            wx_loop.Run()
+        finally:
+            del activator
+            self._wx_loops.pop()
+
+    def _quit_gui_loop(self):
+        self._wx_loops[-1].Exit()
+
+    def _call_in_gui_thread(self, callable):
+        wx.CallAfter(callable)
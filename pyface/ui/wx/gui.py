@@ -20,6 +20,7 @@
 # Standard library imports.
 import logging
 import sys
+from threading import Lock
 
 # Major package imports.
 import wx
@@ -29,6 +30,7 @@ from traits.api import Bool, HasTraits, provides, Unicode
 from pyface.util.guisupport import start_event_loop_wx
 
 # Local imports.
+from pyface.call_queue import CallQueue
 from pyface.i_gui import IGUI, MGUI
 
 
@@ -69,7 +71,7 @@ class GUI(MGUI, HasTraits):
     invoke_after = classmethod(invoke_after)
 
     def invoke_later(cls, callable, *args, **kw):
-        wx.CallAfter(callable, *args, **kw)
+        _call_queue().call(callable, *args, **kw)
 
     invoke_later = classmethod(invoke_later)
 
@@ -79,10 +81,17 @@ class GUI(MGUI, HasTraits):
     set_trait_after = classmethod(set_trait_after)
 
     def set_trait_later(cls, obj, trait_name, new):
-        wx.CallAfter(setattr, obj, trait_name, new)
+        _call_queue().set_trait(obj, trait_name, new)
 
     set_trait_later = classmethod(set_trait_later)
 
+    def set_call_limits(cls, max_calls=None, max_time=None):
+        queue = _call_queue()
+        queue.max_calls = max_calls
+        queue.max_time = max_time
+
+    set_call_limits = classmethod(set_call_limits)
+
     def process_events(allow_user_events=True):
         if allow_user_events:
             wx.GetApp().Yield(True)
@@ -151,4 +160,30 @@ class GUI(MGUI, HasTraits):
 
         return
 
+
+# The queue of calls to make in the main GUI thread, created on first use.
+_queue = None
+
+# Manage the creation of the queue.
+_queue_lock = Lock()
+
+
+def _call_queue():
+    """ Return the queue of calls to make in the main GUI thread.
+
+    A single wx.CallAfter is made whenever the queue goes from empty to
+    non-empty, and all of the queued calls (up to the limits of the queue) are
+    made when it is handled.
+    """
+    global _queue
+
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                queue = CallQueue(None)
+                queue.wake = lambda: wx.CallAfter(queue.drain)
+                _queue = queue
+
+    return _queue
+
 #### EOF ######################################################################
@@ -24,11 +24,13 @@ import os
 import wx
 
 # Enthought library imports.
-from traits.api import Any, HasTraits, List, Property, provides
+from traits.api import Any, Dict, HasTraits, List, Property, provides
 from traits.api import Unicode
 
 # Local imports.
 from pyface.i_image_resource import IImageResource, MImageResource
+from pyface.resource.resource_cache import image_cache
+from .resource_manager import image_nbytes
 
 
 @provides(IImageResource)
@@ -43,6 +45,9 @@ class ImageResource(MImageResource, HasTraits):
     # The resource manager reference for the image.
     _ref = Any
 
+    # The resource manager references for specific image sizes.
+    _refs = Dict
+
     #### 'ImageResource' interface ############################################
 
     absolute_path = Property(Unicode)
@@ -56,13 +61,30 @@ class ImageResource(MImageResource, HasTraits):
     ###########################################################################
 
     def create_bitmap(self, size=None):
-        return self.create_image(size).ConvertToBitmap()
+        # Bitmaps and icons come from the shared image cache, so callers must
+        # copy them before changing them (see 'IImageResource').
+        ref = self._get_ref(size)
+
+        if ref is not None:
+            key = self._get_cache_key(ref, size, 'bitmap')
+            bitmap = image_cache.get(key)
+            if bitmap is None:
+                bitmap = ref.load().ConvertToBitmap()
+                image_cache.set(key, bitmap, image_nbytes(bitmap))
+
+            return bitmap
+
+        return self._get_image_not_found_image().ConvertToBitmap()
 
     def create_icon(self, size=None):
         ref = self._get_ref(size)
 
         if ref is not None:
-            icon = wx.Icon(self.absolute_path, wx.BITMAP_TYPE_ICO)
+            key = self._get_cache_key(ref, size, 'icon')
+            icon = image_cache.get(key)
+            if icon is None:
+                icon = wx.Icon(self.absolute_path, wx.BITMAP_TYPE_ICO)
+                image_cache.set(key, icon, image_nbytes(icon))
         else:
             image = self._get_image_not_found_image()
 
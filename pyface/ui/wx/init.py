@@ -32,6 +32,10 @@ if _app is None:
     _app = wx.App()
 
 
+# Fix for broken Pycrust introspect module.
+from pyface.util import fix_introspect_bug  # noqa: F401
+
+
 # stop logging to a modal window by default
 # (apps can override by setting a different active target)
 _log = wx.LogStderr()
@@ -21,7 +21,9 @@ import wx
 import time
 
 # Enthought library imports
-from traits.api import Bool, Enum, Instance, Int, Property, provides, Str
+from traits.api import (
+    Bool, Enum, Float, Instance, Int, Property, provides, Str
+)
 
 # Local imports
 from pyface.i_progress_dialog import IProgressDialog, MProgressDialog
@@ -43,6 +45,9 @@ class ProgressBar(Widget):
     #: The maximum value for the progress bar.
     _max = Int
 
+    #: The value last shown by the progress bar.
+    _value = Int(-1)
+
     def __init__(self, parent, minimum=0, maximum=100, direction='horizontal',
                  size=(200, -1)):
         """
@@ -63,8 +68,11 @@ class ProgressBar(Widget):
         """ Update the progress bar to the desired value. """
         if self._max == 0:
             self.control.Pulse()
-        else:
+        elif value != self._value:
+            self._value = value
             self.control.SetValue(value)
+        else:
+            return
 
         self.control.Update()
 
@@ -118,6 +126,10 @@ class ProgressDialog(MProgressDialog, Window):
     # Label for the 'cancel' button
     cancel_button_label = Str('Cancel')
 
+    #: The maximum number of repaints per second, or 0 to repaint on every
+    #: update
+    update_rate = Float(0.0)
+
     #: The widget showing the message text
     _message_control = Instance(wx.StaticText)
 
@@ -204,15 +216,52 @@ class ProgressDialog(MProgressDialog, Window):
             # done. Allow it, but do nothing
             return (False, False)
 
+        # An update made from inside Yield is made once this one is done,
+        # rather than recursively.
+        if self._updating:
+            self._nested_values.append(value)
+            return (not self._user_cancelled, False)
+
+        # Don't repaint more often than asked.  Without a maximum, the values
+        # are increments, so those skipped are added to the next one shown.
+        if not self._repaint_due(value):
+            if self.max <= 0:
+                self._skipped_increment += value
+            return (not self._user_cancelled, False)
+
+        if self.max <= 0:
+            value += self._skipped_increment
+            self._skipped_increment = 0
+
+        self._updating = True
+        try:
+            self._show_update(value)
+            while self._nested_values and self.progress_bar is not None:
+                values, self._nested_values = self._nested_values, []
+                # Without a maximum, the values are increments.
+                self._show_update(values[-1] if self.max > 0 else sum(values))
+        finally:
+            self._updating = False
+            self._nested_values = []
+
+        return (not self._user_cancelled, False)
+
+    #-------------------------------------------------------------------------
+    # Private Interface
+    #-------------------------------------------------------------------------
+
+    def _show_update(self, value):
+        """ Show the progress value and yield to the pending events. """
+
         self.progress_bar.update(value)
 
         # A bit hackish, but on Windows if another window sets focus, the
-        # other window will come to the top, obscuring the progress dialog.
-        # Only do this if the control is a top level window, so windows which
-        # embed a progress dialog won't keep popping to the top
-        # When we do embed the dialog, self.control may be None since the
-        # embedding might just be grabbing the guts of the control. This happens
-        # in the Traits UI ProgressEditor.
+        # other window will come to the top, obscuring the progress
+        # dialog. Only do this if the control is a top level window, so
+        # windows which embed a progress dialog won't keep popping to the
+        # top. When we do embed the dialog, self.control may be None since
+        # the embedding might just be grabbing the guts of the control.
+        # This happens in the Traits UI ProgressEditor.
 
         if self.control is not None and self.control.IsTopLevel():
             self.control.Raise()
@@ -220,18 +269,8 @@ class ProgressDialog(MProgressDialog, Window):
         if self.max > 0:
             percent = (float(value) - self.min)/(self.max - self.min)
 
-            if self.show_time and (percent != 0):
-                current_time = time.time()
-                elapsed = current_time - self._start_time
-                estimated = elapsed/percent
-                remaining = estimated - elapsed
-
-                self._set_time_label(elapsed,
-                                 self._elapsed_control)
-                self._set_time_label(estimated,
-                                 self._estimated_control)
-                self._set_time_label(remaining,
-                                 self._remaining_control)
+            if self.show_time:
+                self._update_time_labels(value)
 
             if self.show_percent:
                 self._percent_control = "%3f" % ((percent * 100) % 1)
@@ -244,12 +283,6 @@ class ProgressDialog(MProgressDialog, Window):
 
         wx.GetApp().Yield(True)
 
-        return (not self._user_cancelled, False)
-
-    #-------------------------------------------------------------------------
-    # Private Interface
-    #-------------------------------------------------------------------------
-
     def _on_cancel(self, event):
         self._user_cancelled = True
         self.close()
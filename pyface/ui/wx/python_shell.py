@@ -15,6 +15,7 @@
 
 # Standard library imports.
 import six.moves.builtins
+from functools import partial
 import os
 import sys
 import types
@@ -24,14 +25,16 @@ from wx.py.shell import Shell as PyShellBase
 import wx
 
 # Enthought library imports.
-from traits.api import Event, provides
+from traits.api import Bool, Event, provides
 
 # Private Enthought library imports.
 from traits.util.clean_strings import python_name
 from pyface.wx.drag_and_drop import PythonDropTarget
 
 # Local imports.
-from pyface.i_python_shell import IPythonShell, MPythonShell
+from pyface.i_python_shell import (
+    IPythonShell, MPythonShell, _InterruptibleJob, _redirect_thread_output
+)
 from pyface.key_pressed_event import KeyPressedEvent
 from .widget import Widget
 import six
@@ -49,6 +52,10 @@ class PythonShell(MPythonShell, Widget):
 
     key_pressed = Event(KeyPressedEvent)
 
+    background = Bool(False)
+
+    busy = Bool(False)
+
     ###########################################################################
     # 'object' interface.
     ###########################################################################
@@ -66,6 +73,7 @@ class PythonShell(MPythonShell, Widget):
 
         # Set up to be notified whenever a Python statement is executed:
         self.control.handlers.append(self._on_command_executed)
+        self.control.busy_handlers.append(self._on_busy_changed)
 
     ###########################################################################
     # 'IPythonShell' interface.
@@ -168,6 +176,7 @@ class PythonShell(MPythonShell, Widget):
 
     def _create_control(self, parent):
         shell = PyShell(parent, -1)
+        shell.background = self.background
 
         # Listen for key press events.
         wx.EVT_CHAR(shell, self._wx_on_char)
@@ -216,6 +225,15 @@ class PythonShell(MPythonShell, Widget):
     # Private handler interface.
     ###########################################################################
 
+    def _on_busy_changed(self, busy):
+        """ Called when a command starts or stops executing in the background.
+        """
+        self.busy = busy
+
+    def _background_changed(self, new):
+        if self.control is not None:
+            self.control.background = new
+
     def _wx_on_char(self, event):
         """ Called whenever a change is made to the text of the document. """
 
@@ -245,11 +263,25 @@ class PythonShell(MPythonShell, Widget):
 
 class PyShell(PyShellBase):
 
+    #: Whether commands entered in the shell are executed in a worker thread.
+    background = False
+
+    #: The BackgroundExecutor used to execute commands in the background, or
+    #: None to use the shared executor.
+    executor = None
+
     def __init__(self, parent, id=-1, pos=wx.DefaultPosition,
                  size=wx.DefaultSize, style=wx.CLIP_CHILDREN,
                  introText='', locals=None, InterpClass=None, *args, **kwds):
         self.handlers=[]
 
+        # Called with True or False when a command starts or stops executing
+        # in the background.
+        self.busy_handlers = []
+        self._job = None
+        self._future = None
+        self._command = None
+
         # save a reference to the original raw_input() function since
         # wx.py.shell dosent reassign it back to the original on destruction
         self.raw_input = six.moves.builtins.raw_input
@@ -277,9 +309,30 @@ class PyShell(PyShellBase):
 
     def push(self, command):
         """Send command to the interpreter for execution."""
+        if self._future is not None:
+            # A command is already executing in the background.
+            return
+
         self.write(os.linesep)
-        self.hidden_push(command)
-        self.prompt()
+        if self.background:
+            self._push_in_background(command)
+        else:
+            self.hidden_push(command)
+            self.prompt()
+
+    def interrupt(self):
+        """ Interrupt the command executing in the background, if any. """
+        if self._future is not None and not self._job.interrupt():
+            # The command is still waiting for a worker.
+            self._future.cancel()
+
+    def OnKeyDown(self, event):
+        """ Reimplemented to interrupt background commands with Ctrl+C. """
+        if (self._future is not None and event.ControlDown()
+                and event.GetKeyCode() == ord('C') and not self.CanCopy()):
+            self.interrupt()
+        else:
+            super(PyShell, self).OnKeyDown(event)
 
     def Destroy(self):
         """Cleanup before destroying the control...namely, return std I/O and
@@ -293,6 +346,60 @@ class PyShell(PyShellBase):
         super(PyShellBase, self).Destroy()
 
 
+    def _push_in_background(self, command):
+        """ Send a command to the interpreter in a worker thread. """
+        from pyface.concurrent.api import get_executor
+
+        executor = self.executor if self.executor is not None \
+            else get_executor()
+        write = partial(executor.call_in_gui_thread, self.write)
+        self._job = _InterruptibleJob(_push_command)
+        self._future = executor.submit(self._job, self.interp, command, write)
+        self._future.on_trait_change(self._background_push_done, 'state')
+        self._command = command
+        wx.BeginBusyCursor()
+        for handler in self.busy_handlers:
+            handler(True)
+
+    def _background_push_done(self, future, name, new):
+        """ Called when the state of the background execution changes. """
+        from pyface.concurrent.api import CANCELLED
+
+        if not future.done:
+            return
+
+        future.on_trait_change(
+            self._background_push_done, 'state', remove=True
+        )
+        command = self._command
+        self._job = self._future = self._command = None
+        wx.EndBusyCursor()
+
+        if future.state == CANCELLED or \
+                isinstance(future.exception, KeyboardInterrupt):
+            self.write('KeyboardInterrupt' + os.linesep)
+            self.more = False
+        elif future.traceback:
+            self.write(future.traceback)
+            self.more = False
+        else:
+            self.more = future.result
+        if not self.more:
+            self.addHistory(command.rstrip())
+            for handler in self.handlers:
+                handler()
+        for handler in self.busy_handlers:
+            handler(False)
+        self.prompt()
+
+
+def _push_command(interpreter, command, write):
+    """ Push a command to an interpreter, sending its output to a callable.
+    """
+    with _redirect_thread_output(write):
+        return interpreter.push(command)
+
+
 class _NullIO:
     """ A portable /dev/null for use with PythonShell.execute_file.
     """
@@ -20,14 +20,14 @@
 # Standard library imports.
 import os
 import tempfile
-
-from six.moves import cStringIO as StringIO
+from io import BytesIO
 
 # Major package imports.
 import wx
 
 # Enthought library imports.
 from pyface.resource.api import ResourceFactory
+from pyface.resource.resource_cache import data_cache_key, image_cache
 
 from traits.api import Undefined
 
@@ -42,14 +42,48 @@ class PyfaceResourceFactory(ResourceFactory):
     def image_from_file(self, filename):
         """ Creates an image from the data in the specified filename. """
 
-        # N.B 'wx.BITMAP_TYPE_ANY' tells wxPython to attempt to autodetect the
-        # --- image format.
-        return wx.Image(filename, wx.BITMAP_TYPE_ANY)
+        key = (filename, None, 'image')
+        image = image_cache.get(key)
+        if image is None:
+            # N.B 'wx.BITMAP_TYPE_ANY' tells wxPython to attempt to autodetect
+            # --- the image format.
+            image = wx.Image(filename, wx.BITMAP_TYPE_ANY)
+            if not image.IsOk():
+                return image
+
+            image_cache.set(key, image, image_nbytes(image))
+
+        # wx.Images are mutable (eg. 'Rescale'), so never hand out the cached
+        # image itself.
+        return image.Copy()
 
     def image_from_data(self, data, filename=None):
-        """ Creates an image from the specified data. """
+        """ Creates an image from the specified data.
+
+        The data can be any bytes-like object (eg. a memoryview of a zip file
+        member).  It is only written to a file if this version of wx cannot
+        decode images from a stream.
+        """
+
+        key = (data_cache_key(data), None, 'image')
+        image = image_cache.get(key)
+        if image is None:
+            image = self._image_from_data(data, filename)
+            if image is None or not image.IsOk():
+                return image
+
+            image_cache.set(key, image, image_nbytes(image) + len(data))
+
+        return image.Copy()
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _image_from_data(self, data, filename=None):
+        """ Decodes an image from the specified data. """
         try:
-            return wx.ImageFromStream(StringIO(data))
+            return wx.ImageFromStream(BytesIO(data))
         except:
             # wx.ImageFromStream is only in wx 2.8 or later(?)
             if filename is Undefined:
@@ -76,4 +110,15 @@ class PyfaceResourceFactory(ResourceFactory):
 
         return image
 
+
+def image_nbytes(image):
+    """ Returns the approximate memory used by a wx.Image, Bitmap or Icon. """
+
+    if isinstance(image, wx.Image):
+        depth = 4 if image.HasAlpha() else 3
+    else:
+        depth = max(image.GetDepth(), 8) // 8
+
+    return image.GetWidth() * image.GetHeight() * depth
+
 #### EOF ######################################################################
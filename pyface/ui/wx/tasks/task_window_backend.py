@@ -84,8 +84,18 @@ class TaskWindowBackend(MTaskWindowBackend):
         self.window._aui_manager.AddPane(state.central_pane.control, info)
         self.window._aui_manager.Update()
 
-        # Show the dock panes.
+        # Show the dock panes. The AUI perspectives refer to every pane, so
+        # in lazy mode their controls are all created here.
+        for dock_pane in state.dock_panes:
+            self.window._create_dock_pane(dock_pane)
         self._layout_state(state)
+
+    def show_dock_pane(self, dock_pane):
+        """ Show a dock pane of the active task whose control has just been
+            created, in its dock area.
+        """
+        dock_pane.add_to_manager()
+        dock_pane.commit_if_active()
     
     def get_toolbars(self, task=None):
         if task is None:
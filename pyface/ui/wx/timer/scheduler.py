@@ -0,0 +1,45 @@
+#  Copyright (c) 2018, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+"""A scheduler which runs its callbacks from a single `wx.Timer`.
+"""
+
+import wx
+
+from traits.api import Instance
+
+from pyface.timer.i_scheduler import BaseScheduler
+
+
+class SchedulerTimer(wx.Timer):
+    def __init__(self, scheduler):
+        super(SchedulerTimer, self).__init__()
+        self.scheduler = scheduler
+
+    def Notify(self):
+        self.scheduler.run_due()
+
+
+class PyfaceScheduler(BaseScheduler):
+    """ A scheduler which runs its callbacks from a single wx.Timer. """
+
+    #: The one-shot wx.Timer for the scheduler.
+    _timer = Instance(wx.Timer)
+
+    def _start_timer(self, delay):
+        # Round up, so that the timer doesn't go off before the deadline.
+        self._timer.Start(
+            max(int(delay * 1000 + 0.999), 1), wx.TIMER_ONE_SHOT
+        )
+
+    def _stop_timer(self):
+        self._timer.Stop()
+
+    def __timer_default(self):
+        return SchedulerTimer(self)
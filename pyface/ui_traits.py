@@ -21,6 +21,8 @@ from traits.api import ABCHasStrictTraits, Enum, Range, TraitError, TraitType
 from traits.trait_base import get_resource_path
 import six
 
+from pyface.resource.resource_cache import ResourceCache
+
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +30,26 @@ logger = logging.getLogger(__name__)
 #  Images
 #-------------------------------------------------------------------------------
 
-image_resource_cache = {}
-image_bitmap_cache = {}
+#: The maximum number of image resources kept alive by the resource cache.
+IMAGE_RESOURCE_CACHE_MAX_ITEMS = 1024
+
+#: The maximum (approximate) size in bytes of the bitmaps in the bitmap cache.
+IMAGE_BITMAP_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+#: Cache of image resources created by 'convert_image'.  Resources which are
+#: evicted are still found for as long as they are in use elsewhere (eg. as
+#: the value of an Image trait).
+image_resource_cache = ResourceCache(
+    max_items=IMAGE_RESOURCE_CACHE_MAX_ITEMS, weak_values=True,
+)
+
+#: Cache of bitmaps created by 'convert_bitmap', keyed by image resource.
+#: Bitmaps whose size can't be found count as zero bytes, so the number of
+#: entries is bounded as well.
+image_bitmap_cache = ResourceCache(
+    max_bytes=IMAGE_BITMAP_CACHE_MAX_BYTES,
+    max_items=IMAGE_RESOURCE_CACHE_MAX_ITEMS,
+)
 
 
 def convert_image(value, level=3):
@@ -58,7 +78,8 @@ def convert_image(value, level=3):
             from pyface.image_resource import ImageResource
             result = ImageResource(value, search_path=[search_path])
 
-        image_resource_cache[key] = result
+        if result is not None:
+            image_resource_cache.set(key, result)
 
     return result
 
@@ -66,14 +87,46 @@ def convert_image(value, level=3):
 def convert_bitmap(image_resource):
     """ Converts an ImageResource to a bitmap using a cache.
     """
+    if image_resource is None:
+        return None
+
     bitmap = image_bitmap_cache.get(image_resource)
-    if (bitmap is None) and (image_resource is not None):
-        image_bitmap_cache[image_resource] = bitmap = \
-            image_resource.create_bitmap()
+    if bitmap is None:
+        bitmap = image_resource.create_bitmap()
+        image_bitmap_cache.set(
+            image_resource, bitmap, _bitmap_nbytes(image_resource, bitmap)
+        )
 
     return bitmap
 
 
+def image_cache_statistics():
+    """ Returns the statistics of the image resource and bitmap caches.
+
+    Returns
+    -------
+    statistics : dict
+        A dictionary with 'image_resource' and 'image_bitmap' keys, whose
+        values are the statistics of the corresponding cache.
+    """
+    return {
+        'image_resource': image_resource_cache.statistics(),
+        'image_bitmap': image_bitmap_cache.statistics(),
+    }
+
+
+def _bitmap_nbytes(image_resource, bitmap):
+    """ Returns the approximate size of a bitmap, assuming 32 bits per pixel.
+    """
+    try:
+        width, height = image_resource.image_size(bitmap)
+    except Exception:
+        # Not all toolkits can report the size of an image.
+        return 0
+
+    return width * height * 4
+
+
 class Image(TraitType):
     """ Defines a trait whose value must be a ImageResource or a string
         that can be converted to one.
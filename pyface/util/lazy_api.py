@@ -0,0 +1,97 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#------------------------------------------------------------------------------
+""" Support for 'api' modules whose names are imported on first use.
+
+Importing everything in an api module up front imports dozens of modules and
+resolves many toolkit objects which an application may never use.  An api
+module can instead declare where each of its names comes from::
+
+    from pyface.util.lazy_api import lazy_api
+
+    lazy_api(__name__, globals(), {
+        'AboutDialog': '.about_dialog',
+        'GUI': '.gui',
+    })
+
+    del lazy_api
+
+and each name is then imported the first time it is accessed, using a module
+level ``__getattr__`` function (PEP 562).  ``__all__`` and ``__dir__`` are
+defined, so star-imports and introspection still see every name.  On Python
+versions before 3.7, which don't support module level ``__getattr__``, the
+module's class is changed to one which calls it, and on Python 2 every name
+is imported immediately.
+"""
+
+from importlib import import_module
+import sys
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    """ A module which uses its module level __getattr__ and __dir__
+    functions on Python versions which don't support PEP 562.
+    """
+
+    def __getattr__(self, name):
+        getattr_function = self.__dict__.get('__getattr__')
+        if getattr_function is None:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(self.__name__, name)
+            )
+        return getattr_function(name)
+
+    def __dir__(self):
+        return self.__dict__['__dir__']()
+
+
+def lazy_api(module_name, namespace, names):
+    """ Make the names of an api module be imported on first access.
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the api module.
+    namespace : dict
+        The globals of the api module.
+    names : dict
+        Maps each name to the (possibly relative) name of the module that it
+        is imported from.
+    """
+    package = namespace.get('__package__') or module_name.rpartition('.')[0]
+
+    def __getattr__(name):
+        try:
+            source = names[name]
+        except KeyError:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(module_name, name)
+            )
+
+        value = getattr(import_module(source, package), name)
+        # Later lookups find the name without calling this function.
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(names))
+
+    namespace['__all__'] = sorted(names)
+    namespace['__getattr__'] = __getattr__
+    namespace['__dir__'] = __dir__
+
+    if sys.version_info < (3, 7):
+        module = sys.modules[module_name]
+        if sys.version_info >= (3, 5):
+            module.__class__ = LazyModule
+        else:
+            for name in names:
+                __getattr__(name)
@@ -0,0 +1,317 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#------------------------------------------------------------------------------
+""" Instrumentation of application start-up.
+
+When enabled, the start-up profiler records how long each module import,
+toolkit entry point scan and toolkit object lookup takes, and how many modules
+it imported.  The results can be written as a text report, sorted by time, or
+as a Chrome trace (which can be loaded into chrome://tracing or Perfetto).
+
+Profiling is enabled either by calling :py:func:`enable` as early as possible,
+or by setting the ``PYFACE_STARTUP_PROFILE`` environment variable before
+pyface is first imported.  The value of the variable is where to write the
+results when the process exits: a file name ending with ``.json`` gives a
+Chrome trace, any other file name gives a text report, and ``1`` or ``stderr``
+writes a text report to standard error.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from timeit import default_timer as clock
+
+import six
+from six.moves import builtins
+
+
+#: The name of the environment variable used to enable profiling.
+STARTUP_PROFILE_ENV = 'PYFACE_STARTUP_PROFILE'
+
+#: The currently active profiler, or None if profiling is not enabled.
+current_profiler = None
+
+
+class StartupProfiler(object):
+    """ Records the time taken and modules imported by start-up operations.
+
+    Each record is a tuple of the category (eg. 'import', 'toolkit' or
+    'entry_points'), the name, the start time and duration in seconds, the
+    time not spent in nested records, the number of modules imported, and
+    the thread and nesting depth of the operation.
+    """
+
+    def __init__(self):
+        #: The records of the operations measured so far.
+        self.records = []
+
+        #: The time at which the profiler was created.
+        self.start_time = clock()
+
+        #: The number of modules already imported when the profiler was
+        #: created.
+        self.start_modules = len(sys.modules)
+
+        # The stack of nested operations for each thread.
+        self._local = threading.local()
+
+        # The builtin import function replaced by 'install_import_hook'.
+        self._import = None
+
+    ###########################################################################
+    # 'StartupProfiler' interface.
+    ###########################################################################
+
+    @contextmanager
+    def measure(self, category, name):
+        """ Measure the operation performed in the body of a with statement.
+
+        Parameters
+        ----------
+        category : str
+            The kind of operation, eg. 'import' or 'toolkit'.
+        name : str
+            The name of the operation, eg. the module being imported.
+        """
+        stack = self._stack()
+        # The time spent in nested operations is accumulated in this frame.
+        frame = [0.0]
+        stack.append(frame)
+        modules = len(sys.modules)
+        start = clock()
+        try:
+            yield
+        finally:
+            duration = clock() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += duration
+            self.records.append((
+                category, name, start - self.start_time, duration,
+                duration - frame[0], len(sys.modules) - modules,
+                threading.current_thread().ident, len(stack),
+            ))
+
+    def install_import_hook(self):
+        """ Measure every module import until the hook is removed. """
+        if self._import is not None:
+            return
+
+        self._import = original_import = builtins.__import__
+
+        def profiled_import(name, globals=None, locals=None, fromlist=(),
+                            level=0):
+            # Only imports of modules which are not loaded yet are measured.
+            module_name = _resolve_name(name, globals, level)
+            if module_name in sys.modules:
+                return original_import(name, globals, locals, fromlist, level)
+
+            with self.measure('import', module_name):
+                return original_import(name, globals, locals, fromlist, level)
+
+        builtins.__import__ = profiled_import
+
+    def remove_import_hook(self):
+        """ Stop measuring module imports. """
+        if self._import is not None:
+            builtins.__import__ = self._import
+            self._import = None
+
+    def report(self, limit=None):
+        """ Return a text report of the records, slowest first.
+
+        Parameters
+        ----------
+        limit : int or None
+            The maximum number of records to include, or None for all.
+
+        Returns
+        -------
+        report : str
+            The report, with one line for each record giving its total and
+            self times in milliseconds, the number of modules it imported,
+            its category and its name.
+        """
+        records = sorted(self.records, key=lambda record: -record[3])
+        if limit is not None:
+            records = records[:limit]
+
+        lines = [
+            'Start-up profile: {:.1f} ms, {} modules imported'.format(
+                (clock() - self.start_time) * 1e3,
+                len(sys.modules) - self.start_modules,
+            ),
+            '',
+            '{:>10} {:>10} {:>8}  {:<12} {}'.format(
+                'total ms', 'self ms', 'modules', 'category', 'name'
+            ),
+        ]
+        for category, name, start, duration, own, modules, _, _ in records:
+            lines.append('{:10.3f} {:10.3f} {:8d}  {:<12} {}'.format(
+                duration * 1e3, own * 1e3, modules, category, name
+            ))
+
+        return '\n'.join(lines) + '\n'
+
+    def chrome_trace(self):
+        """ Return the records in the Chrome trace event format.
+
+        Returns
+        -------
+        trace : dict
+            A dictionary with a 'traceEvents' list of complete events, which
+            can be serialized as JSON.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': start * 1e6,
+                'dur': duration * 1e6,
+                'pid': pid,
+                'tid': tid,
+                'args': {'modules': modules},
+            }
+            for category, name, start, duration, _, modules, tid, _
+            in self.records
+        ]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write(self, output):
+        """ Write the results to a file or stream.
+
+        Parameters
+        ----------
+        output : str or file-like
+            A file name ending with '.json' to write a Chrome trace, any other
+            file name to write a text report, or a file-like object to write
+            a text report to.
+        """
+        if not isinstance(output, six.string_types):
+            output.write(self.report())
+        elif output.endswith('.json'):
+            with open(output, 'w') as fp:
+                json.dump(self.chrome_trace(), fp)
+        else:
+            with open(output, 'w') as fp:
+                fp.write(self.report())
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _stack(self):
+        """ Return the stack of nested operations for the current thread. """
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+def _resolve_name(name, globals, level):
+    """ Return the absolute name of a module being imported. """
+    if level <= 0 or not globals:
+        return name
+
+    package = globals.get('__package__') or globals.get('__name__', '')
+    if globals.get('__path__') is None and not globals.get('__package__'):
+        package = package.rpartition('.')[0]
+    if level > 1:
+        package = package.rsplit('.', level - 1)[0]
+
+    return package + '.' + name if name else package
+
+
+def enable(output=None, imports=True):
+    """ Start profiling, if it is not already enabled.
+
+    Parameters
+    ----------
+    output : str, file-like or None
+        Where to write the results when the process exits (see
+        :py:meth:`StartupProfiler.write`), or None to not write them.
+    imports : bool
+        Whether to measure module imports.
+
+    Returns
+    -------
+    profiler : StartupProfiler
+        The active profiler.
+    """
+    global current_profiler
+
+    if current_profiler is None:
+        current_profiler = StartupProfiler()
+        if imports:
+            current_profiler.install_import_hook()
+        if output is not None:
+            atexit.register(_write_at_exit, current_profiler, output)
+
+    return current_profiler
+
+
+def disable():
+    """ Stop profiling.
+
+    Returns
+    -------
+    profiler : StartupProfiler or None
+        The profiler which was active, if any.
+    """
+    global current_profiler
+
+    profiler, current_profiler = current_profiler, None
+    if profiler is not None:
+        profiler.remove_import_hook()
+
+    return profiler
+
+
+def enable_from_environment():
+    """ Start profiling if the PYFACE_STARTUP_PROFILE variable is set. """
+    output = os.environ.get(STARTUP_PROFILE_ENV)
+    if not output:
+        return None
+
+    if output.lower() in {'1', 'stderr'}:
+        output = sys.stderr
+
+    return enable(output)
+
+
+@contextmanager
+def measure(category, name):
+    """ Measure an operation with the active profiler, if any.
+
+    Parameters
+    ----------
+    category : str
+        The kind of operation, eg. 'import' or 'toolkit'.
+    name : str
+        The name of the operation.
+    """
+    profiler = current_profiler
+    if profiler is None:
+        yield
+    else:
+        with profiler.measure(category, name):
+            yield
+
+
+def _write_at_exit(profiler, output):
+    """ Write the results of a profiler, unless it has been disabled. """
+    if profiler is current_profiler:
+        disable()
+        profiler.write(output)
@@ -0,0 +1,70 @@
+from __future__ import absolute_import
+
+import importlib
+import os
+import subprocess
+import sys
+import types
+
+from traits.testing.unittest_tools import unittest
+
+from pyface.util.lazy_api import lazy_api
+
+API_MODULES = [
+    'pyface.api',
+    'pyface.action.api',
+    'pyface.tasks.api',
+    'pyface.workbench.api',
+]
+
+
+class TestLazyApi(unittest.TestCase):
+
+    def setUp(self):
+        self.module = types.ModuleType('pyface.util.tests.lazy_test_api')
+        sys.modules[self.module.__name__] = self.module
+        self.addCleanup(sys.modules.pop, self.module.__name__)
+        lazy_api(self.module.__name__, self.module.__dict__, {
+            'get_unique_id': '..id_helper',
+            'has_traitsui': 'pyface.util.testing',
+        })
+
+    def test_getattr(self):
+        from pyface.util.id_helper import get_unique_id
+
+        self.assertNotIn('get_unique_id', self.module.__dict__)
+        self.assertIs(self.module.get_unique_id, get_unique_id)
+        self.assertIs(self.module.__dict__['get_unique_id'], get_unique_id)
+
+    def test_getattr_missing(self):
+        with self.assertRaises(AttributeError):
+            self.module.missing
+
+    def test_all_and_dir(self):
+        self.assertEqual(self.module.__all__,
+                         ['get_unique_id', 'has_traitsui'])
+        self.assertIn('has_traitsui', dir(self.module))
+
+    def test_api_modules_resolve(self):
+        for module_name in API_MODULES:
+            module = importlib.import_module(module_name)
+            for name in module.__all__:
+                self.assertIsNotNone(getattr(module, name), name)
+
+    def test_api_modules_hide_lazy_api(self):
+        for module_name in API_MODULES:
+            module = importlib.import_module(module_name)
+            self.assertNotIn('lazy_api', dir(module), module_name)
+            self.assertFalse(hasattr(module, 'lazy_api'), module_name)
+
+    @unittest.skipIf(sys.version_info < (3, 5), "Names are imported eagerly")
+    def test_api_import_is_lazy(self):
+        code = (
+            "import sys, pyface.api, pyface.action.api, pyface.tasks.api\n"
+            "print('pyface.about_dialog' in sys.modules,\n"
+            "      'pyface.tasks.task_window' in sys.modules)\n"
+        )
+        output = subprocess.check_output(
+            [sys.executable, '-c', code], env=dict(os.environ)
+        )
+        self.assertEqual(output.split(), [b'False', b'False'])
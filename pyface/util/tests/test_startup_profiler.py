@@ -0,0 +1,110 @@
+from __future__ import absolute_import
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import six
+from traits.testing.unittest_tools import unittest
+
+from pyface.base_toolkit import Toolkit
+from pyface.util import startup_profiler
+from pyface.util.startup_profiler import StartupProfiler
+
+
+class TestStartupProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = StartupProfiler()
+
+    def tearDown(self):
+        self.profiler.remove_import_hook()
+        startup_profiler.disable()
+
+    def test_measure_nested(self):
+        with self.profiler.measure('outer', 'a'):
+            with self.profiler.measure('inner', 'b'):
+                pass
+
+        inner, outer = self.profiler.records
+        self.assertEqual(inner[:2], ('inner', 'b'))
+        self.assertEqual(outer[:2], ('outer', 'a'))
+        self.assertEqual(inner[7], 1)
+        self.assertEqual(outer[7], 0)
+        self.assertAlmostEqual(outer[4], outer[3] - inner[3])
+
+    def test_import_hook(self):
+        self.profiler.install_import_hook()
+        try:
+            import pyface.util.id_helper  # noqa: F401 (already imported)
+            import colorsys  # noqa: F401
+        finally:
+            self.profiler.remove_import_hook()
+
+        names = [record[1] for record in self.profiler.records]
+        self.assertNotIn('pyface.util.id_helper', names)
+        if 'colorsys' in names:
+            record = self.profiler.records[names.index('colorsys')]
+            self.assertEqual(record[0], 'import')
+
+    def test_report(self):
+        with self.profiler.measure('toolkit', 'fast'):
+            pass
+        self.profiler.records.append(
+            ('toolkit', 'slow', 0.0, 1.0, 1.0, 3, 0, 0)
+        )
+
+        lines = self.profiler.report().splitlines()
+
+        self.assertIn('slow', lines[3])
+        self.assertIn('fast', lines[4])
+        self.assertEqual(len(self.profiler.report(limit=1).splitlines()), 4)
+
+    def test_chrome_trace(self):
+        with self.profiler.measure('toolkit', 'name'):
+            pass
+
+        trace = json.loads(json.dumps(self.profiler.chrome_trace()))
+
+        event, = trace['traceEvents']
+        self.assertEqual(event['name'], 'name')
+        self.assertEqual(event['cat'], 'toolkit')
+        self.assertEqual(event['ph'], 'X')
+
+    def test_write(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        with self.profiler.measure('toolkit', 'name'):
+            pass
+
+        self.profiler.write(os.path.join(tmpdir, 'trace.json'))
+        self.profiler.write(os.path.join(tmpdir, 'report.txt'))
+        stream = six.StringIO()
+        self.profiler.write(stream)
+
+        with open(os.path.join(tmpdir, 'trace.json')) as fp:
+            self.assertIn('traceEvents', json.load(fp))
+        with open(os.path.join(tmpdir, 'report.txt')) as fp:
+            # The header line includes the time when the report was made.
+            self.assertEqual(fp.read().splitlines()[1:],
+                             stream.getvalue().splitlines()[1:])
+
+    def test_toolkit_lookup(self):
+        profiler = startup_profiler.enable(imports=False)
+        toolkit = Toolkit('pyface', 'test', 'pyface.util')
+
+        toolkit('id_helper:get_unique_id')
+
+        record, = profiler.records
+        self.assertEqual(record[:2],
+                         ('toolkit', 'pyface.test:id_helper:get_unique_id'))
+
+    def test_enable_disable(self):
+        profiler = startup_profiler.enable(imports=False)
+
+        self.assertIs(startup_profiler.current_profiler, profiler)
+        self.assertIs(startup_profiler.enable(), profiler)
+        self.assertIs(startup_profiler.disable(), profiler)
+        self.assertIsNone(startup_profiler.current_profiler)
@@ -1,22 +1,28 @@
 from __future__ import absolute_import
 
-from .i_editor import IEditor
-from .editor import Editor
+from ..util.lazy_api import lazy_api
 
-from .i_editor_manager import IEditorManager
-from .editor_manager import EditorManager
+lazy_api(__name__, globals(), {
+    'IEditor': '.i_editor',
+    'Editor': '.editor',
 
-from .i_perspective import IPerspective
-from .perspective import Perspective
-from .perspective_item import PerspectiveItem
+    'IEditorManager': '.i_editor_manager',
+    'EditorManager': '.editor_manager',
 
-from .i_view import IView
-from .view import View
+    'IPerspective': '.i_perspective',
+    'Perspective': '.perspective',
+    'PerspectiveItem': '.perspective_item',
 
-from .i_workbench import IWorkbench
-from .workbench import Workbench
+    'IView': '.i_view',
+    'View': '.view',
 
-from .workbench_window import WorkbenchWindow
+    'IWorkbench': '.i_workbench',
+    'Workbench': '.workbench',
 
-from .traits_ui_editor import TraitsUIEditor
-from .traits_ui_view import TraitsUIView
+    'WorkbenchWindow': '.workbench_window',
+
+    'TraitsUIEditor': '.traits_ui_editor',
+    'TraitsUIView': '.traits_ui_view',
+})
+
+del lazy_api